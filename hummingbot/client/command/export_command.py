@@ -92,18 +92,22 @@ class ExportCommand:
                                  start_timestamp: int,
                                  number_of_rows: Optional[int] = None,
                                  config_file_path: str = None) -> List[TradeFill]:
-        session: Session = self.trade_fill_db.get_shared_session()
-        filters = [TradeFill.timestamp >= start_timestamp]
-        if config_file_path is not None:
-            filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
-        query: Query = (session
-                        .query(TradeFill)
-                        .filter(*filters)
-                        .order_by(TradeFill.timestamp.desc()))
-        if number_of_rows is None:
-            result: List[TradeFill] = query.all() or []
-        else:
-            result: List[TradeFill] = query.limit(number_of_rows).all() or []
+        # Read through the reader connection, so that a long history query doesn't hold up the recorder's writes.
+        session: Session = self.trade_fill_db.get_reader_session()
+        try:
+            filters = [TradeFill.timestamp >= start_timestamp]
+            if config_file_path is not None:
+                filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
+            query: Query = (session
+                            .query(TradeFill)
+                            .filter(*filters)
+                            .order_by(TradeFill.timestamp.desc()))
+            if number_of_rows is None:
+                result: List[TradeFill] = query.all() or []
+            else:
+                result: List[TradeFill] = query.limit(number_of_rows).all() or []
+        finally:
+            session.close()
 
         # Get the latest 100 trades in ascending timestamp order
         result.reverse()
@@ -1,6 +1,7 @@
 from decimal import Decimal
 from collections import defaultdict
 
+import numpy as np
 import pandas as pd
 import threading
 import time
@@ -13,13 +14,22 @@ from typing import (
     TYPE_CHECKING,
     List
 )
-from hummingbot.client.performance_analysis import calculate_trade_performance
+from hummingbot.client.performance_analysis import (
+    calculate_asset_delta_from_columns,
+    calculate_trade_performance,
+    RunningTradePerformance
+)
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from datetime import datetime
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_archive import (
+    concat_columns,
+    query_trade_fill_columns,
+    TradeFillArchive
+)
 from hummingbot.client.config.config_helpers import secondary_market_conversion_rate
 
 s_float_0 = float(0)
@@ -31,9 +41,13 @@ if TYPE_CHECKING:
 
 class HistoryCommand:
     def history(self,  # type: HummingbotApplication
-                ):
+                days: Optional[float] = None):
         if threading.current_thread() != threading.main_thread():
-            self.ev_loop.call_soon_threadsafe(self.history)
+            self.ev_loop.call_soon_threadsafe(self.history, days)
+            return
+
+        if days is not None:
+            self.trade_history_report(days)
             return
 
         if not all(market.ready for market in self.markets.values()):
@@ -85,9 +99,13 @@ class HistoryCommand:
                                                      "Trade Delta"])
         return df
 
+    def _get_trades_for_performance(self,  # type: HummingbotApplication
+                                    ) -> List[TradeFill]:
+        return self._get_trades_from_session(self.init_time, config_file_path=self.strategy_file_name)
+
     def _calculate_trade_performance(self,  # type: HummingbotApplication
                                      ) -> Tuple[Dict, Dict]:
-        raw_queried_trades = self._get_trades_from_session(self.init_time, config_file_path=self.strategy_file_name)
+        raw_queried_trades = self._get_trades_for_performance()
         current_strategy_name: str = self.markets_recorder.strategy_name
         conversion_rate = secondary_market_conversion_rate(current_strategy_name)
         trade_performance_stats, market_trading_pair_stats = calculate_trade_performance(
@@ -112,6 +130,21 @@ class HistoryCommand:
         portfolio_delta_percentage: Decimal = trade_performance_stats["portfolio_delta_percentage"]
         return portfolio_delta_percentage
 
+    def calculate_running_profitability(self,  # type: HummingbotApplication
+                                        running_performance: RunningTradePerformance) -> Decimal:
+        """
+        Same as calculate_profitability, but from trades that have already been accumulated by running_performance,
+        instead of re-querying them from the database.
+        """
+        if not self.markets_recorder:
+            return Decimal("0.0")
+        conversion_rate = secondary_market_conversion_rate(self.markets_recorder.strategy_name)
+        trade_performance_stats, _ = running_performance.calculate_trade_performance(
+            self.starting_balances,
+            secondary_market_conversion_rate=conversion_rate
+        )
+        return trade_performance_stats["portfolio_delta_percentage"]
+
     def trade_performance_report(self,  # type: HummingbotApplication
                                  ) -> Optional[pd.DataFrame]:
         if len(self.market_trading_pair_tuples) == 0 or self.markets_recorder is None:
@@ -192,3 +225,60 @@ class HistoryCommand:
             else:
                 lines.extend(["\n  No past trades in this session."])
             self._notify("\n".join(lines))
+
+    def _get_trade_columns(self,  # type: HummingbotApplication
+                           start_timestamp: int) -> Dict[str, np.ndarray]:
+        """
+        The trades of the current strategy config since start_timestamp, from the trade archive and the database.
+        """
+        archived_columns: Dict[str, np.ndarray] = TradeFillArchive().load_trade_fills(self.strategy_file_name,
+                                                                                      start_timestamp)
+        session = self.trade_fill_db.get_reader_session()
+        try:
+            recent_columns: Dict[str, np.ndarray] = query_trade_fill_columns(session,
+                                                                             self.strategy_file_name,
+                                                                             start_timestamp)
+        finally:
+            session.close()
+        return concat_columns(archived_columns, recent_columns)
+
+    def trade_history_report(self,  # type: HummingbotApplication
+                             days: float):
+        if self.strategy_file_name is None:
+            self._notify("\n  Please import or create a strategy config to see its trade history.")
+            return
+
+        start_timestamp: int = int((time.time() - days * 24 * 60 * 60) * 1e3)
+        try:
+            market_trading_pair_stats: Dict[Tuple[str, str], Dict[str, Any]] = calculate_asset_delta_from_columns(
+                self._get_trade_columns(start_timestamp)
+            )
+        except Exception:
+            self.logger().error("Unexpected error reading trade history.", exc_info=True)
+            self._notify("Error reading trade history.")
+            return
+        if len(market_trading_pair_stats) == 0:
+            self._notify(f"\n  No trades in the last {days:g} days.")
+            return
+
+        rows = []
+        for (market, trading_pair), trading_pair_stats in market_trading_pair_stats.items():
+            base_asset: str = trading_pair_stats["base_asset"]
+            quote_asset: str = trading_pair_stats["quote_asset"]
+            base_stats: Dict[str, float] = trading_pair_stats["asset"][base_asset]
+            quote_stats: Dict[str, float] = trading_pair_stats["asset"][quote_asset]
+            base_delta: float = base_stats["acquired"] - base_stats["spent"]
+            quote_delta: float = quote_stats["acquired"] - quote_stats["spent"]
+            trade_value_delta: float = quote_delta + base_delta * trading_pair_stats["end_quote_rate"]
+            rows.append([market,
+                         trading_pair,
+                         trading_pair_stats["buy_count"],
+                         trading_pair_stats["sell_count"],
+                         f"{base_delta:.8f} {base_asset}",
+                         f"{quote_delta:.8f} {quote_asset}",
+                         f"{trade_value_delta:.8f} {quote_asset}"])
+        df = pd.DataFrame(rows, index=None, columns=["Market", "Pair", "Buys", "Sells", "Base Delta", "Quote Delta",
+                                                     "Trade Value Delta"])
+        lines = ["", f"  Trades in the last {days:g} days:"] + \
+            ["    " + line for line in df.to_string(index=False).split("\n")]
+        self._notify("\n".join(lines))
@@ -34,10 +34,10 @@ class OrderBookCommand:
             trading_pair, order_book = market, market_connector.order_books[market]
         else:
             trading_pair, order_book = next(iter(market_connector.order_books.items()))
-        bids = order_book.snapshot[0][['price', 'amount']].head(lines)
-        bids.rename(columns={'price': 'bid_price', 'amount': 'bid_volume'}, inplace=True)
-        asks = order_book.snapshot[1][['price', 'amount']].head(lines)
-        asks.rename(columns={'price': 'ask_price', 'amount': 'ask_volume'}, inplace=True)
+        # Only the displayed levels are read from the book, not the whole book.
+        bid_levels, ask_levels = order_book.depth(lines)
+        bids = pd.DataFrame(data=bid_levels[:, :2], columns=['bid_price', 'bid_volume'])
+        asks = pd.DataFrame(data=ask_levels[:, :2], columns=['ask_price', 'ask_volume'])
         joined_df = pd.concat([bids, asks], axis=1)
         text_lines = ["    " + line for line in joined_df.to_string(index=False).split("\n")]
         self._notify(f"  market: {market_connector.name} {trading_pair}\n")
@@ -23,7 +23,7 @@ class SillyCommands:
 
     async def silly_hummingbot(self,  # type: HummingbotApplication
                                ):
-        last_output = "\n".join(self.app.output_field.document.lines)
+        last_output = "\n".join(self.app.output_field.log_lines)
         self.placeholder_mode = True
         self.app.hide_input = True
         self.clear_output_field()
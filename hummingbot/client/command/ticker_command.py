@@ -1,53 +1,69 @@
-import pandas as pd
 import asyncio
+from hummingbot.client.ui.ticker_dashboard import TickerDashboard
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.core.event.events import PriceType
-from typing import TYPE_CHECKING
+from typing import (
+    List,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 if TYPE_CHECKING:
     from hummingbot.client.hummingbot_application import HummingbotApplication
 
+# Frame rate cap of the ticker, in frames per second.
+MAX_TICKER_FPS = 10
+
 
 class TickerCommand:
     def ticker(self,  # type: HummingbotApplication
                repeat: int = 10,
                exchange: str = None,
-               market: str = None):
-        safe_ensure_future(self.show_ticker(repeat, exchange, market))
+               market: str = None,
+               all_markets: bool = False,
+               interval: float = 1.0):
+        safe_ensure_future(self.show_ticker(repeat, exchange, market, all_markets, interval))
 
     async def show_ticker(self,  # type: HummingbotApplication
                           repeat: int = 10,
                           exchange: str = None,
-                          market: str = None):
+                          market: str = None,
+                          all_markets: bool = False,
+                          interval: float = 1.0):
         if len(self.markets.keys()) == 0:
             self._notify("\n This command can only be used while a strategy is running")
             return
-        if exchange is not None:
-            if exchange not in self.markets:
-                self._notify("\n Please select a valid exchange from the running strategy")
-                return
-            market_connector = self.markets[exchange]
-        else:
-            market_connector = list(self.markets.values())[0]
-        if market is not None:
-            market = market.upper()
-            if market not in market_connector.order_books:
-                self._notify("\n Please select a valid trading pair from the running strategy")
-                return
-            trading_pair, order_book = market, market_connector.order_books[market]
+        if exchange is not None and exchange not in self.markets:
+            self._notify("\n Please select a valid exchange from the running strategy")
+            return
+
+        order_books: List[Tuple[str, str, OrderBook]] = []
+        if all_markets:
+            for market_name, market_connector in self.markets.items():
+                if exchange is None or market_name == exchange:
+                    order_books.extend((market_name, trading_pair, order_book)
+                                       for trading_pair, order_book in market_connector.order_books.items())
         else:
-            trading_pair, order_book = next(iter(market_connector.order_books.items()))
-            self._notify(f"  market: {market_connector.name}")
+            market_connector = self.markets[exchange] if exchange is not None else list(self.markets.values())[0]
+            if market is not None:
+                market = market.upper()
+                if market not in market_connector.order_books:
+                    self._notify("\n Please select a valid trading pair from the running strategy")
+                    return
+                trading_pair = market
+            else:
+                trading_pair = next(iter(market_connector.order_books.keys()))
+            order_books.append((market_connector.name, trading_pair, market_connector.order_books[trading_pair]))
 
-        # Display market ticker x number of times based on repeat value
+        # Display market ticker x number of times based on repeat value. Each frame replaces the previous one in the
+        # output pane, and only the last one goes to the notifiers.
+        dashboard: TickerDashboard = TickerDashboard(order_books)
+        interval = max(interval, 1.0 / MAX_TICKER_FPS)
+        frame: str = ""
         for i in range(repeat):
-            columns = ["Best Bid", "Best Ask", "Mid Price", "Last Trade"]
-            data = [[
-                float(market_connector.get_price_by_type(trading_pair, PriceType.BestBid)),
-                float(market_connector.get_price_by_type(trading_pair, PriceType.BestAsk)),
-                float(market_connector.get_price_by_type(trading_pair, PriceType.MidPrice)),
-                float(market_connector.get_price_by_type(trading_pair, PriceType.LastTrade))
-            ]]
-            ticker_df = pd.DataFrame(data=data, columns=columns).to_string(index=False)
-            self._notify(f"\n  {ticker_df}")
-            await asyncio.sleep(1)
+            frame = f"\n{dashboard.refresh()}"
+            self.app.log_in_place(frame, "ticker")
+            await asyncio.sleep(interval)
+        if frame:
+            for notifier in self.notifiers:
+                notifier.add_msg_to_queue(frame)
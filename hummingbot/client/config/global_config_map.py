@@ -244,6 +244,14 @@ main_config_map = {
                   type_str="str",
                   required_if=lambda: global_config_map.get("db_engine").value != "sqlite",
                   default="dbname"),
+    "trade_fill_archive_days":
+        ConfigVar(key="trade_fill_archive_days",
+                  prompt="After how many days do you want trades to be moved from the database to the trade "
+                         "archive? >>> ",
+                  type_str="float",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_decimal(v, min_value=0, inclusive=False),
+                  default=None),
     "0x_active_cancels":
         ConfigVar(key="0x_active_cancels",
                   prompt="Enable active order cancellations for 0x exchanges (warning: this costs gas)?  >>> ",
@@ -12,6 +12,7 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.logger.application_warning import ApplicationWarning
 
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill_archive import TradeFillArchive
 
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
 
@@ -37,6 +38,7 @@ from hummingbot.client.config.security import Security
 
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+from hummingbot.core.utils.async_utils import safe_ensure_future
 
 from hummingbot.client.settings import CEXES, DEXES, DERIVATIVES
 
@@ -96,6 +98,10 @@ class HummingbotApplication(*commands):
 
         self.trade_fill_db: SQLConnectionManager = SQLConnectionManager.get_trade_fills_instance()
         self.markets_recorder: Optional[MarketsRecorder] = None
+        archive_days = global_config_map.get("trade_fill_archive_days").value
+        # Config files aren't validated when loaded, a value of 0 or less would archive every trade.
+        if archive_days is not None and float(archive_days) > 0:
+            safe_ensure_future(self.archive_trade_fills(float(archive_days)))
         self._script_iterator = None
         # This is to start fetching trading pairs for auto-complete
         TradingPairFetcher.get_instance()
@@ -106,6 +112,23 @@ class HummingbotApplication(*commands):
             return get_strategy_config_map(self.strategy_name)
         return None
 
+    async def archive_trade_fills(self, archive_days: float):
+        """
+        Moves the trades older than archive_days out of the database into the trade archive, in the background.
+        """
+        before_timestamp: int = int((time.time() - archive_days * 24 * 60 * 60) * 1e3)
+        try:
+            archived_count: int = await self.ev_loop.run_in_executor(
+                None, TradeFillArchive().archive_trade_fills, self.trade_fill_db, before_timestamp
+            )
+            if archived_count > 0:
+                self.logger().info(f"Moved {archived_count} trades older than {archive_days} days to the trade "
+                                   f"archive.")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error("Unexpected error archiving trades.", exc_info=True)
+
     def _notify(self, msg: str):
         self.app.log(msg)
         for notifier in self.notifiers:
@@ -1,9 +1,12 @@
 from collections import defaultdict
 from decimal import Decimal
+import numpy as np
 from typing import (
+    Any,
     Tuple,
     Dict,
-    List)
+    List,
+    Optional)
 from hummingbot.core.event.events import TradeType
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
@@ -41,6 +44,22 @@ def calculate_trade_asset_delta_with_fees(trade: TradeFill) -> Tuple[Decimal, De
     return net_base_delta, net_quote_delta
 
 
+def add_trade_to_asset_stats(asset_stats: Dict[str, Dict[str, Decimal]], trade: TradeFill):
+    """
+    For a trade, adds the spent and acquired amount of the corresponding base and quote asset to asset_stats.
+    """
+    trade_side: str = trade.trade_type
+    base_asset: str = trade.base_asset.upper()
+    quote_asset: str = trade.quote_asset.upper()
+    base_delta, quote_delta = calculate_trade_asset_delta_with_fees(trade)
+    if trade_side == TradeType.SELL.name:
+        asset_stats[base_asset]["spent"] += base_delta
+        asset_stats[quote_asset]["acquired"] += quote_delta
+    elif trade_side == TradeType.BUY.name:
+        asset_stats[base_asset]["acquired"] += base_delta
+        asset_stats[quote_asset]["spent"] += quote_delta
+
+
 def calculate_asset_delta_from_trades(current_strategy_name: str,
                                       market_trading_pair_tuples: List[MarketTradingPairTuple],
                                       raw_queried_trades: List[TradeFill],
@@ -81,17 +100,7 @@ def calculate_asset_delta_from_trades(current_strategy_name: str,
             continue
 
         for trade in queried_trades:
-            # For each trade, calculate the spent and acquired amount of the corresponding base and quote asset
-            trade_side: str = trade.trade_type
-            base_asset: str = trade.base_asset.upper()
-            quote_asset: str = trade.quote_asset.upper()
-            base_delta, quote_delta = calculate_trade_asset_delta_with_fees(trade)
-            if trade_side == TradeType.SELL.name:
-                asset_stats[base_asset]["spent"] += base_delta
-                asset_stats[quote_asset]["acquired"] += quote_delta
-            elif trade_side == TradeType.BUY.name:
-                asset_stats[base_asset]["acquired"] += base_delta
-                asset_stats[quote_asset]["spent"] += quote_delta
+            add_trade_to_asset_stats(asset_stats, trade)
 
         market_trading_pair_stats[market_trading_pair_tuple] = {
             "starting_quote_rate": Decimal(repr(queried_trades[0].price)),
@@ -102,6 +111,61 @@ def calculate_asset_delta_from_trades(current_strategy_name: str,
     return market_trading_pair_stats
 
 
+def calculate_asset_delta_from_columns(columns: Dict[str, np.ndarray]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Same as calculate_asset_delta_from_trades, for every market and trading pair in the trade fill columns of
+    TradeFillArchive, with vectorized float math instead of a Decimal sum per trade.
+
+    :param columns: Trade fill columns, sorted by timestamp
+    :return: Spent and acquired amount of each asset, trade counts, and first and last prices, by (market, trading pair)
+    """
+    market_trading_pair_stats: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    if len(columns["id"]) == 0:
+        return market_trading_pair_stats
+
+    keys: np.ndarray = np.char.add(np.char.add(columns["market"], "\t"), columns["symbol"])
+    unique_keys, first_indices, group = np.unique(keys, return_index=True, return_inverse=True)
+    num_groups: int = len(unique_keys)
+    last_indices: np.ndarray = np.zeros(num_groups, dtype=np.int64)
+    np.maximum.at(last_indices, group, np.arange(len(group)))
+
+    is_buy: np.ndarray = columns["trade_type"] == TradeType.BUY.name
+    is_sell: np.ndarray = columns["trade_type"] == TradeType.SELL.name
+    amount: np.ndarray = columns["amount"]
+    quote_amount: np.ndarray = amount * columns["price"]
+    fee_ratio: np.ndarray = 1 - columns["fee_percent"]
+    flat_fees: np.ndarray = columns["quote_flat_fees"]
+
+    def group_sum(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        return np.bincount(group, weights=np.where(mask, values, 0.0), minlength=num_groups)
+
+    base_acquired: np.ndarray = group_sum(amount * fee_ratio - flat_fees, is_buy)
+    quote_spent: np.ndarray = group_sum(quote_amount, is_buy)
+    base_spent: np.ndarray = group_sum(amount, is_sell)
+    quote_acquired: np.ndarray = group_sum(quote_amount * fee_ratio - flat_fees, is_sell)
+    buy_count: np.ndarray = np.bincount(group, weights=is_buy, minlength=num_groups)
+    sell_count: np.ndarray = np.bincount(group, weights=is_sell, minlength=num_groups)
+
+    for i in range(num_groups):
+        first: int = first_indices[i]
+        base_asset: str = columns["base_asset"][first].upper()
+        quote_asset: str = columns["quote_asset"][first].upper()
+        market_trading_pair_stats[(str(columns["market"][first]), str(columns["symbol"][first]))] = {
+            "base_asset": base_asset,
+            "quote_asset": quote_asset,
+            "starting_quote_rate": float(columns["price"][first]),
+            "end_quote_rate": float(columns["price"][last_indices[i]]),
+            "asset": {
+                base_asset: {"spent": float(base_spent[i]), "acquired": float(base_acquired[i])},
+                quote_asset: {"spent": float(quote_spent[i]), "acquired": float(quote_acquired[i])},
+            },
+            "trade_count": int(buy_count[i] + sell_count[i]),
+            "buy_count": int(buy_count[i]),
+            "sell_count": int(sell_count[i]),
+        }
+    return market_trading_pair_stats
+
+
 def calculate_trade_performance(current_strategy_name: str,
                                 market_trading_pair_tuples: List[MarketTradingPairTuple],
                                 raw_queried_trades: List[TradeFill],
@@ -120,13 +184,36 @@ def calculate_trade_performance(current_strategy_name: str,
     :return: Dictionary consisting of total spent and acquired across whole portfolio in quote value,
              as well as individual assets
     """
-    trade_performance_stats: Dict[str, Decimal] = {}
-    # The final stats will be in primary quote unit for arbitrage and maker quote unit for xemm
-    primary_trading_pair: str = market_trading_pair_tuples[0].trading_pair
     market_trading_pair_stats: Dict[str, Dict[str, Decimal]] = calculate_asset_delta_from_trades(
         current_strategy_name,
         market_trading_pair_tuples,
         raw_queried_trades)
+    return calculate_trade_performance_from_asset_delta(market_trading_pair_tuples,
+                                                        market_trading_pair_stats,
+                                                        starting_balances,
+                                                        secondary_market_conversion_rate)
+
+
+def calculate_trade_performance_from_asset_delta(market_trading_pair_tuples: List[MarketTradingPairTuple],
+                                                 market_trading_pair_stats: Dict[MarketTradingPairTuple, Dict],
+                                                 starting_balances: Dict[str, Dict[str, Decimal]],
+                                                 secondary_market_conversion_rate: Decimal = Decimal("1")) \
+        -> Tuple[Dict, Dict]:
+    """
+    Calculate total spent and acquired amount for the whole portfolio in quote value, from the asset deltas given by
+    calculate_asset_delta_from_trades. market_trading_pair_stats is updated in place.
+
+    :param market_trading_pair_tuples: Current MarketTradingPairTuple
+    :param market_trading_pair_stats: Spent and acquired amount for each asset, for each MarketTradingPairTuple
+    :param starting_balances: Dictionary of starting asset balance for each market, as balance_snapshot on
+    history command.
+    :param secondary_market_conversion_rate: A conversion rate for a secondary market if it differs from the primary.
+    :return: Dictionary consisting of total spent and acquired across whole portfolio in quote value,
+             as well as individual assets
+    """
+    trade_performance_stats: Dict[str, Decimal] = {}
+    # The final stats will be in primary quote unit for arbitrage and maker quote unit for xemm
+    primary_trading_pair: str = market_trading_pair_tuples[0].trading_pair
 
     # Calculate total spent and acquired amount for each trading pair in primary quote value
     for market_trading_pair_tuple, trading_pair_stats in market_trading_pair_stats.items():
@@ -203,3 +290,89 @@ def calculate_trade_performance(current_strategy_name: str,
     trade_performance_stats["portfolio_delta_percentage"] = portfolio_delta_percentage
 
     return trade_performance_stats, market_trading_pair_stats
+
+
+class RunningTradePerformance:
+    """
+    Keeps the asset deltas of calculate_asset_delta_from_trades up to date one trade at a time, so the portfolio
+    performance can be evaluated on every fill without re-querying and re-processing the whole trade history.
+    """
+
+    def __init__(self,
+                 current_strategy_name: str,
+                 market_trading_pair_tuples: List[MarketTradingPairTuple],
+                 raw_queried_trades: Optional[List[TradeFill]] = None):
+        self._current_strategy_name: str = current_strategy_name
+        self._market_trading_pair_tuples: List[MarketTradingPairTuple] = market_trading_pair_tuples
+        self._tuples_by_market_and_pair: Dict[Tuple[str, str], MarketTradingPairTuple] = {
+            (t.market.display_name, t.trading_pair): t for t in market_trading_pair_tuples
+        }
+        self._market_trading_pair_stats: Dict[MarketTradingPairTuple, Dict[str, Any]] = {}
+        self.reset(raw_queried_trades or [])
+
+    @property
+    def trade_count(self) -> int:
+        return sum(s["trade_count"] for s in self._market_trading_pair_stats.values())
+
+    def reset(self, raw_queried_trades: List[TradeFill]):
+        """
+        Rebuilds the asset deltas from scratch from a list of trades in ascending timestamp order.
+        """
+        self._market_trading_pair_stats = {}
+        for market_trading_pair_tuple in self._market_trading_pair_tuples:
+            asset_stats: Dict[str, Dict[str, Decimal]] = defaultdict(
+                lambda: {"spent": s_decimal_0, "acquired": s_decimal_0}
+            )
+            asset_stats[market_trading_pair_tuple.base_asset.upper()] = {"spent": s_decimal_0,
+                                                                         "acquired": s_decimal_0}
+            asset_stats[market_trading_pair_tuple.quote_asset.upper()] = {"spent": s_decimal_0,
+                                                                          "acquired": s_decimal_0}
+            self._market_trading_pair_stats[market_trading_pair_tuple] = {
+                "starting_quote_rate": None,
+                "asset": asset_stats,
+                "trade_count": 0
+            }
+        for trade in raw_queried_trades:
+            self.add_trade(trade)
+
+    def add_trade(self, trade: TradeFill) -> bool:
+        """
+        :return: True if the trade belongs to the strategy's markets and was added to the asset deltas.
+        """
+        if trade.strategy != self._current_strategy_name:
+            return False
+        market_trading_pair_tuple: Optional[MarketTradingPairTuple] = \
+            self._tuples_by_market_and_pair.get((trade.market, trade.symbol))
+        if market_trading_pair_tuple is None:
+            return False
+        trading_pair_stats: Dict[str, Any] = self._market_trading_pair_stats[market_trading_pair_tuple]
+        add_trade_to_asset_stats(trading_pair_stats["asset"], trade)
+        if trading_pair_stats["trade_count"] == 0:
+            trading_pair_stats["starting_quote_rate"] = Decimal(repr(trade.price))
+        trading_pair_stats["trade_count"] += 1
+        return True
+
+    def calculate_trade_performance(self,
+                                    starting_balances: Dict[str, Dict[str, Decimal]],
+                                    secondary_market_conversion_rate: Decimal = Decimal("1")) -> Tuple[Dict, Dict]:
+        """
+        Same as calculate_trade_performance, over the trades added so far.
+        """
+        market_trading_pair_stats: Dict[MarketTradingPairTuple, Dict[str, Any]] = {}
+        for market_trading_pair_tuple, trading_pair_stats in self._market_trading_pair_stats.items():
+            asset_stats: Dict[str, Dict[str, Decimal]] = defaultdict(
+                lambda: {"spent": s_decimal_0, "acquired": s_decimal_0}
+            )
+            for asset, stats in trading_pair_stats["asset"].items():
+                asset_stats[asset] = {"spent": stats["spent"], "acquired": stats["acquired"]}
+            starting_quote_rate: Optional[Decimal] = trading_pair_stats["starting_quote_rate"]
+            market_trading_pair_stats[market_trading_pair_tuple] = {
+                "starting_quote_rate": (starting_quote_rate if starting_quote_rate is not None
+                                        else market_trading_pair_tuple.get_mid_price()),
+                "asset": asset_stats,
+                "trade_count": trading_pair_stats["trade_count"]
+            }
+        return calculate_trade_performance_from_asset_delta(self._market_trading_pair_tuples,
+                                                            market_trading_pair_stats,
+                                                            starting_balances,
+                                                            secondary_market_conversion_rate)
@@ -1,9 +1,15 @@
 from __future__ import unicode_literals
+import asyncio
 import six
 from collections import deque
+from itertools import islice
+import threading
+import time
 from typing import (
     List,
     Deque,
+    Optional,
+    Tuple,
 )
 
 from prompt_toolkit.auto_suggest import DynamicAutoSuggest
@@ -54,7 +60,8 @@ class CustomTextArea:
                  dont_extend_height=False, dont_extend_width=False,
                  line_numbers=False, get_line_prefix=None, scrollbar=False,
                  style='', search_field=None, preview_search=True, prompt='',
-                 input_processors=None, max_line_count=1000, initial_text=""):
+                 input_processors=None, max_line_count=1000, initial_text="",
+                 render_interval=0.05, browse_timeout=30.0):
         assert isinstance(text, six.text_type)
         assert search_field is None or isinstance(search_field, SearchToolbar)
 
@@ -131,8 +138,25 @@ class CustomTextArea:
             right_margins=right_margins,
             get_line_prefix=get_line_prefix)
 
-        self.log_lines: Deque[str] = deque()
+        # Ring buffer of the log lines, the oldest lines are dropped once it is full.
+        self.log_lines: Deque[str] = deque(maxlen=max_line_count)
+        self.render_interval: float = render_interval
+        self.browse_timeout: float = browse_timeout
+        self._render_handle: Optional[asyncio.TimerHandle] = None
+        self._full_history: bool = False
+        # Total number of lines logged so far, and the range of rendered lines, counted the same way.
+        self._line_total: int = 0
+        self._rendered_start: int = 0
+        self._rendered_end: int = 0
+        # When the user last moved the cursor away from the end of the log, None while following the end.
+        self._browse_start: Optional[float] = None
+        self._setting_document: bool = False
+        # The key, end and line count of the lines last logged with log_in_place().
+        self._in_place_block: Optional[Tuple[str, int, int]] = None
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.buffer.on_cursor_position_changed += self._cursor_position_changed
         self.log(initial_text)
+        self._render()
 
     @property
     def text(self):
@@ -171,6 +195,10 @@ class CustomTextArea:
         return self.window
 
     def log(self, text: str):
+        if threading.current_thread() is not threading.main_thread():
+            self._ev_loop.call_soon_threadsafe(self.log, text)
+            return
+
         # Getting the max width of the window area
         if self.window.render_info is None:
             max_width = 100
@@ -193,7 +221,125 @@ class CustomTextArea:
             new_lines.append(line)
 
         self.log_lines.extend(new_lines)
-        while len(self.log_lines) > self.max_line_count:
-            self.log_lines.popleft()
-        new_text: str = "\n".join(self.log_lines)
-        self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
+        self._line_total += len(new_lines)
+        self._schedule_render()
+
+    def log_in_place(self, text: str, key: str):
+        """
+        Logs text that replaces the lines last logged with the same key, as long as nothing else was logged since,
+        e.g. to refresh a table instead of appending a new one every time.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            self._ev_loop.call_soon_threadsafe(self.log_in_place, text, key)
+            return
+        if self._in_place_block is not None:
+            block_key, block_end, block_line_count = self._in_place_block
+            if block_key == key and block_end == self._line_total and block_line_count <= len(self.log_lines):
+                for _ in range(block_line_count):
+                    self.log_lines.pop()
+                self._line_total -= block_line_count
+        start: int = self._line_total
+        self.log(text)
+        self._in_place_block = (key, self._line_total, self._line_total - start)
+
+    def _schedule_render(self, delay: Optional[float] = None):
+        """
+        Coalesces the log calls made within render_interval into a single redraw.
+        """
+        if self._render_handle is not None:
+            return
+        if not self._ev_loop.is_running():
+            self._render()
+            return
+        self._render_handle = self._ev_loop.call_later(self.render_interval if delay is None else delay, self._render)
+
+    def _visible_line_count(self) -> int:
+        """
+        Number of tail lines to render: a few screens worth, so that short scrolls don't need the full history.
+        """
+        if self.window.render_info is None:
+            return 200
+        return max(self.window.render_info.window_height * 4, 200)
+
+    def _browse_time_left(self) -> float:
+        """
+        How long new lines still don't move the view: while the user is browsing, after moving the cursor away from
+        the end of the log by scrolling or searching, until the cursor is back at the end or hasn't moved for
+        browse_timeout seconds. Always browsing while the full history is shown.
+        """
+        if self._full_history:
+            return float("inf")
+        if self._browse_start is None:
+            return 0.0
+        return self._browse_start + self.browse_timeout - time.time()
+
+    def _cursor_position_changed(self, _: Buffer):
+        if self._setting_document:
+            return
+        if self.buffer.cursor_position == len(self.buffer.text):
+            self._browse_start = None
+            if self._rendered_end < self._line_total:
+                self._schedule_render()
+            return
+        self._browse_start = time.time()
+        self._expand_to_full_history()
+
+    def _set_document(self, document: Document):
+        self._setting_document = True
+        try:
+            self.buffer.document = document
+        finally:
+            self._setting_document = False
+
+    def _render(self):
+        self._render_handle = None
+        browse_time_left: float = self._browse_time_left()
+        if browse_time_left > 0:
+            # The lines logged meanwhile are rendered when browsing ends. With the full history shown that's on
+            # follow(), otherwise once the cursor is back at the end or at the browse timeout.
+            if browse_time_left != float("inf") and self._ev_loop.is_running():
+                self._schedule_render(browse_time_left)
+            return
+        self._browse_start = None
+        line_count: int = min(self._visible_line_count(), len(self.log_lines))
+        self._render_lines(list(islice(reversed(self.log_lines), line_count))[::-1])
+
+    def _render_lines(self, lines: List[str]):
+        """
+        Renders the last len(lines) log lines, with the cursor at the end.
+        """
+        new_text: str = "\n".join(lines)
+        self._rendered_start = self._line_total - len(lines)
+        self._rendered_end = self._line_total
+        self._set_document(Document(text=new_text, cursor_position=len(new_text)))
+
+    def _expand_to_full_history(self):
+        """
+        Adds the lines older than the rendered tail in front of it, keeping the cursor on the same line, so the user
+        can keep scrolling back past the tail.
+        """
+        first_line: int = self._line_total - len(self.log_lines)
+        hidden_line_count: int = self._rendered_start - first_line
+        if hidden_line_count <= 0:
+            return
+        document: Document = self.buffer.document
+        hidden_text: str = "\n".join(islice(self.log_lines, hidden_line_count)) + "\n"
+        self._rendered_start = first_line
+        self._set_document(Document(text=hidden_text + document.text,
+                                    cursor_position=len(hidden_text) + document.cursor_position))
+
+    def show_full_history(self):
+        """
+        Renders the whole ring buffer, so that searches cover all the log lines and not only the rendered tail.
+        """
+        self._full_history = True
+        self._browse_start = None
+        self._render_lines(list(self.log_lines))
+
+    def follow(self):
+        """
+        Goes back to following the end of the log with the rendered tail only.
+        """
+        self._full_history = False
+        self._browse_start = None
+        self._render()
@@ -82,6 +82,9 @@ class HummingbotCLI:
     def log(self, text: str):
         self.output_field.log(text)
 
+    def log_in_place(self, text: str, key: str):
+        self.output_field.log_in_place(text, key)
+
     def change_prompt(self, prompt: str, is_password: bool = False):
         self.prompt_text = prompt
         processors = []
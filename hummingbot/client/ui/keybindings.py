@@ -45,11 +45,13 @@ def load_key_bindings(hb) -> KeyBindings:
 
     @bindings.add("c-f", filter=to_filter(not is_searching()))
     def do_find(event):
+        hb.app.log_field.show_full_history()
         start_search(hb.app.log_field.control)
 
     @bindings.add("c-f", filter=is_searching)
     def do_exit_find(event):
         stop_search()
+        hb.app.log_field.follow()
         get_app().layout.focus(hb.app.input_field.control)
         get_app().invalidate()
 
@@ -77,6 +77,9 @@ def load_parser(hummingbot, shortcuts) -> ThrowingArgumentParser:
     status_parser.set_defaults(func=hummingbot.status)
 
     history_parser = subparsers.add_parser("history", help="See the past performance of the current bot")
+    history_parser.add_argument("-d", "--days", type=float, default=None, dest="days",
+                                help="Report the trades of the current strategy config over the last number of days, "
+                                     "including archived trades")
     history_parser.set_defaults(func=hummingbot.history)
 
     exit_parser = subparsers.add_parser("exit", help="Exit and cancel all outstanding orders")
@@ -101,6 +104,10 @@ def load_parser(hummingbot, shortcuts) -> ThrowingArgumentParser:
     ticker_parser.add_argument("--repeat", type=int, default=10, dest="repeat", help="Number of times to refresh the quotes")
     ticker_parser.add_argument("--exchange", type=str, dest="exchange", help="The exchange of the market")
     ticker_parser.add_argument("--market", type=str, dest="market", help="The market (trading pair) of the order book")
+    ticker_parser.add_argument("--all", action="store_true", default=False, dest="all_markets",
+                               help="Show all the markets of the running strategy, or of the exchange if given")
+    ticker_parser.add_argument("--interval", type=float, default=1.0, dest="interval",
+                               help="Number of seconds between refreshes")
     ticker_parser.set_defaults(func=hummingbot.ticker)
 
     script_parser = subparsers.add_parser("script", help="Send command to running script instance")
@@ -53,18 +53,28 @@ class StdoutProxy(object):
         self.encoding = original_stdout.encoding
         self.log_field = log_field
         self._ev_loop = get_event_loop()
+        self._pending_texts = []
 
     def _write_and_flush(self, text):
+        """
+        Queues the text for the log field. Texts written until the event loop gets to them are handed over in a
+        single callback, and the log field coalesces them into a single redraw.
+        """
         if not text:
             return
 
-        def write_and_flush():
-            self.log_field.log(text)
-
-        def schedule_write_and_flush():
-            self._ev_loop.run_in_executor(None, write_and_flush)
+        with self._lock:
+            self._pending_texts.append(text)
+            if len(self._pending_texts) > 1:
+                return
+        self._ev_loop.call_soon_threadsafe(self._log_pending_texts)
 
-        self._ev_loop.call_soon_threadsafe(schedule_write_and_flush)
+    def _log_pending_texts(self):
+        with self._lock:
+            texts = self._pending_texts
+            self._pending_texts = []
+        for text in texts:
+            self.log_field.log(text)
 
     def _write(self, data):
         if '\n' in data:
@@ -0,0 +1,107 @@
+import math
+import time
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+def _format_price(price: float) -> str:
+    return "" if math.isnan(price) else f"{price:.8g}"
+
+
+class TickerRow:
+    """
+    A dashboard row for one order book. It keeps the last update count it has seen, so the price cells are only
+    formatted again after the book has changed.
+    """
+    __slots__ = ("exchange", "trading_pair", "order_book", "update_count", "last_trade_price", "last_change",
+                 "last_refresh", "update_rate", "price_cells")
+
+    def __init__(self, exchange: str, trading_pair: str, order_book: OrderBook, now: float):
+        self.exchange: str = exchange
+        self.trading_pair: str = trading_pair
+        self.order_book: OrderBook = order_book
+        self.update_count: int = -1
+        self.last_trade_price: float = float("NaN")
+        self.last_change: float = now
+        self.last_refresh: float = now
+        self.update_rate: float = 0.0
+        self.price_cells: List[str] = []
+
+    def refresh(self, now: float, rate_smoothing: float):
+        update_count: int = self.order_book.update_count
+        last_trade_price: float = self.order_book.last_trade_price
+        elapsed: float = now - self.last_refresh
+        if self.update_count >= 0 and elapsed > 0:
+            rate: float = (update_count - self.update_count) / elapsed
+            self.update_rate += rate_smoothing * (rate - self.update_rate)
+        self.last_refresh = now
+        if update_count == self.update_count and \
+                (last_trade_price == self.last_trade_price or math.isnan(last_trade_price)):
+            return
+        if update_count != self.update_count:
+            self.last_change = now
+        self.update_count = update_count
+        self.last_trade_price = last_trade_price
+        try:
+            best_bid: float = self.order_book.get_price(False)
+        except EnvironmentError:
+            best_bid = float("NaN")
+        try:
+            best_ask: float = self.order_book.get_price(True)
+        except EnvironmentError:
+            best_ask = float("NaN")
+        self.price_cells = [_format_price(best_bid),
+                            _format_price(best_ask),
+                            _format_price((best_bid + best_ask) / 2),
+                            _format_price(last_trade_price)]
+
+    def cells(self, now: float) -> List[str]:
+        return [self.exchange, self.trading_pair] + self.price_cells + \
+               [f"{self.update_rate:.1f}", f"{now - self.last_change:.1f}"]
+
+
+class TickerDashboard:
+    """
+    Live top of book table for any number of order books, across connectors.
+
+    The order books aren't asked for anything until the next frame: each refresh reads the update counter of every
+    book, and only formats the prices of the books that changed since the previous frame. Frames are plain text with
+    fixed width columns, so a refresh costs a few string operations per row.
+    """
+    COLUMNS: Tuple[str, ...] = ("Exchange", "Market", "Best Bid", "Best Ask", "Mid Price", "Last Trade",
+                                "Updates/s", "Stale (s)")
+    RIGHT_ALIGNED_FROM: int = 2
+
+    def __init__(self, order_books: List[Tuple[str, str, OrderBook]], rate_smoothing: float = 0.5):
+        """
+        :param order_books: (exchange name, trading pair, order book) of every row to show.
+        :param rate_smoothing: Weight of the latest frame in the exponentially smoothed update rates.
+        """
+        now: float = time.time()
+        self._rows: List[TickerRow] = [TickerRow(exchange, trading_pair, order_book, now)
+                                       for exchange, trading_pair, order_book in order_books]
+        self._rate_smoothing: float = rate_smoothing
+
+    @property
+    def rows(self) -> List[TickerRow]:
+        return self._rows
+
+    def refresh(self, now: Optional[float] = None) -> str:
+        """
+        Reads the latest state of the order books and returns the table text.
+        """
+        now = time.time() if now is None else now
+        for row in self._rows:
+            row.refresh(now, self._rate_smoothing)
+        table: List[List[str]] = [list(self.COLUMNS)] + [row.cells(now) for row in self._rows]
+        widths: List[int] = [max(len(line[i]) for line in table) for i in range(len(self.COLUMNS))]
+        lines: List[str] = []
+        for line in table:
+            lines.append("  ".join(cell.ljust(width) if i < self.RIGHT_ALIGNED_FROM else cell.rjust(width)
+                                   for i, (cell, width) in enumerate(zip(line, widths))))
+        return "\n".join(lines)
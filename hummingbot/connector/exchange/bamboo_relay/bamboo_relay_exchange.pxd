@@ -19,7 +19,7 @@ cdef class BambooRelayExchange(ExchangeBase):
         double _last_update_trading_rules_timestamp
         double _last_update_available_balance_timestamp
         double _poll_interval
-        dict _in_flight_limit_orders
+        object _in_flight_limit_orders
         dict _in_flight_market_orders
         object _in_flight_pending_limit_orders
         object _in_flight_cancels
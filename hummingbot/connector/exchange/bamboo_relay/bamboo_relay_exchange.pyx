@@ -54,6 +54,7 @@ from hummingbot.connector.exchange.bamboo_relay.bamboo_relay_order_book_tracker
 from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.connector.in_flight_order_registry import InFlightOrderRegistry
 from hummingbot.core.event.events import OrderType
 from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
 from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
@@ -166,7 +167,7 @@ cdef class BambooRelayExchange(ExchangeBase):
         self._last_update_trading_rules_timestamp = 0
         self._last_update_available_balance_timestamp = 0
         self._poll_interval = poll_interval
-        self._in_flight_limit_orders = {}   # limit orders are off chain
+        self._in_flight_limit_orders = InFlightOrderRegistry()   # limit orders are off chain
         self._in_flight_market_orders = {}  # market orders are on chain
         self._in_flight_pending_limit_orders = OrderedDict()  # in the case that an order needs to be cancelled before its been accepted
         self._in_flight_cancels = OrderedDict()
@@ -324,7 +325,7 @@ cdef class BambooRelayExchange(ExchangeBase):
 
     def reset_state(self):
         self._in_flight_market_orders = {}
-        self._in_flight_limit_orders = {}
+        self._in_flight_limit_orders = InFlightOrderRegistry()
         self._in_flight_pending_limit_orders = OrderedDict()
         self._in_flight_cancels = OrderedDict()
         self._in_flight_pending_cancels = OrderedDict()
@@ -567,90 +568,89 @@ cdef class BambooRelayExchange(ExchangeBase):
             int quote_asset_decimals
             BambooRelayInFlightOrder tracked_limit_order
 
-        tracked_limit_orders = list(self._in_flight_limit_orders.values())
-
-        for tracked_limit_order in tracked_limit_orders:
-            if tracked_limit_order.exchange_order_id == fill_event.order_hash:
-                previous_is_done = tracked_limit_order.is_done
-
-                if not previous_is_done:
-                    order_remaining_base_token_amount = tracked_limit_order.available_amount_base
-
-                    trading_pair_rules = self.trading_rules.get(tracked_limit_order.trading_pair)
-                    base_asset_decimals = -int(math.ceil(math.log10(float(trading_pair_rules.min_base_amount_increment))))
-                    quote_asset_decimals = -int(math.ceil(math.log10(float(trading_pair_rules.min_quote_amount_increment))))
+        tracked_limit_order = self._in_flight_limit_orders.get_by_exchange_order_id(fill_event.order_hash)
+        if tracked_limit_order is None:
+            return
 
-                    order_filled_base_token_amount = s_decimal_0
-                    order_filled_quote_token_amount = s_decimal_0
+        previous_is_done = tracked_limit_order.is_done
 
-                    # Each update has a list of fills, we only process these once
-                    if fill_event.tx_hash not in tracked_limit_order.recorded_fills:
-                        if tracked_limit_order.trade_type is TradeType.BUY:
-                            order_filled_base_token_amount = fill_event.taker_asset_filled_amount / Decimal(f"1e{base_asset_decimals}")
-                            order_filled_quote_token_amount = fill_event.maker_asset_filled_amount / Decimal(f"1e{quote_asset_decimals}")
-                        else:
-                            order_filled_base_token_amount = fill_event.maker_asset_filled_amount / Decimal(f"1e{base_asset_decimals}")
-                            order_filled_quote_token_amount = fill_event.taker_asset_filled_amount / Decimal(f"1e{quote_asset_decimals}")
+        if not previous_is_done:
+            order_remaining_base_token_amount = tracked_limit_order.available_amount_base
 
-                        if order_filled_base_token_amount > 0:
-                            tracked_limit_order.recorded_fills.append(fill_event.tx_hash)
+            trading_pair_rules = self.trading_rules.get(tracked_limit_order.trading_pair)
+            base_asset_decimals = -int(math.ceil(math.log10(float(trading_pair_rules.min_base_amount_increment))))
+            quote_asset_decimals = -int(math.ceil(math.log10(float(trading_pair_rules.min_quote_amount_increment))))
 
-                    tracked_limit_order.available_amount_base = order_remaining_base_token_amount - order_filled_base_token_amount
+            order_filled_base_token_amount = s_decimal_0
+            order_filled_quote_token_amount = s_decimal_0
 
-                    if tracked_limit_order.available_amount_base < 0:
-                        tracked_limit_order.available_amount_base = 0
+            # Each update has a list of fills, we only process these once
+            if fill_event.tx_hash not in tracked_limit_order.recorded_fills:
+                if tracked_limit_order.trade_type is TradeType.BUY:
+                    order_filled_base_token_amount = fill_event.taker_asset_filled_amount / Decimal(f"1e{base_asset_decimals}")
+                    order_filled_quote_token_amount = fill_event.maker_asset_filled_amount / Decimal(f"1e{quote_asset_decimals}")
+                else:
+                    order_filled_base_token_amount = fill_event.maker_asset_filled_amount / Decimal(f"1e{base_asset_decimals}")
+                    order_filled_quote_token_amount = fill_event.taker_asset_filled_amount / Decimal(f"1e{quote_asset_decimals}")
 
-                    if order_filled_base_token_amount > 0:
-                        tracked_limit_order.executed_amount_base = tracked_limit_order.executed_amount_base + order_filled_base_token_amount
-                        tracked_limit_order.executed_amount_quote = tracked_limit_order.executed_amount_quote + order_filled_quote_token_amount
-                        self.logger().info(f"Filled {order_filled_base_token_amount} out of {tracked_limit_order.amount} of the "
-                                           f"limit order {tracked_limit_order.client_order_id} according to the RPC transaction logs.")
-                        self.c_trigger_event(
-                            self.MARKET_ORDER_FILLED_EVENT_TAG,
-                            OrderFilledEvent(
-                                current_timestamp,
-                                tracked_limit_order.client_order_id,
-                                tracked_limit_order.trading_pair,
-                                tracked_limit_order.trade_type,
-                                OrderType.LIMIT,
-                                tracked_limit_order.price,
-                                order_filled_base_token_amount,
-                                TradeFee(0.0),  # no fee for limit order fills
-                                tracked_limit_order.exchange_order_id,  # Use order hash for limit order validation
-                            )
-                        )
-                    if tracked_limit_order.available_amount_base == 0:
-                        tracked_limit_order.last_state = "FILLED"
-                        self.c_expire_order(tracked_limit_order.client_order_id, 60)
-                        # Remove from log tracking
-                        safe_ensure_future(self._wallet.current_backend.zeroex_fill_watcher.unwatch_order_hash(tracked_limit_order.exchange_order_id))
-                        if tracked_limit_order.trade_type is TradeType.BUY:
-                            self.logger().info(f"The limit buy order {tracked_limit_order.client_order_id} "
-                                               f"has completed according to the RPC transaction logs.")
-                            self.c_trigger_event(self.MARKET_BUY_ORDER_COMPLETED_EVENT_TAG,
-                                                 BuyOrderCompletedEvent(current_timestamp,
-                                                                        tracked_limit_order.client_order_id,
-                                                                        tracked_limit_order.base_asset,
-                                                                        tracked_limit_order.quote_asset,
-                                                                        tracked_limit_order.quote_asset,
-                                                                        tracked_limit_order.executed_amount_base,
-                                                                        tracked_limit_order.executed_amount_quote,
-                                                                        tracked_limit_order.protocol_fee_amount,
-                                                                        OrderType.LIMIT))
-                        else:
-                            self.logger().info(f"The limit sell order {tracked_limit_order.client_order_id} "
-                                               f"has completed according to the RPC transaction logs.")
-                            self.c_trigger_event(self.MARKET_SELL_ORDER_COMPLETED_EVENT_TAG,
-                                                 SellOrderCompletedEvent(current_timestamp,
-                                                                         tracked_limit_order.client_order_id,
-                                                                         tracked_limit_order.base_asset,
-                                                                         tracked_limit_order.quote_asset,
-                                                                         tracked_limit_order.quote_asset,
-                                                                         tracked_limit_order.executed_amount_base,
-                                                                         tracked_limit_order.executed_amount_quote,
-                                                                         tracked_limit_order.protocol_fee_amount,
-                                                                         OrderType.LIMIT))
-                return
+                if order_filled_base_token_amount > 0:
+                    tracked_limit_order.recorded_fills.append(fill_event.tx_hash)
+
+            tracked_limit_order.available_amount_base = order_remaining_base_token_amount - order_filled_base_token_amount
+
+            if tracked_limit_order.available_amount_base < 0:
+                tracked_limit_order.available_amount_base = 0
+
+            if order_filled_base_token_amount > 0:
+                tracked_limit_order.executed_amount_base = tracked_limit_order.executed_amount_base + order_filled_base_token_amount
+                tracked_limit_order.executed_amount_quote = tracked_limit_order.executed_amount_quote + order_filled_quote_token_amount
+                self.logger().info(f"Filled {order_filled_base_token_amount} out of {tracked_limit_order.amount} of the "
+                                   f"limit order {tracked_limit_order.client_order_id} according to the RPC transaction logs.")
+                self.c_trigger_event(
+                    self.MARKET_ORDER_FILLED_EVENT_TAG,
+                    OrderFilledEvent(
+                        current_timestamp,
+                        tracked_limit_order.client_order_id,
+                        tracked_limit_order.trading_pair,
+                        tracked_limit_order.trade_type,
+                        OrderType.LIMIT,
+                        tracked_limit_order.price,
+                        order_filled_base_token_amount,
+                        TradeFee(0.0),  # no fee for limit order fills
+                        tracked_limit_order.exchange_order_id,  # Use order hash for limit order validation
+                    )
+                )
+            if tracked_limit_order.available_amount_base == 0:
+                tracked_limit_order.last_state = "FILLED"
+                self.c_expire_order(tracked_limit_order.client_order_id, 60)
+                # Remove from log tracking
+                safe_ensure_future(self._wallet.current_backend.zeroex_fill_watcher.unwatch_order_hash(tracked_limit_order.exchange_order_id))
+                if tracked_limit_order.trade_type is TradeType.BUY:
+                    self.logger().info(f"The limit buy order {tracked_limit_order.client_order_id} "
+                                       f"has completed according to the RPC transaction logs.")
+                    self.c_trigger_event(self.MARKET_BUY_ORDER_COMPLETED_EVENT_TAG,
+                                         BuyOrderCompletedEvent(current_timestamp,
+                                                                tracked_limit_order.client_order_id,
+                                                                tracked_limit_order.base_asset,
+                                                                tracked_limit_order.quote_asset,
+                                                                tracked_limit_order.quote_asset,
+                                                                tracked_limit_order.executed_amount_base,
+                                                                tracked_limit_order.executed_amount_quote,
+                                                                tracked_limit_order.protocol_fee_amount,
+                                                                OrderType.LIMIT))
+                else:
+                    self.logger().info(f"The limit sell order {tracked_limit_order.client_order_id} "
+                                       f"has completed according to the RPC transaction logs.")
+                    self.c_trigger_event(self.MARKET_SELL_ORDER_COMPLETED_EVENT_TAG,
+                                         SellOrderCompletedEvent(current_timestamp,
+                                                                 tracked_limit_order.client_order_id,
+                                                                 tracked_limit_order.base_asset,
+                                                                 tracked_limit_order.quote_asset,
+                                                                 tracked_limit_order.quote_asset,
+                                                                 tracked_limit_order.executed_amount_base,
+                                                                 tracked_limit_order.executed_amount_quote,
+                                                                 tracked_limit_order.protocol_fee_amount,
+                                                                 OrderType.LIMIT))
 
     async def _update_limit_order_status(self):
         cdef:
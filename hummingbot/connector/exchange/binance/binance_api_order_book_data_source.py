@@ -6,7 +6,7 @@ import logging
 import pandas as pd
 from typing import (
     Any,
-    AsyncIterable,
+    Callable,
     Dict,
     List,
     Optional
@@ -16,9 +16,6 @@ import re
 import requests
 import cachetools.func
 import time
-import ujson
-import websockets
-from websockets.exceptions import ConnectionClosed
 
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -27,20 +24,17 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
 from hummingbot.connector.exchange.binance.binance_utils import convert_to_exchange_trading_pair
+from hummingbot.connector.exchange.binance.binance_websocket_manager import BinanceWebSocketManager
 
 TRADING_PAIR_FILTER = re.compile(r"(BTC|ETH|USDT)$")
 
 SNAPSHOT_REST_URL = "https://api.binance.com/api/v1/depth"
-DIFF_STREAM_URL = "wss://stream.binance.com:9443/ws"
 TICKER_PRICE_CHANGE_URL = "https://api.binance.com/api/v1/ticker/24hr"
 EXCHANGE_INFO_URL = "https://api.binance.com/api/v1/exchangeInfo"
 
 
 class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
-    MESSAGE_TIMEOUT = 30.0
-    PING_TIMEOUT = 10.0
-
     _baobds_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -49,9 +43,24 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
             cls._baobds_logger = logging.getLogger(__name__)
         return cls._baobds_logger
 
-    def __init__(self, trading_pairs: List[str]):
+    def __init__(self,
+                 trading_pairs: List[str],
+                 periodic_snapshots: bool = False,
+                 ws_manager: Optional[BinanceWebSocketManager] = None):
+        """
+        :param periodic_snapshots: Whether to also refresh every order book from a REST snapshot every hour. Not needed
+                                   for the books to stay in sync, as the tracker resyncs a book when its diffs skip
+                                   updates.
+        :param ws_manager: The websocket connections to share with the exchange's other streams.
+        """
         super().__init__(trading_pairs)
         self._order_book_create_function = lambda: OrderBook()
+        self._periodic_snapshots: bool = periodic_snapshots
+        self._ws_manager: BinanceWebSocketManager = ws_manager or BinanceWebSocketManager()
+
+    @property
+    def ws_manager(self) -> BinanceWebSocketManager:
+        return self._ws_manager
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
@@ -116,81 +125,57 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
             return data
 
-    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+    async def get_order_book_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
         async with aiohttp.ClientSession() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
             snapshot_timestamp: float = time.time()
-            snapshot_msg: OrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(
+            return BinanceOrderBook.snapshot_message_from_exchange(
                 snapshot,
                 snapshot_timestamp,
                 metadata={"trading_pair": trading_pair}
             )
-            order_book = self.order_book_create_function()
-            order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
-            return order_book
 
-    async def _inner_messages(self,
-                              ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
-        # Terminate the recv() loop as soon as the next message timed out, so the outer loop can reconnect.
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        snapshot_msg: OrderBookMessage = await self.get_order_book_snapshot_message(trading_pair)
+        order_book = self.order_book_create_function()
+        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        return order_book
+
+    def _stream_channels(self, stream: str) -> List[str]:
+        return [f"{convert_to_exchange_trading_pair(trading_pair).lower()}@{stream}"
+                for trading_pair in self._trading_pairs]
+
+    async def _listen_for_stream(self,
+                                 stream: str,
+                                 output: asyncio.Queue,
+                                 message_parser: Callable[[Dict[str, Any]], OrderBookMessage]):
+        """
+        Converts the messages of one stream of every trading pair, received through the websocket manager.
+        """
+        channels: List[str] = self._stream_channels(stream)
+        payloads: asyncio.Queue = asyncio.Queue()
+        self._ws_manager.subscribe(channels, payloads)
         try:
             while True:
+                payload: Dict[str, Any] = await payloads.get()
                 try:
-                    msg: str = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
-                    yield msg
-                except asyncio.TimeoutError:
-                    try:
-                        pong_waiter = await ws.ping()
-                        await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
-                    except asyncio.TimeoutError:
-                        raise
-        except asyncio.TimeoutError:
-            self.logger().warning("WebSocket ping timed out. Going to reconnect...")
-            return
-        except ConnectionClosed:
-            return
+                    output.put_nowait(message_parser(payload))
+                except Exception:
+                    self.logger().error(f"Unexpected error parsing Binance {stream} message {payload}.",
+                                        exc_info=True)
         finally:
-            await ws.close()
+            self._ws_manager.unsubscribe(channels)
 
     async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                ws_path: str = "/".join([f"{convert_to_exchange_trading_pair(trading_pair).lower()}@trade" for trading_pair in self._trading_pairs])
-                stream_url: str = f"{DIFF_STREAM_URL}/{ws_path}"
-
-                async with websockets.connect(stream_url) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
-                        trade_msg: OrderBookMessage = BinanceOrderBook.trade_message_from_exchange(msg)
-                        output.put_nowait(trade_msg)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
-                                    exc_info=True)
-                await asyncio.sleep(30.0)
+        await self._listen_for_stream("trade", output, BinanceOrderBook.trade_message_from_exchange)
 
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                ws_path: str = "/".join([f"{convert_to_exchange_trading_pair(trading_pair).lower()}@depth" for trading_pair in self._trading_pairs])
-                stream_url: str = f"{DIFF_STREAM_URL}/{ws_path}"
-
-                async with websockets.connect(stream_url) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
-                        order_book_message: OrderBookMessage = BinanceOrderBook.diff_message_from_exchange(
-                            msg, time.time())
-                        output.put_nowait(order_book_message)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
-                                    exc_info=True)
-                await asyncio.sleep(30.0)
+        await self._listen_for_stream("depth", output,
+                                      lambda payload: BinanceOrderBook.diff_message_from_exchange(payload, time.time()))
 
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        if not self._periodic_snapshots:
+            return
         while True:
             try:
                 async with aiohttp.ClientSession() as client:
@@ -3,16 +3,12 @@
 import asyncio
 import aiohttp
 import logging
-import time
 from typing import (
-    AsyncIterable,
     Dict,
     Optional
 )
-import ujson
-import websockets
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.connector.exchange.binance.binance_websocket_manager import BinanceWebSocketManager
 from binance.client import Client as BinanceClient
 from hummingbot.logger import HummingbotLogger
 
@@ -22,9 +18,6 @@ BINANCE_USER_STREAM_ENDPOINT = "userDataStream"
 
 class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
-    MESSAGE_TIMEOUT = 30.0
-    PING_TIMEOUT = 10.0
-
     _bausds_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -33,16 +26,21 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
             cls._bausds_logger = logging.getLogger(__name__)
         return cls._bausds_logger
 
-    def __init__(self, binance_client: BinanceClient):
+    def __init__(self, binance_client: BinanceClient, ws_manager: Optional[BinanceWebSocketManager] = None):
+        """
+        :param ws_manager: The websocket connections to share with the exchange's other streams. The user stream is
+                           subscribed to on them with its listen key.
+        """
         self._binance_client: BinanceClient = binance_client
+        self._ws_manager: BinanceWebSocketManager = ws_manager or BinanceWebSocketManager()
         self._current_listen_key = None
-        self._listen_for_user_stream_task = None
-        self._last_recv_time: float = 0
         super().__init__()
 
     @property
     def last_recv_time(self) -> float:
-        return self._last_recv_time
+        if self._current_listen_key is None:
+            return 0
+        return self._ws_manager.last_recv_time(self._current_listen_key)
 
     async def get_listen_key(self):
         async with aiohttp.ClientSession() as client:
@@ -65,41 +63,6 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     return False
                 return True
 
-    async def _inner_messages(self, ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
-        # Terminate the recv() loop as soon as the next message timed out, so the outer loop can reconnect.
-        try:
-            while True:
-                try:
-                    msg: str = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
-                    self._last_recv_time = time.time()
-                    yield msg
-                except asyncio.TimeoutError:
-                    try:
-                        pong_waiter = await ws.ping()
-                        await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
-                        self._last_recv_time = time.time()
-                    except asyncio.TimeoutError:
-                        raise
-        except asyncio.TimeoutError:
-            self.logger().warning("WebSocket ping timed out. Going to reconnect...")
-            return
-        except websockets.exceptions.ConnectionClosed:
-            return
-        finally:
-            await ws.close()
-
-    async def messages(self) -> AsyncIterable[str]:
-        async with (await self.get_ws_connection()) as ws:
-            async for msg in self._inner_messages(ws):
-                yield msg
-
-    async def get_ws_connection(self) -> websockets.WebSocketClientProtocol:
-        stream_url: str = f"wss://stream.binance.com:9443/ws/{self._current_listen_key}"
-        self.logger().info(f"Reconnecting to {stream_url}.")
-
-        # Create the WS connection.
-        return websockets.connect(stream_url)
-
     async def listen_for_user_stream(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         try:
             while True:
@@ -107,17 +70,13 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     if self._current_listen_key is None:
                         self._current_listen_key = await self.get_listen_key()
                         self.logger().debug(f"Obtained listen key {self._current_listen_key}.")
-                        if self._listen_for_user_stream_task is not None:
-                            self._listen_for_user_stream_task.cancel()
-                        self._listen_for_user_stream_task = safe_ensure_future(self.log_user_stream(output))
+                        self._ws_manager.subscribe([self._current_listen_key], output)
                         await self.wait_til_next_tick(seconds=60.0)
 
                     success: bool = await self.ping_listen_key(self._current_listen_key)
                     if not success:
+                        self._ws_manager.unsubscribe([self._current_listen_key])
                         self._current_listen_key = None
-                        if self._listen_for_user_stream_task is not None:
-                            self._listen_for_user_stream_task.cancel()
-                            self._listen_for_user_stream_task = None
                         continue
                     self.logger().debug(f"Refreshed listen key {self._current_listen_key}.")
 
@@ -129,20 +88,7 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
                                         "5 seconds...", exc_info=True)
                     await asyncio.sleep(5)
         finally:
-            # Make sure no background task is leaked.
-            if self._listen_for_user_stream_task is not None:
-                self._listen_for_user_stream_task.cancel()
-                self._listen_for_user_stream_task = None
+            # Make sure no subscription is leaked.
+            if self._current_listen_key is not None:
+                self._ws_manager.unsubscribe([self._current_listen_key])
             self._current_listen_key = None
-
-    async def log_user_stream(self, output: asyncio.Queue):
-        while True:
-            try:
-                async for message in self.messages():
-                    decoded: Dict[str, any] = ujson.loads(message)
-                    output.put_nowait(decoded)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error. Retrying after 5 seconds...", exc_info=True)
-                await asyncio.sleep(5.0)
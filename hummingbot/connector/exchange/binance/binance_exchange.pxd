@@ -6,6 +6,7 @@ from hummingbot.core.data_type.transaction_tracker cimport TransactionTracker
 cdef class BinanceExchange(ExchangeBase):
     cdef:
         object _user_stream_tracker
+        object _ws_manager
         object _binance_client
         object _ev_loop
         object _poll_notifier
@@ -25,6 +26,7 @@ cdef class BinanceExchange(ExchangeBase):
         object _async_scheduler
         object _set_server_time_offset_task
         object _throttler
+        object _trade_id_cursors
 
     cdef c_did_timeout_tx(self, str tracking_id)
     cdef c_start_tracking_order(self,
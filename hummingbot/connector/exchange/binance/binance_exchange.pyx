@@ -55,10 +55,12 @@ from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.transaction_tracker import TransactionTracker
 from hummingbot.connector.trading_rule cimport TradingRule
+from hummingbot.connector.trade_id_cursors import TradeIdCursors
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
 from .binance_order_book_tracker import BinanceOrderBookTracker
 from .binance_user_stream_tracker import BinanceUserStreamTracker
+from .binance_websocket_manager import BinanceWebSocketManager
 from .binance_time import BinanceTime
 from .binance_in_flight_order import BinanceInFlightOrder
 from .binance_utils import (
@@ -68,6 +70,7 @@ from .binance_utils import (
 s_logger = None
 s_decimal_0 = Decimal(0)
 s_decimal_NaN = Decimal("nan")
+TRADE_ID_CURSORS_KEY = "__trade_id_cursors__"
 BROKER_ID = "x-XEKWYICX"
 
 
@@ -131,9 +134,12 @@ cdef class BinanceExchange(ExchangeBase):
         self.monkey_patch_binance_time()
         super().__init__()
         self._trading_required = trading_required
-        self._order_book_tracker = BinanceOrderBookTracker(trading_pairs=trading_pairs)
+        # The order book, trade and user streams share the websocket connections.
+        self._ws_manager = BinanceWebSocketManager()
+        self._order_book_tracker = BinanceOrderBookTracker(trading_pairs=trading_pairs, ws_manager=self._ws_manager)
         self._binance_client = BinanceClient(binance_api_key, binance_api_secret)
-        self._user_stream_tracker = BinanceUserStreamTracker(binance_client=self._binance_client)
+        self._user_stream_tracker = BinanceUserStreamTracker(binance_client=self._binance_client,
+                                                             ws_manager=self._ws_manager)
         self._ev_loop = asyncio.get_event_loop()
         self._poll_notifier = asyncio.Event()
         self._last_timestamp = 0
@@ -149,6 +155,7 @@ cdef class BinanceExchange(ExchangeBase):
         self._async_scheduler = AsyncCallScheduler(call_interval=0.5)
         self._last_poll_timestamp = 0
         self._throttler = Throttler((10.0, 1.0))
+        self._trade_id_cursors = TradeIdCursors()
 
     @property
     def name(self) -> str:
@@ -162,6 +169,10 @@ cdef class BinanceExchange(ExchangeBase):
     def binance_client(self) -> BinanceClient:
         return self._binance_client
 
+    @property
+    def ws_manager(self) -> BinanceWebSocketManager:
+        return self._ws_manager
+
     @property
     def trading_rules(self) -> Dict[str, TradingRule]:
         return self._trading_rules
@@ -177,12 +188,21 @@ cdef class BinanceExchange(ExchangeBase):
             for in_flight_order in self._in_flight_orders.values()
         ]
 
+    @property
+    def trade_id_cursors(self) -> TradeIdCursors:
+        return self._trade_id_cursors
+
     @property
     def tracking_states(self) -> Dict[str, any]:
-        return {
+        retval = {
             key: value.to_json()
             for key, value in self._in_flight_orders.items()
         }
+        # The trade id cursors are only saved while there are orders to track, so the saved states stay empty once
+        # all orders are done. Trades made while no orders are tracked are of no interest to the poller anyway.
+        if len(retval) > 0 and len(self._trade_id_cursors) > 0:
+            retval[TRADE_ID_CURSORS_KEY] = self._trade_id_cursors.to_json()
+        return retval
 
     @property
     def order_book_tracker(self) -> BinanceOrderBookTracker:
@@ -193,9 +213,11 @@ cdef class BinanceExchange(ExchangeBase):
         return self._user_stream_tracker
 
     def restore_tracking_states(self, saved_states: Dict[str, any]):
+        self._trade_id_cursors = TradeIdCursors.from_json(saved_states.get(TRADE_ID_CURSORS_KEY))
         self._in_flight_orders.update({
             key: BinanceInFlightOrder.from_json(value)
             for key, value in saved_states.items()
+            if key != TRADE_ID_CURSORS_KEY
         })
 
     async def get_active_exchange_markets(self) -> pd.DataFrame:
@@ -393,8 +415,7 @@ cdef class BinanceExchange(ExchangeBase):
                 trading_pairs_to_order_map[o.trading_pair][o.exchange_order_id] = o
 
             trading_pairs = list(trading_pairs_to_order_map.keys())
-            tasks = [self.query_api(self._binance_client.get_my_trades, symbol=convert_to_exchange_trading_pair(trading_pair))
-                     for trading_pair in trading_pairs]
+            tasks = [self._fetch_new_trades(trading_pair) for trading_pair in trading_pairs]
             self.logger().debug("Polling for order fills of %d trading pairs.", len(tasks))
             results = await safe_gather(*tasks, return_exceptions=True)
             for trades, trading_pair in zip(results, trading_pairs):
@@ -405,6 +426,7 @@ cdef class BinanceExchange(ExchangeBase):
                         app_warning_msg=f"Failed to fetch trade update for {trading_pair}."
                     )
                     continue
+                trades = self._trade_id_cursors.new_trades(trading_pair, trades)
                 for trade in trades:
                     order_id = str(trade["orderId"])
                     if order_id in order_map:
@@ -430,6 +452,23 @@ cdef class BinanceExchange(ExchangeBase):
                                                          Decimal(trade["qty"])),
                                                      exchange_trade_id=trade["id"]
                                                  ))
+                # Orders that have not been acknowledged by the exchange yet can't be matched against their trades,
+                # so hold the cursor until all the orders of the trading pair have an exchange order id.
+                if len(trades) > 0 and None not in order_map:
+                    self._trade_id_cursors.advance(trading_pair, trades[-1]["id"])
+
+    async def _fetch_new_trades(self, trading_pair: str) -> List[Dict[str, Any]]:
+        """
+        Fetches the account trades of a trading pair that are newer than the pair's trade id cursor. Without a
+        cursor (first poll), this falls back to the most recent trades.
+        """
+        from_id = self._trade_id_cursors.next_trade_id(trading_pair)
+        if from_id is None:
+            return await self.query_api(self._binance_client.get_my_trades,
+                                        symbol=convert_to_exchange_trading_pair(trading_pair))
+        return await self.query_api(self._binance_client.get_my_trades,
+                                    symbol=convert_to_exchange_trading_pair(trading_pair),
+                                    fromId=from_id)
 
     async def _update_order_status(self):
         cdef:
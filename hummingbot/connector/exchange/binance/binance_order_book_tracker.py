@@ -14,6 +14,7 @@ from typing import (
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
+from hummingbot.connector.exchange.binance.binance_websocket_manager import BinanceWebSocketManager
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 
@@ -28,9 +29,13 @@ class BinanceOrderBookTracker(OrderBookTracker):
         return cls._bobt_logger
 
     def __init__(self,
-                 trading_pairs: Optional[List[str]] = None):
+                 trading_pairs: Optional[List[str]] = None,
+                 periodic_snapshots: bool = False,
+                 ws_manager: Optional[BinanceWebSocketManager] = None):
         super().__init__(
-            data_source=BinanceAPIOrderBookDataSource(trading_pairs=trading_pairs),
+            data_source=BinanceAPIOrderBookDataSource(trading_pairs=trading_pairs,
+                                                      periodic_snapshots=periodic_snapshots,
+                                                      ws_manager=ws_manager),
             trading_pairs=trading_pairs
         )
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
@@ -114,7 +119,9 @@ class BinanceOrderBookTracker(OrderBookTracker):
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
+                    last_update_id: int = max(order_book.snapshot_uid, order_book.last_diff_uid)
                     order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    self._check_diff(trading_pair, order_book, message, last_update_id)
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
@@ -130,6 +137,7 @@ class BinanceOrderBookTracker(OrderBookTracker):
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    self._resync_requests.pop(trading_pair, None)
                     self.logger().debug("Processed order book snapshot for %s.", trading_pair)
             except asyncio.CancelledError:
                 raise
@@ -13,6 +13,7 @@ from hummingbot.core.utils.async_utils import (
     safe_gather,
 )
 from .binance_api_user_stream_data_source import BinanceAPIUserStreamDataSource
+from .binance_websocket_manager import BinanceWebSocketManager
 from binance.client import Client as BinanceClient
 
 
@@ -25,9 +26,12 @@ class BinanceUserStreamTracker(UserStreamTracker):
             cls._bust_logger = logging.getLogger(__name__)
         return cls._bust_logger
 
-    def __init__(self, binance_client: Optional[BinanceClient] = None):
+    def __init__(self,
+                 binance_client: Optional[BinanceClient] = None,
+                 ws_manager: Optional[BinanceWebSocketManager] = None):
         super().__init__()
         self._binance_client: BinanceClient = binance_client
+        self._ws_manager: Optional[BinanceWebSocketManager] = ws_manager
         self._ev_loop: asyncio.events.AbstractEventLoop = asyncio.get_event_loop()
         self._data_source: Optional[UserStreamTrackerDataSource] = None
         self._user_stream_tracking_task: Optional[asyncio.Task] = None
@@ -35,7 +39,8 @@ class BinanceUserStreamTracker(UserStreamTracker):
     @property
     def data_source(self) -> UserStreamTrackerDataSource:
         if not self._data_source:
-            self._data_source = BinanceAPIUserStreamDataSource(binance_client=self._binance_client)
+            self._data_source = BinanceAPIUserStreamDataSource(binance_client=self._binance_client,
+                                                               ws_manager=self._ws_manager)
         return self._data_source
 
     @property
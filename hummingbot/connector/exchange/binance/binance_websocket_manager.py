@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+import ujson
+
+from hummingbot.core.utils.websocket_manager import WebSocketManager
+
+COMBINED_STREAM_URL = "wss://stream.binance.com:9443/stream"
+
+
+class BinanceWebSocketManager(WebSocketManager):
+    """
+    Binance combined streams. A channel is a stream name, e.g. "ethusdt@depth", or a user stream listen key, and its
+    messages come as {"stream": <channel>, "data": <payload>}.
+    """
+    MAX_CHANNELS_PER_CONNECTION: int = 1024
+    MAX_CHANNELS_PER_MESSAGE: int = 200
+    # Binance closes connections that send more than 5 messages per second, pings and pongs included. The
+    # subscription messages are sent below that, up to 6 of them when subscribing to all of a connection's channels.
+    MAX_MESSAGES_PER_SECOND: float = 4.0
+
+    def __init__(self, url: str = COMBINED_STREAM_URL):
+        super().__init__(url)
+        self._last_request_id: int = 0
+
+    def subscription_messages(self, channels: List[str], subscribe: bool) -> List[str]:
+        messages: List[str] = []
+        for i in range(0, len(channels), self.MAX_CHANNELS_PER_MESSAGE):
+            self._last_request_id += 1
+            messages.append(ujson.dumps({"method": "SUBSCRIBE" if subscribe else "UNSUBSCRIBE",
+                                         "params": channels[i:i + self.MAX_CHANNELS_PER_MESSAGE],
+                                         "id": self._last_request_id}))
+        return messages
+
+    def parse_message(self, raw_message: str) -> Optional[Tuple[str, Any]]:
+        msg: Dict[str, Any] = ujson.loads(raw_message)
+        if "stream" not in msg:
+            # Response to a subscription request.
+            if msg.get("error") is not None:
+                self.logger().network(f"Binance websocket request error: {msg}")
+            return None
+        return msg["stream"], msg["data"]
+
+    def event_time(self, payload: Any) -> Optional[float]:
+        event_time: Optional[int] = payload.get("E")
+        return event_time * 1e-3 if event_time is not None else None
@@ -10,7 +10,7 @@ cdef class BittrexExchange(ExchangeBase):
         object _bittrex_auth
         object _coro_queue
         object _ev_loop
-        dict _in_flight_orders
+        object _in_flight_orders
         double _last_timestamp
         double _last_poll_timestamp
         dict _order_not_found_records
@@ -33,6 +33,7 @@ from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.in_flight_order_registry import InFlightOrderRegistry
 
 bm_logger = None
 s_decimal_0 = Decimal(0)
@@ -87,7 +88,7 @@ cdef class BittrexExchange(ExchangeBase):
         self._account_id = ""
         self._bittrex_auth = BittrexAuth(bittrex_api_key, bittrex_secret_key)
         self._ev_loop = asyncio.get_event_loop()
-        self._in_flight_orders = {}
+        self._in_flight_orders = InFlightOrderRegistry()
         self._last_poll_timestamp = 0
         self._last_timestamp = 0
         self._order_book_tracker = BittrexOrderBookTracker(trading_pairs=trading_pairs)
@@ -482,12 +483,14 @@ cdef class BittrexExchange(ExchangeBase):
                     order_status = order["status"]
                     order_id = order["id"]
 
-                    tracked_order = None
-                    for o in self._in_flight_orders.values():
-                        exchange_order_id = await o.get_exchange_order_id()
-                        if exchange_order_id == order_id:
-                            tracked_order = o
-                            break
+                    tracked_order = self._in_flight_orders.get_by_exchange_order_id(order_id)
+                    if tracked_order is None:
+                        # The update may come before the order creation response, so wait for the orders still
+                        # without an exchange order id.
+                        for o in list(self._in_flight_orders.values()):
+                            if o.exchange_order_id is None:
+                                await o.get_exchange_order_id()
+                        tracked_order = self._in_flight_orders.get_by_exchange_order_id(order_id)
 
                     if tracked_order is None:
                         continue
@@ -36,6 +36,7 @@ from hummingbot.core.event.events import (
     TradeFee
 )
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.in_flight_order_registry import InFlightOrderRegistry
 from hummingbot.connector.exchange.crypto_com.crypto_com_order_book_tracker import CryptoComOrderBookTracker
 from hummingbot.connector.exchange.crypto_com.crypto_com_user_stream_tracker import CryptoComUserStreamTracker
 from hummingbot.connector.exchange.crypto_com.crypto_com_auth import CryptoComAuth
@@ -84,7 +85,7 @@ class CryptoComExchange(ExchangeBase):
         self._shared_client = None
         self._poll_notifier = asyncio.Event()
         self._last_timestamp = 0
-        self._in_flight_orders = {}  # Dict[client_order_id:str, CryptoComInFlightOrder]
+        self._in_flight_orders = InFlightOrderRegistry()  # Dict[client_order_id:str, CryptoComInFlightOrder]
         self._order_not_found_records = {}  # Dict[client_order_id:str, count:int]
         self._trading_rules = {}  # Dict[trading_pair:str, TradingRule]
         self._status_polling_task = None
@@ -650,12 +651,16 @@ class CryptoComExchange(ExchangeBase):
         Updates in-flight order and trigger order filled event for trade message received. Triggers order completed
         event if the total executed amount equals to the specified order amount.
         """
-        for order in self._in_flight_orders.values():
-            await order.get_exchange_order_id()
-        track_order = [o for o in self._in_flight_orders.values() if trade_msg["order_id"] == o.exchange_order_id]
-        if not track_order:
+        tracked_order = self._in_flight_orders.get_by_exchange_order_id(trade_msg["order_id"])
+        if tracked_order is None:
+            # The trade may come before the order creation response, so wait for the orders still without an
+            # exchange order id.
+            for order in list(self._in_flight_orders.values()):
+                if order.exchange_order_id is None:
+                    await order.get_exchange_order_id()
+            tracked_order = self._in_flight_orders.get_by_exchange_order_id(trade_msg["order_id"])
+        if tracked_order is None:
             return
-        tracked_order = track_order[0]
         updated = tracked_order.update_with_trade_update(trade_msg)
         if not updated:
             return
@@ -15,6 +15,7 @@ from decimal import Decimal
 import time
 import ujson
 import websockets
+import zlib
 from websockets.exceptions import ConnectionClosed
 
 import requests
@@ -36,6 +37,30 @@ SNAPSHOT_REST_URL = "https://api.kraken.com/0/public/Depth"
 DIFF_STREAM_URL = "wss://ws.kraken.com"
 TICKER_URL = "https://api.kraken.com/0/public/Ticker"
 ASSET_PAIRS_URL = "https://api.kraken.com/0/public/AssetPairs"
+BOOK_DEPTH = 1000
+CHECKSUM_LEVELS = 10
+
+
+def _decimals(value: str) -> int:
+    point: int = value.find(".")
+    return len(value) - point - 1 if point >= 0 else 0
+
+
+def _level_string(levels: List[List[float]], price_decimals: int, volume_decimals: int) -> str:
+    return "".join(f"{price:.{price_decimals}f}".replace(".", "").lstrip("0") +
+                   f"{amount:.{volume_decimals}f}".replace(".", "").lstrip("0")
+                   for price, amount, _ in levels)
+
+
+def order_book_checksum(order_book: OrderBook, price_decimals: int, volume_decimals: int) -> int:
+    """
+    Kraken's CRC32 checksum of the top 10 asks and bids of an order book, from the prices and amounts written with the
+    pair's precision, without the decimal point and leading zeros.
+    """
+    asks: List[List[float]] = order_book.get_top_levels(False, CHECKSUM_LEVELS).tolist()
+    bids: List[List[float]] = order_book.get_top_levels(True, CHECKSUM_LEVELS).tolist()
+    return zlib.crc32((_level_string(asks, price_decimals, volume_decimals) +
+                       _level_string(bids, price_decimals, volume_decimals)).encode("utf8"))
 
 
 class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
@@ -51,9 +76,19 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
             cls._kraobds_logger = logging.getLogger(__name__)
         return cls._kraobds_logger
 
-    def __init__(self, trading_pairs: List[str]):
+    def __init__(self, trading_pairs: List[str], periodic_snapshots: bool = False):
+        """
+        :param periodic_snapshots: Whether to also refresh every order book from a REST snapshot every hour. Not needed
+                                   for the books to stay in sync, as the tracker resyncs a book when its checksum stops
+                                   matching Kraken's.
+        """
         super().__init__(trading_pairs)
         self._order_book_create_function = lambda: OrderBook()
+        self._periodic_snapshots: bool = periodic_snapshots
+        self._book_ws: Optional[websockets.WebSocketClientProtocol] = None
+        # Precision of the prices and amounts of each pair, as Kraken writes them in the book messages.
+        self._price_decimals: Dict[str, int] = {}
+        self._volume_decimals: Dict[str, int] = {}
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
@@ -93,18 +128,41 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
             return data
 
-    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+    async def get_order_book_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
         async with aiohttp.ClientSession() as client:
-            snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
+            snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, BOOK_DEPTH)
             snapshot_timestamp: float = time.time()
-            snapshot_msg: OrderBookMessage = KrakenOrderBook.snapshot_message_from_exchange(
+            return KrakenOrderBook.snapshot_message_from_exchange(
                 snapshot,
                 snapshot_timestamp,
                 metadata={"trading_pair": trading_pair}
             )
-            order_book: OrderBook = self.order_book_create_function()
-            order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
-            return order_book
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        snapshot_msg: OrderBookMessage = await self.get_order_book_snapshot_message(trading_pair)
+        order_book: OrderBook = self.order_book_create_function()
+        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        return order_book
+
+    def is_order_book_consistent(self, trading_pair: str, order_book: OrderBook, message: OrderBookMessage) -> bool:
+        checksum: Optional[int] = message.content.get("checksum")
+        price_decimals: Optional[int] = self._price_decimals.get(trading_pair)
+        if checksum is None or price_decimals is None:
+            return True
+        return order_book_checksum(order_book, price_decimals, self._volume_decimals[trading_pair]) == checksum
+
+    async def resubscribe_order_book(self, trading_pair: str) -> bool:
+        """
+        Subscribes again to the book of one pair, for Kraken to send a new snapshot of it in order with its diffs.
+        :return: False if the order book stream is not connected.
+        """
+        ws: Optional[websockets.WebSocketClientProtocol] = self._book_ws
+        if ws is None or not ws.open:
+            return False
+        pairs: List[str] = [self.get_ws_pair_name(trading_pair)]
+        await ws.send(self.get_ws_message("unsubscribe", "book", pairs))
+        await ws.send(self.get_ws_message("subscribe", "book", pairs))
+        return True
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
@@ -197,15 +255,26 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with websockets.connect(DIFF_STREAM_URL) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     await ws.send(ws_message)
+                    self._book_ws = ws
                     async for raw_msg in self._inner_messages(ws):
                         msg = ujson.loads(raw_msg)
 
-                        msg_dict = {"trading_pair": convert_from_exchange_trading_pair(msg[-1]),
-                                    "asks": msg[1].get("a", []) or msg[1].get("as", []) or [],
-                                    "bids": msg[1].get("b", []) or msg[1].get("bs", []) or []}
+                        # Updates to both sides come as separate ask and bid objects, the last one with the checksum.
+                        book: Dict[str, Any] = {}
+                        for part in msg[1:-2]:
+                            book.update(part)
+                        trading_pair: str = convert_from_exchange_trading_pair(msg[-1])
+                        msg_dict = {"trading_pair": trading_pair,
+                                    "asks": book.get("a", []) or book.get("as", []) or [],
+                                    "bids": book.get("b", []) or book.get("bs", []) or [],
+                                    "checksum": int(book["c"]) if "c" in book else None}
                         msg_dict["update_id"] = max([*map(lambda x: float(x[2]), msg_dict["bids"] + msg_dict["asks"])],
                                                     default=0.)
-                        if "as" in msg[1] and "bs" in msg[1]:
+                        if len(msg_dict["asks"]) > 0 or len(msg_dict["bids"]) > 0:
+                            price, amount = (msg_dict["asks"] or msg_dict["bids"])[0][:2]
+                            self._price_decimals[trading_pair] = _decimals(price)
+                            self._volume_decimals[trading_pair] = _decimals(amount)
+                        if "as" in book and "bs" in book:
                             order_book_message: OrderBookMessage = KrakenOrderBook.snapshot_ws_message_from_exchange(
                                 msg_dict, time.time())
                         else:
@@ -218,8 +287,12 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
                                     exc_info=True)
                 await asyncio.sleep(30.0)
+            finally:
+                self._book_ws = None
 
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        if not self._periodic_snapshots:
+            return
         while True:
             try:
                 async with aiohttp.ClientSession() as client:
@@ -252,18 +325,20 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_ws_subscription_message(self, subscription_type: str):
         # all_markets: pd.DataFrame = await self.get_active_exchange_markets()
-        trading_pairs: List[str] = []
-        for tp in self._trading_pairs:
-            base, quote = self.split_to_base_quote(convert_to_exchange_trading_pair(tp))
-            trading_pairs.append(f"{base}/{quote}")
+        trading_pairs: List[str] = [self.get_ws_pair_name(tp) for tp in self._trading_pairs]
+        return self.get_ws_message("subscribe", subscription_type, trading_pairs)
 
-        ws_message_dict: Dict[str, Any] = {"event": "subscribe",
-                                           "pair": trading_pairs,
-                                           "subscription": {"name": subscription_type, "depth": 1000}}
-
-        ws_message: str = ujson.dumps(ws_message_dict)
+    @staticmethod
+    def get_ws_message(event: str, subscription_type: str, ws_pair_names: List[str]) -> str:
+        ws_message_dict: Dict[str, Any] = {"event": event,
+                                           "pair": ws_pair_names,
+                                           "subscription": {"name": subscription_type, "depth": BOOK_DEPTH}}
+        return ujson.dumps(ws_message_dict)
 
-        return ws_message
+    @classmethod
+    def get_ws_pair_name(cls, trading_pair: str) -> str:
+        base, quote = cls.split_to_base_quote(convert_to_exchange_trading_pair(trading_pair))
+        return f"{base}/{quote}"
 
     @staticmethod
     def split_to_base_quote(exchange_trading_pair: str) -> (Optional[str], Optional[str]):
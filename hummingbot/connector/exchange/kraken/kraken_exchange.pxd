@@ -11,7 +11,7 @@ cdef class KrakenExchange(ExchangeBase):
         double _last_timestamp
         double _poll_interval
         double _last_pull_timestamp
-        dict _in_flight_orders
+        object _in_flight_orders
         dict _order_not_found_records
         TransactionTracker _tx_tracker
         dict _trading_rules
@@ -46,6 +46,7 @@ from hummingbot.core.event.events import (
     TradeFee
 )
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.in_flight_order_registry import InFlightOrderRegistry
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.connector.exchange.kraken.kraken_order_book_tracker import KrakenOrderBookTracker
@@ -123,7 +124,7 @@ cdef class KrakenExchange(ExchangeBase):
         self._poll_notifier = asyncio.Event()
         self._last_timestamp = 0
         self._poll_interval = poll_interval
-        self._in_flight_orders = {}  # Dict[client_order_id:str, KrakenInFlightOrder]
+        self._in_flight_orders = InFlightOrderRegistry()  # Dict[client_order_id:str, KrakenInFlightOrder]
         self._order_not_found_records = {}  # Dict[client_order_id:str, count:int]
         self._tx_tracker = KrakenExchangeTransactionTracker(self)
         self._trading_rules = {}  # Dict[trading_pair:str, TradingRule]
@@ -460,17 +461,11 @@ cdef class KrakenExchange(ExchangeBase):
                         trade: Dict[str, str] = update[trade_id]
                         trade["trade_id"] = trade_id
                         exchange_order_id = trade.get("ordertxid")
-                        try:
-                            client_order_id = next(key for key, value in self._in_flight_orders.items()
-                                                   if value.exchange_order_id == exchange_order_id)
-                        except StopIteration:
-                            continue
-
-                        tracked_order = self._in_flight_orders.get(client_order_id)
+                        tracked_order = self._in_flight_orders.get_by_exchange_order_id(exchange_order_id)
 
                         if tracked_order is None:
                             # Hiding the messages for now. Root cause to be investigated in later sprints.
-                            self.logger().debug(f"Unrecognized order ID from user stream: {client_order_id}.")
+                            self.logger().debug(f"Unrecognized order ID from user stream: {exchange_order_id}.")
                             self.logger().debug(f"Event: {event_message}")
                             self.logger().debug(f"Order Event: {update}")
                             continue
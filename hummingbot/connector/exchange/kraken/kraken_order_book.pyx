@@ -48,7 +48,8 @@ cdef class KrakenOrderBook(OrderBook):
             "trading_pair": msg["trading_pair"].replace("/", ""),
             "update_id": msg["update_id"],
             "bids": msg["bids"],
-            "asks": msg["asks"]
+            "asks": msg["asks"],
+            "checksum": msg.get("checksum")
         }, timestamp=timestamp * 1e-3)
 
     @classmethod
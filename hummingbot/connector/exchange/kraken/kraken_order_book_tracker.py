@@ -31,8 +31,8 @@ class KrakenOrderBookTracker(OrderBookTracker):
             cls._krobt_logger = logging.getLogger(__name__)
         return cls._krobt_logger
 
-    def __init__(self, trading_pairs: List[str]):
-        super().__init__(KrakenAPIOrderBookDataSource(trading_pairs), trading_pairs)
+    def __init__(self, trading_pairs: List[str], periodic_snapshots: bool = False):
+        super().__init__(KrakenAPIOrderBookDataSource(trading_pairs, periodic_snapshots), trading_pairs)
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
@@ -48,6 +48,20 @@ class KrakenOrderBookTracker(OrderBookTracker):
     def exchange_name(self) -> str:
         return "kraken"
 
+    async def _resync_order_book(self, trading_pair: str):
+        """
+        Subscribes to the book again when the order book stream is up, as the snapshot then comes in order with the
+        diffs. Falls back to a REST snapshot otherwise.
+        """
+        try:
+            if await self.data_source.resubscribe_order_book(trading_pair):
+                return
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(f"Error resubscribing to the order book of {trading_pair}.", exc_info=True)
+        await super()._resync_order_book(trading_pair)
+
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
@@ -66,14 +66,13 @@ class LiquidOrderBookTracker(OrderBookTracker):
                 # Liquid order_book diff message does not contain entries to be deleted, it is actually a snapshot with
                 # just one side of the book (either bids or asks), we have to manually check for existing entries here
                 # and include them with 0 amount.
-                if "asks" in ob_message.content and len(ob_message.content["asks"]) > 0:
-                    for price in order_book.snapshot[1].price:
-                        if price not in [float(p[0]) for p in ob_message.content["asks"]]:
-                            ob_message.content["asks"].append([str(price), str(0)])
-                elif "bids" in ob_message.content and len(ob_message.content["bids"]) > 0:
-                    for price in order_book.snapshot[0].price:
-                        if price not in [float(p[0]) for p in ob_message.content["bids"]]:
-                            ob_message.content["bids"].append([str(price), str(0)])
+                for side, is_bid in (("asks", False), ("bids", True)):
+                    if side in ob_message.content and len(ob_message.content[side]) > 0:
+                        message_prices = set(float(p[0]) for p in ob_message.content[side])
+                        for price in order_book.get_top_levels(is_bid)[:, 0].tolist():
+                            if price not in message_prices:
+                                ob_message.content[side].append([str(price), str(0)])
+                        break
                 await message_queue.put(ob_message)
                 messages_accepted += 1
 
@@ -236,8 +236,16 @@ class MiMCEdDSA(_SignatureScheme):
 
 
 class PoseidonEdDSA(_SignatureScheme):
+    # Deriving the round constants and the matrix is as expensive as hashing, so they are only derived once.
+    _hash_params = None
+
+    @classmethod
+    def hash_params(cls):
+        if cls._hash_params is None:
+            cls._hash_params = poseidon_params(SNARK_SCALAR_FIELD, 6, 6, 52, b'poseidon', 5, security_target=128)
+        return cls._hash_params
+
     @classmethod
     def hash_public(cls, *args):
-        PoseidonHashParams = poseidon_params(SNARK_SCALAR_FIELD, 6, 6, 52, b'poseidon', 5, security_target=128)
         inputMsg = list(as_scalar(*args))
-        return poseidon(inputMsg, PoseidonHashParams)
+        return poseidon(inputMsg, cls.hash_params())
@@ -15,6 +15,7 @@ cdef class LoopringExchange(ExchangeBase):
         int _loopring_exchangeid
         str _loopring_private_key
         object _order_sign_param
+        object _order_signer
 
         object _user_stream_tracker
         object _user_stream_tracker_task
@@ -51,9 +51,8 @@ from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.core.utils.estimate_fee import estimate_fee
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 
-from hummingbot.connector.exchange.loopring.ethsnarks2.eddsa import PureEdDSA, PoseidonEdDSA
-from hummingbot.connector.exchange.loopring.ethsnarks2.field import FQ, SNARK_SCALAR_FIELD
-from hummingbot.connector.exchange.loopring.ethsnarks2.poseidon import poseidon_params, poseidon
+from hummingbot.connector.exchange.loopring.ethsnarks2.field import SNARK_SCALAR_FIELD
+from hummingbot.connector.exchange.loopring.loopring_order_signer import LoopringOrderSigner, ORDER_HASH_PARAMS
 
 s_logger = None
 s_decimal_0 = Decimal(0)
@@ -164,7 +163,8 @@ cdef class LoopringExchange(ExchangeBase):
         self._in_flight_orders = {}
         self._next_order_id = {}
         self._trading_pairs = trading_pairs
-        self._order_sign_param = poseidon_params(SNARK_SCALAR_FIELD, 14, 6, 53, b'poseidon', 5, security_target=128)
+        self._order_sign_param = ORDER_HASH_PARAMS
+        self._order_signer = LoopringOrderSigner(loopring_private_key)
 
         self._order_id_lock = asyncio.Lock()
 
@@ -302,16 +302,16 @@ cdef class LoopringExchange(ExchangeBase):
             order["orderType"] = "MAKER_ONLY"
 
         serialized_message = await self._serialize_order(order)
-        msgHash = poseidon(serialized_message, self._order_sign_param)
-        fq_obj = FQ(int(self._loopring_private_key))
-        signed_message = PoseidonEdDSA.sign(msgHash, fq_obj)
+        # Hashing and signing run in the signer's process pool, so the orders of a ladder are signed in parallel.
+        msg_hash, signature_rx, signature_ry, signature_s = \
+            await self._order_signer.sign_order_async(serialized_message)
 
         # Update with signature
         order.update({
-            "hash": str(msgHash),
-            "signatureRx": str(signed_message.sig.R.x),
-            "signatureRy": str(signed_message.sig.R.y),
-            "signatureS": str(signed_message.sig.s)
+            "hash": msg_hash,
+            "signatureRx": signature_rx,
+            "signatureRy": signature_ry,
+            "signatureS": signature_s
         })
 
         return await self.api_request("POST", ORDER_ROUTE, params=order, data=order)
@@ -522,6 +522,7 @@ cdef class LoopringExchange(ExchangeBase):
             self._user_stream_event_listener_task.cancel()
         self._user_stream_tracker_task = None
         self._user_stream_event_listener_task = None
+        self._order_signer.shutdown()
 
     async def check_network(self) -> NetworkStatus:
         try:
@@ -875,8 +876,7 @@ cdef class LoopringExchange(ExchangeBase):
             hasher = hashlib.sha256()
             hasher.update(ordered_data.encode('utf-8'))
             msgHash = int(hasher.hexdigest(), 16) % SNARK_SCALAR_FIELD
-            signed = PoseidonEdDSA.sign(msgHash, FQ(int(self._loopring_private_key)))
-            signature = ','.join(str(_) for _ in [signed.sig.R.x, signed.sig.R.y, signed.sig.s])
+            signature = ','.join(await self._order_signer.sign_async(msgHash))
             headers.update({"X-API-SIG": signature})
 
         async with self._shared_client.request(http_method, url=full_url,
@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import logging
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+from hummingbot.connector.exchange.loopring.ethsnarks2.eddsa import (
+    PoseidonEdDSA,
+    Signature
+)
+from hummingbot.connector.exchange.loopring.ethsnarks2.field import (
+    FQ,
+    SNARK_SCALAR_FIELD
+)
+from hummingbot.connector.exchange.loopring.ethsnarks2.jubjub import (
+    JUBJUB_A,
+    JUBJUB_D,
+    JUBJUB_E,
+    JUBJUB_L,
+    Point
+)
+from hummingbot.connector.exchange.loopring.ethsnarks2.poseidon import (
+    poseidon,
+    poseidon_params
+)
+from hummingbot.logger import HummingbotLogger
+
+# Jubjub points in extended twisted Edwards coordinates (X, Y, T, Z), over plain ints.
+ExtendedPoint = Tuple[int, int, int, int]
+
+Q = SNARK_SCALAR_FIELD
+ORDER_HASH_PARAMS = poseidon_params(SNARK_SCALAR_FIELD, 14, 6, 53, b'poseidon', 5, security_target=128)
+EDDSA_HASH_PARAMS = PoseidonEdDSA.hash_params()
+COMB_WINDOW_BITS = 4
+COMB_WINDOWS = (JUBJUB_E.bit_length() + COMB_WINDOW_BITS - 1) // COMB_WINDOW_BITS
+COMB_WINDOW_MASK = (1 << COMB_WINDOW_BITS) - 1
+
+_generator_table: Optional[List[List[ExtendedPoint]]] = None
+_public_keys: Dict[int, Point] = {}
+
+
+def _point_add(p1: ExtendedPoint, p2: ExtendedPoint) -> ExtendedPoint:
+    """
+    Unified addition in extended twisted Edwards coordinates (add-2008-hwcd), same formulas as EtecPoint.add.
+    """
+    x1, y1, t1, z1 = p1
+    x2, y2, t2, z2 = p2
+    a = x1 * x2 % Q
+    b = y1 * y2 % Q
+    c = JUBJUB_D * t1 % Q * t2 % Q
+    d = z1 * z2 % Q
+    e = ((x1 + y1) * (x2 + y2) - a - b) % Q
+    f = (d - c) % Q
+    g = (d + c) % Q
+    h = (b - JUBJUB_A * a) % Q
+    return e * f % Q, g * h % Q, e * h % Q, f * g % Q
+
+
+def _to_point(p: ExtendedPoint) -> Point:
+    x, y, _, z = p
+    inv_z: int = pow(z, Q - 2, Q)
+    return Point(FQ(x * inv_z % Q), FQ(y * inv_z % Q))
+
+
+def generator_table() -> List[List[ExtendedPoint]]:
+    """
+    Fixed-base comb table for the Jubjub generator B: table[i][j] = j * 2^(4i) * B. A multiplication by B is then
+    one table lookup and addition per 4 bits of the scalar, with no doublings and a single inversion at the end.
+    Built once per process.
+    """
+    global _generator_table
+    if _generator_table is None:
+        generator: Point = PoseidonEdDSA.B()
+        base: ExtendedPoint = (generator.x.n, generator.y.n, generator.x.n * generator.y.n % Q, 1)
+        table: List[List[ExtendedPoint]] = []
+        for _ in range(COMB_WINDOWS):
+            row: List[ExtendedPoint] = [(0, 1, 0, 1), base]
+            for _ in range(2, 1 << COMB_WINDOW_BITS):
+                row.append(_point_add(row[-1], base))
+            table.append(row)
+            base = _point_add(row[-1], base)
+        _generator_table = table
+    return _generator_table
+
+
+def generator_mult(scalar: int) -> Point:
+    """
+    :return: scalar * B, equal to `PoseidonEdDSA.B() * scalar`.
+    """
+    table: List[List[ExtendedPoint]] = generator_table()
+    acc: ExtendedPoint = (0, 1, 0, 1)
+    window: int = 0
+    while scalar > 0:
+        digit: int = scalar & COMB_WINDOW_MASK
+        if digit != 0:
+            acc = _point_add(acc, table[window][digit])
+        scalar >>= COMB_WINDOW_BITS
+        window += 1
+    return _to_point(acc)
+
+
+def public_key(private_key: int) -> Point:
+    """
+    :return: The public key A = k * B of a private key, cached per process.
+    """
+    if private_key not in _public_keys:
+        _public_keys[private_key] = generator_mult(private_key)
+    return _public_keys[private_key]
+
+
+def sign_message(private_key: int, msg_hash: int) -> Signature:
+    """
+    Same signature as `PoseidonEdDSA.sign(msg_hash, FQ(private_key))`, using the cached public key, the fixed-base
+    table and the cached Poseidon parameters.
+    """
+    if private_key >= JUBJUB_L or private_key <= 0:
+        raise RuntimeError("Strict parsing of k failed")
+    key: FQ = FQ(private_key)
+    A: Point = public_key(private_key)
+    r: int = PoseidonEdDSA.hash_secret(key, msg_hash)
+    R: Point = generator_mult(r)
+    t: int = poseidon([R.x.n, R.y.n, A.x.n, A.y.n, msg_hash], EDDSA_HASH_PARAMS)
+    S: int = (r + (private_key * t)) % JUBJUB_E
+    return Signature(R, S)
+
+
+def order_hash(serialized_order: List[int]) -> int:
+    return poseidon(serialized_order, ORDER_HASH_PARAMS)
+
+
+def sign_message_strings(private_key: int, msg_hash: int) -> Tuple[str, str, str]:
+    signature: Signature = sign_message(private_key, msg_hash)
+    return str(signature.R.x), str(signature.R.y), str(signature.s)
+
+
+def sign_order_strings(private_key: int, serialized_order: List[int]) -> Tuple[str, str, str, str]:
+    msg_hash: int = order_hash(serialized_order)
+    return (str(msg_hash),) + sign_message_strings(private_key, msg_hash)
+
+
+class LoopringOrderSigner:
+    """
+    Signs Loopring orders and API requests off the event loop.
+
+    Signing runs in a small process pool, so a ladder of orders is signed in parallel and the event loop is not
+    blocked meanwhile. Each worker builds the fixed-base table and derives the public key once. If the process pool
+    can't be used, signing falls back to the calling thread.
+    """
+    _los_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._los_logger is None:
+            cls._los_logger = logging.getLogger(__name__)
+        return cls._los_logger
+
+    def __init__(self, private_key: str, use_process_pool: bool = True, max_workers: int = 2):
+        self._private_key: int = int(private_key)
+        self._use_process_pool: bool = use_process_pool
+        self._max_workers: int = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def public_key(self) -> Point:
+        return public_key(self._private_key)
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self._use_process_pool and self._executor is None:
+            try:
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            except Exception:
+                self.logger().warning("Could not start the signing process pool. Signing on the event loop.",
+                                      exc_info=True)
+                self._use_process_pool = False
+        return self._executor
+
+    async def _run(self, func, *args):
+        executor: Optional[ProcessPoolExecutor] = self._get_executor()
+        if executor is not None:
+            try:
+                return await asyncio.get_event_loop().run_in_executor(executor, func, *args)
+            except BrokenProcessPool:
+                self.logger().warning("The signing process pool is broken. Signing on the event loop.",
+                                      exc_info=True)
+                self.shutdown()
+                self._use_process_pool = False
+        return func(*args)
+
+    def sign(self, msg_hash: int) -> Signature:
+        return sign_message(self._private_key, msg_hash)
+
+    async def sign_async(self, msg_hash: int) -> Tuple[str, str, str]:
+        """
+        :return: (signatureRx, signatureRy, signatureS) of the message hash.
+        """
+        return await self._run(sign_message_strings, self._private_key, msg_hash)
+
+    async def sign_order_async(self, serialized_order: List[int]) -> Tuple[str, str, str, str]:
+        """
+        :return: (hash, signatureRx, signatureRy, signatureS) of a serialized order.
+        """
+        return await self._run(sign_order_strings, self._private_key, serialized_order)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -1,7 +1,8 @@
-from typing import List, Callable
+from typing import List, Callable, Optional
 from hummingbot.client.config.config_helpers import get_connector_class
 from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.connector.exchange.paper_trade.queue_fill_model import QueueFillModel
 
 
 def get_order_book_tracker_class(connector_name: str) -> Callable:
@@ -16,8 +17,10 @@ def get_order_book_tracker_class(connector_name: str) -> Callable:
     raise Exception(f"Connector {connector_name} OrderBookTracker class not found")
 
 
-def create_paper_trade_market(exchange_name: str, trading_pairs: List[str]):
+def create_paper_trade_market(exchange_name: str, trading_pairs: List[str],
+                              fill_model: Optional[QueueFillModel] = None):
     order_book_tracker = get_order_book_tracker_class(exchange_name)
     return PaperTradeExchange(order_book_tracker(trading_pairs=trading_pairs),
                               MarketConfig.default_config(),
-                              get_connector_class(exchange_name))
+                              get_connector_class(exchange_name),
+                              fill_model)
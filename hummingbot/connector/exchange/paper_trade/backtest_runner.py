@@ -0,0 +1,311 @@
+#!/usr/bin/env python
+
+from decimal import Decimal
+import logging
+import time
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.client.config.config_helpers import get_connector_class
+from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.connector.exchange.paper_trade.queue_fill_model import QueueFillModel
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.order_book_replay import OrderBookReplayTracker
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderFilledEvent,
+    TradeType,
+)
+from hummingbot.core.time_iterator import TimeIterator
+from hummingbot.logger import HummingbotLogger
+
+s_decimal_0 = Decimal(0)
+
+
+class BacktestFillStats:
+    """
+    Fill statistics of one trading pair on one market.
+    """
+    __slots__ = ("buy_count", "sell_count", "buy_base_volume", "sell_base_volume", "buy_quote_volume",
+                 "sell_quote_volume", "fees")
+
+    def __init__(self):
+        self.buy_count: int = 0
+        self.sell_count: int = 0
+        self.buy_base_volume: Decimal = s_decimal_0
+        self.sell_base_volume: Decimal = s_decimal_0
+        self.buy_quote_volume: Decimal = s_decimal_0
+        self.sell_quote_volume: Decimal = s_decimal_0
+        # In the quote asset. Fees in other assets are left out.
+        self.fees: Decimal = s_decimal_0
+
+    @property
+    def fill_count(self) -> int:
+        return self.buy_count + self.sell_count
+
+    @property
+    def avg_buy_price(self) -> Decimal:
+        return self.buy_quote_volume / self.buy_base_volume if self.buy_base_volume > s_decimal_0 else s_decimal_0
+
+    @property
+    def avg_sell_price(self) -> Decimal:
+        return self.sell_quote_volume / self.sell_base_volume if self.sell_base_volume > s_decimal_0 else s_decimal_0
+
+    def add_fill(self, event: OrderFilledEvent, base_asset: str, quote_asset: str):
+        price: Decimal = Decimal(str(event.price))
+        amount: Decimal = Decimal(str(event.amount))
+        quote_amount: Decimal = price * amount
+        if event.trade_type is TradeType.BUY:
+            self.buy_count += 1
+            self.buy_base_volume += amount
+            self.buy_quote_volume += quote_amount
+        else:
+            self.sell_count += 1
+            self.sell_base_volume += amount
+            self.sell_quote_volume += quote_amount
+        self.fees += Decimal(str(event.trade_fee.percent)) * quote_amount
+        for asset, fee_amount in event.trade_fee.flat_fees:
+            if asset == quote_asset:
+                self.fees += Decimal(str(fee_amount))
+            elif asset == base_asset:
+                self.fees += Decimal(str(fee_amount)) * price
+
+
+class BacktestResult:
+    """
+    Outcome of a backtest run. PnL values are in the valuation asset, with every asset valued at its last mid price.
+    Paper trade markets do not take fees from the balances, so the net PnL subtracts the fees of all the fills.
+    """
+
+    def __init__(self,
+                 start_time: float,
+                 end_time: float,
+                 wall_time: float,
+                 valuation_asset: str,
+                 prices: Dict[str, Decimal],
+                 start_balances: Dict[str, Dict[str, Decimal]],
+                 end_balances: Dict[str, Dict[str, Decimal]],
+                 fill_stats: Dict[Tuple[str, str], BacktestFillStats],
+                 fills: List[OrderFilledEvent],
+                 order_count: int,
+                 cancel_count: int):
+        self.start_time: float = start_time
+        self.end_time: float = end_time
+        self.wall_time: float = wall_time
+        self.valuation_asset: str = valuation_asset
+        self.prices: Dict[str, Decimal] = prices
+        self.start_balances: Dict[str, Dict[str, Decimal]] = start_balances
+        self.end_balances: Dict[str, Dict[str, Decimal]] = end_balances
+        self.fill_stats: Dict[Tuple[str, str], BacktestFillStats] = fill_stats
+        self.fills: List[OrderFilledEvent] = fills
+        self.order_count: int = order_count
+        self.cancel_count: int = cancel_count
+
+    @property
+    def speed(self) -> float:
+        """
+        Simulated seconds per wall clock second.
+        """
+        return (self.end_time - self.start_time) / self.wall_time if self.wall_time > 0 else float("inf")
+
+    @property
+    def unvalued_assets(self) -> List[str]:
+        """
+        Assets without a price in the valuation asset, left out of the portfolio values.
+        """
+        return sorted({asset for balances in list(self.start_balances.values()) + list(self.end_balances.values())
+                       for asset in balances.keys() if asset not in self.prices})
+
+    def portfolio_value(self, balances: Dict[str, Dict[str, Decimal]]) -> Decimal:
+        return sum((amount * self.prices[asset]
+                    for market_balances in balances.values()
+                    for asset, amount in market_balances.items() if asset in self.prices), s_decimal_0)
+
+    @property
+    def start_value(self) -> Decimal:
+        return self.portfolio_value(self.start_balances)
+
+    @property
+    def end_value(self) -> Decimal:
+        return self.portfolio_value(self.end_balances)
+
+    @property
+    def fees(self) -> Decimal:
+        return sum((stats.fees for stats in self.fill_stats.values()), s_decimal_0)
+
+    @property
+    def pnl(self) -> Decimal:
+        return self.end_value - self.start_value - self.fees
+
+    @property
+    def return_pct(self) -> Decimal:
+        start_value: Decimal = self.start_value
+        return self.pnl / start_value * Decimal(100) if start_value > s_decimal_0 else s_decimal_0
+
+    @property
+    def fill_count(self) -> int:
+        return len(self.fills)
+
+    def report(self) -> str:
+        lines: List[str] = [
+            f"Backtest of {self.end_time - self.start_time:.0f} seconds in {self.wall_time:.2f} seconds "
+            f"({self.speed:.0f}x real time)",
+            f"Orders: {self.order_count}, cancelled: {self.cancel_count}, fills: {self.fill_count}",
+            f"Portfolio value: {self.start_value:.6g} -> {self.end_value:.6g} {self.valuation_asset}",
+            f"Fees: {self.fees:.6g} {self.valuation_asset}",
+            f"PnL: {self.pnl:.6g} {self.valuation_asset} ({self.return_pct:.4f}%)",
+        ]
+        if len(self.unvalued_assets) > 0:
+            lines.append(f"Not valued: {', '.join(self.unvalued_assets)}")
+        for (market_name, trading_pair), stats in self.fill_stats.items():
+            lines.append(f"  {market_name} {trading_pair}: "
+                         f"{stats.buy_count} buys of {stats.buy_base_volume:.6g} at {stats.avg_buy_price:.6g}, "
+                         f"{stats.sell_count} sells of {stats.sell_base_volume:.6g} at {stats.avg_sell_price:.6g}, "
+                         f"fees {stats.fees:.6g}")
+        return "\n".join(lines)
+
+
+class BacktestRunner:
+    """
+    Runs strategies against paper trade markets replaying recorded order books under a backtest clock, without any
+    network or asyncio task.
+
+    Each tick replays the recorded messages up to the tick time, then ticks the markets and the strategies, so the
+    markets fill orders from the replayed trades and books exactly as they do in paper trade mode, only faster.
+
+        runner = BacktestRunner(start_time, end_time)
+        market = runner.add_market("binance", ["ETH-USDT"], recording_dir, {"ETH": Decimal(10), "USDT": Decimal(1000)})
+        runner.add_strategy(PureMarketMakingStrategy(MarketTradingPairTuple(market, "ETH-USDT", "ETH", "USDT"), ...))
+        print(runner.run().report())
+    """
+    _br_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._br_logger is None:
+            cls._br_logger = logging.getLogger(__name__)
+        return cls._br_logger
+
+    def __init__(self, start_time: float, end_time: float, tick_size: float = 1.0,
+                 valuation_asset: Optional[str] = None):
+        self._start_time: float = start_time
+        self._end_time: float = end_time
+        self._tick_size: float = tick_size
+        self._valuation_asset: Optional[str] = valuation_asset
+        self._clock: Clock = Clock(ClockMode.BACKTEST, tick_size, start_time, end_time)
+        self._markets: List[PaperTradeExchange] = []
+        self._trackers: List[OrderBookReplayTracker] = []
+        self._strategies: List[TimeIterator] = []
+        self._fills: List[OrderFilledEvent] = []
+        self._fill_stats: Dict[Tuple[str, str], BacktestFillStats] = {}
+        self._order_count: int = 0
+        self._cancel_count: int = 0
+        self._fill_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
+        self._order_created_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_create_order)
+        self._order_cancelled_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_cancel_order)
+
+    @property
+    def clock(self) -> Clock:
+        return self._clock
+
+    @property
+    def markets(self) -> List[PaperTradeExchange]:
+        return self._markets
+
+    def add_market(self,
+                   exchange_name: str,
+                   trading_pairs: List[str],
+                   recording_dir: str,
+                   balances: Dict[str, Decimal],
+                   config: Optional[MarketConfig] = None,
+                   target_market: Optional[type] = None,
+                   fill_model: Optional[QueueFillModel] = None) -> PaperTradeExchange:
+        """
+        Adds a paper trade market of the exchange, replaying the order books recorded in recording_dir.
+        :param target_market: Exchange class for trading pair conversions, looked up from the exchange name by default.
+        :param fill_model: Queue position and latency simulation of the limit orders.
+        """
+        tracker: OrderBookReplayTracker = OrderBookReplayTracker(recording_dir, trading_pairs,
+                                                                 start_time=self._start_time,
+                                                                 end_time=self._end_time,
+                                                                 exchange_name=exchange_name)
+        market: PaperTradeExchange = PaperTradeExchange(tracker,
+                                                        config or MarketConfig.default_config(),
+                                                        target_market or get_connector_class(exchange_name),
+                                                        fill_model)
+        for asset, balance in balances.items():
+            market.set_balance(asset, balance)
+        tracker.start()
+        market.add_listener(MarketEvent.OrderFilled, self._fill_forwarder)
+        market.add_listener(MarketEvent.BuyOrderCreated, self._order_created_forwarder)
+        market.add_listener(MarketEvent.SellOrderCreated, self._order_created_forwarder)
+        market.add_listener(MarketEvent.OrderCancelled, self._order_cancelled_forwarder)
+        self._markets.append(market)
+        self._trackers.append(tracker)
+        self._clock.add_iterator(market)
+        if self._valuation_asset is None:
+            self._valuation_asset = market.split_trading_pair(trading_pairs[0])[1]
+        return market
+
+    def add_strategy(self, strategy: TimeIterator):
+        """
+        Adds a strategy, or any other time iterator, ticked after the markets.
+        """
+        self._strategies.append(strategy)
+        self._clock.add_iterator(strategy)
+
+    def _did_fill_order(self, event_tag: int, market: PaperTradeExchange, event: OrderFilledEvent):
+        self._fills.append(event)
+        key: Tuple[str, str] = (market.name, event.trading_pair)
+        if key not in self._fill_stats:
+            self._fill_stats[key] = BacktestFillStats()
+        base_asset, quote_asset = market.split_trading_pair(event.trading_pair)
+        self._fill_stats[key].add_fill(event, base_asset, quote_asset)
+
+    def _did_create_order(self, event_tag: int, market: PaperTradeExchange, event: object):
+        self._order_count += 1
+
+    def _did_cancel_order(self, event_tag: int, market: PaperTradeExchange, event: object):
+        self._cancel_count += 1
+
+    def _balances(self) -> Dict[str, Dict[str, Decimal]]:
+        return {market.name: dict(market.get_all_balances()) for market in self._markets}
+
+    def _prices(self) -> Dict[str, Decimal]:
+        """
+        :return: The mid price of each base asset traded against the valuation asset.
+        """
+        prices: Dict[str, Decimal] = {self._valuation_asset: Decimal(1)}
+        for market in self._markets:
+            for trading_pair, order_book in market.order_books.items():
+                base_asset, quote_asset = market.split_trading_pair(trading_pair)
+                if quote_asset == self._valuation_asset and base_asset not in prices:
+                    prices[base_asset] = Decimal(str((order_book.get_price(True) + order_book.get_price(False)) / 2))
+        return prices
+
+    def replay_til(self, timestamp: float):
+        for tracker in self._trackers:
+            tracker.replay_til(timestamp)
+        self._clock.backtest_til(timestamp)
+
+    def run(self) -> BacktestResult:
+        start_balances: Dict[str, Dict[str, Decimal]] = self._balances()
+        wall_start: float = time.perf_counter()
+        with self._clock:
+            timestamp: float = self._start_time
+            while timestamp <= self._end_time:
+                self.replay_til(timestamp)
+                timestamp += self._tick_size
+        wall_time: float = time.perf_counter() - wall_start
+        return BacktestResult(self._start_time, self._end_time, wall_time, self._valuation_asset, self._prices(),
+                              start_balances, self._balances(), self._fill_stats, self._fills, self._order_count,
+                              self._cancel_count)
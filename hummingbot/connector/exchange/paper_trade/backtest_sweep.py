@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import copy
+from decimal import Decimal
+import itertools
+import logging
+import random
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import pandas as pd
+
+from hummingbot.connector.exchange.paper_trade.backtest_runner import (
+    BacktestResult,
+    BacktestRunner,
+)
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.connector.exchange.paper_trade.queue_fill_model import QueueFillModel
+from hummingbot.core.time_iterator import TimeIterator
+from hummingbot.logger import HummingbotLogger
+
+s_logger = None
+
+# Builds the strategy of a backtest from its markets and parameters. Runs in the worker processes, so it has to be a
+# module level function.
+StrategyFactory = Callable[[List[PaperTradeExchange], Dict[str, Any]], TimeIterator]
+
+
+class BacktestMarketSpec(NamedTuple):
+    exchange_name: str
+    trading_pairs: List[str]
+    recording_dir: str
+    balances: Dict[str, Decimal]
+    target_market: Optional[type] = None
+    # Copied for each backtest.
+    fill_model: Optional[QueueFillModel] = None
+
+
+class BacktestSweepResult(NamedTuple):
+    parameters: Dict[str, Any]
+    pnl: Decimal = Decimal(0)
+    return_pct: Decimal = Decimal(0)
+    fees: Decimal = Decimal(0)
+    fill_count: int = 0
+    buy_count: int = 0
+    sell_count: int = 0
+    quote_volume: Decimal = Decimal(0)
+    order_count: int = 0
+    cancel_count: int = 0
+    wall_time: float = 0.0
+    error: Optional[str] = None
+
+    @classmethod
+    def from_backtest_result(cls, parameters: Dict[str, Any], result: BacktestResult) -> "BacktestSweepResult":
+        stats = result.fill_stats.values()
+        return BacktestSweepResult(parameters=parameters,
+                                   pnl=result.pnl,
+                                   return_pct=result.return_pct,
+                                   fees=result.fees,
+                                   fill_count=result.fill_count,
+                                   buy_count=sum(s.buy_count for s in stats),
+                                   sell_count=sum(s.sell_count for s in stats),
+                                   quote_volume=sum((s.buy_quote_volume + s.sell_quote_volume for s in stats),
+                                                    Decimal(0)),
+                                   order_count=result.order_count,
+                                   cancel_count=result.cancel_count,
+                                   wall_time=result.wall_time)
+
+
+def pure_market_making_factory(markets: List[PaperTradeExchange], parameters: Dict[str, Any]) -> TimeIterator:
+    """
+    Pure market making on the first trading pair of the first market, with the parameters as keyword arguments.
+    """
+    from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+    from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+    market: PaperTradeExchange = markets[0]
+    trading_pair: str = list(market.order_books.keys())[0]
+    base_asset, quote_asset = market.split_trading_pair(trading_pair)
+    return PureMarketMakingStrategy(MarketTradingPairTuple(market, trading_pair, base_asset, quote_asset),
+                                    **parameters)
+
+
+def parameter_grid(grid: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    :return: Every combination of the parameter values.
+    """
+    names: List[str] = list(grid.keys())
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def random_parameters(space: Dict[str, Union[Sequence[Any], Tuple[Any, Any]]],
+                      count: int,
+                      seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Random search over a parameter space. A (low, high) tuple of numbers is sampled uniformly, as a Decimal, int or
+    float like its bounds, and any other sequence is sampled as a list of choices.
+    """
+    rng: random.Random = random.Random(seed)
+
+    def sample(values: Union[Sequence[Any], Tuple[Any, Any]]) -> Any:
+        if isinstance(values, tuple) and len(values) == 2 and all(isinstance(v, (int, float, Decimal)) for v in values):
+            low, high = values
+            if isinstance(low, Decimal) or isinstance(high, Decimal):
+                return Decimal(str(round(rng.uniform(float(low), float(high)), 8)))
+            if isinstance(low, int) and isinstance(high, int):
+                return rng.randint(low, high)
+            return rng.uniform(low, high)
+        return rng.choice(list(values))
+
+    return [{name: sample(values) for name, values in space.items()} for _ in range(count)]
+
+
+def run_backtest(markets: List[BacktestMarketSpec],
+                 strategy_factory: StrategyFactory,
+                 parameters: Dict[str, Any],
+                 start_time: float,
+                 end_time: float,
+                 tick_size: float = 1.0,
+                 valuation_asset: Optional[str] = None) -> BacktestSweepResult:
+    """
+    Runs one backtest of the sweep, with its own event loop for the markets' network checks.
+    """
+    ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    asyncio.set_event_loop(ev_loop)
+    try:
+        runner: BacktestRunner = BacktestRunner(start_time, end_time, tick_size, valuation_asset)
+        paper_markets: List[PaperTradeExchange] = [
+            runner.add_market(spec.exchange_name, spec.trading_pairs, spec.recording_dir, spec.balances,
+                              target_market=spec.target_market, fill_model=copy.deepcopy(spec.fill_model))
+            for spec in markets
+        ]
+        runner.add_strategy(strategy_factory(paper_markets, parameters))
+        return BacktestSweepResult.from_backtest_result(parameters, runner.run())
+    except Exception as e:
+        BacktestSweep.logger().error(f"Error running backtest with {parameters}.", exc_info=True)
+        return BacktestSweepResult(parameters=parameters, error=repr(e))
+    finally:
+        ev_loop.close()
+
+
+class BacktestSweep:
+    """
+    Runs the same backtest for many strategy parameter sets across a process pool.
+
+    The workers replay the same recording files, which OrderBookRecordReader memory maps, so the market data is read
+    from disk once and shared by all the processes through the page cache.
+
+        sweep = BacktestSweep([BacktestMarketSpec("binance", ["ETH-USDT"], recording_dir, balances)],
+                              pure_market_making_factory, start_time, end_time)
+        results = sweep.run(parameter_grid({"bid_spread": [Decimal("0.001"), Decimal("0.002")], ...}))
+        results_frame(results).to_csv("sweep.csv")
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self,
+                 markets: List[BacktestMarketSpec],
+                 strategy_factory: StrategyFactory,
+                 start_time: float,
+                 end_time: float,
+                 tick_size: float = 1.0,
+                 valuation_asset: Optional[str] = None):
+        self._markets: List[BacktestMarketSpec] = markets
+        self._strategy_factory: StrategyFactory = strategy_factory
+        self._start_time: float = start_time
+        self._end_time: float = end_time
+        self._tick_size: float = tick_size
+        self._valuation_asset: Optional[str] = valuation_asset
+
+    def run(self, parameter_sets: List[Dict[str, Any]], max_workers: Optional[int] = None) -> List[BacktestSweepResult]:
+        """
+        :param max_workers: Number of worker processes, the number of CPUs by default. With 1, runs in this process.
+        :return: The results of the parameter sets, best PnL first.
+        """
+        args: List[Tuple] = [(self._markets, self._strategy_factory, parameters, self._start_time, self._end_time,
+                              self._tick_size, self._valuation_asset) for parameters in parameter_sets]
+        if max_workers == 1:
+            results: List[BacktestSweepResult] = [run_backtest(*arg) for arg in args]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(run_backtest, *zip(*args)))
+        return rank_results(results)
+
+
+def rank_results(results: List[BacktestSweepResult]) -> List[BacktestSweepResult]:
+    """
+    Sorts by PnL, then by fill count, best first. Failed backtests go last.
+    """
+    return sorted(results, key=lambda r: (r.error is None, r.pnl, r.fill_count), reverse=True)
+
+
+def results_frame(results: List[BacktestSweepResult]) -> pd.DataFrame:
+    """
+    :return: A table of the results, one row per parameter set with a column per parameter, in the given order.
+    """
+    rows: List[Dict[str, Any]] = []
+    for rank, result in enumerate(results, 1):
+        row: Dict[str, Any] = {"rank": rank}
+        row.update(result.parameters)
+        row.update({
+            "pnl": float(result.pnl),
+            "return_pct": float(result.return_pct),
+            "fees": float(result.fees),
+            "fills": result.fill_count,
+            "buys": result.buy_count,
+            "sells": result.sell_count,
+            "volume": float(result.quote_volume),
+            "orders": result.order_count,
+            "fill_ratio": result.fill_count / result.order_count if result.order_count > 0 else 0.0,
+            "cancels": result.cancel_count,
+            "wall_time": result.wall_time,
+            "error": result.error,
+        })
+        rows.append(row)
+    return pd.DataFrame(rows)
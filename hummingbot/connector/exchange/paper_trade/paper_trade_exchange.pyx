@@ -13,6 +13,7 @@ import random
 from typing import (
     Dict,
     List,
+    Optional,
     Tuple)
 from cython.operator cimport(
     postincrement as inc,
@@ -51,6 +52,7 @@ from hummingbot.core.event.events import (
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.exchange.paper_trade.queue_fill_model import QueueFillModel
 from hummingbot.connector.exchange.paper_trade.trading_pair import TradingPair
 from hummingbot.core.utils.estimate_fee import estimate_fee
 
@@ -168,7 +170,12 @@ cdef class PaperTradeExchange(ExchangeBase):
     MARKET_SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
     MARKET_BUY_ORDER_CREATED_EVENT_TAG = MarketEvent.BuyOrderCreated.value
 
-    def __init__(self, order_book_tracker: OrderBookTracker, config: MarketConfig, target_market: type):
+    def __init__(self, order_book_tracker: OrderBookTracker, config: MarketConfig, target_market: type,
+                 fill_model: Optional[QueueFillModel] = None):
+        """
+        :param fill_model: Simulates the queue position and order entry latency of limit orders. Without it, limit
+        orders fill as soon as the price trades through them.
+        """
         order_book_tracker.data_source.order_book_create_function = lambda: CompositeOrderBook()
         self._order_book_tracker = order_book_tracker
         super(ExchangeBase, self).__init__()
@@ -181,6 +188,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._quantization_params = {}
         self._order_book_trade_listener = OrderBookTradeListener(self)
         self._target_market = target_market
+        self._fill_model = fill_model
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
         self.c_add_listener(self.ORDER_FILLED_EVENT_TAG, self._market_order_filled_listener)
 
@@ -215,6 +223,10 @@ cdef class PaperTradeExchange(ExchangeBase):
     def display_name(self) -> str:
         return f"Paper"
 
+    @property
+    def fill_model(self) -> Optional[QueueFillModel]:
+        return self._fill_model
+
     @property
     def order_books(self) -> Dict[str, CompositeOrderBook]:
         return self._order_book_tracker.order_books
@@ -277,10 +289,15 @@ cdef class PaperTradeExchange(ExchangeBase):
     def on_hold_balances(self) -> Dict[str, Decimal]:
         _on_hold_balances = defaultdict(Decimal)
         for limit_order in self.limit_orders:
+            quantity = limit_order.quantity
+            if self._fill_model is not None:
+                # Less what partial fills took.
+                remaining = self._fill_model.remaining(limit_order.client_order_id)
+                quantity = remaining if remaining is not None else quantity
             if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
+                _on_hold_balances[limit_order.quote_currency] += quantity * limit_order.price
             else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
+                _on_hold_balances[limit_order.base_currency] += quantity
         return _on_hold_balances
 
     @property
@@ -317,6 +334,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_tick(self, double timestamp):
         ExchangeBase.c_tick(self, timestamp)
         self.c_process_market_orders()
+        if self._fill_model is not None:
+            self.c_process_fill_model()
         self.c_process_crossed_limit_orders()
 
     cdef str c_buy(self,
@@ -364,6 +383,9 @@ cdef class PaperTradeExchange(ExchangeBase):
                 <PyObject *> quantized_price,
                 <PyObject *> quantized_amount
             ))
+            if self._fill_model is not None:
+                self._fill_model.add_order(order_id, trading_pair_str, True, quantized_price, quantized_amount,
+                                           self._current_timestamp)
         self.c_trigger_event(self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
                              BuyOrderCreatedEvent(
                                  self._current_timestamp,
@@ -419,6 +441,9 @@ cdef class PaperTradeExchange(ExchangeBase):
                 <PyObject *> quantized_price,
                 <PyObject *> quantized_amount
             ))
+            if self._fill_model is not None:
+                self._fill_model.add_order(order_id, trading_pair_str, False, quantized_price, quantized_amount,
+                                           self._current_timestamp)
         self.c_trigger_event(self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
                              SellOrderCreatedEvent(
                                  self._current_timestamp,
@@ -566,6 +591,8 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
         try:
+            if self._fill_model is not None:
+                self._fill_model.remove_order(deref(orders_it).getClientOrderID().decode("utf8"))
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -577,7 +604,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair = cpp_limit_order_ptr.getTradingPair().decode("utf8")
@@ -585,9 +613,8 @@ cdef class PaperTradeExchange(ExchangeBase):
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
             object quote_asset_balance = self.c_get_balance(quote_asset)
-            object quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * \
-                                        <object> cpp_limit_order_ptr.getQuantity()
-            object base_asset_traded = <object> cpp_limit_order_ptr.getQuantity()
+            object base_asset_traded = self.c_limit_order_fill_amount(order_id, cpp_limit_order_ptr, fill_amount)
+            object quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * base_asset_traded
 
         # Check if there's enough balance to satisfy the order. If not, remove the limit order without doing anything.
         if quote_asset_balance < quote_asset_traded:
@@ -616,10 +643,14 @@ cdef class PaperTradeExchange(ExchangeBase):
                 TradeType.BUY,
                 OrderType.LIMIT,
                 <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                base_asset_traded,
                 fees
             ))
 
+        if self._fill_model is not None and self._fill_model.remaining(order_id) > s_decimal_0:
+            # Partially filled, the order stays on the book.
+            return
+
         self.c_trigger_event(
             self.BUY_ORDER_COMPLETED_EVENT_TAG,
             BuyOrderCompletedEvent(
@@ -628,8 +659,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 base_asset,
                 quote_asset,
                 base_asset if config.buy_fees_asset is AssetType.BASE_CURRENCY else quote_asset,
-                base_asset_traded,
-                quote_asset_traded,
+                <object> cpp_limit_order_ptr.getQuantity(),
+                <object> cpp_limit_order_ptr.getPrice() * <object> cpp_limit_order_ptr.getQuantity(),
                 s_decimal_0,
                 OrderType.LIMIT
             ))
@@ -638,7 +669,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
@@ -646,9 +678,8 @@ cdef class PaperTradeExchange(ExchangeBase):
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
             object base_asset_balance = self.c_get_balance(base_asset)
-            object quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * \
-                                        <object> cpp_limit_order_ptr.getQuantity()
-            object base_asset_traded = <object> cpp_limit_order_ptr.getQuantity()
+            object base_asset_traded = self.c_limit_order_fill_amount(order_id, cpp_limit_order_ptr, fill_amount)
+            object quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * base_asset_traded
 
         # Check if there's enough balance to satisfy the order. If not, remove the limit order without doing anything.
         if base_asset_balance < base_asset_traded:
@@ -676,10 +707,14 @@ cdef class PaperTradeExchange(ExchangeBase):
                 TradeType.SELL,
                 OrderType.LIMIT,
                 <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                base_asset_traded,
                 fees
             ))
 
+        if self._fill_model is not None and self._fill_model.remaining(order_id) > s_decimal_0:
+            # Partially filled, the order stays on the book.
+            return
+
         self.c_trigger_event(
             self.SELL_ORDER_COMPLETED_EVENT_TAG,
             SellOrderCompletedEvent(
@@ -688,23 +723,35 @@ cdef class PaperTradeExchange(ExchangeBase):
                 base_asset,
                 quote_asset,
                 base_asset if config.sell_fees_asset is AssetType.BASE_CURRENCY else quote_asset,
-                base_asset_traded,
-                quote_asset_traded,
+                <object> cpp_limit_order_ptr.getQuantity(),
+                <object> cpp_limit_order_ptr.getPrice() * <object> cpp_limit_order_ptr.getQuantity(),
                 s_decimal_0,
                 OrderType.LIMIT
             ))
         self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
 
+    cdef object c_limit_order_fill_amount(self, str order_id, const CPPLimitOrder *cpp_limit_order_ptr,
+                                          object fill_amount):
+        """
+        :return: fill_amount if given, else the rest of the order.
+        """
+        if fill_amount is None and self._fill_model is not None:
+            fill_amount = self._fill_model.fill_remaining(order_id)
+        if fill_amount is None:
+            fill_amount = <object> cpp_limit_order_ptr.getQuantity()
+        return fill_amount
+
     cdef c_process_limit_order(self,
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it):
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_amount=None):
         try:
             if is_buy:
-                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
             else:
-                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
         except Exception as e:
             self.logger().error(f"Error processing limit order.", exc_info=True)
 
@@ -734,15 +781,19 @@ cdef class PaperTradeExchange(ExchangeBase):
                 cpp_limit_order_ptr = address(deref(orders_rit))
                 if opposite_order_book_price > <object>cpp_limit_order_ptr.getPrice():
                     break
-                process_order_its.push_back(getIteratorFromReverseIterator(
-                    <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                if self._fill_model is None or \
+                        self._fill_model.is_active(cpp_limit_order_ptr.getClientOrderID().decode("utf8")):
+                    process_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
                 inc(orders_rit)
         else:
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
                 if opposite_order_book_price < <object>cpp_limit_order_ptr.getPrice():
                     break
-                process_order_its.push_back(orders_it)
+                if self._fill_model is None or \
+                        self._fill_model.is_active(cpp_limit_order_ptr.getClientOrderID().decode("utf8")):
+                    process_order_its.push_back(orders_it)
                 inc(orders_it)
 
         for orders_it in process_order_its:
@@ -766,6 +817,18 @@ cdef class PaperTradeExchange(ExchangeBase):
             if map_it != limit_orders_ptr.end():
                 inc(map_it)
 
+    cdef c_process_fill_model(self):
+        """
+        Applies the cancels whose latency has elapsed, then updates the queue positions of the limit orders.
+        """
+        for order in self._fill_model.due_cancels(self._current_timestamp):
+            self.c_cancel_order_from_orders_map(address(self._bid_limit_orders) if order.is_buy
+                                                else address(self._ask_limit_orders),
+                                                order.trading_pair, False, order.order_id)
+            self._fill_model.remove_order(order.order_id)
+        for trading_pair in self._fill_model.trading_pairs:
+            self._fill_model.update_queues(trading_pair, self.c_get_order_book(trading_pair), self._current_timestamp)
+
     # <editor-fold desc="Event listener functions">
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event):
         """
@@ -791,6 +854,25 @@ cdef class PaperTradeExchange(ExchangeBase):
         if map_it == limit_orders_map_ptr.end():
             return
 
+        if self._fill_model is not None:
+            for order_id, fill_amount in self._fill_model.match_trade(order_book_trade_event.trading_pair,
+                                                                      is_maker_buy,
+                                                                      float(trade_price),
+                                                                      float(trade_quantity)):
+                # Filling an order can remove the trading pair's collection.
+                map_it = limit_orders_map_ptr.find(cpp_trading_pair)
+                if map_it == limit_orders_map_ptr.end():
+                    return
+                orders_collection_ptr = address(deref(map_it).second)
+                orders_it = orders_collection_ptr.begin()
+                while orders_it != orders_collection_ptr.end():
+                    if deref(orders_it).getClientOrderID().decode("utf8") == order_id:
+                        self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it,
+                                                   fill_amount)
+                        break
+                    inc(orders_it)
+            return
+
         orders_collection_ptr = address(deref(map_it).second)
         if is_maker_buy:
             orders_rit = orders_collection_ptr.rbegin()
@@ -886,6 +968,9 @@ cdef class PaperTradeExchange(ExchangeBase):
             LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
                                                  if is_maker_buy
                                                  else address(self._ask_limit_orders))
+        if self._fill_model is not None and self._fill_model.request_cancel(client_order_id, self._current_timestamp):
+            # Cancelled once the cancel latency has elapsed, by c_process_fill_model().
+            return
         self.c_cancel_order_from_orders_map(limit_orders_map_ptr, trading_pair_str, False, client_order_id)
 
     cdef object c_get_fee(self,
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+s_decimal_0 = Decimal(0)
+
+
+class SimulatedLimitOrder:
+    __slots__ = ("order_id", "trading_pair", "is_buy", "price", "remaining", "active_timestamp", "queue_ahead",
+                 "cancel_timestamp")
+
+    def __init__(self, order_id: str, trading_pair: str, is_buy: bool, price: Decimal, amount: Decimal,
+                 active_timestamp: float):
+        self.order_id: str = order_id
+        self.trading_pair: str = trading_pair
+        self.is_buy: bool = is_buy
+        self.price: float = float(price)
+        self.remaining: Decimal = amount
+        self.active_timestamp: float = active_timestamp
+        # Amount queued ahead of the order at its price level, None until the order reaches the exchange.
+        self.queue_ahead: Optional[float] = None
+        self.cancel_timestamp: Optional[float] = None
+
+    def __repr__(self) -> str:
+        return (f"SimulatedLimitOrder('{self.order_id}', '{self.trading_pair}', {self.is_buy}, {self.price}, "
+                f"{self.remaining}, queue_ahead={self.queue_ahead})")
+
+
+class QueueFillModel:
+    """
+    Limit order fill simulation for PaperTradeExchange, accounting for order entry latency and for the volume queued
+    ahead of each order at its price level.
+
+    - An order reaches the exchange placement_latency seconds after it is created. It then joins the back of its price
+      level, behind the amount the order book shows there at that time.
+    - Trades at the order's price consume the queue ahead of it first, then fill it partially or fully. Trades through
+      its price fill it fully. Cancellations ahead are inferred when the level shrinks below the queue ahead, and
+      cancellations behind never move the order forward.
+    - A cancel takes effect cancel_latency seconds after it is requested, and the order can fill until then.
+
+    Latencies resolve at the clock tick, as the exchange only sees time move on its ticks. Queue positions are only
+    refreshed for pairs with orders and whose order book changed, from the top `depth` levels; orders deeper than that
+    keep their queue position until the book comes back to them.
+    """
+
+    def __init__(self, placement_latency: float = 0.0, cancel_latency: float = 0.0, depth: int = 50):
+        self._placement_latency: float = placement_latency
+        self._cancel_latency: float = cancel_latency
+        self._depth: int = depth
+        self._orders: Dict[str, SimulatedLimitOrder] = {}
+        self._pair_orders: Dict[str, Dict[str, SimulatedLimitOrder]] = {}
+        self._update_counts: Dict[str, int] = {}
+        self._pending_activations: Dict[str, int] = {}
+
+    @property
+    def placement_latency(self) -> float:
+        return self._placement_latency
+
+    @property
+    def cancel_latency(self) -> float:
+        return self._cancel_latency
+
+    @property
+    def orders(self) -> Dict[str, SimulatedLimitOrder]:
+        return self._orders
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return list(self._pair_orders.keys())
+
+    def add_order(self, order_id: str, trading_pair: str, is_buy: bool, price: Decimal, amount: Decimal,
+                  timestamp: float):
+        order: SimulatedLimitOrder = SimulatedLimitOrder(order_id, trading_pair, is_buy, price, amount,
+                                                         timestamp + self._placement_latency)
+        self._orders[order_id] = order
+        self._pair_orders.setdefault(trading_pair, {})[order_id] = order
+        self._pending_activations[trading_pair] = self._pending_activations.get(trading_pair, 0) + 1
+
+    def remove_order(self, order_id: str):
+        order: Optional[SimulatedLimitOrder] = self._orders.pop(order_id, None)
+        if order is None:
+            return
+        pair_orders: Dict[str, SimulatedLimitOrder] = self._pair_orders[order.trading_pair]
+        del pair_orders[order_id]
+        if order.queue_ahead is None:
+            self._pending_activations[order.trading_pair] -= 1
+        if len(pair_orders) == 0:
+            del self._pair_orders[order.trading_pair]
+            self._pending_activations.pop(order.trading_pair, None)
+            self._update_counts.pop(order.trading_pair, None)
+
+    def is_active(self, order_id: str) -> bool:
+        """
+        :return: Whether the order is on the exchange and can fill. Orders unknown to the model are.
+        """
+        order: Optional[SimulatedLimitOrder] = self._orders.get(order_id)
+        return order is None or order.queue_ahead is not None
+
+    def request_cancel(self, order_id: str, timestamp: float) -> bool:
+        """
+        :return: True if the cancel is delayed, False if it should take effect now.
+        """
+        order: Optional[SimulatedLimitOrder] = self._orders.get(order_id)
+        if order is None or self._cancel_latency <= 0:
+            return False
+        if order.cancel_timestamp is None:
+            order.cancel_timestamp = timestamp + self._cancel_latency
+        return True
+
+    def due_cancels(self, timestamp: float) -> List[SimulatedLimitOrder]:
+        return [order for order in self._orders.values()
+                if order.cancel_timestamp is not None and order.cancel_timestamp <= timestamp]
+
+    def update_queues(self, trading_pair: str, order_book: OrderBook, timestamp: float):
+        """
+        Activates the orders that reached the exchange and refreshes the queue positions from the order book.
+        """
+        pair_orders: Optional[Dict[str, SimulatedLimitOrder]] = self._pair_orders.get(trading_pair)
+        if pair_orders is None:
+            return
+        update_count: int = order_book.update_count
+        if self._pending_activations[trading_pair] == 0 and self._update_counts.get(trading_pair) == update_count:
+            return
+        self._update_counts[trading_pair] = update_count
+        sides: Dict[bool, Tuple[Dict[float, float], float]] = {}
+        for order in pair_orders.values():
+            if order.queue_ahead is None and order.active_timestamp > timestamp:
+                continue
+            if order.is_buy not in sides:
+                levels = order_book.get_top_levels(order.is_buy, self._depth)
+                # Prices beyond the last level are not known.
+                last_price: float = float(levels[-1, 0]) if len(levels) == self._depth else \
+                    (float("-inf") if order.is_buy else float("inf"))
+                sides[order.is_buy] = (dict(zip(levels[:, 0].tolist(), levels[:, 1].tolist())), last_price)
+            level_amounts, last_price = sides[order.is_buy]
+            level_amount: float = level_amounts.get(order.price, 0.0)
+            if order.is_buy and order.price < last_price or not order.is_buy and order.price > last_price:
+                # Behind everything at its level, whatever that is, until the level is in view.
+                level_amount = float("inf")
+            if order.queue_ahead is None:
+                order.queue_ahead = level_amount
+                self._pending_activations[trading_pair] -= 1
+            elif level_amount < order.queue_ahead:
+                order.queue_ahead = level_amount
+
+    def match_trade(self, trading_pair: str, is_maker_buy: bool, price: float, amount: float) \
+            -> List[Tuple[str, Decimal]]:
+        """
+        Fills the active orders a trade reaches, best price first.
+        :param is_maker_buy: True if the trade hit the bids.
+        :return: (order id, fill amount) of the filled orders, with their remaining amounts already reduced.
+        """
+        pair_orders: Optional[Dict[str, SimulatedLimitOrder]] = self._pair_orders.get(trading_pair)
+        if pair_orders is None:
+            return []
+        orders: List[SimulatedLimitOrder] = [
+            order for order in pair_orders.values()
+            if order.is_buy is is_maker_buy and order.queue_ahead is not None and
+            (order.price >= price if is_maker_buy else order.price <= price)
+        ]
+        orders.sort(key=lambda o: o.price, reverse=is_maker_buy)
+        fills: List[Tuple[str, Decimal]] = []
+        for order in orders:
+            if order.price != price:
+                # The trade went through the order's price level, so the whole level was taken.
+                fill_amount: Decimal = order.remaining
+            else:
+                available: float = amount - order.queue_ahead
+                order.queue_ahead = max(order.queue_ahead - amount, 0.0)
+                if available <= 0:
+                    continue
+                fill_amount = min(order.remaining, Decimal(repr(available)))
+                # The rest of the trade goes to the orders queued behind.
+                amount = available - float(fill_amount)
+            order.remaining -= fill_amount
+            fills.append((order.order_id, fill_amount))
+        return fills
+
+    def remaining(self, order_id: str) -> Optional[Decimal]:
+        order: Optional[SimulatedLimitOrder] = self._orders.get(order_id)
+        return order.remaining if order is not None else None
+
+    def fill_remaining(self, order_id: str) -> Optional[Decimal]:
+        """
+        Fills the whole remaining amount of an order, e.g. when the book crosses its price.
+        :return: The amount filled, or None if the order is unknown to the model.
+        """
+        order: Optional[SimulatedLimitOrder] = self._orders.get(order_id)
+        if order is None:
+            return None
+        amount: Decimal = order.remaining
+        order.remaining = s_decimal_0
+        return amount
@@ -1,7 +1,7 @@
 cdef class InFlightOrderBase:
     cdef:
         public str client_order_id
-        public str exchange_order_id
+        str _exchange_order_id
         public str trading_pair
         public object order_type
         public object trade_type
@@ -13,3 +13,4 @@ cdef class InFlightOrderBase:
         public object fee_paid
         public str last_state
         public object exchange_order_id_update_event
+        object _registry
@@ -25,6 +25,7 @@ cdef class InFlightOrderBase:
                  amount: Decimal,
                  initial_state: str):
 
+        self._registry = None
         self.client_order_id = client_order_id
         self.exchange_order_id = exchange_order_id
         self.trading_pair = trading_pair
@@ -54,6 +55,28 @@ cdef class InFlightOrderBase:
                f"fee_paid={self.fee_paid}, " \
                f"last_state='{self.last_state}')"
 
+    @property
+    def exchange_order_id(self) -> Optional[str]:
+        return self._exchange_order_id
+
+    @exchange_order_id.setter
+    def exchange_order_id(self, exchange_order_id: Optional[str]):
+        previous_exchange_order_id: Optional[str] = self._exchange_order_id
+        self._exchange_order_id = exchange_order_id
+        if self._registry is not None and exchange_order_id != previous_exchange_order_id:
+            self._registry.on_exchange_order_id_update(self, previous_exchange_order_id)
+
+    @property
+    def registry(self):
+        """
+        The InFlightOrderRegistry tracking the order, which indexes it by its exchange order ID.
+        """
+        return self._registry
+
+    @registry.setter
+    def registry(self, registry):
+        self._registry = registry
+
     @property
     def is_done(self) -> bool:
         raise NotImplementedError
@@ -0,0 +1,96 @@
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+
+
+class InFlightOrderRegistry(dict):
+    """
+    The in-flight orders of a connector by client order ID (or whatever key the connector tracks them by), also
+    indexed by exchange order ID and by trading pair, for the user stream and order status handlers to find an order
+    without scanning all of them.
+
+    It is a drop-in replacement for the connectors' in-flight order dicts. The indexes are maintained as orders are
+    added and removed, and as their exchange order IDs are set, through the order's registry back-reference.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__()
+        self._by_exchange_order_id: Dict[str, InFlightOrderBase] = {}
+        self._by_trading_pair: Dict[str, Dict[str, InFlightOrderBase]] = {}
+        self.update(*args, **kwargs)
+
+    def get_by_exchange_order_id(self, exchange_order_id: str) -> Optional[InFlightOrderBase]:
+        return self._by_exchange_order_id.get(exchange_order_id)
+
+    def orders_for_trading_pair(self, trading_pair: str) -> List[InFlightOrderBase]:
+        return list(self._by_trading_pair.get(trading_pair, {}).values())
+
+    def on_exchange_order_id_update(self, order: InFlightOrderBase, previous_exchange_order_id: Optional[str]):
+        if previous_exchange_order_id is not None and \
+                self._by_exchange_order_id.get(previous_exchange_order_id) is order:
+            del self._by_exchange_order_id[previous_exchange_order_id]
+        if order.exchange_order_id is not None:
+            self._by_exchange_order_id[order.exchange_order_id] = order
+
+    def _index(self, key: str, order: InFlightOrderBase):
+        self._by_trading_pair.setdefault(order.trading_pair, {})[key] = order
+        if isinstance(order, InFlightOrderBase):
+            order.registry = self
+        if order.exchange_order_id is not None:
+            self._by_exchange_order_id[order.exchange_order_id] = order
+
+    def _unindex(self, key: str, order: InFlightOrderBase):
+        pair_orders: Optional[Dict[str, InFlightOrderBase]] = self._by_trading_pair.get(order.trading_pair)
+        if pair_orders is not None:
+            pair_orders.pop(key, None)
+            if len(pair_orders) == 0:
+                del self._by_trading_pair[order.trading_pair]
+        if order.exchange_order_id is not None and self._by_exchange_order_id.get(order.exchange_order_id) is order:
+            del self._by_exchange_order_id[order.exchange_order_id]
+        if isinstance(order, InFlightOrderBase) and order.registry is self:
+            order.registry = None
+
+    def __setitem__(self, key: str, order: InFlightOrderBase):
+        previous: Optional[InFlightOrderBase] = self.get(key)
+        if previous is not None:
+            self._unindex(key, previous)
+        super().__setitem__(key, order)
+        self._index(key, order)
+
+    def __delitem__(self, key: str):
+        order: InFlightOrderBase = self[key]
+        super().__delitem__(key)
+        self._unindex(key, order)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key not in self:
+            if len(default) > 0:
+                return default[0]
+            raise KeyError(key)
+        order: InFlightOrderBase = super().pop(key)
+        self._unindex(key, order)
+        return order
+
+    def popitem(self) -> Any:
+        key, order = super().popitem()
+        self._unindex(key, order)
+        return key, order
+
+    def setdefault(self, key: str, default: Optional[InFlightOrderBase] = None) -> InFlightOrderBase:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any):
+        for key, order in dict(*args, **kwargs).items():
+            self[key] = order
+
+    def clear(self):
+        for key, order in list(self.items()):
+            self._unindex(key, order)
+        super().clear()
@@ -3,6 +3,7 @@
 import os.path
 import pandas as pd
 import asyncio
+import json
 from sqlalchemy.orm import (
     Session,
     Query
@@ -10,6 +11,7 @@ from sqlalchemy.orm import (
 import time
 import threading
 from typing import (
+    Any,
     Dict,
     List,
     Optional,
@@ -33,12 +35,44 @@ from hummingbot.core.event.events import (
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_entry import MarketStateEntry
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
 
 
+def split_tracking_states(tracking_states: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Splits a market's tracking states into the entries they are saved as, keyed by their JSON encoded key path.
+
+    Most markets track their in-flight orders as {order id: order JSON}, making each order an entry. Markets that
+    group them by kind, like {"limit_orders": {order id: order JSON}, ...}, get an entry per order as well.
+    """
+    entries: Dict[str, Any] = {}
+    for key, value in tracking_states.items():
+        if isinstance(value, dict) and len(value) > 0 and all(isinstance(v, dict) for v in value.values()):
+            for inner_key, inner_value in value.items():
+                entries[json.dumps([key, inner_key])] = inner_value
+        else:
+            entries[json.dumps([key])] = value
+    return entries
+
+
+def join_tracking_states(entries: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The reverse of split_tracking_states.
+    """
+    tracking_states: Dict[str, Any] = {}
+    for key, value in entries.items():
+        key_path: List[str] = json.loads(key)
+        if len(key_path) == 1:
+            tracking_states[key_path[0]] = value
+        else:
+            tracking_states.setdefault(key_path[0], {})[key_path[1]] = value
+    return tracking_states
+
+
 class MarketsRecorder:
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
@@ -58,6 +92,8 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        # The saved tracking state entries of each market as compact JSON, by (config file path, market name)
+        self._market_state_entries: Dict[Tuple[str, str], Dict[str, str]] = {}
 
         self._create_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_create_order)
         self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
@@ -128,20 +164,61 @@ class MarketsRecorder:
             return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, no_commit: bool = False):
+        """
+        Checkpoints the market's tracking states. Only the entries that changed since the last checkpoint are written,
+        and the ones that are gone are deleted.
+        """
         session: Session = self.session
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
+        market_states: Optional[MarketState] = self._get_market_state_record(config_file_path, market)
+        saved_entries: Dict[str, str] = self._get_saved_entries(config_file_path, market)
         timestamp: int = self.db_timestamp
+        entries: Dict[str, str] = {
+            key: json.dumps(value, separators=(",", ":"))
+            for key, value in split_tracking_states(market.tracking_states).items()
+        }
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
             market_states.timestamp = timestamp
+            # The tracking states saved before they were split into entries are replaced by the entries.
+            if len(market_states.saved_state) > 0:
+                market_states.saved_state = {}
         else:
             market_states = MarketState(config_file_path=config_file_path,
                                         market=market.display_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state={})
             session.add(market_states)
 
+        removed_keys: List[str] = [key for key in saved_entries.keys() if key not in entries]
+        if len(removed_keys) > 0:
+            (session.query(MarketStateEntry)
+             .filter(MarketStateEntry.config_file_path == config_file_path,
+                     MarketStateEntry.market == market.display_name,
+                     MarketStateEntry.key.in_(removed_keys))
+             .delete(synchronize_session=False))
+            for key in removed_keys:
+                del saved_entries[key]
+
+        for key, value_json in entries.items():
+            saved_value_json: Optional[str] = saved_entries.get(key)
+            if saved_value_json == value_json:
+                continue
+            if saved_value_json is None:
+                session.add(MarketStateEntry(config_file_path=config_file_path,
+                                             market=market.display_name,
+                                             key=key,
+                                             timestamp=timestamp,
+                                             value=MarketStateEntry.encode_value(value_json)))
+            else:
+                (session.query(MarketStateEntry)
+                 .filter(MarketStateEntry.config_file_path == config_file_path,
+                         MarketStateEntry.market == market.display_name,
+                         MarketStateEntry.key == key)
+                 .update({MarketStateEntry.timestamp: timestamp,
+                          MarketStateEntry.value: MarketStateEntry.encode_value(value_json)},
+                         synchronize_session=False))
+            saved_entries[key] = value_json
+
         if not no_commit:
             session.commit()
 
@@ -152,6 +229,26 @@ class MarketsRecorder:
             market.restore_tracking_states(market_states.saved_state)
 
     def get_market_states(self, config_file_path: str, market: ConnectorBase) -> Optional[MarketState]:
+        """
+        :return: The market's last checkpoint, with its tracking states joined back from their entries. It is not
+                 attached to the session, so changes to it are not saved.
+        """
+        market_states: Optional[MarketState] = self._get_market_state_record(config_file_path, market)
+        if market_states is None:
+            return None
+        saved_state: Dict[str, Any] = market_states.saved_state
+        if len(saved_state) == 0:
+            saved_state = join_tracking_states({
+                key: json.loads(value_json)
+                for key, value_json in self._get_saved_entries(config_file_path, market).items()
+            })
+        return MarketState(id=market_states.id,
+                           config_file_path=market_states.config_file_path,
+                           market=market_states.market,
+                           timestamp=market_states.timestamp,
+                           saved_state=saved_state)
+
+    def _get_market_state_record(self, config_file_path: str, market: ConnectorBase) -> Optional[MarketState]:
         session: Session = self.session
         query: Query = (session
                         .query(MarketState)
@@ -160,6 +257,19 @@ class MarketsRecorder:
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
+    def _get_saved_entries(self, config_file_path: str, market: ConnectorBase) -> Dict[str, str]:
+        cache_key: Tuple[str, str] = (config_file_path, market.display_name)
+        if cache_key not in self._market_state_entries:
+            session: Session = self.session
+            query: Query = (session
+                            .query(MarketStateEntry.key, MarketStateEntry.value)
+                            .filter(MarketStateEntry.config_file_path == config_file_path,
+                                    MarketStateEntry.market == market.display_name))
+            self._market_state_entries[cache_key] = {
+                key: MarketStateEntry.decode_value(value) for key, value in query.all()
+            }
+        return self._market_state_entries[cache_key]
+
     def _did_create_order(self,
                           event_tag: int,
                           market: ConnectorBase,
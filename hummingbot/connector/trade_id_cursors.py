@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional
+)
+
+
+class TradeIdCursors:
+    """
+    Keeps, per trading pair, the id of the last exchange trade that has been processed by a connector's trade
+    polling loop. Connectors use it to only request trades newer than the cursor (e.g. Binance's `fromId`), instead
+    of re-downloading and re-deduplicating the same recent trades on every poll.
+
+    The cursors are meant to be persisted alongside the connector's tracking states, so that a restarted bot resumes
+    from where it stopped.
+    """
+
+    def __init__(self, cursors: Optional[Dict[str, int]] = None):
+        self._cursors: Dict[str, int] = dict(cursors) if cursors is not None else {}
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+    def __contains__(self, trading_pair: str) -> bool:
+        return trading_pair in self._cursors
+
+    def __repr__(self) -> str:
+        return f"TradeIdCursors({self._cursors})"
+
+    def get(self, trading_pair: str) -> Optional[int]:
+        return self._cursors.get(trading_pair)
+
+    def next_trade_id(self, trading_pair: str) -> Optional[int]:
+        """
+        :return: The first trade id that has not been processed yet for the trading pair, or None if nothing has
+        been processed yet.
+        """
+        cursor: Optional[int] = self._cursors.get(trading_pair)
+        return cursor + 1 if cursor is not None else None
+
+    def advance(self, trading_pair: str, trade_id: int):
+        """
+        Moves the cursor of the trading pair forward to trade_id. Cursors never move backwards, so out of order
+        or replayed trades are harmless.
+        """
+        trade_id = int(trade_id)
+        cursor: Optional[int] = self._cursors.get(trading_pair)
+        if cursor is None or trade_id > cursor:
+            self._cursors[trading_pair] = trade_id
+
+    def new_trades(self,
+                   trading_pair: str,
+                   trades: Iterable[Any],
+                   trade_id_getter: Callable[[Any], int] = lambda trade: trade["id"]) -> List[Any]:
+        """
+        Filters out the trades that have already been processed for the trading pair.
+        :return: The unprocessed trades, sorted by ascending trade id.
+        """
+        cursor: Optional[int] = self._cursors.get(trading_pair)
+        retval: List[Any] = [trade for trade in trades
+                             if cursor is None or int(trade_id_getter(trade)) > cursor]
+        retval.sort(key=lambda trade: int(trade_id_getter(trade)))
+        return retval
+
+    def remove(self, trading_pair: str):
+        self._cursors.pop(trading_pair, None)
+
+    def to_json(self) -> Dict[str, int]:
+        return dict(self._cursors)
+
+    @classmethod
+    def from_json(cls, data: Optional[Dict[str, Any]]) -> "TradeIdCursors":
+        if not data:
+            return TradeIdCursors()
+        return TradeIdCursors({trading_pair: int(trade_id) for trading_pair, trade_id in data.items()})
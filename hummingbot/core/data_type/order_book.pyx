@@ -47,6 +47,7 @@ cdef class OrderBook(PubSub):
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
+        self._update_count = 0
         self._best_bid = self._best_ask = float("NaN")
         self._last_trade_price = float("NaN")
         self._last_applied_trade = -1000.0
@@ -92,6 +93,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self._update_count += 1
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -132,6 +134,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self._update_count += 1
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -166,6 +169,14 @@ cdef class OrderBook(PubSub):
     def last_diff_uid(self) -> int:
         return self._last_diff_uid
 
+    @property
+    def update_count(self) -> int:
+        """
+        Number of snapshots and diffs applied so far. Readers can compare it between two reads to know whether the
+        book changed, without subscribing to every update.
+        """
+        return self._update_count
+
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
         bids_rows = list(self.bid_entries())
@@ -277,6 +288,43 @@ cdef class OrderBook(PubSub):
             yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
             inc(it)
 
+    cdef np.ndarray c_get_top_levels(self, bint is_bid, int levels):
+        cdef:
+            size_t book_size = self._bid_book.size() if is_bid else self._ask_book.size()
+            int count = <int>book_size if levels < 0 or <size_t>levels > book_size else levels
+            np.ndarray[np.float64_t, ndim=2] result = np.empty((count, 3), dtype=np.float64)
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            OrderBookEntry entry
+            int i
+        for i in range(count):
+            if is_bid:
+                entry = deref(bid_it)
+                inc(bid_it)
+            else:
+                entry = deref(ask_it)
+                inc(ask_it)
+            result[i, 0] = entry.getPrice()
+            result[i, 1] = entry.getAmount()
+            result[i, 2] = entry.getUpdateId()
+        return result
+
+    def get_top_levels(self, is_bid: bool, levels: int = -1) -> np.ndarray:
+        """
+        Reads the best levels of one side of the book straight from the C++ book, without building rows or DataFrames.
+        :param is_bid: True for the bids, False for the asks
+        :param levels: The number of levels, negative for the whole side
+        :return: A (levels, 3) float64 array of [price, amount, update_id] rows, best price first. The same layout as
+                 apply_numpy_snapshot() takes.
+        """
+        return self.c_get_top_levels(is_bid, levels)
+
+    def depth(self, levels: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :return: The top levels of (bids, asks), see get_top_levels().
+        """
+        return self.c_get_top_levels(True, levels), self.c_get_top_levels(False, levels)
+
     def simulate_buy(self, amount: float) -> List[OrderBookRow]:
         amount_left = amount
         retval = []
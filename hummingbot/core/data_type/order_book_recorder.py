@@ -0,0 +1,364 @@
+#!/usr/bin/env python
+
+import asyncio
+from collections import deque
+from enum import IntEnum
+import logging
+import mmap
+import os
+import struct
+import time
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    TradeType,
+)
+from hummingbot.logger import HummingbotLogger
+
+# Recording file layout:
+#   header: FILE_MAGIC, version (uint8), trading pair length (uint16), trading pair (utf-8)
+#   records: RECORD_HEADER, then (number of bids + number of asks) x (price, amount) float64 pairs
+# The index file next to it holds an INDEX_ENTRY per checkpoint record: (receive time, file offset).
+FILE_MAGIC = b"HBOB"
+FILE_VERSION = 1
+FILE_EXTENSION = ".hbob"
+INDEX_EXTENSION = ".idx"
+FILE_HEADER = struct.Struct("<BH")
+# record type, receive time, message timestamp, update or trade id, number of bids, number of asks
+RECORD_HEADER = struct.Struct("<BddqII")
+INDEX_ENTRY = struct.Struct("<dQ")
+INDEX_DTYPE = np.dtype([("timestamp", "<f8"), ("offset", "<u8")])
+PAST_DIFF_WINDOW_SIZE = 32
+
+s_empty_levels = np.empty((0, 2), dtype=np.float64)
+
+
+class OrderBookRecordType(IntEnum):
+    # Full order book state written by the recorder, used as the starting point of replays.
+    CHECKPOINT = 0
+    SNAPSHOT = OrderBookMessageType.SNAPSHOT.value
+    DIFF = OrderBookMessageType.DIFF.value
+    TRADE = OrderBookMessageType.TRADE.value
+
+
+class OrderBookRecord(NamedTuple):
+    record_type: OrderBookRecordType
+    recv_time: float
+    timestamp: float
+    record_id: int
+    bids: np.ndarray
+    asks: np.ndarray
+
+    def to_message(self, trading_pair: str) -> OrderBookMessage:
+        """
+        Rebuilds the recorded message. Trades are recorded as a single bid level for buys and a single ask level for
+        sells.
+        """
+        if self.record_type is OrderBookRecordType.TRADE:
+            is_buy: bool = len(self.bids) > 0
+            price, amount = (self.bids if is_buy else self.asks)[0]
+            return OrderBookMessage(OrderBookMessageType.TRADE, {
+                "trading_pair": trading_pair,
+                "trade_type": float(TradeType.BUY.value if is_buy else TradeType.SELL.value),
+                "trade_id": self.record_id,
+                "update_id": self.record_id,
+                "price": float(price),
+                "amount": float(amount)
+            }, timestamp=self.timestamp)
+        message_type: OrderBookMessageType = OrderBookMessageType.DIFF if self.record_type is OrderBookRecordType.DIFF \
+            else OrderBookMessageType.SNAPSHOT
+        return OrderBookMessage(message_type, {
+            "trading_pair": trading_pair,
+            "update_id": self.record_id,
+            "bids": self.bids.tolist(),
+            "asks": self.asks.tolist()
+        }, timestamp=self.timestamp)
+
+
+def order_book_levels(rows: List[OrderBookRow]) -> np.ndarray:
+    if len(rows) == 0:
+        return s_empty_levels
+    return np.array([[row.price, row.amount] for row in rows], dtype=np.float64)
+
+
+def load_order_book_levels(order_book: OrderBook, bids: np.ndarray, asks: np.ndarray, update_id: int):
+    """
+    Replaces the content of an order book with recorded levels.
+    """
+    order_book.apply_snapshot([OrderBookRow(price, amount, update_id) for price, amount in bids.tolist()],
+                              [OrderBookRow(price, amount, update_id) for price, amount in asks.tolist()],
+                              update_id)
+
+
+def apply_order_book_message(order_book: OrderBook, past_diffs_window: Deque[OrderBookMessage],
+                             message: OrderBookMessage):
+    """
+    Applies a message to an order book the same way OrderBookTracker does: diffs older than the last snapshot are
+    dropped, and snapshots are restored with the diffs received since.
+    """
+    if message.type is OrderBookMessageType.DIFF:
+        if order_book.snapshot_uid > message.update_id:
+            return
+        order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        past_diffs_window.append(message)
+        while len(past_diffs_window) > PAST_DIFF_WINDOW_SIZE:
+            past_diffs_window.popleft()
+    elif message.type is OrderBookMessageType.SNAPSHOT:
+        order_book.restore_from_snapshot_and_diffs(message, list(past_diffs_window))
+    elif message.type is OrderBookMessageType.TRADE:
+        order_book.apply_trade(OrderBookTradeEvent(
+            trading_pair=message.trading_pair,
+            timestamp=message.timestamp,
+            price=float(message.content["price"]),
+            amount=float(message.content["amount"]),
+            type=TradeType.SELL if
+            message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+        ))
+
+
+def recording_path(directory: str, trading_pair: str) -> str:
+    return os.path.join(directory, f"{trading_pair}{FILE_EXTENSION}")
+
+
+class OrderBookRecordWriter:
+    """
+    Appends the records of one trading pair to its recording file, and the checkpoint offsets to its index file.
+    """
+
+    def __init__(self, path: str, trading_pair: str):
+        is_new_file: bool = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, "ab")
+        self._index_file = open(path + INDEX_EXTENSION, "ab")
+        if is_new_file:
+            encoded_trading_pair: bytes = trading_pair.encode("utf-8")
+            self._file.write(FILE_MAGIC + FILE_HEADER.pack(FILE_VERSION, len(encoded_trading_pair)) +
+                             encoded_trading_pair)
+
+    def write(self,
+              record_type: OrderBookRecordType,
+              recv_time: float,
+              timestamp: float,
+              record_id: int,
+              bids: np.ndarray,
+              asks: np.ndarray):
+        if record_type is OrderBookRecordType.CHECKPOINT:
+            self._index_file.write(INDEX_ENTRY.pack(recv_time, self._file.tell()))
+        self._file.write(RECORD_HEADER.pack(record_type, recv_time, timestamp or 0.0, record_id, len(bids), len(asks)))
+        self._file.write(np.ascontiguousarray(bids, dtype=np.float64).tobytes())
+        self._file.write(np.ascontiguousarray(asks, dtype=np.float64).tobytes())
+
+    def flush(self):
+        # The records go to disk before the index entries that point to them.
+        self._file.flush()
+        self._index_file.flush()
+
+    def close(self):
+        self.flush()
+        self._file.close()
+        self._index_file.close()
+
+
+class OrderBookRecordReader:
+    """
+    Reads the records of a recording file, optionally starting from the last checkpoint at or before a timestamp.
+    """
+
+    def __init__(self, path: str):
+        self._path: str = path
+        with open(path, "rb") as f:
+            magic: bytes = f.read(len(FILE_MAGIC))
+            if magic != FILE_MAGIC:
+                raise ValueError(f"{path} is not an order book recording.")
+            version, pair_length = FILE_HEADER.unpack(f.read(FILE_HEADER.size))
+            if version != FILE_VERSION:
+                raise ValueError(f"Unsupported order book recording version {version} in {path}.")
+            self._trading_pair: str = f.read(pair_length).decode("utf-8")
+            self._data_offset: int = f.tell()
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def checkpoints(self) -> np.ndarray:
+        """
+        :return: The (timestamp, offset) index entries of the checkpoints, oldest first.
+        """
+        index_path: str = self._path + INDEX_EXTENSION
+        if not os.path.exists(index_path):
+            return np.empty(0, dtype=INDEX_DTYPE)
+        entries: np.ndarray = np.fromfile(index_path, dtype=INDEX_DTYPE)
+        # Drop the entries of checkpoints that didn't make it to disk.
+        return entries[entries["offset"] < os.path.getsize(self._path)]
+
+    def checkpoint_offset(self, timestamp: Optional[float] = None) -> Optional[int]:
+        """
+        :return: The file offset of the last checkpoint at or before the timestamp, of the first checkpoint if there is
+        none or if the timestamp is None, or None if the recording has no checkpoint.
+        """
+        checkpoints: np.ndarray = self.checkpoints
+        if len(checkpoints) == 0:
+            return None
+        position: int = 0
+        if timestamp is not None:
+            position = max(int(np.searchsorted(checkpoints["timestamp"], timestamp, side="right")) - 1, 0)
+        return int(checkpoints["offset"][position])
+
+    def records(self, start_time: Optional[float] = None, from_checkpoint: bool = True) -> Iterator[OrderBookRecord]:
+        """
+        :param start_time: Start from the last checkpoint at or before this receive time, or from the first one if None.
+        :param from_checkpoint: If False, reads the whole file instead.
+        """
+        offset: Optional[int] = self.checkpoint_offset(start_time) if from_checkpoint else self._data_offset
+        if offset is None:
+            return
+        # The levels are read-only views of the memory mapped file, so processes replaying the same recording share
+        # its pages instead of each holding a copy.
+        with open(self._path, "rb") as f:
+            data: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        size: int = len(data)
+        while offset + RECORD_HEADER.size <= size:
+            record_type, recv_time, timestamp, record_id, bid_count, ask_count = RECORD_HEADER.unpack_from(data, offset)
+            offset += RECORD_HEADER.size
+            level_count: int = bid_count + ask_count
+            if offset + level_count * 16 > size:
+                # Truncated last record, the recorder was interrupted while writing it.
+                return
+            levels: np.ndarray = np.frombuffer(data, dtype=np.float64, count=level_count * 2,
+                                               offset=offset).reshape(-1, 2)
+            offset += level_count * 16
+            yield OrderBookRecord(OrderBookRecordType(record_type), recv_time, timestamp, record_id,
+                                  levels[:bid_count], levels[bid_count:])
+
+
+class OrderBookRecorder:
+    """
+    Records the order book and trade messages of an OrderBookTracker to one append-only file per trading pair.
+
+    Messages are recorded as they are put into the tracker's message queues, with their receive time. The recorder
+    keeps its own copy of every order book, built from the initial order books and the recorded messages, and writes
+    it as a checkpoint every `checkpoint_interval` seconds. Replays start from a checkpoint, found with the index file.
+    """
+    _obr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obr_logger is None:
+            cls._obr_logger = logging.getLogger(__name__)
+        return cls._obr_logger
+
+    def __init__(self, directory: str, checkpoint_interval: float = 60.0, flush_interval: float = 1.0):
+        os.makedirs(directory, exist_ok=True)
+        self._directory: str = directory
+        self._checkpoint_interval: float = checkpoint_interval
+        self._flush_interval: float = flush_interval
+        self._writers: Dict[str, OrderBookRecordWriter] = {}
+        self._order_books: Dict[str, OrderBook] = {}
+        self._past_diffs_windows: Dict[str, Deque[OrderBookMessage]] = {}
+        self._last_checkpoint_times: Dict[str, float] = {}
+        # Messages received before the initial order book of their trading pair.
+        self._pending_messages: Dict[str, List[OrderBookMessage]] = {}
+        self._last_flush_time: float = 0.0
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def _writer(self, trading_pair: str) -> OrderBookRecordWriter:
+        if trading_pair not in self._writers:
+            self._writers[trading_pair] = OrderBookRecordWriter(recording_path(self._directory, trading_pair),
+                                                                trading_pair)
+        return self._writers[trading_pair]
+
+    def _write_checkpoint(self, trading_pair: str, recv_time: float):
+        order_book: OrderBook = self._order_books[trading_pair]
+        self._writer(trading_pair).write(OrderBookRecordType.CHECKPOINT, recv_time, recv_time, order_book.snapshot_uid,
+                                         order_book.get_top_levels(True)[:, :2], order_book.get_top_levels(False)[:, :2])
+        self._last_checkpoint_times[trading_pair] = recv_time
+
+    def _write_message(self, message: OrderBookMessage, recv_time: float):
+        trading_pair: str = message.trading_pair
+        if message.type is OrderBookMessageType.TRADE:
+            level: np.ndarray = np.array([[float(message.content["price"]), float(message.content["amount"])]])
+            is_sell: bool = message.content["trade_type"] == float(TradeType.SELL.value)
+            try:
+                trade_id: int = int(message.trade_id)
+            except (KeyError, TypeError, ValueError):
+                trade_id = -1
+            self._writer(trading_pair).write(OrderBookRecordType.TRADE, recv_time, message.timestamp, trade_id,
+                                             s_empty_levels if is_sell else level, level if is_sell else s_empty_levels)
+        else:
+            self._writer(trading_pair).write(OrderBookRecordType(message.type.value), recv_time, message.timestamp,
+                                             int(message.update_id), order_book_levels(message.bids),
+                                             order_book_levels(message.asks))
+        apply_order_book_message(self._order_books[trading_pair], self._past_diffs_windows[trading_pair], message)
+
+    def record_order_book(self, trading_pair: str, order_book: OrderBook):
+        """
+        Records the initial order book of a trading pair, then the messages received for it until now.
+        """
+        recv_time: float = time.time()
+        recorded_order_book: OrderBook = OrderBook()
+        load_order_book_levels(recorded_order_book, order_book.get_top_levels(True)[:, :2],
+                               order_book.get_top_levels(False)[:, :2], order_book.snapshot_uid)
+        self._order_books[trading_pair] = recorded_order_book
+        self._past_diffs_windows[trading_pair] = deque()
+        self._write_checkpoint(trading_pair, recv_time)
+        for message in self._pending_messages.pop(trading_pair, []):
+            self._write_message(message, recv_time)
+
+    def record_message(self, message: OrderBookMessage):
+        try:
+            trading_pair: str = message.trading_pair
+            if trading_pair not in self._order_books:
+                self._pending_messages.setdefault(trading_pair, []).append(message)
+                return
+            recv_time: float = time.time()
+            self._write_message(message, recv_time)
+            if recv_time - self._last_checkpoint_times[trading_pair] >= self._checkpoint_interval:
+                self._write_checkpoint(trading_pair, recv_time)
+            if recv_time - self._last_flush_time >= self._flush_interval:
+                self.flush()
+                self._last_flush_time = recv_time
+        except Exception:
+            self.logger().error("Unexpected error recording order book message.", exc_info=True)
+
+    def flush(self):
+        for writer in self._writers.values():
+            writer.flush()
+
+    def close(self):
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+
+class RecordingQueue(asyncio.Queue):
+    """
+    Message queue that records every message put into it.
+    """
+
+    def __init__(self, recorder: OrderBookRecorder, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._recorder: OrderBookRecorder = recorder
+
+    def put_nowait(self, item: OrderBookMessage):
+        self._recorder.record_message(item)
+        super().put_nowait(item)
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+
+import asyncio
+from collections import deque
+import heapq
+import logging
+import math
+from typing import (
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_recorder import (
+    OrderBookRecord,
+    OrderBookRecordReader,
+    OrderBookRecordType,
+    apply_order_book_message,
+    load_order_book_levels,
+    recording_path,
+)
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.logger import HummingbotLogger
+
+
+class OrderBookReplayDataSource(OrderBookTrackerDataSource):
+    """
+    Order book data source reading the recordings of an OrderBookRecorder.
+
+    The order books start from the last checkpoint at or before `start_time`, and the messages stop after `end_time`.
+    The listen methods feed the recorded messages to the tracker queues as fast as the tracker consumes them.
+    """
+    _obrds_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obrds_logger is None:
+            cls._obrds_logger = logging.getLogger(__name__)
+        return cls._obrds_logger
+
+    def __init__(self,
+                 recording_dir: str,
+                 trading_pairs: List[str],
+                 start_time: Optional[float] = None,
+                 end_time: Optional[float] = None):
+        super().__init__(trading_pairs)
+        self._readers: Dict[str, OrderBookRecordReader] = {
+            trading_pair: OrderBookRecordReader(recording_path(recording_dir, trading_pair))
+            for trading_pair in trading_pairs
+        }
+        self._start_time: Optional[float] = start_time
+        self._end_time: float = end_time if end_time is not None else float("inf")
+
+    @property
+    def start_time(self) -> Optional[float]:
+        return self._start_time
+
+    @property
+    def end_time(self) -> float:
+        return self._end_time
+
+    def initial_checkpoint(self, trading_pair: str) -> OrderBookRecord:
+        record: Optional[OrderBookRecord] = next(self._readers[trading_pair].records(self._start_time), None)
+        if record is None:
+            raise ValueError(f"The recording of {trading_pair} has no checkpoint.")
+        return record
+
+    def create_order_book(self, trading_pair: str) -> OrderBook:
+        """
+        :return: The order book at the starting checkpoint of the trading pair.
+        """
+        checkpoint: OrderBookRecord = self.initial_checkpoint(trading_pair)
+        order_book: OrderBook = self.order_book_create_function()
+        load_order_book_levels(order_book, checkpoint.bids, checkpoint.asks, checkpoint.record_id)
+        return order_book
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        return self.create_order_book(trading_pair)
+
+    @classmethod
+    async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
+        return {}
+
+    def _pair_records(self, trading_pair: str) -> Iterator[Tuple[float, str, OrderBookRecord]]:
+        records: Iterator[OrderBookRecord] = self._readers[trading_pair].records(self._start_time)
+        # The starting checkpoint is the initial order book.
+        next(records, None)
+        for record in records:
+            if record.recv_time > self._end_time:
+                return
+            yield record.recv_time, trading_pair, record
+
+    def records(self) -> Iterator[Tuple[str, OrderBookRecord]]:
+        """
+        :return: (trading pair, record) of all the trading pairs after their starting checkpoints, in receive time
+        order.
+        """
+        merged = heapq.merge(*[self._pair_records(trading_pair) for trading_pair in self._trading_pairs],
+                             key=lambda item: item[0])
+        for _, trading_pair, record in merged:
+            yield trading_pair, record
+
+    async def _listen_for_records(self, record_types: Set[OrderBookRecordType], output: asyncio.Queue):
+        for trading_pair, record in self.records():
+            if record.record_type in record_types:
+                await output.put(record.to_message(trading_pair))
+        # Nothing left to replay.
+        await asyncio.Event().wait()
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await self._listen_for_records({OrderBookRecordType.DIFF}, output)
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await self._listen_for_records({OrderBookRecordType.SNAPSHOT}, output)
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await self._listen_for_records({OrderBookRecordType.TRADE}, output)
+
+
+class OrderBookReplayTracker(OrderBookTracker):
+    """
+    Order book tracker replaying recorded order books in step with a backtest clock.
+
+    start() loads the order books at the starting checkpoints, without any network or asyncio task. Calling
+    replay_til(timestamp) before each clock.backtest_til(timestamp) then applies every recorded message received up
+    to the timestamp, in receive time order and the same way the live tracker applies them, so a replay always
+    produces the same order books and trades whatever its speed.
+    """
+
+    def __init__(self,
+                 recording_dir: str,
+                 trading_pairs: List[str],
+                 start_time: Optional[float] = None,
+                 end_time: Optional[float] = None,
+                 exchange_name: str = "replay"):
+        super().__init__(OrderBookReplayDataSource(recording_dir, trading_pairs, start_time, end_time), trading_pairs)
+        self._exchange_name: str = exchange_name
+        self._records: Optional[Iterator[Tuple[str, OrderBookRecord]]] = None
+        self._next_record: Optional[Tuple[str, OrderBookRecord]] = None
+        self._replay_timestamp: float = float("nan")
+
+    @property
+    def data_source(self) -> OrderBookReplayDataSource:
+        return self._data_source
+
+    @property
+    def exchange_name(self) -> str:
+        return self._exchange_name
+
+    @property
+    def replay_timestamp(self) -> float:
+        """
+        Receive time of the last replayed message.
+        """
+        return self._replay_timestamp
+
+    @property
+    def start_timestamp(self) -> float:
+        """
+        Receive time of the latest starting checkpoint, from which all the order books are available.
+        """
+        return max(self.data_source.initial_checkpoint(trading_pair).recv_time for trading_pair in self._trading_pairs)
+
+    @property
+    def finished(self) -> bool:
+        return self._records is not None and self._next_record is None
+
+    def start(self):
+        self.stop()
+        for trading_pair in self._trading_pairs:
+            self._order_books[trading_pair] = self.data_source.create_order_book(trading_pair)
+            self._past_diffs_windows[trading_pair] = deque()
+        self._records = self.data_source.records()
+        self._next_record = next(self._records, None)
+        self._order_books_initialized.set()
+
+    def replay_til(self, timestamp: float) -> int:
+        """
+        Applies the recorded messages received up to the timestamp.
+        :return: The number of messages applied.
+        """
+        if self._records is None:
+            self.start()
+        count: int = 0
+        while self._next_record is not None and not (self._next_record[1].recv_time > timestamp):
+            trading_pair, record = self._next_record
+            order_book: OrderBook = self._order_books[trading_pair]
+            past_diffs_window: Deque[OrderBookMessage] = self._past_diffs_windows[trading_pair]
+            if record.record_type is OrderBookRecordType.CHECKPOINT:
+                # Same content as the replayed order book, unless the recording was restarted in between.
+                load_order_book_levels(order_book, record.bids, record.asks, record.record_id)
+            else:
+                apply_order_book_message(order_book, past_diffs_window, record.to_message(trading_pair))
+            self._replay_timestamp = record.recv_time
+            count += 1
+            self._next_record = next(self._records, None)
+        return count
+
+    def replay(self) -> int:
+        return self.replay_til(math.inf)
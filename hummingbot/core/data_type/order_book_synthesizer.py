@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+
+import math
+from typing import (
+    Dict,
+    Optional,
+)
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_recorder import (
+    OrderBookRecordType,
+    OrderBookRecordWriter,
+    recording_path,
+    s_empty_levels,
+)
+
+
+def _levels(ticks: Dict[int, float], price_step: float, descending: bool) -> np.ndarray:
+    if len(ticks) == 0:
+        return s_empty_levels
+    return np.array([[round(tick * price_step, 10), amount]
+                     for tick, amount in sorted(ticks.items(), reverse=descending)], dtype=np.float64)
+
+
+def _diff_levels(old_ticks: Dict[int, float], new_ticks: Dict[int, float], price_step: float) -> np.ndarray:
+    """
+    :return: The levels changing from old_ticks to new_ticks, with a zero amount for the removed ones.
+    """
+    changes: Dict[int, float] = {tick: 0.0 for tick in old_ticks.keys() if tick not in new_ticks}
+    changes.update({tick: amount for tick, amount in new_ticks.items() if old_ticks.get(tick) != amount})
+    return _levels(changes, price_step, False)
+
+
+def write_synthetic_recording(directory: str,
+                              trading_pair: str,
+                              start_time: float,
+                              end_time: float,
+                              mid_price: float = 100.0,
+                              volatility: float = 0.0005,
+                              spread: float = 0.001,
+                              price_step: float = 0.01,
+                              depth: int = 20,
+                              level_amount: float = 1.0,
+                              update_interval: float = 1.0,
+                              trade_rate: float = 0.5,
+                              trade_amount: float = 0.5,
+                              checkpoint_interval: float = 60.0,
+                              seed: Optional[int] = None) -> str:
+    """
+    Writes a synthetic order book recording, in the format of OrderBookRecorder, for backtests without recorded data.
+
+    The mid price follows a geometric random walk with `volatility` as the standard deviation of its log return per
+    update. Every `update_interval` a diff moves `depth` levels per side around it, `price_step` apart, with the best
+    bid and ask `spread` (relative) apart. Between updates, market trades arrive at `trade_rate` per second on a random
+    side at the best price, with exponentially distributed amounts averaging `trade_amount`.
+
+    :return: The path of the recording file.
+    """
+    rng: np.random.RandomState = np.random.RandomState(seed)
+    path: str = recording_path(directory, trading_pair)
+    writer: OrderBookRecordWriter = OrderBookRecordWriter(path, trading_pair)
+    bid_ticks: Dict[int, float] = {}
+    ask_ticks: Dict[int, float] = {}
+    update_id: int = 0
+    trade_id: int = 0
+    last_checkpoint_time: float = -math.inf
+    timestamp: float = start_time
+    try:
+        while timestamp <= end_time:
+            update_id += 1
+            half_spread_ticks: float = mid_price * spread / 2.0 / price_step
+            best_bid_tick: int = int(math.floor(mid_price / price_step - half_spread_ticks))
+            best_ask_tick: int = max(int(math.ceil(mid_price / price_step + half_spread_ticks)), best_bid_tick + 1)
+            amounts: np.ndarray = level_amount * rng.uniform(0.5, 1.5, (2, depth)).round(4)
+            new_bid_ticks: Dict[int, float] = {best_bid_tick - i: amounts[0, i] for i in range(depth)}
+            new_ask_ticks: Dict[int, float] = {best_ask_tick + i: amounts[1, i] for i in range(depth)}
+
+            if timestamp - last_checkpoint_time >= checkpoint_interval:
+                writer.write(OrderBookRecordType.CHECKPOINT, timestamp, timestamp, update_id,
+                             _levels(new_bid_ticks, price_step, True), _levels(new_ask_ticks, price_step, False))
+                last_checkpoint_time = timestamp
+            else:
+                writer.write(OrderBookRecordType.DIFF, timestamp, timestamp, update_id,
+                             _diff_levels(bid_ticks, new_bid_ticks, price_step),
+                             _diff_levels(ask_ticks, new_ask_ticks, price_step))
+            bid_ticks, ask_ticks = new_bid_ticks, new_ask_ticks
+
+            trade_count: int = rng.poisson(trade_rate * update_interval)
+            for trade_time in np.sort(rng.uniform(0.0, update_interval, trade_count)):
+                trade_id += 1
+                level: np.ndarray = np.array([[0.0, round(rng.exponential(trade_amount), 6)]])
+                if rng.random_sample() < 0.5:
+                    level[0, 0] = round(best_ask_tick * price_step, 10)
+                    bids, asks = level, s_empty_levels
+                else:
+                    level[0, 0] = round(best_bid_tick * price_step, 10)
+                    bids, asks = s_empty_levels, level
+                writer.write(OrderBookRecordType.TRADE, timestamp + trade_time, timestamp + trade_time, trade_id,
+                             bids, asks)
+
+            mid_price *= math.exp(volatility * rng.standard_normal())
+            timestamp += update_interval
+    finally:
+        writer.close()
+    return path
@@ -21,6 +21,10 @@ from .order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
 )
+from hummingbot.core.data_type.order_book_recorder import (
+    OrderBookRecorder,
+    RecordingQueue,
+)
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 
 TRADING_PAIR_FILTER = re.compile(r"(BTC|ETH|USDT)$")
@@ -34,6 +38,10 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker(ABC):
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Seconds to wait for the snapshot of a resync before requesting another one.
+    RESYNC_TIMEOUT: float = 30.0
+    # Seconds before fetching the snapshot of a resync again after a failure, doubling up to RESYNC_TIMEOUT.
+    RESYNC_RETRY_DELAY: float = 1.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -54,6 +62,9 @@ class OrderBookTracker(ABC):
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self._recorder: Optional[OrderBookRecorder] = None
+        self._resync_requests: Dict[str, float] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -76,6 +87,26 @@ class OrderBookTracker(ABC):
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def recorder(self) -> Optional[OrderBookRecorder]:
+        return self._recorder
+
+    @recorder.setter
+    def recorder(self, recorder: Optional[OrderBookRecorder]):
+        """
+        Records the order book and trade messages received from the data source, and the initial order books. Must be
+        set before the tracker is started.
+        """
+        self._recorder = recorder
+        if recorder is not None:
+            self._order_book_diff_stream = RecordingQueue(recorder)
+            self._order_book_snapshot_stream = RecordingQueue(recorder)
+            self._order_book_trade_stream = RecordingQueue(recorder)
+        else:
+            self._order_book_diff_stream = asyncio.Queue()
+            self._order_book_snapshot_stream = asyncio.Queue()
+            self._order_book_trade_stream = asyncio.Queue()
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -140,6 +171,10 @@ class OrderBookTracker(ABC):
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        for task in self._resync_tasks.values():
+            task.cancel()
+        self._resync_tasks.clear()
+        self._resync_requests.clear()
         self._order_books_initialized.clear()
 
     async def _update_last_trade_prices_loop(self):
@@ -172,6 +207,8 @@ class OrderBookTracker(ABC):
         """
         for index, trading_pair in enumerate(self._trading_pairs):
             self._order_books[trading_pair] = await self._data_source.get_new_order_book(trading_pair)
+            if self._recorder is not None:
+                self._recorder.record_order_book(trading_pair, self._order_books[trading_pair])
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
             self.logger().info(f"Initialized order book for {trading_pair}. "
@@ -251,7 +288,9 @@ class OrderBookTracker(ABC):
             try:
                 message: OrderBookMessage = await message_queue.get()
                 if message.type is OrderBookMessageType.DIFF:
+                    last_update_id: int = max(order_book.snapshot_uid, order_book.last_diff_uid)
                     order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    self._check_diff(trading_pair, order_book, message, last_update_id)
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
@@ -267,6 +306,7 @@ class OrderBookTracker(ABC):
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    self._resync_requests.pop(trading_pair, None)
                     self.logger().debug("Processed order book snapshot for %s.", trading_pair)
             except asyncio.CancelledError:
                 raise
@@ -274,6 +314,60 @@ class OrderBookTracker(ABC):
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    def _check_diff(self, trading_pair: str, order_book: OrderBook, message: OrderBookMessage, last_update_id: int):
+        """
+        Validates an order book right after a diff message was applied to it, and requests a resync of the book if it
+        went out of sync: when the diff doesn't follow on from the last update (for data sources giving the first
+        update ID of their diffs), or when the data source finds the book inconsistent, e.g. with an exchange checksum.
+        Diffs received while a resync is pending are not checked.
+        """
+        if self._is_resyncing(trading_pair):
+            return
+        first_update_id: Optional[int] = message.content.get("first_update_id")
+        if first_update_id is not None and first_update_id > last_update_id + 1:
+            self._request_resync(trading_pair, f"Missed order book diffs {last_update_id + 1} to {first_update_id - 1}")
+        elif not self._data_source.is_order_book_consistent(trading_pair, order_book, message):
+            self._request_resync(trading_pair, f"Order book checksum mismatch at update {message.update_id}")
+
+    def _is_resyncing(self, trading_pair: str) -> bool:
+        requested: Optional[float] = self._resync_requests.get(trading_pair)
+        return requested is not None and time.time() - requested < self.RESYNC_TIMEOUT
+
+    def _request_resync(self, trading_pair: str, reason: str):
+        self.logger().network(f"{reason} for {trading_pair}. Resyncing the order book.")
+        self._resync_requests[trading_pair] = time.time()
+        task: Optional[asyncio.Task] = self._resync_tasks.get(trading_pair)
+        if task is None or task.done():
+            self._resync_tasks[trading_pair] = safe_ensure_future(self._resync_order_book(trading_pair))
+
+    async def _resync_order_book(self, trading_pair: str):
+        """
+        Fetches a new snapshot of the order book. It goes through the snapshot stream, and the diffs received in the
+        meantime are replayed on top of it.
+
+        Failed fetches are retried with exponential backoff until a snapshot is queued. The diff that revealed the
+        problem is already applied, so the following diffs look in sync and wouldn't request the resync again.
+        """
+        delay: float = self.RESYNC_RETRY_DELAY
+        while trading_pair in self._resync_requests:
+            try:
+                snapshot_msg: OrderBookMessage = await self._data_source.get_order_book_snapshot_message(trading_pair)
+                self._resync_requests[trading_pair] = time.time()
+                self._order_book_snapshot_stream.put_nowait(snapshot_msg)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(f"Error fetching the order book snapshot of {trading_pair} to resync it.",
+                                      exc_info=True,
+                                      app_warning_msg=f"Error resyncing the order book of {trading_pair}. "
+                                                      f"Retrying after {delay:.0f} seconds.")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.RESYNC_TIMEOUT)
+            # Diffs aren't checked while the resync is still pending.
+            if trading_pair in self._resync_requests:
+                self._resync_requests[trading_pair] = time.time()
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -11,6 +11,7 @@ from typing import (
     List,
 )
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
 
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
@@ -35,6 +36,20 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
         raise NotImplementedError
 
+    async def get_order_book_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        """
+        Fetches a fresh snapshot of one order book, used by the tracker to resync a book it found out of sync.
+        """
+        raise NotImplementedError
+
+    def is_order_book_consistent(self, trading_pair: str, order_book: OrderBook, message: OrderBookMessage) -> bool:
+        """
+        Checks the order book against the exchange after a diff message was applied, e.g. with a checksum the exchange
+        sends along with the diff.
+        :return: False if the order book is out of sync and needs a resync.
+        """
+        return True
+
     @abstractmethod
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         """
@@ -1,10 +1,24 @@
 import asyncio
 import logging
+import threading
+import time
 from decimal import Decimal
-from typing import Optional
+from typing import (
+    List,
+    Optional
+)
 from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.performance_analysis import RunningTradePerformance
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderFilledEvent,
+    TradeFee
+)
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.model.trade_fill import TradeFill
 
 
 class KillSwitch:
@@ -19,33 +33,72 @@ class KillSwitch:
     def __init__(self,
                  hummingbot_application: "HummingbotApplication"):  # noqa F821
         self._hummingbot_application = hummingbot_application
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
 
         self._kill_switch_enabled: bool = global_config_map.get("kill_switch_enabled").value
         self._kill_switch_rate: Decimal = Decimal(global_config_map.get("kill_switch_rate").value or "0.0") / \
             Decimal(100)
         self._started = False
-        self._update_interval = 10.0
+        self._triggered = False
+        # Profitability is maintained incrementally from fill events, so checking it is cheap. The check loop only
+        # catches moves of the market prices between fills, and periodically rebuilds the running profitability from
+        # the trades in the database to make sure it is consistent with the performance report.
+        self._update_interval = 1.0
+        self._consistency_check_interval = 300.0
+        self._last_consistency_check_timestamp = 0.0
         self._check_profitability_task: Optional[asyncio.Task] = None
         self._profitability: Optional[Decimal] = None
+        self._running_performance: Optional[RunningTradePerformance] = None
+        self._markets: List[ConnectorBase] = []
+        self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
+
+    def check_profitability(self) -> bool:
+        """
+        Updates the profitability from the running trade performance, and stops the bot if a kill switch threshold
+        has been crossed.
+        :return: True if the kill switch has been triggered.
+        """
+        if self._triggered:
+            return True
+        if not self._kill_switch_enabled or self._running_performance is None:
+            return False
+
+        # calculate_running_profitability gives profitability in percent terms i.e. 0.015 to indicate 0.015%
+        # self._kill_switch_rate is in numerical term 1.e. 0.015 to indicate 1.5%
+        self._profitability: Decimal = \
+            self._hummingbot_application.calculate_running_profitability(self._running_performance) / Decimal("100")
+
+        # Stop the bot if losing too much money, or if gained a certain amount of profit
+        if (self._profitability <= self._kill_switch_rate < Decimal("0.0")) or \
+                (self._profitability >= self._kill_switch_rate > Decimal("0.0")):
+            self._triggered = True
+            self.logger().info("Kill switch threshold reached. Stopping the bot...")
+            self._hummingbot_application._notify(f"\n[Kill switch triggered]\n"
+                                                 f"Current profitability "
+                                                 f"is {self._profitability}. Stopping the bot...")
+            self._hummingbot_application.trade_performance_report()
+            self._hummingbot_application.stop()
+        return self._triggered
+
+    def check_consistency(self):
+        """
+        Rebuilds the running trade performance from the trades recorded in the database.
+        """
+        trades: List[TradeFill] = self._hummingbot_application._get_trades_for_performance()
+        previous_trade_count: int = self._running_performance.trade_count
+        self._running_performance.reset(trades)
+        if self._running_performance.trade_count != previous_trade_count:
+            self.logger().debug(f"Kill switch running profitability was built from {previous_trade_count} trades, "
+                                f"while {self._running_performance.trade_count} trades are recorded. Rebuilt.")
+        self._last_consistency_check_timestamp = time.time()
 
     async def check_profitability_loop(self):
         while True:
             try:
                 if self._kill_switch_enabled:
-                    # calculate_profitability gives profitability in percent terms i.e. 0.015 to indicate 0.015%
-                    # self._kill_switch_rate is in numerical term 1.e. 0.015 to indicate 1.5%
-                    self._profitability: Decimal = \
-                        self._hummingbot_application.calculate_profitability() / Decimal("100")
-
-                    # Stop the bot if losing too much money, or if gained a certain amount of profit
-                    if (self._profitability <= self._kill_switch_rate < Decimal("0.0")) or \
-                            (self._profitability >= self._kill_switch_rate > Decimal("0.0")):
-                        self.logger().info("Kill switch threshold reached. Stopping the bot...")
-                        self._hummingbot_application._notify(f"\n[Kill switch triggered]\n"
-                                                             f"Current profitability "
-                                                             f"is {self._profitability}. Stopping the bot...")
-                        self._hummingbot_application.trade_performance_report()
-                        self._hummingbot_application.stop()
+                    if time.time() - self._last_consistency_check_timestamp >= self._consistency_check_interval:
+                        self.check_consistency()
+                    if self.check_profitability():
                         break
 
             except asyncio.CancelledError:
@@ -55,15 +108,56 @@ class KillSwitch:
 
             await asyncio.sleep(self._update_interval)
 
+    def _did_fill_order(self,
+                        event_tag: int,
+                        market: ConnectorBase,
+                        evt: OrderFilledEvent):
+        if threading.current_thread() != threading.main_thread():
+            self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
+            return
+        if self._running_performance is None or self._hummingbot_application.markets_recorder is None:
+            return
+
+        try:
+            base_asset, quote_asset = evt.trading_pair.split("-")
+            # Mirrors the record MarketsRecorder writes for the fill, so the running profitability is computed from
+            # exactly the same values as the performance report.
+            trade: TradeFill = TradeFill(strategy=self._hummingbot_application.markets_recorder.strategy_name,
+                                         market=market.display_name,
+                                         symbol=evt.trading_pair,
+                                         base_asset=base_asset,
+                                         quote_asset=quote_asset,
+                                         trade_type=evt.trade_type.name,
+                                         price=float(evt.price) if evt.price == evt.price else 0,
+                                         amount=float(evt.amount),
+                                         trade_fee=TradeFee.to_json(evt.trade_fee))
+            if self._running_performance.add_trade(trade):
+                self.check_profitability()
+        except Exception as e:
+            self.logger().error(f"Error updating profitability from fill: {e}", exc_info=True)
+
     def start(self):
         safe_ensure_future(self.start_loop())
 
     async def start_loop(self):
         self.stop()
+        self._triggered = False
+        if self._kill_switch_enabled and self._hummingbot_application.markets_recorder is not None:
+            self._running_performance = RunningTradePerformance(
+                self._hummingbot_application.markets_recorder.strategy_name,
+                self._hummingbot_application.market_trading_pair_tuples
+            )
+            self.check_consistency()
+            self._markets = list(self._hummingbot_application.markets.values())
+            for market in self._markets:
+                market.add_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
         self._check_profitability_task = safe_ensure_future(self.check_profitability_loop())
         self._started = True
 
     def stop(self):
+        for market in self._markets:
+            market.remove_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+        self._markets = []
         if self._check_profitability_task and not self._check_profitability_task.done():
             self._check_profitability_task.cancel()
         self._started = False
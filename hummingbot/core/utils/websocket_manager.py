@@ -0,0 +1,290 @@
+#!/usr/bin/env python
+
+from abc import (
+    ABCMeta,
+    abstractmethod,
+)
+import asyncio
+import logging
+import random
+import time
+from typing import (
+    Any,
+    AsyncIterable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import websockets
+from websockets.exceptions import ConnectionClosed
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+class WebSocketChannelStats:
+    """
+    Message statistics of one channel. The rate is counted over windows of RATE_WINDOW seconds, and the lag, the time
+    between the exchange's event time and the message's arrival, is an exponential moving average.
+    """
+    RATE_WINDOW: float = 10.0
+    LAG_SMOOTHING: float = 0.1
+
+    __slots__ = ("message_count", "last_message_time", "rate", "lag", "_window_start", "_window_count")
+
+    def __init__(self):
+        self.message_count: int = 0
+        self.last_message_time: float = 0.0
+        self.rate: float = 0.0
+        self.lag: Optional[float] = None
+        self._window_start: float = time.time()
+        self._window_count: int = 0
+
+    def record(self, timestamp: float, event_time: Optional[float]):
+        self.message_count += 1
+        self.last_message_time = timestamp
+        elapsed: float = timestamp - self._window_start
+        if elapsed >= self.RATE_WINDOW:
+            self.rate = self._window_count / elapsed
+            self._window_start = timestamp
+            self._window_count = 0
+        self._window_count += 1
+        if event_time is not None:
+            lag: float = timestamp - event_time
+            self.lag = lag if self.lag is None else self.lag + self.LAG_SMOOTHING * (lag - self.lag)
+
+    def __repr__(self) -> str:
+        return (f"WebSocketChannelStats(message_count={self.message_count}, rate={self.rate:.2f}, "
+                f"lag={self.lag})")
+
+
+class WebSocketConnection:
+    __slots__ = ("channels", "ws", "task", "last_recv_time", "last_send_time", "send_lock")
+
+    def __init__(self):
+        self.channels: Set[str] = set()
+        self.ws: Optional[websockets.WebSocketClientProtocol] = None
+        self.task: Optional[asyncio.Task] = None
+        self.last_recv_time: float = 0.0
+        self.last_send_time: float = 0.0
+        self.send_lock: asyncio.Lock = asyncio.Lock()
+
+
+class WebSocketManager(metaclass=ABCMeta):
+    """
+    Multiplexes the channel subscriptions of an exchange, e.g. the order book diffs, trades and user streams of all the
+    trading pairs, over as few websocket connections as the exchange allows.
+
+    Each raw message is parsed once, by parse_message(), and its payload is put in the queue of its channel. A
+    connection is opened when its first channel is subscribed to and closed after its last one is unsubscribed. After
+    a disconnection, it reconnects with exponential backoff and full jitter, and subscribes to its channels again.
+
+    Subclasses give the exchange's subscription messages and message format. Exchanges that limit how many messages
+    a connection may send set MAX_MESSAGES_PER_SECOND, the messages of each connection are then sent at that pace.
+    """
+    MESSAGE_TIMEOUT = 30.0
+    PING_TIMEOUT = 10.0
+    MAX_CHANNELS_PER_CONNECTION: int = 200
+    MAX_MESSAGES_PER_SECOND: Optional[float] = None
+    RECONNECT_MIN_DELAY: float = 1.0
+    RECONNECT_MAX_DELAY: float = 60.0
+
+    _wsm_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._wsm_logger is None:
+            cls._wsm_logger = logging.getLogger(__name__)
+        return cls._wsm_logger
+
+    def __init__(self, url: str):
+        self._url: str = url
+        self._connections: List[WebSocketConnection] = []
+        self._channel_connections: Dict[str, WebSocketConnection] = {}
+        self._channel_queues: Dict[str, asyncio.Queue] = {}
+        self._channel_stats: Dict[str, WebSocketChannelStats] = {}
+
+    @abstractmethod
+    def subscription_messages(self, channels: List[str], subscribe: bool) -> List[str]:
+        """
+        :param subscribe: True to subscribe to the channels, False to unsubscribe from them.
+        :return: The messages to send for it.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def parse_message(self, raw_message: str) -> Optional[Tuple[str, Any]]:
+        """
+        :return: The channel and payload of a message, or None for messages that aren't channel data, like
+                 subscription responses.
+        """
+        raise NotImplementedError
+
+    def event_time(self, payload: Any) -> Optional[float]:
+        """
+        :return: The exchange's timestamp of a payload, in seconds, if it has one.
+        """
+        return None
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+    @property
+    def connection_count(self) -> int:
+        return len(self._connections)
+
+    @property
+    def channel_stats(self) -> Dict[str, WebSocketChannelStats]:
+        return self._channel_stats
+
+    def last_recv_time(self, channel: str) -> float:
+        """
+        :return: When the connection of a channel last received anything, messages of other channels and pongs
+                 included, or 0 if it isn't connected.
+        """
+        connection: Optional[WebSocketConnection] = self._channel_connections.get(channel)
+        return connection.last_recv_time if connection is not None else 0.0
+
+    def subscribe(self, channels: List[str], queue: asyncio.Queue):
+        """
+        Puts the payloads of the channels' messages in a queue, from now on. Channels already subscribed to are moved
+        to the new queue.
+        """
+        new_channels: List[str] = []
+        for channel in channels:
+            self._channel_queues[channel] = queue
+            if channel not in self._channel_connections:
+                new_channels.append(channel)
+                self._channel_stats[channel] = WebSocketChannelStats()
+        while len(new_channels) > 0:
+            connection: WebSocketConnection = self._connection_with_room()
+            added: List[str] = new_channels[:self.MAX_CHANNELS_PER_CONNECTION - len(connection.channels)]
+            new_channels = new_channels[len(added):]
+            connection.channels.update(added)
+            for channel in added:
+                self._channel_connections[channel] = connection
+            if connection.task is None:
+                connection.task = safe_ensure_future(self._connection_loop(connection))
+            elif connection.ws is not None:
+                safe_ensure_future(self._send(connection, self.subscription_messages(added, True)))
+
+    def unsubscribe(self, channels: List[str]):
+        removed: Dict[WebSocketConnection, List[str]] = {}
+        for channel in channels:
+            connection: Optional[WebSocketConnection] = self._channel_connections.pop(channel, None)
+            self._channel_queues.pop(channel, None)
+            self._channel_stats.pop(channel, None)
+            if connection is not None:
+                connection.channels.discard(channel)
+                removed.setdefault(connection, []).append(channel)
+        for connection, connection_channels in removed.items():
+            if len(connection.channels) == 0:
+                self._connections.remove(connection)
+                connection.task.cancel()
+            elif connection.ws is not None:
+                safe_ensure_future(self._send(connection, self.subscription_messages(connection_channels, False)))
+
+    def stop(self):
+        for connection in self._connections:
+            connection.task.cancel()
+        self._connections.clear()
+        self._channel_connections.clear()
+        self._channel_queues.clear()
+        self._channel_stats.clear()
+
+    def _connection_with_room(self) -> WebSocketConnection:
+        for connection in self._connections:
+            if len(connection.channels) < self.MAX_CHANNELS_PER_CONNECTION:
+                return connection
+        connection: WebSocketConnection = WebSocketConnection()
+        self._connections.append(connection)
+        return connection
+
+    def reconnect_delay(self, failures: int) -> float:
+        """
+        Exponential backoff with full jitter, so the connections of many clients don't all retry at once.
+        """
+        cap: float = min(self.RECONNECT_MAX_DELAY, self.RECONNECT_MIN_DELAY * 2 ** min(failures, 16))
+        return random.uniform(0, cap)
+
+    async def _send(self, connection: WebSocketConnection, messages: List[str]):
+        ws: websockets.WebSocketClientProtocol = connection.ws
+        try:
+            async with connection.send_lock:
+                for message in messages:
+                    if self.MAX_MESSAGES_PER_SECOND is not None:
+                        delay: float = connection.last_send_time + 1.0 / self.MAX_MESSAGES_PER_SECOND - time.time()
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                    if connection.ws is not ws:
+                        # Reconnected meanwhile, the connection loop has subscribed to the channels again.
+                        return
+                    await ws.send(message)
+                    connection.last_send_time = time.time()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # The connection loop reconnects and subscribes again.
+            self.logger().network(f"Error sending websocket message to {self._url}.", exc_info=True)
+
+    async def _inner_messages(self, connection: WebSocketConnection) -> AsyncIterable[str]:
+        # Terminate the recv() loop as soon as the next message timed out, so the outer loop can reconnect.
+        ws: websockets.WebSocketClientProtocol = connection.ws
+        try:
+            while True:
+                try:
+                    msg: str = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
+                    connection.last_recv_time = time.time()
+                    yield msg
+                except asyncio.TimeoutError:
+                    pong_waiter = await ws.ping()
+                    await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
+                    connection.last_recv_time = time.time()
+        except asyncio.TimeoutError:
+            self.logger().warning(f"WebSocket ping to {self._url} timed out. Going to reconnect...")
+            return
+        except ConnectionClosed:
+            return
+        finally:
+            await ws.close()
+
+    async def _connection_loop(self, connection: WebSocketConnection):
+        failures: int = 0
+        while True:
+            try:
+                async with websockets.connect(self._url) as ws:
+                    connection.ws = ws
+                    await self._send(connection, self.subscription_messages(sorted(connection.channels), True))
+                    async for raw_msg in self._inner_messages(connection):
+                        failures = 0
+                        self._dispatch(raw_msg, connection.last_recv_time)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(f"Unexpected error with WebSocket connection to {self._url}.", exc_info=True)
+            finally:
+                connection.ws = None
+                connection.last_recv_time = 0.0
+            failures += 1
+            delay: float = self.reconnect_delay(failures)
+            self.logger().info(f"Reconnecting to {self._url} in {delay:.1f} seconds.")
+            await asyncio.sleep(delay)
+
+    def _dispatch(self, raw_msg: str, timestamp: float):
+        try:
+            parsed: Optional[Tuple[str, Any]] = self.parse_message(raw_msg)
+        except Exception:
+            self.logger().error(f"Error parsing websocket message: {raw_msg}", exc_info=True)
+            return
+        if parsed is None:
+            return
+        channel, payload = parsed
+        queue: Optional[asyncio.Queue] = self._channel_queues.get(channel)
+        if queue is None:
+            return
+        self._channel_stats[channel].record(timestamp, self.event_time(payload))
+        queue.put_nowait(payload)
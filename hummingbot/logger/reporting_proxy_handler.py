@@ -1,5 +1,8 @@
 #!/usr/bin/env python
 
+import asyncio
+from collections import deque
+import gzip
 import io
 from os.path import (
     realpath,
@@ -7,8 +10,16 @@ from os.path import (
 )
 import json
 import logging
+import threading
+import time
 import traceback
-from typing import Optional
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    List,
+    Optional
+)
 
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.logger import (
@@ -23,6 +34,15 @@ CLIENT_VERSION = open(VERSIONFILE, "rt").read()
 
 
 class ReportingProxyHandler(logging.Handler):
+    """
+    Ships log records to the reporting proxy.
+
+    emit() only queues a message on the caller's thread, with the exception already formatted so that the queue
+    doesn't keep tracebacks and their frames alive. Serializing and compressing the batches is done by a background
+    shipping thread, which sends a batch whenever more than `capacity` messages are pending or `flush_interval`
+    seconds have passed. The queue is bounded by `max_queue_size`, the oldest messages are dropped on overflow and
+    the number of dropped messages is reported with the next batch. Nothing is queued when send_error_logs is off.
+    """
     _rrh_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -34,27 +54,54 @@ class ReportingProxyHandler(logging.Handler):
     def __init__(self,
                  level=logging.ERROR,
                  proxy_url="https://127.0.0.1:9000",
-                 capacity=1):
+                 capacity=1,
+                 max_queue_size=10000,
+                 max_batch_size=500,
+                 flush_interval=5.0,
+                 compress=True):
         super().__init__()
         self.setLevel(level)
-        self._log_queue: list = []
+        self._log_queue: Deque[Dict[str, Any]] = deque(maxlen=max_queue_size)
+        self._queue_cond: threading.Condition = threading.Condition()
+        self._dropped_log_count: int = 0
+        self._unreported_dropped_log_count: int = 0
+        self._last_send_timestamp: float = time.time()
+        self._shipping_thread: Optional[threading.Thread] = None
+        self._closed: bool = False
         self.capacity: int = capacity
+        self.max_batch_size: int = max_batch_size
+        self.flush_interval: float = flush_interval
+        self.compress: bool = compress
         self.proxy_url: str = proxy_url
         self.log_server_client: LogServerClient = LogServerClient.get_instance()
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
 
     @property
     def client_id(self):
         return global_config_map["client_id"].value or ""
 
+    @property
+    def dropped_log_count(self) -> int:
+        return self._dropped_log_count
+
+    @property
+    def pending_log_count(self) -> int:
+        return len(self._log_queue)
+
+    @staticmethod
+    def _send_error_logs_disabled() -> bool:
+        # None until the global config is loaded, the logs from before that are kept until it is.
+        return global_config_map["send_error_logs"].value is False
+
     def emit(self, record):
-        if record.__dict__.get("do_not_send", False):
+        if record.__dict__.get("do_not_send", False) or self._send_error_logs_disabled():
             return
         if not self.log_server_client.started:
             self.log_server_client.start()
         log_type = record.__dict__.get("message_type", "log")
         if not log_type == "event":
             self.process_log(record)
-        self.flush()
+        self._start_shipping_thread()
 
     def formatException(self, ei):
         """
@@ -87,42 +134,107 @@ class ReportingProxyHandler(logging.Handler):
             message["exc_info"] = self.formatException(log.exc_info)
             message["exception_type"] = str(log.exc_info[0])
             message["exception_msg"] = str(log.exc_info[1])
-        self._log_queue.append(message)
+        with self._queue_cond:
+            if len(self._log_queue) == self._log_queue.maxlen:
+                # The deque drops the oldest message by itself.
+                self._dropped_log_count += 1
+                self._unreported_dropped_log_count += 1
+            self._log_queue.append(message)
+            if len(self._log_queue) > self.capacity:
+                self._queue_cond.notify()
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        """
+        Pops up to max_batch_size messages off the queue. Must be called with _queue_cond held.
+        """
+        batch: List[Dict[str, Any]] = []
+        while len(self._log_queue) > 0 and len(batch) < self.max_batch_size:
+            batch.append(self._log_queue.popleft())
+        if self._unreported_dropped_log_count > 0:
+            batch.append({
+                "name": __name__,
+                "funcName": "process_log",
+                "msg": f"Log queue overflow. {self._unreported_dropped_log_count} log messages were dropped.",
+                "created": time.time(),
+                "level": "WARNING"
+            })
+            self._unreported_dropped_log_count = 0
+        return batch
 
     def send_logs(self, logs):
+        data: Any = json.dumps(logs, default=log_encoder)
+        headers: Dict[str, str] = {'Content-Type': "application/json"}
+        if self.compress:
+            data = gzip.compress(data.encode("utf8"))
+            headers["Content-Encoding"] = "gzip"
         request_obj = {
             "url": f"{self.proxy_url}/logs",
             "method": "POST",
             "request_obj": {
-                "headers": {
-                    'Content-Type': "application/json"
-                },
-                "data": json.dumps(logs, default=log_encoder),
+                "headers": headers,
+                "data": data,
                 "params": {"ddtags": f"client_id:{self.client_id},"
                                      f"client_version:{CLIENT_VERSION},"
                                      f"type:log",
                            "ddsource": "hummingbot-client"}
             }
         }
-        self.log_server_client.request(request_obj)
+        if threading.current_thread() is threading.main_thread() or self._ev_loop.is_closed():
+            self.log_server_client.request(request_obj)
+        else:
+            # LogServerClient's queue belongs to the event loop.
+            self._ev_loop.call_soon_threadsafe(self.log_server_client.request, request_obj)
+
+    def _ship_pending_logs(self, send_all: bool = False):
+        min_send_capacity = 0 if send_all else self.capacity
+        while True:
+            with self._queue_cond:
+                if len(self._log_queue) == 0 and self._unreported_dropped_log_count == 0:
+                    return
+                interval_passed: bool = time.time() - self._last_send_timestamp >= self.flush_interval
+                if len(self._log_queue) <= min_send_capacity and not interval_passed:
+                    return
+                if not global_config_map["send_error_logs"].value:
+                    if self._send_error_logs_disabled():
+                        self._log_queue.clear()
+                        self._unreported_dropped_log_count = 0
+                    return
+                batch: List[Dict[str, Any]] = self._take_batch()
+                self._last_send_timestamp = time.time()
+            self.send_logs(batch)
+
+    def _shipping_loop(self):
+        while not self._closed:
+            try:
+                with self._queue_cond:
+                    self._queue_cond.wait(timeout=self.flush_interval)
+                self._ship_pending_logs()
+            except Exception:
+                self.logger().error("Error sending logs.", exc_info=True, extra={"do_not_send": True})
+                time.sleep(self.flush_interval)
+
+    def _start_shipping_thread(self):
+        if self._shipping_thread is None and not self._closed:
+            self._shipping_thread = threading.Thread(target=self._shipping_loop,
+                                                     name="ReportingProxyHandler",
+                                                     daemon=True)
+            self._shipping_thread.start()
 
     def flush(self, send_all=False):
-        self.acquire()
-        min_send_capacity = self.capacity
-        if send_all:
-            min_send_capacity = 0
         try:
-            if global_config_map["send_error_logs"].value:
-                if len(self._log_queue) > min_send_capacity:
-                    self.send_logs(self._log_queue)
-                    self._log_queue = []
+            if send_all:
+                self._ship_pending_logs(send_all=True)
+            else:
+                with self._queue_cond:
+                    self._queue_cond.notify()
         except Exception:
             self.logger().error("Error sending logs.", exc_info=True, extra={"do_not_send": True})
-        finally:
-            self.release()
 
     def close(self):
         try:
+            self._closed = True
+            with self._queue_cond:
+                self._queue_cond.notify()
             self.flush(send_all=True)
             self.log_server_client.stop()
         finally:
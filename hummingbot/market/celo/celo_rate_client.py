@@ -0,0 +1,151 @@
+import aiohttp
+import asyncio
+from decimal import Decimal
+from eth_utils import function_signature_to_4byte_selector
+import logging
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.logger import HummingbotLogger
+from hummingbot.market.celo.celo_cli import (
+    CELO_BASE,
+    CELO_QUOTE,
+    UNIT_MULTIPLIER,
+)
+from hummingbot.market.celo.celo_data_types import CeloExchangeRate
+
+DEFAULT_NODE_URL = "http://localhost:8545"
+# The Celo registry contract, at the same address on every Celo network.
+REGISTRY_ADDRESS = "0x000000000000000000000000000000000000ce10"
+GET_ADDRESS_FOR_STRING = function_signature_to_4byte_selector("getAddressForString(string)")
+GET_BUY_TOKEN_AMOUNT = function_signature_to_4byte_selector("getBuyTokenAmount(uint256,bool)")
+
+
+def encode_uint256(value: int) -> bytes:
+    return value.to_bytes(32, "big")
+
+
+def encode_string(value: str) -> bytes:
+    data: bytes = value.encode("utf-8")
+    padding: bytes = b"\x00" * (-len(data) % 32)
+    return encode_uint256(32) + encode_uint256(len(data)) + data + padding
+
+
+class CeloRateClient:
+    """
+    Quotes the Celo exchange over JSON-RPC to a Celo node, the same quotes `celocli exchange:show` gives, without
+    spawning a celocli process per call.
+
+    The node connection is kept open between calls. Quotes are cached for the block they were made at, since the
+    exchange rates only change with new blocks.
+    """
+    _crc_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._crc_logger is None:
+            cls._crc_logger = logging.getLogger(__name__)
+        return cls._crc_logger
+
+    def __init__(self, node_url: str = DEFAULT_NODE_URL, timeout: float = 10.0):
+        self._node_url: str = node_url
+        self._timeout: float = timeout
+        self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._last_request_id: int = 0
+        self._exchange_address: Optional[str] = None
+        self._quotes_block_number: Optional[int] = None
+        # Quotes at the current block, by (sell amount in wei, whether CGLD is sold)
+        self._quotes: Dict[Tuple[int, bool], int] = {}
+
+    async def _http_client(self) -> aiohttp.ClientSession:
+        if self._shared_client is None or self._shared_client.closed:
+            self._shared_client = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self._timeout))
+        return self._shared_client
+
+    async def close(self):
+        if self._shared_client is not None:
+            await self._shared_client.close()
+            self._shared_client = None
+
+    async def request(self, method: str, params: List[Any]) -> Any:
+        self._last_request_id += 1
+        client: aiohttp.ClientSession = await self._http_client()
+        async with client.post(self._node_url, json={"jsonrpc": "2.0",
+                                                     "id": self._last_request_id,
+                                                     "method": method,
+                                                     "params": params}) as response:
+            if response.status != 200:
+                raise IOError(f"Error calling {method} on the Celo node. HTTP status is {response.status}.")
+            result: Dict[str, Any] = await response.json(content_type=None)
+        if result.get("error") is not None:
+            raise IOError(f"Error calling {method} on the Celo node: {result['error'].get('message')}")
+        return result["result"]
+
+    async def call(self, contract_address: str, data: bytes) -> bytes:
+        result: str = await self.request("eth_call", [{"to": contract_address, "data": "0x" + data.hex()}, "latest"])
+        return bytes.fromhex(result[2:])
+
+    async def block_number(self) -> int:
+        return int(await self.request("eth_blockNumber", []), 16)
+
+    async def exchange_address(self) -> str:
+        if self._exchange_address is None:
+            result: bytes = await self.call(REGISTRY_ADDRESS, GET_ADDRESS_FOR_STRING + encode_string("Exchange"))
+            self._exchange_address = "0x" + result[12:32].hex()
+        return self._exchange_address
+
+    async def validate_node_synced(self) -> Optional[str]:
+        """
+        :return: None if the node is synced, else the reason it is not, like CeloCLI.validate_node_synced.
+        """
+        try:
+            syncing: Any = await self.request("eth_syncing", [])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return str(e)
+        if syncing is not False:
+            return f"Node is syncing: block {int(syncing['currentBlock'], 16)} of {int(syncing['highestBlock'], 16)}."
+        return None
+
+    async def _buy_token_amount(self, sell_amount: int, sell_gold: bool) -> int:
+        if (sell_amount, sell_gold) not in self._quotes:
+            exchange_address: str = await self.exchange_address()
+            data: bytes = GET_BUY_TOKEN_AMOUNT + encode_uint256(sell_amount) + encode_uint256(int(sell_gold))
+            self._quotes[(sell_amount, sell_gold)] = int.from_bytes(await self.call(exchange_address, data), "big")
+        return self._quotes[(sell_amount, sell_gold)]
+
+    async def exchange_rates(self, cgld_amount: Decimal, cusd_amount: Decimal) -> Tuple[CeloExchangeRate,
+                                                                                        CeloExchangeRate]:
+        """
+        Quotes selling cgld_amount CGLD for CUSD and selling cusd_amount CUSD for CGLD at the latest block, with the
+        two quotes requested in parallel.
+
+        :return: The CGLD => CUSD rate and the CUSD => CGLD rate.
+        """
+        block_number: int = await self.block_number()
+        # Looked up before the parallel quotes, so that it is looked up only once.
+        await self.exchange_address()
+        if block_number != self._quotes_block_number:
+            self._quotes_block_number = block_number
+            self._quotes = {}
+        cgld_wei: int = int(cgld_amount * UNIT_MULTIPLIER)
+        cusd_wei: int = int(cusd_amount * UNIT_MULTIPLIER)
+        cusd_received, cgld_received = await safe_gather(self._buy_token_amount(cgld_wei, True),
+                                                         self._buy_token_amount(cusd_wei, False))
+        return (CeloExchangeRate(CELO_BASE, Decimal(cgld_wei) / UNIT_MULTIPLIER,
+                                 CELO_QUOTE, Decimal(cusd_received) / UNIT_MULTIPLIER),
+                CeloExchangeRate(CELO_QUOTE, Decimal(cusd_wei) / UNIT_MULTIPLIER,
+                                 CELO_BASE, Decimal(cgld_received) / UNIT_MULTIPLIER))
+
+    async def exchange_rate(self, amount: Decimal = Decimal("1")) -> List[CeloExchangeRate]:
+        """
+        The same rates as CeloCLI.exchange_rate: selling amount CGLD for CUSD, and amount CUSD for CGLD.
+        """
+        return list(await self.exchange_rates(amount, amount))
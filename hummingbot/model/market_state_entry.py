@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+import zlib
+
+from sqlalchemy import (
+    Column,
+    Text,
+    Integer,
+    BigInteger,
+    LargeBinary,
+    Index
+)
+
+from . import HummingbotBase
+
+
+class MarketStateEntry(HummingbotBase):
+    """
+    One entry of a market's saved tracking states, usually one in-flight order, so that a checkpoint only writes the
+    entries that changed since the last one. The entry value is zlib compressed compact JSON.
+    """
+    __tablename__ = "MarketStateEntry"
+    __table_args__ = (Index("mse_config_market_key_index",
+                            "config_file_path", "market", "key", unique=True),)
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    key = Column(Text, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+    value = Column(LargeBinary, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"MarketStateEntry(id='{self.id}', config_file_path='{self.config_file_path}', " \
+            f"market='{self.market}', key='{self.key}', timestamp={self.timestamp})"
+
+    @staticmethod
+    def encode_value(value_json: str) -> bytes:
+        return zlib.compress(value_json.encode("utf-8"))
+
+    @staticmethod
+    def decode_value(value: bytes) -> str:
+        return zlib.decompress(value).decode("utf-8")
@@ -5,6 +5,7 @@ import logging
 from os.path import join
 from sqlalchemy import (
     create_engine,
+    event,
     inspect,
     MetaData,
 )
@@ -16,7 +17,11 @@ from sqlalchemy.orm import (
     Query
 )
 from sqlalchemy.schema import DropConstraint, ForeignKeyConstraint, Table
-from typing import Optional
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot import data_path
 from hummingbot.logger.logger import HummingbotLogger
@@ -49,6 +54,19 @@ class SQLConnectionManager:
     LOCAL_DB_VERSION_KEY = "local_db_version"
     LOCAL_DB_VERSION_VALUE = "20190614"
 
+    # Set on every SQLite connection. In WAL mode, readers don't block the writer and the writer doesn't block
+    # readers, and synchronous=NORMAL only syncs at checkpoints while still keeping the database consistent on a
+    # crash. Reads of large trade databases go through the memory map and the larger page cache.
+    SQLITE_PRAGMAS: List[Tuple[str, str]] = [
+        ("journal_mode", "WAL"),
+        ("synchronous", "NORMAL"),
+        ("mmap_size", str(256 * 1024 * 1024)),
+        ("cache_size", str(-32 * 1024)),
+        ("temp_store", "MEMORY"),
+    ]
+    # The number of prepared statements each SQLite connection keeps.
+    SQLITE_CACHED_STATEMENTS = 256
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._scm_logger is None:
@@ -68,7 +86,8 @@ class SQLConnectionManager:
     @classmethod
     def get_db_engine(cls,
                       dialect: str,
-                      params: dict) -> Engine:
+                      params: dict,
+                      read_only: bool = False) -> Engine:
         # Fallback to `sqlite` if dialect is None
         if dialect is None:
             dialect = "sqlite"
@@ -76,7 +95,10 @@ class SQLConnectionManager:
         if "sqlite" in dialect:
             db_path = params.get("db_path")
 
-            return create_engine(f"{dialect}:///{db_path}")
+            engine: Engine = create_engine(f"{dialect}:///{db_path}",
+                                           connect_args={"cached_statements": cls.SQLITE_CACHED_STATEMENTS})
+            event.listen(engine, "connect", cls.get_sqlite_connect_listener(read_only))
+            return engine
         else:
             username = params.get("db_username")
             password = params.get("db_password")
@@ -86,6 +108,20 @@ class SQLConnectionManager:
 
             return create_engine(f"{dialect}://{username}:{password}@{host}:{port}/{db_name}")
 
+    @classmethod
+    def get_sqlite_connect_listener(cls, read_only: bool):
+        pragmas: List[Tuple[str, str]] = list(cls.SQLITE_PRAGMAS)
+        if read_only:
+            pragmas.append(("query_only", "ON"))
+
+        def set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for pragma, value in pragmas:
+                cursor.execute(f"PRAGMA {pragma}={value}")
+            cursor.close()
+
+        return set_sqlite_pragmas
+
     def __init__(self,
                  connection_type: SQLConnectionType,
                  db_path: Optional[str] = None):
@@ -127,6 +163,14 @@ class SQLConnectionManager:
         self._session_cls = sessionmaker(bind=self._engine)
         self._shared_session: Session = self._session_cls()
 
+        # History queries read through their own connection, so they don't wait on, or hold up, the recorder's
+        # writes on the shared session. An in-memory SQLite database only exists on its own connection, so it is
+        # read through the same engine.
+        self._reader_engine: Engine = self._engine
+        if self._engine.dialect.name == "sqlite" and db_path != ":memory:":
+            self._reader_engine = self.get_db_engine(engine_options.get("db_engine"), engine_options, read_only=True)
+        self._reader_session_cls = sessionmaker(bind=self._reader_engine)
+
         if connection_type is SQLConnectionType.TRADE_FILLS:
             self.check_and_upgrade_trade_fills_db()
 
@@ -137,6 +181,13 @@ class SQLConnectionManager:
     def get_shared_session(self) -> Session:
         return self._shared_session
 
+    def get_reader_session(self) -> Session:
+        """
+        :return: A new session for read only queries, on the reader connection. Close it once the query is done, the
+                 objects it loaded stay usable.
+        """
+        return self._reader_session_cls()
+
     def check_and_upgrade_trade_fills_db(self):
         try:
             query: Query = (self._shared_session.query(LocalMetadata)
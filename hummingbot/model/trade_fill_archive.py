@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+from datetime import (
+    datetime,
+    timezone,
+)
+import json
+import logging
+import os
+from os.path import join
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.engine import ResultProxy
+from sqlalchemy.orm import Session
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+from hummingbot import data_path
+from hummingbot.logger import HummingbotLogger
+from .sql_connection_manager import SQLConnectionManager
+from .trade_fill import TradeFill
+
+# The TradeFill columns kept in the archive, with their numpy types. trade_fee is kept as its JSON string.
+TRADE_FILL_COLUMNS: Dict[str, Any] = {
+    "id": np.int64,
+    "config_file_path": np.str_,
+    "strategy": np.str_,
+    "market": np.str_,
+    "symbol": np.str_,
+    "base_asset": np.str_,
+    "quote_asset": np.str_,
+    "timestamp": np.int64,
+    "order_id": np.str_,
+    "trade_type": np.str_,
+    "order_type": np.str_,
+    "price": np.float64,
+    "amount": np.float64,
+    "trade_fee": np.str_,
+    "exchange_trade_id": np.str_,
+}
+# Taken from trade_fee when a fill is turned into columns, so that the fees can be accounted for without parsing it.
+FEE_COLUMNS: Dict[str, Any] = {
+    "fee_percent": np.float64,
+    "quote_flat_fees": np.float64,
+}
+ALL_COLUMNS: Dict[str, Any] = {**TRADE_FILL_COLUMNS, **FEE_COLUMNS}
+
+
+def quote_flat_fees(trade_fee: Dict[str, Any], quote_asset: str) -> float:
+    """
+    The flat fees of a trade that are counted against its quote asset, like calculate_trade_asset_delta_with_fees.
+    """
+    total_flat_fees: float = 0.0
+    for flat_fee in trade_fee["flat_fees"]:
+        if isinstance(flat_fee, dict):
+            flat_fee_currency = flat_fee["asset"]
+            flat_fee_amount = flat_fee["amount"]
+        else:
+            flat_fee_currency, flat_fee_amount = flat_fee
+        if flat_fee_currency == quote_asset or \
+                (flat_fee_currency.upper() in ("ETH", "WETH") and quote_asset.upper() in ("ETH", "WETH")):
+            total_flat_fees += float(flat_fee_amount)
+    return total_flat_fees
+
+
+def trade_fill_columns(rows: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Turns TradeFill rows, as mappings of column name to value, into arrays by column.
+    """
+    columns: Dict[str, np.ndarray] = {
+        name: np.array([row[name] if name != "trade_fee" else json.dumps(row[name]) for row in rows], dtype=dtype)
+        for name, dtype in TRADE_FILL_COLUMNS.items()
+    }
+    columns["fee_percent"] = np.array([float(row["trade_fee"]["percent"]) for row in rows], dtype=np.float64)
+    columns["quote_flat_fees"] = np.array([quote_flat_fees(row["trade_fee"], row["quote_asset"]) for row in rows],
+                                          dtype=np.float64)
+    return columns
+
+
+def empty_columns() -> Dict[str, np.ndarray]:
+    return {name: np.array([], dtype=dtype) for name, dtype in ALL_COLUMNS.items()}
+
+
+def concat_columns(*columns_list: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Joins trade fill columns and sorts them by timestamp, dropping repeated fills.
+    """
+    columns_list = [columns for columns in columns_list if len(columns["id"]) > 0]
+    if len(columns_list) == 0:
+        return empty_columns()
+    columns: Dict[str, np.ndarray] = {
+        name: np.concatenate([c[name] for c in columns_list]).astype(dtype) for name, dtype in ALL_COLUMNS.items()
+    }
+    _, unique_indices = np.unique(columns["id"], return_index=True)
+    order: np.ndarray = unique_indices[np.argsort(columns["timestamp"][unique_indices], kind="stable")]
+    return {name: values[order] for name, values in columns.items()}
+
+
+def query_trade_fill_columns(session: Session,
+                             config_file_path: Optional[str] = None,
+                             start_timestamp: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    Reads trade fills from the database straight into columns, without loading TradeFill objects.
+    """
+    query = select([TradeFill.__table__])
+    if config_file_path is not None:
+        query = query.where(TradeFill.config_file_path == config_file_path)
+    if start_timestamp is not None:
+        query = query.where(TradeFill.timestamp >= start_timestamp)
+    rows: List[Dict[str, Any]] = [dict(row) for row in session.execute(query.order_by(TradeFill.timestamp))]
+    return trade_fill_columns(rows) if len(rows) > 0 else empty_columns()
+
+
+class TradeFillArchive:
+    """
+    Old trade fills, moved out of the database into compressed numpy column files, one per config file and UTC day.
+
+    The archive keeps the database small for long running bots, and reports over months of fills read only the
+    columns of the days they need instead of loading a TradeFill object per fill.
+    """
+    _tfa_logger: Optional[HummingbotLogger] = None
+
+    DAY_FORMAT = "%Y-%m-%d"
+    READ_BATCH_SIZE = 10000
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._tfa_logger is None:
+            cls._tfa_logger = logging.getLogger(__name__)
+        return cls._tfa_logger
+
+    def __init__(self, archive_path: Optional[str] = None):
+        if archive_path is None:
+            archive_path = join(data_path(), "trade_fill_archive")
+        self._archive_path: str = archive_path
+
+    @property
+    def archive_path(self) -> str:
+        return self._archive_path
+
+    @classmethod
+    def day_of(cls, timestamp: int) -> str:
+        return datetime.fromtimestamp(timestamp / 1e3, tz=timezone.utc).strftime(cls.DAY_FORMAT)
+
+    def config_path(self, config_file_path: str) -> str:
+        return join(self._archive_path, config_file_path.replace(os.sep, "_").replace("/", "_"))
+
+    def partition_path(self, config_file_path: str, day: str) -> str:
+        return join(self.config_path(config_file_path), f"{day}.npz")
+
+    def load_partition(self, path: str) -> Dict[str, np.ndarray]:
+        with np.load(path, allow_pickle=False) as data:
+            return {name: data[name] for name in ALL_COLUMNS.keys()}
+
+    def save_partition(self, config_file_path: str, day: str, columns: Dict[str, np.ndarray]):
+        """
+        Adds the fills to the partition's file, which is replaced as a whole so that it is never left half written.
+        """
+        path: str = self.partition_path(config_file_path, day)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if os.path.exists(path):
+            columns = concat_columns(self.load_partition(path), columns)
+        temp_path: str = f"{path}.tmp.npz"
+        np.savez_compressed(temp_path, **columns)
+        os.replace(temp_path, path)
+
+    def archive_trade_fills(self, sql: SQLConnectionManager, before_timestamp: int) -> int:
+        """
+        Moves the fills from before before_timestamp out of the database into the archive, a day at a time.
+
+        Each day's fills are written to the archive before they are deleted from the database, so a failure in
+        between leaves them in both, and they are archived once when the job runs again.
+
+        :return: The number of fills archived.
+        """
+        archived_count: int = 0
+        day_rows: List[Dict[str, Any]] = []
+        # The fills are read through the reader connection in batches while each archived day is deleted through
+        # the writer, so that neither a large database nor the job hold up the recorder.
+        session: Session = sql.get_reader_session()
+        try:
+            result: ResultProxy = session.execute(select([TradeFill.__table__])
+                                                  .where(TradeFill.timestamp < before_timestamp)
+                                                  .order_by(TradeFill.timestamp))
+            while True:
+                rows: List[Dict[str, Any]] = [dict(row) for row in result.fetchmany(self.READ_BATCH_SIZE)]
+                if len(rows) == 0:
+                    break
+                for row in rows:
+                    if len(day_rows) > 0 and self.day_of(row["timestamp"]) != self.day_of(day_rows[0]["timestamp"]):
+                        archived_count += self._archive_day(sql, day_rows)
+                        day_rows = []
+                    day_rows.append(row)
+        finally:
+            session.close()
+        if len(day_rows) > 0:
+            archived_count += self._archive_day(sql, day_rows)
+        return archived_count
+
+    def _archive_day(self, sql: SQLConnectionManager, rows: List[Dict[str, Any]]) -> int:
+        day: str = self.day_of(rows[0]["timestamp"])
+        config_rows: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            config_rows.setdefault(row["config_file_path"], []).append(row)
+        for config_file_path, fills in config_rows.items():
+            self.save_partition(config_file_path, day, trade_fill_columns(fills))
+
+        ids: List[int] = [row["id"] for row in rows]
+        with sql.begin() as session:
+            # In chunks, to stay under SQLite's limit on the number of query parameters.
+            for i in range(0, len(ids), 500):
+                (session.query(TradeFill)
+                 .filter(TradeFill.id.in_(ids[i:i + 500]))
+                 .delete(synchronize_session=False))
+        self.logger().info(f"Archived {len(rows)} trade fills of {day}.")
+        return len(rows)
+
+    def load_trade_fills(self,
+                         config_file_path: str,
+                         start_timestamp: Optional[int] = None,
+                         end_timestamp: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        :return: The archived fills of the config file between the timestamps, as columns sorted by timestamp.
+        """
+        config_path: str = self.config_path(config_file_path)
+        if not os.path.isdir(config_path):
+            return empty_columns()
+        start_day: Optional[str] = self.day_of(start_timestamp) if start_timestamp is not None else None
+        end_day: Optional[str] = self.day_of(end_timestamp) if end_timestamp is not None else None
+        partitions: List[Dict[str, np.ndarray]] = []
+        for file_name in sorted(os.listdir(config_path)):
+            if not file_name.endswith(".npz") or ".tmp" in file_name:
+                continue
+            day: str = file_name[:-len(".npz")]
+            if (start_day is not None and day < start_day) or (end_day is not None and day > end_day):
+                continue
+            partitions.append(self.load_partition(join(config_path, file_name)))
+        columns: Dict[str, np.ndarray] = concat_columns(*partitions)
+
+        mask: np.ndarray = np.ones(len(columns["id"]), dtype=bool)
+        if start_timestamp is not None:
+            mask &= columns["timestamp"] >= start_timestamp
+        if end_timestamp is not None:
+            mask &= columns["timestamp"] <= end_timestamp
+        return {name: values[mask] for name, values in columns.items()}
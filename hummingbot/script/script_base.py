@@ -1,9 +1,9 @@
 import asyncio
-from multiprocessing import Queue
 from typing import List, Optional, Dict, Any, Callable
 from decimal import Decimal
 from statistics import mean, median
-from operator import itemgetter
+from .script_ipc import ScriptChannel, MidPriceRing
+from .script_indicators import RollingIndicator, VWAP
 from .script_interface import OnTick, OnStatus, OnCommand, OnRefresh, PMMParameters, CallNotify, CallSendImage, CallLog, CallStop, CallForceRefresh
 from hummingbot.core.event.events import (
     OrderFilledEvent,
@@ -18,19 +18,27 @@ class ScriptBase:
     A user defined script should derive from this base class to get all its functionality.
     """
     def __init__(self):
-        self._parent_queue: Queue = None
-        self._child_queue: Queue = None
+        self._parent_queue: ScriptChannel = None
+        self._child_queue: ScriptChannel = None
         self._queue_check_interval: float = 0.0
         self._mid_price: Decimal = Decimal("0")
+        self._mid_price_history: Optional[MidPriceRing] = None
         self.pmm_parameters: PMMParameters = None
         # all_total_balances stores balances in {exchange: {token: balance}} format
         # for example {"binance": {"BTC": Decimal("0.1"), "ETH": Decimal("20"}}
         self.all_total_balances: Dict[str, Dict[str, Decimal]] = None
-
-    def assign_init(self, parent_queue: Queue, child_queue: Queue, queue_check_interval: float):
+        self._mid_price_indicators: List[RollingIndicator] = []
+        self._fill_indicators: List[VWAP] = []
+
+    def assign_init(self,
+                    parent_queue: ScriptChannel,
+                    child_queue: ScriptChannel,
+                    queue_check_interval: float,
+                    mid_price_history: Optional[MidPriceRing] = None):
         self._parent_queue = parent_queue
         self._child_queue = child_queue
         self._queue_check_interval = queue_check_interval
+        self._mid_price_history = mid_price_history
 
     @property
     def mid_price(self):
@@ -39,15 +47,38 @@ class ScriptBase:
         """
         return self._mid_price
 
+    @property
+    def mid_price_history(self) -> Optional[MidPriceRing]:
+        """
+        The recent mid prices, one per tick, kept in shared memory by the main process.
+        e.g. self.mid_price_history.latest(60) or self.mid_price_history.samples(interval, length)
+        """
+        return self._mid_price_history
+
+    def track_mid_price(self, indicator: RollingIndicator) -> RollingIndicator:
+        """
+        Registers a rolling indicator to be updated with the mid price on every tick, before on_tick is called.
+        e.g. self.avg_price = self.track_mid_price(SMA(600)), then self.avg_price.value in on_tick.
+        :param indicator: The indicator, e.g. SMA, EMA, RollingStdev, RollingVolatility, RollingMin or RollingMax
+        :returns the indicator.
+        """
+        self._mid_price_indicators.append(indicator)
+        return indicator
+
+    def track_fills(self, indicator: VWAP) -> VWAP:
+        """
+        Registers a VWAP to be updated with the price and amount of every order fill, before on_order_filled is called.
+        :returns the indicator.
+        """
+        self._fill_indicators.append(indicator)
+        return indicator
+
     async def run(self):
         asyncio.ensure_future(self.listen_to_parent())
 
     async def listen_to_parent(self):
         while True:
-            if self._parent_queue.empty():
-                await asyncio.sleep(self._queue_check_interval)
-                continue
-            item = self._parent_queue.get()
+            item = await self._parent_queue.get()
             # print(f"child gets {str(item)}")
             if item is None:
                 # print("child exiting..")
@@ -55,10 +86,13 @@ class ScriptBase:
                 break
             if isinstance(item, OnTick):
                 self._mid_price = item.mid_price
-                self.pmm_parameters = item.pmm_parameters
-                self.all_total_balances = item.all_total_balances
+                self._apply_tick_updates(item)
+                for indicator in self._mid_price_indicators:
+                    indicator.update(item.mid_price)
                 self.on_tick()
             elif isinstance(item, OrderFilledEvent):
+                for indicator in self._fill_indicators:
+                    indicator.update(item.price, item.amount)
                 self.on_order_filled(item)
             elif isinstance(item, BuyOrderCompletedEvent):
                 self.on_buy_order_completed(item)
@@ -73,6 +107,20 @@ class ScriptBase:
             elif isinstance(item, OnRefresh):
                 self.on_order_refresh()
 
+    def _apply_tick_updates(self, on_tick: OnTick):
+        if self.pmm_parameters is None:
+            self.pmm_parameters = PMMParameters()
+        self.pmm_parameters.apply_updates(on_tick.updated_parameters)
+        if self.all_total_balances is None:
+            self.all_total_balances = {}
+        for exchange, balances in on_tick.updated_balances.items():
+            exchange_balances = self.all_total_balances.setdefault(exchange, {})
+            for token, balance in balances.items():
+                if balance is None:
+                    exchange_balances.pop(token, None)
+                else:
+                    exchange_balances[token] = balance
+
     def notify(self, msg: str):
         """
         Notifies the user, the message will appear on top left panel of HB application.
@@ -128,16 +176,10 @@ class ScriptBase:
         :param length: The number of the samples.
         :returns None if there is not enough samples to satisfy length, otherwise the sample list.
         """
-        index_list = list(range(len(a_list) - 1, -1, -1 * interval))
-        index_list = sorted(index_list)
-        index_list = index_list[-1 * length:]
-        if len(index_list) < length:
+        first_index = len(a_list) - 1 - (length - 1) * interval
+        if length <= 0 or first_index < 0:
             return None
-        if len(index_list) == 1:
-            # return a list with just 1 item in it.
-            return [a_list[index_list[0]]]
-        samples = list(itemgetter(*index_list)(a_list))
-        return samples
+        return a_list[first_index::interval]
 
     def on_tick(self):
         """
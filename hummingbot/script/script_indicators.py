@@ -0,0 +1,241 @@
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Optional, Tuple, Union
+
+import numpy as np
+
+Number = Union[float, int, Decimal]
+
+
+class RingBuffer:
+    """
+    A fixed size numpy ring buffer of floats. Appending overwrites the oldest value once the buffer is full.
+    """
+
+    def __init__(self, length: int):
+        if length <= 0:
+            raise ValueError("length must be positive.")
+        self._values: np.ndarray = np.zeros(length, dtype=np.float64)
+        self._length: int = length
+        self._count: int = 0
+
+    def __len__(self) -> int:
+        return min(self._count, self._length)
+
+    @property
+    def length(self) -> int:
+        return self._length
+
+    @property
+    def is_full(self) -> bool:
+        return self._count >= self._length
+
+    def append(self, value: float) -> Optional[float]:
+        """
+        :return: The value that was overwritten, or None if the buffer wasn't full.
+        """
+        index: int = self._count % self._length
+        evicted: Optional[float] = float(self._values[index]) if self.is_full else None
+        self._values[index] = value
+        self._count += 1
+        return evicted
+
+    def values(self) -> np.ndarray:
+        """
+        :return: A copy of the values, oldest first.
+        """
+        if not self.is_full:
+            return self._values[:self._count].copy()
+        start: int = self._count % self._length
+        return np.concatenate((self._values[start:], self._values[:start]))
+
+
+class RollingIndicator:
+    """
+    Base class of the rolling indicators. Each update is O(1), whatever the window length.
+    """
+
+    def __init__(self, length: int):
+        self._length: int = length
+        self._count: int = 0
+
+    @property
+    def length(self) -> int:
+        return self._length
+
+    @property
+    def ready(self) -> bool:
+        """
+        True once the indicator has seen a full window of values.
+        """
+        return self._count >= self._length
+
+    @property
+    def value(self) -> Optional[float]:
+        raise NotImplementedError
+
+    def update(self, value: Number):
+        raise NotImplementedError
+
+
+class SMA(RollingIndicator):
+    """
+    Simple moving average over the last `length` values.
+    """
+
+    def __init__(self, length: int):
+        super().__init__(length)
+        self._buffer: RingBuffer = RingBuffer(length)
+        self._sum: float = 0.0
+
+    def update(self, value: Number):
+        value = float(value)
+        evicted: Optional[float] = self._buffer.append(value)
+        self._sum += value - (evicted or 0.0)
+        self._count += 1
+        # Re-sum once per window so that rounding errors don't accumulate over long runs.
+        if self._count % self._length == 0:
+            self._sum = float(self._buffer.values().sum())
+
+    @property
+    def value(self) -> Optional[float]:
+        size: int = len(self._buffer)
+        return self._sum / size if size > 0 else None
+
+
+class EMA(RollingIndicator):
+    """
+    Exponential moving average with a smoothing factor of 2 / (length + 1), seeded with the first value.
+    """
+
+    def __init__(self, length: int):
+        super().__init__(length)
+        self._alpha: float = 2.0 / (length + 1)
+        self._value: Optional[float] = None
+
+    def update(self, value: Number):
+        value = float(value)
+        self._value = value if self._value is None else self._value + self._alpha * (value - self._value)
+        self._count += 1
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._value
+
+
+class RollingStdev(RollingIndicator):
+    """
+    Sample standard deviation over the last `length` values.
+    """
+
+    def __init__(self, length: int):
+        super().__init__(length)
+        self._buffer: RingBuffer = RingBuffer(length)
+        self._sum: float = 0.0
+        self._sum_sq: float = 0.0
+
+    def update(self, value: Number):
+        value = float(value)
+        evicted: float = self._buffer.append(value) or 0.0
+        self._sum += value - evicted
+        self._sum_sq += value * value - evicted * evicted
+        self._count += 1
+        if self._count % self._length == 0:
+            values: np.ndarray = self._buffer.values()
+            self._sum = float(values.sum())
+            self._sum_sq = float(np.dot(values, values))
+
+    @property
+    def mean(self) -> Optional[float]:
+        size: int = len(self._buffer)
+        return self._sum / size if size > 0 else None
+
+    @property
+    def value(self) -> Optional[float]:
+        size: int = len(self._buffer)
+        if size < 2:
+            return None
+        variance: float = (self._sum_sq - self._sum * self._sum / size) / (size - 1)
+        return max(variance, 0.0) ** 0.5
+
+
+class RollingVolatility(RollingIndicator):
+    """
+    Standard deviation of the relative changes between consecutive values, over the last `length` changes.
+    """
+
+    def __init__(self, length: int):
+        super().__init__(length)
+        self._stdev: RollingStdev = RollingStdev(length)
+        self._last_value: Optional[float] = None
+
+    def update(self, value: Number):
+        value = float(value)
+        if self._last_value is not None and self._last_value != 0:
+            self._stdev.update((value - self._last_value) / self._last_value)
+            self._count += 1
+        self._last_value = value
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._stdev.value
+
+
+class _RollingExtremum(RollingIndicator):
+    """
+    Rolling min or max with a monotonic deque of (index, value), amortized O(1) per update.
+    """
+
+    def __init__(self, length: int, is_max: bool):
+        super().__init__(length)
+        self._is_max: bool = is_max
+        self._deque: Deque[Tuple[int, float]] = deque()
+
+    def update(self, value: Number):
+        value = float(value)
+        while len(self._deque) > 0 and (self._deque[-1][1] <= value if self._is_max else self._deque[-1][1] >= value):
+            self._deque.pop()
+        self._deque.append((self._count, value))
+        if self._deque[0][0] <= self._count - self._length:
+            self._deque.popleft()
+        self._count += 1
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._deque[0][1] if len(self._deque) > 0 else None
+
+
+class RollingMin(_RollingExtremum):
+    def __init__(self, length: int):
+        super().__init__(length, is_max=False)
+
+
+class RollingMax(_RollingExtremum):
+    def __init__(self, length: int):
+        super().__init__(length, is_max=True)
+
+
+class VWAP(RollingIndicator):
+    """
+    Volume weighted average price over the last `length` trades.
+    """
+
+    def __init__(self, length: int):
+        super().__init__(length)
+        self._notionals: RingBuffer = RingBuffer(length)
+        self._amounts: RingBuffer = RingBuffer(length)
+        self._notional_sum: float = 0.0
+        self._amount_sum: float = 0.0
+
+    def update(self, price: Number, amount: Number = 1):
+        notional: float = float(price) * float(amount)
+        self._notional_sum += notional - (self._notionals.append(notional) or 0.0)
+        self._amount_sum += float(amount) - (self._amounts.append(float(amount)) or 0.0)
+        self._count += 1
+        if self._count % self._length == 0:
+            self._notional_sum = float(self._notionals.values().sum())
+            self._amount_sum = float(self._amounts.values().sum())
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._notional_sum / self._amount_sum if self._amount_sum > 0 else None
@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 from decimal import Decimal
 
 child_queue = None
@@ -106,14 +106,29 @@ class PMMParameters:
     def __repr__(self):
         return f"{self.__class__.__name__} {str(self.__dict__)}"
 
+    def apply_updates(self, updated_parameters: Dict[str, Any]):
+        """
+        Applies the parameter values sent by the main process, without sending them back as updates from the script.
+        """
+        for name, value in updated_parameters.items():
+            setattr(self, "_" + name, value)
+
+
+PMM_PARAMETER_NAMES: List[str] = [attr for attr, value in PMMParameters.__dict__.items()
+                                  if isinstance(value, StrategyParameter)]
+
 
 class OnTick:
+    """
+    Sent to the script on every tick. Only the parameters and balances that changed since the previous tick are sent,
+    a balance of None means the token no longer has a balance.
+    """
     def __init__(self, mid_price: Decimal,
-                 pmm_parameters: PMMParameters,
-                 all_total_balances: Dict[str, Dict[str, Decimal]]):
+                 updated_parameters: Dict[str, Any],
+                 updated_balances: Dict[str, Dict[str, Optional[Decimal]]]):
         self.mid_price = mid_price
-        self.pmm_parameters = pmm_parameters
-        self.all_total_balances = all_total_balances
+        self.updated_parameters = updated_parameters
+        self.updated_balances = updated_balances
 
     def __repr__(self):
         return f"{self.__class__.__name__} {str(self.__dict__)}"
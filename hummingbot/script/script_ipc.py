@@ -0,0 +1,183 @@
+import asyncio
+from collections import deque
+from multiprocessing import Pipe, RawArray, RawValue
+from multiprocessing.connection import Connection
+from multiprocessing.util import Finalize
+import os
+import threading
+from typing import Any, Deque, List, Optional
+
+import numpy as np
+
+
+class ScriptChannel:
+    """
+    A one way message channel between the main process and the script process, built on a pipe.
+
+    Unlike polling a multiprocessing.Queue, the reading side waits on the pipe's file descriptor with the asyncio
+    event loop, so it wakes up as soon as a message arrives and doesn't use any CPU in between.
+    The writing side has the same put() method as a queue, and like a queue it never blocks: messages are buffered
+    and written to the pipe by a sender thread, so a reader that falls behind can't stall the writer's event loop.
+    """
+    # How long a process waits at exit for its sender thread to write the messages left in the buffer.
+    EXIT_FLUSH_TIMEOUT = 5.0
+
+    def __init__(self):
+        self._reader, self._writer = Pipe(duplex=False)
+        self._init_sender()
+
+    def _init_sender(self):
+        self._send_buffer: Deque[Any] = deque()
+        self._send_condition: threading.Condition = threading.Condition()
+        self._sender_thread: Optional[threading.Thread] = None
+        self._sender_pid: int = os.getpid()
+
+    def __getstate__(self):
+        return {"_reader": self._reader, "_writer": self._writer}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_sender()
+
+    def put(self, item: Any):
+        # A forked process inherits the buffer but not the sender thread, it starts its own.
+        if self._sender_pid != os.getpid():
+            self._init_sender()
+        with self._send_condition:
+            self._send_buffer.append(item)
+            if self._sender_thread is None:
+                self._sender_thread = threading.Thread(target=self._send_loop, daemon=True)
+                self._sender_thread.start()
+                # Like a multiprocessing.Queue's feeder thread, the messages left are written before the process exits.
+                Finalize(self._sender_thread, ScriptChannel._flush_buffer,
+                         args=(self._send_condition, self._send_buffer, self.EXIT_FLUSH_TIMEOUT), exitpriority=-5)
+            self._send_condition.notify_all()
+
+    def _send_loop(self):
+        while True:
+            with self._send_condition:
+                while len(self._send_buffer) == 0:
+                    self._send_condition.wait()
+                item = self._send_buffer[0]
+            try:
+                self._writer.send(item)
+            except OSError:
+                return
+            with self._send_condition:
+                self._send_buffer.popleft()
+                self._send_condition.notify_all()
+
+    @property
+    def pending_count(self) -> int:
+        """
+        The number of messages put but not yet written to the pipe.
+        """
+        return len(self._send_buffer)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until all messages put are written to the pipe.
+        :returns False if they were not written before the timeout.
+        """
+        return self._flush_buffer(self._send_condition, self._send_buffer, timeout)
+
+    @staticmethod
+    def _flush_buffer(send_condition: threading.Condition, send_buffer: Deque[Any], timeout: Optional[float]) -> bool:
+        with send_condition:
+            return send_condition.wait_for(lambda: len(send_buffer) == 0, timeout)
+
+    def get_nowait(self) -> Optional[Any]:
+        """
+        :return: The next message, or None if there is none.
+        """
+        if self._reader.poll():
+            return self._reader.recv()
+        return None
+
+    async def get(self) -> Any:
+        """
+        Waits for and returns the next message.
+        """
+        while not self._reader.poll():
+            await self._wait_readable()
+        return self._reader.recv()
+
+    async def _wait_readable(self):
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        readable: asyncio.Future = ev_loop.create_future()
+        fd: int = self._reader.fileno()
+        ev_loop.add_reader(fd, lambda: readable.done() or readable.set_result(None))
+        try:
+            await readable
+        finally:
+            ev_loop.remove_reader(fd)
+
+    @property
+    def reader(self) -> Connection:
+        return self._reader
+
+    def close(self):
+        self._reader.close()
+        self._writer.close()
+
+
+class MidPriceRing:
+    """
+    A ring buffer of the most recent mid prices in shared memory, written by the main process on every tick and read
+    by the script process, so scripts don't need to keep their own price history.
+
+    There is a single writer. It writes the value before publishing the new count, and readers never read the slot
+    the writer writes next, so readers don't need a lock.
+    """
+
+    def __init__(self, capacity: int = 3600):
+        self._capacity: int = capacity
+        self._prices = RawArray("d", capacity)
+        self._count = RawValue("q", 0)
+        self._view: Optional[np.ndarray] = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_view"] = None
+        return state
+
+    def __len__(self) -> int:
+        return min(self._count.value, self._capacity - 1)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def view(self) -> np.ndarray:
+        if self._view is None:
+            self._view = np.frombuffer(self._prices, dtype=np.float64)
+        return self._view
+
+    def append(self, price: float):
+        count: int = self._count.value
+        self.view[count % self._capacity] = float(price)
+        self._count.value = count + 1
+
+    def latest(self, length: Optional[int] = None) -> np.ndarray:
+        """
+        :return: A copy of the last `length` mid prices (all available ones if None), oldest first.
+        """
+        count: int = self._count.value
+        available: int = min(count, self._capacity - 1)
+        length = available if length is None else min(length, available)
+        if length <= 0:
+            return np.empty(0, dtype=np.float64)
+        indices: np.ndarray = np.arange(count - length, count) % self._capacity
+        return self.view[indices]
+
+    def samples(self, interval: int, length: int) -> Optional[List[float]]:
+        """
+        Takes `length` mid prices at every `interval` ticks, ending with the most recent one, same as
+        ScriptBase.take_samples.
+        :returns None if there is not enough samples to satisfy length, otherwise the sample list.
+        """
+        needed: int = (length - 1) * interval + 1
+        if needed > len(self):
+            return None
+        return self.latest(needed)[::-1][::interval][::-1].tolist()
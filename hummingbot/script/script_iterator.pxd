@@ -16,6 +16,9 @@ cdef class ScriptIterator(TimeIterator):
         object _script_module
         object _parent_queue
         object _child_queue
+        object _mid_price_history
+        dict _sent_parameters
+        dict _sent_balances
         object _ev_loop
         object _script_process
         object _listen_to_child_task
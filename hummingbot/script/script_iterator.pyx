@@ -1,9 +1,13 @@
 # distutils: language=c++
 
-from typing import List
+from typing import (
+    Any,
+    Dict,
+    List
+)
 import asyncio
 import logging
-from multiprocessing import Process, Queue
+from multiprocessing import Process
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.clock import Clock
 from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
@@ -17,7 +21,8 @@ from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.script.script_process import run_script
-from hummingbot.script.script_interface import StrategyParameter, PMMParameters, OnTick, OnStatus, OnRefresh, OnCommand, CallNotify, CallSendImage, CallLog, CallStop, CallForceRefresh
+from hummingbot.script.script_ipc import ScriptChannel, MidPriceRing
+from hummingbot.script.script_interface import StrategyParameter, PMM_PARAMETER_NAMES, OnTick, OnStatus, OnRefresh, OnCommand, CallNotify, CallSendImage, CallLog, CallStop, CallForceRefresh
 
 sir_logger = None
 
@@ -35,7 +40,8 @@ cdef class ScriptIterator(TimeIterator):
                  markets: List[ExchangeBase],
                  strategy: PureMarketMakingStrategy,
                  queue_check_interval: float = 0.01,
-                 is_unit_testing_mode: bool = False):
+                 is_unit_testing_mode: bool = False,
+                 mid_price_history_size: int = 3600):
         super().__init__()
         self._script_file_path = script_file_path
         self._markets = markets
@@ -51,13 +57,18 @@ cdef class ScriptIterator(TimeIterator):
             (MarketEvent.SellOrderCompleted, self._did_complete_sell_order_forwarder)
         ]
         self._ev_loop = asyncio.get_event_loop()
-        self._parent_queue = Queue()
-        self._child_queue = Queue()
+        # The channels wake up their reader when a message arrives, queue_check_interval is no longer used for polling.
+        self._parent_queue = ScriptChannel()
+        self._child_queue = ScriptChannel()
+        self._mid_price_history = MidPriceRing(mid_price_history_size)
+        self._sent_parameters = {}
+        self._sent_balances = {}
         self._listen_to_child_task = safe_ensure_future(self.listen_to_child_queue(), loop=self._ev_loop)
 
         self._script_process = Process(
             target=run_script,
-            args=(script_file_path, self._parent_queue, self._child_queue, queue_check_interval,)
+            args=(script_file_path, self._parent_queue, self._child_queue, queue_check_interval,
+                  self._mid_price_history,)
         )
         self.logger().info(f"starting script in {script_file_path}")
         self._script_process.start()
@@ -66,6 +77,10 @@ cdef class ScriptIterator(TimeIterator):
     def strategy(self):
         return self._strategy
 
+    @property
+    def mid_price_history(self) -> MidPriceRing:
+        return self._mid_price_history
+
     cdef c_start(self, Clock clock, double timestamp):
         TimeIterator.c_start(self, clock, timestamp)
         for market in self._markets:
@@ -84,38 +99,63 @@ cdef class ScriptIterator(TimeIterator):
         TimeIterator.c_tick(self, timestamp)
         if not self._strategy.all_markets_ready():
             return
-        cdef object pmm_strategy = PMMParameters()
-        for attr in PMMParameters.__dict__.keys():
-            if attr[:1] != '_':
-                param_value = getattr(self._strategy, attr)
-                setattr(pmm_strategy, attr, param_value)
-        cdef object on_tick = OnTick(self.strategy.get_mid_price(), pmm_strategy, self.all_total_balances())
-        self._parent_queue.put(on_tick)
+        mid_price = self._strategy.get_mid_price()
+        self._mid_price_history.append(mid_price)
+        cdef object on_tick = OnTick(mid_price, self.updated_parameters(), self.updated_balances())
+        self._send_to_script(on_tick)
+
+    def _send_to_script(self, item):
+        # A dead script process doesn't drain the channel, its messages would pile up in the channel's buffer.
+        if self._script_process.is_alive():
+            self._parent_queue.put(item)
+
+    def updated_parameters(self) -> Dict[str, Any]:
+        """
+        :return: The strategy parameters that changed since they were last sent to the script.
+        """
+        updated = {}
+        for name in PMM_PARAMETER_NAMES:
+            value = getattr(self._strategy, name)
+            if name not in self._sent_parameters or self._sent_parameters[name] != value:
+                updated[name] = value
+                self._sent_parameters[name] = value
+        return updated
+
+    def updated_balances(self) -> Dict[str, Dict[str, Any]]:
+        """
+        :return: The balances that changed since they were last sent to the script, None for removed tokens.
+        """
+        updated = {}
+        for exchange, balances in self.all_total_balances().items():
+            sent = self._sent_balances.setdefault(exchange, {})
+            exchange_updates = {token: bal for token, bal in balances.items() if sent.get(token) != bal}
+            exchange_updates.update({token: None for token in sent.keys() if token not in balances})
+            if exchange_updates:
+                updated[exchange] = exchange_updates
+                self._sent_balances[exchange] = balances
+        return updated
 
     def _order_filled(self,
                       event_tag: int,
                       market: ExchangeBase,
                       event: OrderFilledEvent):
-        self._parent_queue.put(event)
+        self._send_to_script(event)
 
     def _did_complete_buy_order(self,
                                 event_tag: int,
                                 market: ExchangeBase,
                                 event: BuyOrderCompletedEvent):
-        self._parent_queue.put(event)
+        self._send_to_script(event)
 
     def _did_complete_sell_order(self,
                                  event_tag: int,
                                  market: ExchangeBase,
                                  event: SellOrderCompletedEvent):
-        self._parent_queue.put(event)
+        self._send_to_script(event)
 
     async def listen_to_child_queue(self):
         while True:
-            if self._child_queue.empty():
-                await asyncio.sleep(self._queue_check_interval)
-                continue
-            item = self._child_queue.get()
+            item = await self._child_queue.get()
             # print(f"received: {str(item)}")
             if item is None:
                 break
@@ -143,14 +183,14 @@ cdef class ScriptIterator(TimeIterator):
                 self.logger().info(f"script - {item.msg}")
 
     def request_status(self):
-        self._parent_queue.put(OnStatus())
+        self._send_to_script(OnStatus())
 
     def request_command(self, cmd: str, args: List[str]):
-        self._parent_queue.put(OnCommand(cmd, args))
+        self._send_to_script(OnCommand(cmd, args))
 
     def request_updated_parameters(self):
         self.logger().info(f"sending: request_updated_parameters")
-        self._parent_queue.put(OnRefresh())
+        self._send_to_script(OnRefresh())
 
     def all_total_balances(self):
         all_bals = {m.name: m.get_all_balances() for m in self._markets}
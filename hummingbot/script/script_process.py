@@ -2,15 +2,20 @@ import asyncio
 import importlib
 import inspect
 import os
-from multiprocessing import Queue
+from typing import Optional
 from hummingbot.script.script_base import ScriptBase
 from hummingbot.script.script_interface import set_child_queue
+from hummingbot.script.script_ipc import ScriptChannel, MidPriceRing
 
 
-def run_script(script_file_name: str, parent_queue: Queue, child_queue: Queue, queue_check_interval: float):
+def run_script(script_file_name: str,
+               parent_queue: ScriptChannel,
+               child_queue: ScriptChannel,
+               queue_check_interval: float,
+               mid_price_history: Optional[MidPriceRing] = None):
     script_class = import_script_sub_class(script_file_name)
     script = script_class()
-    script.assign_init(parent_queue, child_queue, queue_check_interval)
+    script.assign_init(parent_queue, child_queue, queue_check_interval, mid_price_history)
     set_child_queue(child_queue)
     policy = asyncio.get_event_loop_policy()
     policy.set_event_loop(policy.new_event_loop())
@@ -39,3 +39,12 @@ cdef list c_find_profitable_arbitrage_orders(object min_profitability,
                                              object sell_market_trading_pair_tuple,
                                              object buy_market_conversion_rate,
                                              object sell_market_conversion_rate)
+
+cdef tuple c_find_best_profitable_step(list profitable_orders,
+                                       double min_profitability,
+                                       double buy_fee_percent,
+                                       double buy_flat_fees,
+                                       double sell_fee_percent,
+                                       double sell_flat_fees,
+                                       double buy_market_quote_balance,
+                                       double sell_market_base_balance)
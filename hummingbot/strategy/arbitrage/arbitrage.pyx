@@ -2,6 +2,7 @@
 import logging
 from decimal import Decimal
 import pandas as pd
+from libcpp.vector cimport vector
 from typing import (
     List,
     Tuple,
@@ -392,33 +393,29 @@ cdef class ArbitrageStrategy(StrategyBase):
         markets and the profitability ratio. This function accounts for trading fees required by both markets before
         arriving at the optimal order size and profitability ratio.
 
+        The fees are resolved once, for the top step, and the search over the steps is done on doubles by
+        c_find_best_profitable_step().
+
         :param buy_market_trading_pair_tuple: trading pair for buy side
         :param sell_market_trading_pair_tuple: trading pair for sell side
         :return: (order size, profitability ratio, bid_price, ask_price)
         :rtype: Tuple[float, float, float, float]
         """
         cdef:
-            object total_bid_value = s_decimal_0  # total revenue
-            object total_ask_value = s_decimal_0  # total cost
-            object total_bid_value_adjusted = s_decimal_0  # total revenue adjusted with exchange rate conversion
-            object total_ask_value_adjusted = s_decimal_0  # total cost adjusted with exchange rate conversion
-            object total_previous_step_base_amount = s_decimal_0
-            object profitability
             object best_profitable_order_amount = s_decimal_0
             object best_profitable_order_profitability = s_decimal_0
             object buy_fee
             object sell_fee
             object total_sell_flat_fees
             object total_buy_flat_fees
-            object quantized_profitable_base_amount
-            object net_sell_proceeds
-            object net_buy_costs
             object buy_market_quote_balance
             object sell_market_base_balance
+            int best_step
+            int stop_step
+            bint balance_limited
+            double profitability
             ExchangeBase buy_market = buy_market_trading_pair_tuple.market
             ExchangeBase sell_market = sell_market_trading_pair_tuple.market
-            OrderBook buy_order_book = buy_market_trading_pair_tuple.order_book
-            OrderBook sell_order_book = sell_market_trading_pair_tuple.order_book
 
         buy_market_conversion_rate = self.market_conversion_rate(buy_market_trading_pair_tuple)
         sell_market_conversion_rate = self.market_conversion_rate(sell_market_trading_pair_tuple)
@@ -427,79 +424,71 @@ cdef class ArbitrageStrategy(StrategyBase):
                                                                sell_market_trading_pair_tuple,
                                                                buy_market_conversion_rate,
                                                                sell_market_conversion_rate)
+        if len(profitable_orders) == 0:
+            return s_decimal_0, s_decimal_0, s_decimal_0, s_decimal_0
 
-        # check if each step meets the profit level after fees, and is within the wallet balance
-        # fee must be calculated at every step because fee might change a potentially profitable order to unprofitable
         # market.c_get_fee returns a namedtuple with 2 keys "percent" and "flat_fees"
         # "percent" is the percent in decimals the exchange charges for the particular trade
         # "flat_fees" returns list of additional fees ie: [("ETH", 0.01), ("BNB", 2.5)]
         # typically most exchanges will only have 1 flat fee (ie: gas cost of transaction in ETH)
-        for bid_price_adjusted, ask_price_adjusted, bid_price, ask_price, amount in profitable_orders:
-            buy_fee = buy_market.c_get_fee(
-                buy_market_trading_pair_tuple.base_asset,
-                buy_market_trading_pair_tuple.quote_asset,
-                buy_market_trading_pair_tuple.market.get_taker_order_type(),
-                TradeType.BUY,
-                total_previous_step_base_amount + amount,
-                ask_price
-            )
-            sell_fee = sell_market.c_get_fee(
-                sell_market_trading_pair_tuple.base_asset,
-                sell_market_trading_pair_tuple.quote_asset,
-                sell_market_trading_pair_tuple.market.get_taker_order_type(),
-                TradeType.SELL,
-                total_previous_step_base_amount + amount,
-                bid_price
-            )
-            # accumulated flat fees of exchange
-            total_buy_flat_fees = self.c_sum_flat_fees(buy_market_trading_pair_tuple.quote_asset, buy_fee.flat_fees)
-            total_sell_flat_fees = self.c_sum_flat_fees(sell_market_trading_pair_tuple.quote_asset, sell_fee.flat_fees)
-
-            # accumulated profitability with fees
-            total_bid_value_adjusted += bid_price_adjusted * amount
-            total_ask_value_adjusted += ask_price_adjusted * amount
-            net_sell_proceeds = total_bid_value_adjusted * (1 - sell_fee.percent) - total_sell_flat_fees
-            net_buy_costs = total_ask_value_adjusted * (1 + buy_fee.percent) + total_buy_flat_fees
-            profitability = net_sell_proceeds / net_buy_costs
-
-            # if current step is within minimum profitability, set to best profitable order
-            # because the total amount is greater than the previous step
-            if profitability > (1 + self._min_profitability):
-                best_profitable_order_amount = total_previous_step_base_amount + amount
-                best_profitable_order_profitability = profitability
-
-            if self._logging_options & self.OPTION_LOG_PROFITABILITY_STEP:
-                self.log_with_clock(logging.DEBUG, f"Total profitability with fees: {profitability}, "
-                                                   f"Current step profitability: {bid_price/ask_price},"
-                                                   f"bid, ask price, amount: {bid_price, ask_price, amount}")
-            buy_market_quote_balance = buy_market.c_get_available_balance(buy_market_trading_pair_tuple.quote_asset)
-            sell_market_base_balance = sell_market.c_get_available_balance(sell_market_trading_pair_tuple.base_asset)
-            # stop current step if buy/sell market does not have enough asset
-            if (buy_market_quote_balance < net_buy_costs or
-                    sell_market_base_balance < (total_previous_step_base_amount + amount)):
-                # use previous step as best profitable order if below min profitability
-                if profitability < (1 + self._min_profitability):
-                    break
-                if self._logging_options & self.OPTION_LOG_INSUFFICIENT_ASSET:
-                    self.log_with_clock(logging.DEBUG,
-                                        f"Not enough asset to complete this step. "
-                                        f"Quote asset needed: {total_ask_value + ask_price * amount}. "
-                                        f"Quote asset available balance: {buy_market_quote_balance}. "
-                                        f"Base asset needed: {total_bid_value + bid_price * amount}. "
-                                        f"Base asset available balance: {sell_market_base_balance}. ")
-
-                # market buys need to be adjusted to account for additional fees
-                buy_market_adjusted_order_size = ((buy_market_quote_balance / ask_price - total_buy_flat_fees) /
-                                                  (1 + buy_fee.percent))
-                # buy and sell with the amount of available base or quote asset, whichever is smaller
-                best_profitable_order_amount = min(sell_market_base_balance, buy_market_adjusted_order_size)
-                best_profitable_order_profitability = profitability
-                break
-
-            total_bid_value += bid_price * amount
-            total_ask_value += ask_price * amount
-            total_previous_step_base_amount += amount
-
+        # The fees do not depend on the order size, so they are taken for the top step rather than for every step.
+        _, _, top_bid_price, top_ask_price, top_amount = profitable_orders[0]
+        buy_fee = buy_market.c_get_fee(
+            buy_market_trading_pair_tuple.base_asset,
+            buy_market_trading_pair_tuple.quote_asset,
+            buy_market_trading_pair_tuple.market.get_taker_order_type(),
+            TradeType.BUY,
+            top_amount,
+            top_ask_price
+        )
+        sell_fee = sell_market.c_get_fee(
+            sell_market_trading_pair_tuple.base_asset,
+            sell_market_trading_pair_tuple.quote_asset,
+            sell_market_trading_pair_tuple.market.get_taker_order_type(),
+            TradeType.SELL,
+            top_amount,
+            top_bid_price
+        )
+        # accumulated flat fees of exchange
+        total_buy_flat_fees = self.c_sum_flat_fees(buy_market_trading_pair_tuple.quote_asset, buy_fee.flat_fees)
+        total_sell_flat_fees = self.c_sum_flat_fees(sell_market_trading_pair_tuple.quote_asset, sell_fee.flat_fees)
+        buy_market_quote_balance = buy_market.c_get_available_balance(buy_market_trading_pair_tuple.quote_asset)
+        sell_market_base_balance = sell_market.c_get_available_balance(sell_market_trading_pair_tuple.base_asset)
+
+        best_step, stop_step, balance_limited, profitability = c_find_best_profitable_step(
+            profitable_orders,
+            float(self._min_profitability),
+            float(buy_fee.percent),
+            float(total_buy_flat_fees),
+            float(sell_fee.percent),
+            float(total_sell_flat_fees),
+            float(buy_market_quote_balance),
+            float(sell_market_base_balance)
+        )
+        _, _, bid_price, ask_price, _ = profitable_orders[stop_step]
+
+        if balance_limited:
+            if self._logging_options & self.OPTION_LOG_INSUFFICIENT_ASSET:
+                self.log_with_clock(logging.DEBUG,
+                                    f"Not enough asset to complete step {stop_step}. "
+                                    f"Quote asset available balance: {buy_market_quote_balance}. "
+                                    f"Base asset available balance: {sell_market_base_balance}. ")
+            # market buys need to be adjusted to account for additional fees
+            buy_market_adjusted_order_size = ((buy_market_quote_balance / ask_price - total_buy_flat_fees) /
+                                              (1 + buy_fee.percent))
+            # buy and sell with the amount of available base or quote asset, whichever is smaller
+            best_profitable_order_amount = min(sell_market_base_balance, buy_market_adjusted_order_size)
+            best_profitable_order_profitability = Decimal(profitability)
+        elif best_step >= 0:
+            # summed as Decimal, so that the amount is quantized the same as the order book amounts
+            best_profitable_order_amount = sum(step[4] for step in profitable_orders[:best_step + 1])
+            best_profitable_order_profitability = Decimal(profitability)
+
+        if self._logging_options & self.OPTION_LOG_PROFITABILITY_STEP:
+            self.log_with_clock(logging.DEBUG, f"Total profitability with fees: {best_profitable_order_profitability}, "
+                                               f"Current step profitability: {bid_price/ask_price},"
+                                               f"bid, ask price, amount: "
+                                               f"{bid_price, ask_price, best_profitable_order_amount}")
         if self._logging_options & self.OPTION_LOG_FULL_PROFITABILITY_STEP:
             self.log_with_clock(
                 logging.DEBUG,
@@ -613,3 +602,121 @@ cdef list c_find_profitable_arbitrage_orders(object min_profitability,
         pass
 
     return profitable_orders
+
+
+def find_best_profitable_step(profitable_orders: List[Tuple[Decimal, Decimal, Decimal, Decimal, Decimal]],
+                              min_profitability: float,
+                              buy_fee_percent: float,
+                              buy_flat_fees: float,
+                              sell_fee_percent: float,
+                              sell_flat_fees: float,
+                              buy_market_quote_balance: float,
+                              sell_market_base_balance: float) -> Tuple[int, int, bool, float]:
+    return c_find_best_profitable_step(profitable_orders, min_profitability, buy_fee_percent, buy_flat_fees,
+                                       sell_fee_percent, sell_flat_fees, buy_market_quote_balance,
+                                       sell_market_base_balance)
+
+
+cdef tuple c_find_best_profitable_step(list profitable_orders,
+                                       double min_profitability,
+                                       double buy_fee_percent,
+                                       double buy_flat_fees,
+                                       double sell_fee_percent,
+                                       double sell_flat_fees,
+                                       double buy_market_quote_balance,
+                                       double sell_market_base_balance):
+    """
+    Finds the largest profitable order over the steps returned by c_find_profitable_arbitrage_orders(), after fees
+    and within the available balances.
+
+    The cumulative order value curve is computed in one pass, then searched with binary searches: the cumulative
+    costs and amounts only grow with the steps, and as each step has a lower bid and a higher ask than the last, the
+    profit above min_profitability rises and then falls over the steps, so the largest profitable order is past the
+    turning point where it is decreasing.
+
+    :param profitable_orders: steps of (bid_price_adjusted, ask_price_adjusted, bid_price, ask_price, amount)
+    :param min_profitability: minimum profit ratio
+    :param buy_fee_percent: percent fee of the buy market
+    :param buy_flat_fees: flat fees of the buy market, in its quote asset
+    :param sell_fee_percent: percent fee of the sell market
+    :param sell_flat_fees: flat fees of the sell market, in its quote asset
+    :param buy_market_quote_balance: available quote asset balance on the buy market
+    :param sell_market_base_balance: available base asset balance on the sell market
+    :return: (last step of the best order or -1 if none is profitable, step the search stopped at, whether the
+             order is limited by the balances at the stop step, profitability of the best order)
+    """
+    cdef:
+        int num_steps = len(profitable_orders)
+        int i
+        int lo
+        int hi
+        int mid
+        int balance_step
+        int peak_step
+        double threshold = 1 + min_profitability
+        double sell_factor = 1 - sell_fee_percent
+        double buy_factor = 1 + buy_fee_percent
+        double amount
+        double profitability
+        vector[double] bid_values
+        vector[double] ask_values
+        vector[double] cumulative_amounts
+        vector[double] cumulative_bid_values
+        vector[double] cumulative_ask_values
+
+    bid_values.reserve(num_steps)
+    ask_values.reserve(num_steps)
+    cumulative_amounts.reserve(num_steps)
+    cumulative_bid_values.reserve(num_steps)
+    cumulative_ask_values.reserve(num_steps)
+    for i in range(num_steps):
+        step = profitable_orders[i]
+        amount = float(step[4])
+        bid_values.push_back(float(step[0]) * amount)
+        ask_values.push_back(float(step[1]) * amount)
+        cumulative_amounts.push_back(amount + (cumulative_amounts[i - 1] if i > 0 else 0))
+        cumulative_bid_values.push_back(bid_values[i] + (cumulative_bid_values[i - 1] if i > 0 else 0))
+        cumulative_ask_values.push_back(ask_values[i] + (cumulative_ask_values[i - 1] if i > 0 else 0))
+
+    # The first step the balances are not enough for.
+    lo, hi = 0, num_steps
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if (buy_market_quote_balance < cumulative_ask_values[mid] * buy_factor + buy_flat_fees or
+                sell_market_base_balance < cumulative_amounts[mid]):
+            hi = mid
+        else:
+            lo = mid + 1
+    balance_step = lo
+
+    if balance_step < num_steps:
+        profitability = ((cumulative_bid_values[balance_step] * sell_factor - sell_flat_fees) /
+                         (cumulative_ask_values[balance_step] * buy_factor + buy_flat_fees))
+        if profitability >= threshold:
+            return -1, balance_step, True, profitability
+
+    # The first step that lowers the profit above min_profitability, after which it only falls.
+    lo, hi = 0, balance_step
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if bid_values[mid] * sell_factor <= threshold * ask_values[mid] * buy_factor:
+            hi = mid
+        else:
+            lo = mid + 1
+    peak_step = max(lo - 1, 0)
+
+    # The last step that is still profitable, on the falling side.
+    lo, hi = peak_step, balance_step
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if (cumulative_bid_values[mid] * sell_factor - sell_flat_fees >
+                threshold * (cumulative_ask_values[mid] * buy_factor + buy_flat_fees)):
+            lo = mid + 1
+        else:
+            hi = mid
+    i = lo - 1
+    if i < peak_step:
+        return -1, min(balance_step, num_steps - 1), False, 0.0
+    profitability = ((cumulative_bid_values[i] * sell_factor - sell_flat_fees) /
+                     (cumulative_ask_values[i] * buy_factor + buy_flat_fees))
+    return i, min(balance_step, num_steps - 1), False, profitability
@@ -24,6 +24,7 @@ cdef class CeloArbStrategy(StrategyBase):
         object _async_scheduler
         object _main_task
         bint _mock_celo_cli_mode
+        object _celo_rate_client
         object _trade_profits
         object _ev_loop
 
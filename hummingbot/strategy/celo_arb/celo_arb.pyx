@@ -4,6 +4,7 @@ from libc.stdint cimport int64_t
 import logging
 from typing import (
     List,
+    Optional,
     Tuple,
     Dict
 )
@@ -26,9 +27,11 @@ from hummingbot.market.celo.celo_cli import (
     CELO_QUOTE,
 )
 from hummingbot.market.celo.celo_data_types import (
+    CeloExchangeRate,
     CeloOrder,
     CeloArbTradeProfit
 )
+from hummingbot.market.celo.celo_rate_client import CeloRateClient
 from hummingbot.core.event.events import (
     TradeType,
     OrderType,
@@ -43,9 +46,10 @@ ds_logger = None
 NODE_SYNCED_CHECK_INTERVAL = 60.0 * 5.0
 
 
-def get_trade_profits(market, trading_pair: str, order_amount: Decimal) -> List[CeloArbTradeProfit]:
-    order_amount = Decimal(str(order_amount))
-    results = []
+def get_ctp_prices(market, trading_pair: str, order_amount: Decimal) -> Tuple[Decimal, Decimal, Decimal, Decimal]:
+    """
+    :return: The counter party buy price, buy vwap, sell price and sell vwap for the order_amount.
+    """
     # Find Celo counter party price for the order_amount
     # volume weighted average price is used for profit calculation.
     query_result = market.get_vwap_for_volume(trading_pair, True, float(order_amount))
@@ -58,13 +62,17 @@ def get_trade_profits(market, trading_pair: str, order_amount: Decimal) -> List[
     ctp_vwap_sell = Decimal(str(query_result.result_price))
     query_result = market.get_price_for_volume(trading_pair, False, float(order_amount))
     ctp_sell = Decimal(str(query_result.result_price))
-    # Celo exchange rate show buy result in USD amount
-    celo_buy_amount = ctp_vwap_sell * order_amount
-    celo_ex_rates = CeloCLI.exchange_rate(celo_buy_amount)
-    celo_buy_ex_rate = [r for r in celo_ex_rates if r.to_token == CELO_BASE and r.from_token == CELO_QUOTE][0]
+    return ctp_buy, ctp_vwap_buy, ctp_sell, ctp_vwap_sell
+
+
+def trade_profits_from_rates(ctp_buy: Decimal,
+                             ctp_vwap_buy: Decimal,
+                             ctp_sell: Decimal,
+                             ctp_vwap_sell: Decimal,
+                             celo_buy_ex_rate: CeloExchangeRate,
+                             celo_sell_ex_rate: CeloExchangeRate) -> List[CeloArbTradeProfit]:
+    results = []
     celo_buy = celo_buy_ex_rate.from_amount / celo_buy_ex_rate.to_amount
-    celo_ex_rates = CeloCLI.exchange_rate(order_amount)
-    celo_sell_ex_rate = [r for r in celo_ex_rates if r.from_token == CELO_BASE and r.to_token == CELO_QUOTE][0]
     celo_sell = celo_sell_ex_rate.to_amount / celo_sell_ex_rate.from_amount
     celo_buy_profit = (ctp_vwap_sell - celo_buy) / celo_buy
     results.append(CeloArbTradeProfit(True, ctp_sell, ctp_vwap_sell, celo_buy, celo_buy_profit))
@@ -73,6 +81,34 @@ def get_trade_profits(market, trading_pair: str, order_amount: Decimal) -> List[
     return results
 
 
+def get_trade_profits(market, trading_pair: str, order_amount: Decimal) -> List[CeloArbTradeProfit]:
+    order_amount = Decimal(str(order_amount))
+    ctp_buy, ctp_vwap_buy, ctp_sell, ctp_vwap_sell = get_ctp_prices(market, trading_pair, order_amount)
+    # Celo exchange rate show buy result in USD amount
+    celo_buy_amount = ctp_vwap_sell * order_amount
+    celo_ex_rates = CeloCLI.exchange_rate(celo_buy_amount)
+    celo_buy_ex_rate = [r for r in celo_ex_rates if r.to_token == CELO_BASE and r.from_token == CELO_QUOTE][0]
+    celo_ex_rates = CeloCLI.exchange_rate(order_amount)
+    celo_sell_ex_rate = [r for r in celo_ex_rates if r.from_token == CELO_BASE and r.to_token == CELO_QUOTE][0]
+    return trade_profits_from_rates(ctp_buy, ctp_vwap_buy, ctp_sell, ctp_vwap_sell,
+                                    celo_buy_ex_rate, celo_sell_ex_rate)
+
+
+async def get_trade_profits_async(market,
+                                  trading_pair: str,
+                                  order_amount: Decimal,
+                                  celo_rate_client: CeloRateClient) -> List[CeloArbTradeProfit]:
+    """
+    Same as get_trade_profits, with the Celo quotes from the node through celo_rate_client.
+    """
+    order_amount = Decimal(str(order_amount))
+    ctp_buy, ctp_vwap_buy, ctp_sell, ctp_vwap_sell = get_ctp_prices(market, trading_pair, order_amount)
+    celo_sell_ex_rate, celo_buy_ex_rate = await celo_rate_client.exchange_rates(order_amount,
+                                                                                ctp_vwap_sell * order_amount)
+    return trade_profits_from_rates(ctp_buy, ctp_vwap_buy, ctp_sell, ctp_vwap_sell,
+                                    celo_buy_ex_rate, celo_sell_ex_rate)
+
+
 cdef class CeloArbStrategy(StrategyBase):
     OPTION_LOG_NULL_ORDER_SIZE = 1 << 0
     OPTION_LOG_REMOVING_ORDER = 1 << 1
@@ -99,7 +135,13 @@ cdef class CeloArbStrategy(StrategyBase):
                  logging_options: int = OPTION_LOG_ALL,
                  status_report_interval: float = 900,
                  hb_app_notification: bool = True,
-                 mock_celo_cli_mode: bool = False):
+                 mock_celo_cli_mode: bool = False,
+                 celo_rate_client: Optional[CeloRateClient] = None):
+        """
+        :param celo_rate_client: Quotes the Celo exchange over the node's JSON-RPC, defaults to one on the local node,
+                                 start.py gives one on the configured celo_node_url.
+                                 In mock celo cli mode, quotes come from CeloCLI instead.
+        """
         super().__init__()
         self._market_info = market_info
         self._exchange = market_info.market.name
@@ -107,6 +149,9 @@ cdef class CeloArbStrategy(StrategyBase):
         self._order_amount = order_amount
         self._celo_slippage_buffer = celo_slippage_buffer
         self._mock_celo_cli_mode = mock_celo_cli_mode
+        self._celo_rate_client = celo_rate_client
+        if self._celo_rate_client is None and not mock_celo_cli_mode:
+            self._celo_rate_client = CeloRateClient()
         self._last_no_arb_reported = 0
         self._trade_profits = None
         self._celo_orders = []
@@ -218,6 +263,8 @@ cdef class CeloArbStrategy(StrategyBase):
         if self._main_task is not None and not self._main_task.done():
             self._main_task.cancel()
             self._main_task = None
+        if self._celo_rate_client is not None:
+            safe_ensure_future(self._celo_rate_client.close())
         StrategyBase.c_stop(self, clock)
 
     cdef c_tick(self, double timestamp):
@@ -261,25 +308,47 @@ cdef class CeloArbStrategy(StrategyBase):
             self.main_process()
         else:
             if self._main_task is None or self._main_task.done():
-                coro = self._async_scheduler.call_async(self.main_process, timeout_seconds=30)
-                self._main_task = safe_ensure_future(coro)
+                self._main_task = safe_ensure_future(self.main_process_async())
 
     def main_process(self):
         if self._last_synced_checked < self._current_timestamp - NODE_SYNCED_CHECK_INTERVAL:
-            err_msg = CeloCLI.validate_node_synced()
-            self._node_synced = err_msg is None
-            self._last_synced_checked = self._current_timestamp
-            check_msg = "synced" if err_msg is None else f"Error: {err_msg}"
-            self.log_with_clock(logging.INFO, f"Node sync check - {check_msg}")
+            self.set_node_synced(CeloCLI.validate_node_synced())
         if not self._node_synced:
             return
         self._trade_profits = get_trade_profits(self._market_info.market, self._market_info.trading_pair, self._order_amount)
-        arb_trades = [t for t in self._trade_profits if t.profit >= self._min_profitability]
-        if len(arb_trades) == 0:
-            if self._last_no_arb_reported < self._current_timestamp - 20:
-                self.logger().info(f"No arbitrage opportunity: {self._trade_profits[0]} {self._trade_profits[1]}")
-                self._last_no_arb_reported = self._current_timestamp
+        self.execute_arb_trades(self.arb_trades())
+
+    async def main_process_async(self):
+        """
+        The main process with the Celo quotes and node sync check from the rate client on the event loop. Only the
+        Celo orders, which go through celocli, are run on the async scheduler's thread.
+        """
+        if self._last_synced_checked < self._current_timestamp - NODE_SYNCED_CHECK_INTERVAL:
+            self.set_node_synced(await self._celo_rate_client.validate_node_synced())
+        if not self._node_synced:
             return
+        self._trade_profits = await get_trade_profits_async(self._market_info.market,
+                                                            self._market_info.trading_pair,
+                                                            self._order_amount,
+                                                            self._celo_rate_client)
+        arb_trades = self.arb_trades()
+        if len(arb_trades) > 0:
+            await self._async_scheduler.call_async(self.execute_arb_trades, arb_trades, timeout_seconds=30)
+
+    def set_node_synced(self, err_msg: Optional[str]):
+        self._node_synced = err_msg is None
+        self._last_synced_checked = self._current_timestamp
+        check_msg = "synced" if err_msg is None else f"Error: {err_msg}"
+        self.log_with_clock(logging.INFO, f"Node sync check - {check_msg}")
+
+    def arb_trades(self) -> List[CeloArbTradeProfit]:
+        arb_trades = [t for t in self._trade_profits if t.profit >= self._min_profitability]
+        if len(arb_trades) == 0 and self._last_no_arb_reported < self._current_timestamp - 20:
+            self.logger().info(f"No arbitrage opportunity: {self._trade_profits[0]} {self._trade_profits[1]}")
+            self._last_no_arb_reported = self._current_timestamp
+        return arb_trades
+
+    def execute_arb_trades(self, arb_trades: List[CeloArbTradeProfit]):
         for arb_trade in arb_trades:
             self.logger().info(f"Found arbitrage opportunity!: {arb_trade}")
             if arb_trade.is_celo_buy:
@@ -9,6 +9,7 @@ from hummingbot.client.settings import (
     EXAMPLE_PAIRS,
 )
 from decimal import Decimal
+from hummingbot.market.celo.celo_rate_client import DEFAULT_NODE_URL
 
 
 def exchange_on_validated(value: str) -> None:
@@ -63,4 +64,9 @@ celo_arb_config_map = {
         default=Decimal("0.01"),
         validator=lambda v: validate_decimal(v),
         type_str="decimal"),
+    "celo_node_url": ConfigVar(
+        key="celo_node_url",
+        prompt=f"What is the JSON-RPC URL of your Celo node, the one celocli uses? (default: {DEFAULT_NODE_URL}) >>> ",
+        default=DEFAULT_NODE_URL,
+        type_str="str"),
 }
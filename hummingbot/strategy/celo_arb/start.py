@@ -3,6 +3,7 @@ from typing import (
     Tuple,
 )
 from decimal import Decimal
+from hummingbot.market.celo.celo_rate_client import CeloRateClient
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.celo_arb.celo_arb import CeloArbStrategy
 from hummingbot.strategy.celo_arb.celo_arb_config_map import celo_arb_config_map
@@ -14,6 +15,7 @@ def start(self):
     order_amount = celo_arb_config_map.get("order_amount").value
     min_profitability = celo_arb_config_map.get("min_profitability").value / Decimal("100")
     celo_slippage_buffer = celo_arb_config_map.get("celo_slippage_buffer").value / Decimal("100")
+    celo_node_url = celo_arb_config_map.get("celo_node_url").value
     try:
         secondary_trading_pair: str = secondary_market
         secondary_assets: Tuple[str, str] = self._initialize_market_assets(secondary_exchange,
@@ -30,4 +32,5 @@ def start(self):
     secondary_data = [self.markets[secondary_exchange], secondary_trading_pair] + list(secondary_assets)
     market_info = MarketTradingPairTuple(*secondary_data)
     self.market_trading_pair_tuples = [market_info]
-    self.strategy = CeloArbStrategy(market_info, min_profitability, order_amount, celo_slippage_buffer)
+    self.strategy = CeloArbStrategy(market_info, min_profitability, order_amount, celo_slippage_buffer,
+                                    celo_rate_client=CeloRateClient(celo_node_url))
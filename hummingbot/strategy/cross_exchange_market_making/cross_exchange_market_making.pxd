@@ -5,6 +5,7 @@ from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.strategy.strategy_base cimport StrategyBase
 from .order_id_market_pair_tracker cimport OrderIDMarketPairTracker
+from .price_sample_window cimport PriceSampleWindow
 
 cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
     cdef:
@@ -22,12 +23,14 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         object _cancel_order_threshold
         object _top_depth_tolerance
         double _anti_hysteresis_duration
+        double _price_sample_window_duration
         double _status_report_interval
         double _last_timestamp
         double _limit_order_min_expiration
         dict _order_fill_buy_events
         dict _order_fill_sell_events
         dict _suggested_price_samples
+        dict _taker_vwap_cache
         dict _market_pairs
         int64_t _logging_options
         OrderIDMarketPairTracker _market_pair_tracker
@@ -68,12 +71,16 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                                            object market_pair,
                                            LimitOrder active_order)
 
+    cdef object c_get_taker_vwap(self,
+                                 object market_pair,
+                                 bint is_buy,
+                                 object size)
     cdef tuple c_get_top_bid_ask(self,
                                  object market_pair)
     cdef tuple c_get_top_bid_ask_from_price_samples(self,
                                                     object market_pair)
-    cdef tuple c_get_suggested_price_samples(self,
-                                             object market_pair)
+    cdef PriceSampleWindow c_get_suggested_price_samples(self,
+                                                         object market_pair)
     cdef c_take_suggested_price_sample(self,
                                        object market_pair)
     cdef c_check_and_create_new_orders(self,
@@ -1,7 +1,4 @@
-from collections import (
-    defaultdict,
-    deque
-)
+from collections import defaultdict
 from decimal import Decimal
 import logging
 from math import (
@@ -28,6 +25,8 @@ from hummingbot.strategy.strategy_base cimport StrategyBase
 from hummingbot.strategy.strategy_base import StrategyBase
 from .cross_exchange_market_pair import CrossExchangeMarketPair
 from .order_id_market_pair_tracker import OrderIDMarketPairTracker
+from .price_sample_window cimport PriceSampleWindow
+from .price_sample_window import PriceSampleWindow
 
 NaN = float("nan")
 s_decimal_zero = Decimal(0)
@@ -46,7 +45,6 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
     OPTION_LOG_ALL = 0x7fffffffffffffff
 
     ORDER_ADJUST_SAMPLE_INTERVAL = 5
-    ORDER_ADJUST_SAMPLE_WINDOW = 12
 
     SHADOW_MAKER_ORDER_KEEP_ALIVE_DURATION = 60.0 * 15
     CANCEL_EXPIRY_DURATION = 60.0
@@ -68,6 +66,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                  limit_order_min_expiration: float = 130.0,
                  adjust_order_enabled: bool = True,
                  anti_hysteresis_duration: float = 60.0,
+                 price_sample_window_duration: float = 60.0,
                  active_order_canceling: bint = True,
                  cancel_order_threshold: Decimal = Decimal("0.05"),
                  top_depth_tolerance: Decimal = Decimal(0),
@@ -95,6 +94,8 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                                        strategy to force an order cancellation
         :param active_order_canceling: True if active order cancellation is enabled, False if disabled
         :param anti_hysteresis_duration: the minimum amount of time interval between adjusting limit order prices
+        :param price_sample_window_duration: how far back, in seconds, the maker market price samples are taken into
+                                             account when pricing new limit orders
         :param logging_options: bit field for what types of logging to enable in this strategy object
         :param status_report_interval: what is the time interval between outputting new network warnings
         """
@@ -104,6 +105,8 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
             raise ValueError(f"order_size_taker_volume_factor must be between 0 and 1.")
         if not 0 <= order_size_taker_balance_factor <= 1:
             raise ValueError(f"order_size_taker_balance_factor must be between 0 and 1.")
+        if price_sample_window_duration <= 0:
+            raise ValueError(f"price_sample_window_duration must be positive.")
 
         super().__init__()
         self._market_pairs = {
@@ -124,8 +127,10 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         self._order_fill_buy_events = {}
         self._order_fill_sell_events = {}
         self._suggested_price_samples = {}
+        self._taker_vwap_cache = {}
         self._active_order_canceling = active_order_canceling
         self._anti_hysteresis_duration = anti_hysteresis_duration
+        self._price_sample_window_duration = price_sample_window_duration
         self._logging_options = <int64_t>logging_options
         self._last_timestamp = 0
         self._limit_order_min_expiration = limit_order_min_expiration
@@ -268,6 +273,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         try:
             # Perform clock tick with the market pair tracker.
             self._market_pair_tracker.c_tick(timestamp)
+            self._taker_vwap_cache.clear()
 
             if not self._all_markets_ready:
                 self._all_markets_ready = all([market.ready for market in self._sb_markets])
@@ -736,7 +742,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
             user_order = self.c_get_adjusted_limit_order_size(market_pair)
 
             try:
-                taker_price = taker_market.c_get_vwap_for_volume(taker_trading_pair, False, user_order).result_price
+                taker_price = self.c_get_taker_vwap(market_pair, False, user_order)
             except ZeroDivisionError:
                 top_ask_price = market_pair.taker.get_price(True)
                 taker_price = top_ask_price
@@ -756,7 +762,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
             user_order = self.c_get_adjusted_limit_order_size(market_pair)
 
             try:
-                taker_price = taker_market.c_get_vwap_for_volume(taker_trading_pair, True, user_order).result_price
+                taker_price = self.c_get_taker_vwap(market_pair, True, user_order)
             except ZeroDivisionError:
                 top_bid_price = taker_market.c_get_price(taker_trading_pair, True)
                 taker_price = top_bid_price
@@ -803,7 +809,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                 price_above_bid = (ceil(top_bid_price / price_quantum) + 1) * price_quantum
 
             try:
-                taker_price = taker_market.c_get_vwap_for_volume(taker_trading_pair, False, size).result_price
+                taker_price = self.c_get_taker_vwap(market_pair, False, size)
             except ZeroDivisionError:
                 return s_decimal_nan
 
@@ -839,7 +845,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                 next_price_below_top_ask = (floor(top_ask_price / price_quantum) - 1) * price_quantum
 
             try:
-                taker_price = taker_market.c_get_vwap_for_volume(taker_trading_pair, True, size).result_price
+                taker_price = self.c_get_taker_vwap(market_pair, True, size)
             except ZeroDivisionError:
                 return s_decimal_nan
 
@@ -892,7 +898,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         # Calculate the next price from the top, and the order size limit.
         if is_bid:
             try:
-                taker_price = taker_market.c_get_vwap_for_volume(taker_trading_pair, False, size).result_price
+                taker_price = self.c_get_taker_vwap(market_pair, False, size)
             except ZeroDivisionError:
                 return None
 
@@ -903,7 +909,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
             return taker_price
         else:
             try:
-                taker_price = taker_market.c_get_vwap_for_volume(taker_trading_pair, True, size).result_price
+                taker_price = self.c_get_taker_vwap(market_pair, True, size)
             except ZeroDivisionError:
                 return None
 
@@ -912,16 +918,41 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
 
             return taker_price
 
-    cdef tuple c_get_suggested_price_samples(self, object market_pair):
+    cdef object c_get_taker_vwap(self, object market_pair, bint is_buy, object size):
+        """
+        Get the VWAP price of a size on the taker market, from the taker order book.
+
+        The prices are cached per market pair until the taker order book is updated, or until the next tick, since
+        the same sizes are priced several times per tick when checking and placing the orders.
+
+        :param market_pair: cross exchange market pair
+        :param is_buy: whether the price is for buying or selling on the taker market
+        :param size: size of the order
+        :return: a Decimal which is the VWAP price
+        """
+        cdef:
+            OrderBook taker_order_book = market_pair.taker.order_book
+            ExchangeBase taker_market = market_pair.taker.market
+            tuple cache_entry = self._taker_vwap_cache.get(market_pair)
+            dict prices
+            tuple key = (is_buy, size)
+
+        if cache_entry is None or cache_entry[0] != taker_order_book._update_count:
+            cache_entry = (taker_order_book._update_count, {})
+            self._taker_vwap_cache[market_pair] = cache_entry
+        prices = cache_entry[1]
+        if key not in prices:
+            prices[key] = taker_market.c_get_vwap_for_volume(market_pair.taker.trading_pair, is_buy, size).result_price
+        return prices[key]
+
+    cdef PriceSampleWindow c_get_suggested_price_samples(self, object market_pair):
         """
-        Get the queues of order book price samples for a market pair.
+        Get the window of order book price samples for a market pair.
 
         :param market_pair: The market pair under which samples were collected for.
-        :return: (bid order price samples, ask order price samples)
+        :return: the price sample window of the market pair, or None if no samples were taken yet
         """
-        if market_pair in self._suggested_price_samples:
-            return self._suggested_price_samples[market_pair]
-        return deque(), deque()
+        return self._suggested_price_samples.get(market_pair)
 
     cdef tuple c_get_top_bid_ask(self, object market_pair):
         """
@@ -954,27 +985,25 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
 
     cdef c_take_suggested_price_sample(self, object market_pair):
         """
-        Record the bid and ask sample queues.
+        Record the bid and ask price samples.
 
         These samples are later taken to check if price has drifted for new limit orders, s.t. new limit orders can
         properly take into account transient orders that appear and disappear frequently on the maker market.
 
         :param market_pair: cross exchange market pair
         """
+        cdef:
+            PriceSampleWindow price_samples
+
         if ((self._last_timestamp // self.ORDER_ADJUST_SAMPLE_INTERVAL) <
                 (self._current_timestamp // self.ORDER_ADJUST_SAMPLE_INTERVAL)):
             if market_pair not in self._suggested_price_samples:
-                self._suggested_price_samples[market_pair] = (deque(), deque())
+                self._suggested_price_samples[market_pair] = PriceSampleWindow(self._price_sample_window_duration)
 
-            top_bid_price, top_ask_price = self.c_get_top_bid_ask_from_price_samples(market_pair)
+            top_bid_price, top_ask_price = self.c_get_top_bid_ask(market_pair)
 
-            bid_price_samples_deque, ask_price_samples_deque = self._suggested_price_samples[market_pair]
-            bid_price_samples_deque.append(top_bid_price)
-            ask_price_samples_deque.append(top_ask_price)
-            while len(bid_price_samples_deque) > self.ORDER_ADJUST_SAMPLE_WINDOW:
-                bid_price_samples_deque.popleft()
-            while len(ask_price_samples_deque) > self.ORDER_ADJUST_SAMPLE_WINDOW:
-                ask_price_samples_deque.popleft()
+            price_samples = self._suggested_price_samples[market_pair]
+            price_samples.c_add_sample(self._current_timestamp, top_bid_price, top_ask_price)
 
     cdef tuple c_get_top_bid_ask_from_price_samples(self,
                                                     object market_pair):
@@ -984,19 +1013,23 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         :param market_pair: cross exchange market pair
         :return: (top bid, top ask)
         """
+        cdef:
+            PriceSampleWindow price_samples = self.c_get_suggested_price_samples(market_pair)
+
         # Incorporate the past bid & ask price samples.
         current_top_bid_price, current_top_ask_price = self.c_get_top_bid_ask(market_pair)
 
-        bid_price_samples, ask_price_samples = self.c_get_suggested_price_samples(market_pair)
-
-        if not any(Decimal.is_nan(p) for p in bid_price_samples) and not Decimal.is_nan(current_top_bid_price):
-            top_bid_price = max(list(bid_price_samples) + [current_top_bid_price])
+        if price_samples is None:
+            top_bid_price, top_ask_price = current_top_bid_price, current_top_ask_price
         else:
+            top_bid_price, top_ask_price = price_samples.c_get_top_bid_ask(self._current_timestamp,
+                                                                           current_top_bid_price,
+                                                                           current_top_ask_price)
+
+        if Decimal.is_nan(top_bid_price):
             top_bid_price = current_top_ask_price
 
-        if not any(Decimal.is_nan(p) for p in ask_price_samples) and not Decimal.is_nan(current_top_ask_price):
-            top_ask_price = min(list(ask_price_samples) + [current_top_ask_price])
-        else:
+        if Decimal.is_nan(top_ask_price):
             top_ask_price = current_top_ask_price
 
         return top_bid_price, top_ask_price
@@ -166,6 +166,15 @@ cross_exchange_market_making_config_map = {
         required_if=lambda: False,
         validator=lambda v: validate_decimal(v, min_value=0, inclusive=False)
     ),
+    "price_sample_window_duration": ConfigVar(
+        key="price_sample_window_duration",
+        prompt="How far back do you want maker market prices to be taken into account when pricing new limit orders? "
+               "(in seconds) >>> ",
+        default=60,
+        type_str="float",
+        required_if=lambda: False,
+        validator=lambda v: validate_decimal(v, min_value=0, inclusive=False)
+    ),
     "order_size_taker_volume_factor": ConfigVar(
         key="order_size_taker_volume_factor",
         prompt="What percentage of hedge-able volume would you like to be traded on the taker market? "
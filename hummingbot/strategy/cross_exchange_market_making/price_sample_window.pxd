@@ -0,0 +1,11 @@
+cdef class PriceSampleWindow:
+    cdef:
+        double _window_duration
+        object _max_bids
+        object _min_asks
+        double _last_nan_bid_timestamp
+        double _last_nan_ask_timestamp
+
+    cdef c_expire_samples(self, double timestamp)
+    cdef c_add_sample(self, double timestamp, object bid_price, object ask_price)
+    cdef tuple c_get_top_bid_ask(self, double timestamp, object current_bid_price, object current_ask_price)
@@ -0,0 +1,86 @@
+from collections import deque
+from decimal import Decimal
+
+NaN = float("nan")
+s_decimal_nan = Decimal("nan")
+
+
+cdef class PriceSampleWindow:
+    """
+    Top bid and ask price samples of a market over a time window, for the highest bid and the lowest ask seen in it.
+
+    Only the samples that can still be the extremum are kept, in monotonic deques: a sample is dropped once a later
+    sample is at least as good, since it would leave the window first. So the extrema are at the front of the deques,
+    O(1) to read and amortized O(1) to update, whatever the window duration. A NaN sample voids the extremum of its
+    side for as long as it is in the window, so only the time of the last one is kept.
+    """
+
+    def __init__(self, double window_duration):
+        self._window_duration = window_duration
+        self._max_bids = deque()  # (timestamp, bid price), with decreasing prices
+        self._min_asks = deque()  # (timestamp, ask price), with increasing prices
+        self._last_nan_bid_timestamp = NaN
+        self._last_nan_ask_timestamp = NaN
+
+    @property
+    def window_duration(self) -> float:
+        return self._window_duration
+
+    cdef c_expire_samples(self, double timestamp):
+        cdef:
+            double expiry_timestamp = timestamp - self._window_duration
+
+        while len(self._max_bids) > 0 and self._max_bids[0][0] <= expiry_timestamp:
+            self._max_bids.popleft()
+        while len(self._min_asks) > 0 and self._min_asks[0][0] <= expiry_timestamp:
+            self._min_asks.popleft()
+
+    cdef c_add_sample(self, double timestamp, object bid_price, object ask_price):
+        self.c_expire_samples(timestamp)
+
+        if Decimal.is_nan(bid_price):
+            self._last_nan_bid_timestamp = timestamp
+        else:
+            while len(self._max_bids) > 0 and self._max_bids[-1][1] <= bid_price:
+                self._max_bids.pop()
+            self._max_bids.append((timestamp, bid_price))
+
+        if Decimal.is_nan(ask_price):
+            self._last_nan_ask_timestamp = timestamp
+        else:
+            while len(self._min_asks) > 0 and self._min_asks[-1][1] >= ask_price:
+                self._min_asks.pop()
+            self._min_asks.append((timestamp, ask_price))
+
+    cdef tuple c_get_top_bid_ask(self, double timestamp, object current_bid_price, object current_ask_price):
+        """
+        :return: (highest of the bid samples in the window and the current bid, lowest of the ask samples in the
+                 window and the current ask), each NaN if any of the prices it is taken from is NaN
+        """
+        cdef:
+            double expiry_timestamp = timestamp - self._window_duration
+            object top_bid_price = current_bid_price
+            object top_ask_price = current_ask_price
+
+        self.c_expire_samples(timestamp)
+
+        if Decimal.is_nan(current_bid_price) or self._last_nan_bid_timestamp > expiry_timestamp:
+            top_bid_price = s_decimal_nan
+        elif len(self._max_bids) > 0 and self._max_bids[0][1] > current_bid_price:
+            top_bid_price = self._max_bids[0][1]
+
+        if Decimal.is_nan(current_ask_price) or self._last_nan_ask_timestamp > expiry_timestamp:
+            top_ask_price = s_decimal_nan
+        elif len(self._min_asks) > 0 and self._min_asks[0][1] < current_ask_price:
+            top_ask_price = self._min_asks[0][1]
+
+        return top_bid_price, top_ask_price
+
+    # The following exposed Python functions are meant for unit tests
+    # ---------------------------------------------------------------
+    def add_sample(self, timestamp: float, bid_price: Decimal, ask_price: Decimal):
+        self.c_add_sample(timestamp, bid_price, ask_price)
+
+    def get_top_bid_ask(self, timestamp: float, current_bid_price: Decimal, current_ask_price: Decimal):
+        return self.c_get_top_bid_ask(timestamp, current_bid_price, current_ask_price)
+    # ---------------------------------------------------------------
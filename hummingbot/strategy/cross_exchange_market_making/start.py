@@ -28,6 +28,7 @@ def start(self):
     order_size_taker_balance_factor = xemm_map.get("order_size_taker_balance_factor").value / Decimal("100")
     order_size_portfolio_ratio_limit = xemm_map.get("order_size_portfolio_ratio_limit").value / Decimal("100")
     anti_hysteresis_duration = xemm_map.get("anti_hysteresis_duration").value
+    price_sample_window_duration = xemm_map.get("price_sample_window_duration").value
     taker_to_maker_base_conversion_rate = xemm_map.get("taker_to_maker_base_conversion_rate").value
     taker_to_maker_quote_conversion_rate = xemm_map.get("taker_to_maker_quote_conversion_rate").value
 
@@ -83,6 +84,7 @@ def start(self):
         order_size_taker_balance_factor=order_size_taker_balance_factor,
         order_size_portfolio_ratio_limit=order_size_portfolio_ratio_limit,
         anti_hysteresis_duration=anti_hysteresis_duration,
+        price_sample_window_duration=price_sample_window_duration,
         taker_to_maker_base_conversion_rate=taker_to_maker_base_conversion_rate,
         taker_to_maker_quote_conversion_rate=taker_to_maker_quote_conversion_rate,
         hb_app_notification=True,
@@ -1235,7 +1235,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         # ensure this function is only called once in an order refresh cycle
         if self._script_order_refresh_called is False:
             from hummingbot.client.hummingbot_application import HummingbotApplication
-            script = HummingbotApplication.main_application()._script_iterator
+            # without a running application (e.g. in backtests) there's no script
+            main_app = HummingbotApplication._main_app
+            script = main_app._script_iterator if main_app is not None else None
             # request parameter update from script
             # params update timestamp will be set as soon as any update is received
             if script is not None:
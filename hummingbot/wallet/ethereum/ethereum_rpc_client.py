@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+
+import aiohttp
+import asyncio
+import itertools
+import logging
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+import ujson
+
+from hummingbot.logger import HummingbotLogger
+
+ERC20_BALANCE_OF_SELECTOR = "0x70a08231"
+
+
+class EthereumRPCError(Exception):
+    def __init__(self, method: str, error: Dict[str, Any]):
+        super().__init__(f"JSON-RPC call {method} failed: {error}")
+        self.method: str = method
+        self.code: Optional[int] = error.get("code")
+        self.error_message: Optional[str] = error.get("message")
+
+
+class EthereumRPCClient:
+    """
+    Asyncio native Ethereum JSON-RPC client.
+
+    Unlike going through Web3 on the shared thread pool, calls don't block a thread each, and they are sent over a
+    single reused HTTP session. Calls made concurrently (e.g. from `safe_gather`) are coalesced into one JSON-RPC
+    batch request, so e.g. the balances of all the tokens of a wallet are fetched in a single round trip.
+    """
+    _erc_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._erc_logger is None:
+            cls._erc_logger = logging.getLogger(__name__)
+        return cls._erc_logger
+
+    def __init__(self,
+                 jsonrpc_url: str,
+                 max_batch_size: int = 100,
+                 request_timeout: float = 10.0):
+        self._jsonrpc_url: str = jsonrpc_url
+        self._max_batch_size: int = max_batch_size
+        self._request_timeout: float = request_timeout
+        self._request_id: itertools.count = itertools.count(1)
+        self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._pending_calls: List[Tuple[Tuple[str, List[Any]], asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+
+    @property
+    def jsonrpc_url(self) -> str:
+        return self._jsonrpc_url
+
+    async def _http_client(self) -> aiohttp.ClientSession:
+        if self._shared_client is None or self._shared_client.closed:
+            self._shared_client = aiohttp.ClientSession()
+        return self._shared_client
+
+    async def close(self):
+        if self._shared_client is not None:
+            await self._shared_client.close()
+            self._shared_client = None
+
+    def _make_request(self, method: str, params: List[Any]) -> Dict[str, Any]:
+        return {"jsonrpc": "2.0", "id": next(self._request_id), "method": method, "params": params}
+
+    async def _post(self, payload: Any) -> Any:
+        client: aiohttp.ClientSession = await self._http_client()
+        async with client.post(self._jsonrpc_url,
+                               data=ujson.dumps(payload),
+                               headers={"Content-Type": "application/json"},
+                               timeout=self._request_timeout) as response:
+            if response.status != 200:
+                raise IOError(f"Error fetching data from {self._jsonrpc_url}. HTTP status is {response.status}.")
+            return await response.json(loads=ujson.loads, content_type=None)
+
+    async def batch_call(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """
+        Sends a list of (method, params) calls in as few JSON-RPC batch requests as max_batch_size allows.
+        :return: The results, in the order of the calls. Failed calls are returned as EthereumRPCError instances.
+        """
+        requests: List[Dict[str, Any]] = [self._make_request(method, params) for method, params in calls]
+        responses_by_id: Dict[int, Dict[str, Any]] = {}
+        for i in range(0, len(requests), self._max_batch_size):
+            batch_responses: Any = await self._post(requests[i:i + self._max_batch_size])
+            if isinstance(batch_responses, dict):
+                # Nodes answer a batch they can't process with a single error object.
+                raise EthereumRPCError("batch", batch_responses.get("error", batch_responses))
+            for response in batch_responses:
+                responses_by_id[response.get("id")] = response
+
+        results: List[Any] = []
+        for request in requests:
+            response: Optional[Dict[str, Any]] = responses_by_id.get(request["id"])
+            if response is None:
+                results.append(EthereumRPCError(request["method"], {"message": "Missing response in batch."}))
+            elif "error" in response:
+                results.append(EthereumRPCError(request["method"], response["error"]))
+            else:
+                results.append(response.get("result"))
+        return results
+
+    async def call(self, method: str, params: Optional[List[Any]] = None) -> Any:
+        """
+        Queues a JSON-RPC call. Calls queued during the same event loop iteration are sent as a single batch.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending_calls.append(((method, params or []), future))
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_soon(self._flush_pending_calls)
+        result: Any = await future
+        return result
+
+    def _flush_pending_calls(self):
+        self._flush_handle = None
+        pending_calls: List[Tuple[Tuple[str, List[Any]], asyncio.Future]] = self._pending_calls
+        self._pending_calls = []
+        asyncio.ensure_future(self._send_pending_calls(pending_calls))
+
+    async def _send_pending_calls(self, pending_calls: List[Tuple[Tuple[str, List[Any]], asyncio.Future]]):
+        try:
+            results: List[Any] = await self.batch_call([call for call, _ in pending_calls])
+        except Exception as e:
+            for _, future in pending_calls:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(pending_calls, results):
+            if future.done():
+                continue
+            if isinstance(result, EthereumRPCError):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    @staticmethod
+    def to_int(hex_value: Optional[str]) -> Optional[int]:
+        return int(hex_value, 16) if hex_value is not None else None
+
+    @staticmethod
+    def erc20_balance_of_data(account_address: str) -> str:
+        return ERC20_BALANCE_OF_SELECTOR + account_address.lower().replace("0x", "").rjust(64, "0")
+
+    async def get_balance(self, address: str, block_identifier: str = "latest") -> int:
+        return self.to_int(await self.call("eth_getBalance", [address, block_identifier]))
+
+    async def get_transaction_count(self, address: str, block_identifier: str = "pending") -> int:
+        return self.to_int(await self.call("eth_getTransactionCount", [address, block_identifier]))
+
+    async def get_gas_price(self) -> int:
+        return self.to_int(await self.call("eth_gasPrice"))
+
+    async def get_block_number(self) -> int:
+        return self.to_int(await self.call("eth_blockNumber"))
+
+    async def get_block_by_hash(self, block_hash: str, full_transactions: bool = False) -> Optional[Dict[str, Any]]:
+        return await self.call("eth_getBlockByHash", [block_hash, full_transactions])
+
+    async def get_transaction_receipt(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        return await self.call("eth_getTransactionReceipt", [tx_hash])
+
+    async def get_erc20_balance(self,
+                                token_address: str,
+                                account_address: str,
+                                block_identifier: str = "latest") -> int:
+        result: str = await self.call("eth_call", [{"to": token_address,
+                                                    "data": self.erc20_balance_of_data(account_address)},
+                                                   block_identifier])
+        return self.to_int(result) if result not in (None, "0x") else 0
+
+    async def get_balances(self,
+                           account_address: str,
+                           token_addresses: List[str],
+                           block_identifier: str = "latest") -> Tuple[int, List[int]]:
+        """
+        Fetches the ETH balance and the balances of a list of ERC20 tokens of an account in one round trip.
+        :return: (ETH balance, token balances in the order of token_addresses), in raw units.
+        """
+        calls: List[Tuple[str, List[Any]]] = [("eth_getBalance", [account_address, block_identifier])]
+        calls.extend(("eth_call", [{"to": token_address, "data": self.erc20_balance_of_data(account_address)},
+                                   block_identifier])
+                     for token_address in token_addresses)
+        results: List[Any] = await self.batch_call(calls)
+        for result in results:
+            if isinstance(result, EthereumRPCError):
+                raise result
+        return (self.to_int(results[0]),
+                [self.to_int(result) if result not in (None, "0x") else 0 for result in results[1:]])
@@ -16,6 +16,7 @@ from web3.datastructures import AttributeDict
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.wallet.ethereum.erc20_token import ERC20Token
+from hummingbot.wallet.ethereum.ethereum_rpc_client import EthereumRPCClient
 from hummingbot.core.event.events import NewBlocksWatcherEvent
 from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.utils.async_utils import (
@@ -42,8 +43,11 @@ class AccountBalanceWatcher(BaseWatcher):
                  blocks_watcher: WSNewBlocksWatcher,
                  account_address: str,
                  erc20_addresses: List[str],
-                 erc20_abis: List[any]):
+                 erc20_abis: List[any],
+                 rpc_client: Optional[EthereumRPCClient] = None):
         super().__init__(w3)
+        # If given, all the balances are fetched in a single JSON-RPC batch request on every new block.
+        self._rpc_client: Optional[EthereumRPCClient] = rpc_client
         self._blocks_watcher: WSNewBlocksWatcher = blocks_watcher
         self._account_address: str = account_address
         self._addresses_to_contracts: Dict[str, Contract] = {
@@ -131,6 +135,10 @@ class AccountBalanceWatcher(BaseWatcher):
         safe_ensure_future(self.update_balances())
 
     async def update_balances(self):
+        if self._rpc_client is not None:
+            await self._update_balances_batched()
+            return
+
         asset_symbols: List[str] = []
         asset_update_tasks: List[Coroutine] = []
 
@@ -152,3 +160,21 @@ class AccountBalanceWatcher(BaseWatcher):
                                   exc_info=True,
                                   app_warning_msg="Error account balance updates. "
                                                   "Check Ethereum node connection.")
+
+    async def _update_balances_batched(self):
+        asset_symbols: List[str] = list(self._erc20_contracts.keys())
+        token_addresses: List[str] = [self._erc20_contracts[asset_name].address for asset_name in asset_symbols]
+        try:
+            eth_raw_balance, token_raw_balances = await self._rpc_client.get_balances(
+                self._account_address, token_addresses
+            )
+            self._raw_account_balances["ETH"] = eth_raw_balance
+            for asset_name, raw_balance in zip(asset_symbols, token_raw_balances):
+                self._raw_account_balances[asset_name] = raw_balance
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network("Error fetching account balance updates.",
+                                  exc_info=True,
+                                  app_warning_msg="Error account balance updates. "
+                                                  "Check Ethereum node connection.")
@@ -9,7 +9,8 @@ from typing import (
     Dict,
     List,
     Optional,
-    Set
+    Set,
+    Tuple
 )
 from web3 import Web3
 from web3.datastructures import AttributeDict
@@ -20,6 +21,10 @@ from eth_abi.codec import (
     ABICodec,
 )
 from eth_abi.registry import registry
+from eth_utils import (
+    event_abi_to_log_topic,
+    to_checksum_address
+)
 
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.utils.async_utils import safe_gather
@@ -81,8 +86,7 @@ class ContractEventLogger:
                     check_block = False
                     break
             if check_block:
-                event_filter_params["blockHash"] = block["hash"].hex()
-                tasks.append(self._get_logs(event_filter_params))
+                tasks.append(self._get_logs(dict(event_filter_params, blockHash=block["hash"].hex())))
 
         new_entries = []
         if len(tasks) > 0:
@@ -113,24 +117,136 @@ class ContractEventLogger:
     async def _get_logs(self,
                         event_filter_params: Dict[str, any],
                         max_tries: Optional[int] = 30) -> List[Dict[str, any]]:
-        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
-        count: int = 0
-        logs = []
-        while True:
-            try:
-                count += 1
-                if count > max_tries:
-                    self.logger().debug(
-                        f"Error fetching logs from block with filters: '{event_filter_params}'."
-                    )
-                    break
-                logs = await async_scheduler.call_async(
-                    functools.partial(self._w3.eth.getLogs, event_filter_params)
+        return await get_logs(self._w3, event_filter_params, max_tries=max_tries)
+
+
+async def get_logs(w3: Web3,
+                   event_filter_params: Dict[str, any],
+                   max_tries: Optional[int] = 30) -> List[Dict[str, any]]:
+    async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
+    count: int = 0
+    logs = []
+    while True:
+        try:
+            count += 1
+            if count > max_tries:
+                ContractEventLogger.logger().debug(
+                    f"Error fetching logs from block with filters: '{event_filter_params}'."
                 )
                 break
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().debug(f"Block not found with filters: '{event_filter_params}'. Retrying...")
-                await asyncio.sleep(0.5)
-        return logs
+            logs = await async_scheduler.call_async(
+                functools.partial(w3.eth.getLogs, event_filter_params)
+            )
+            break
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            ContractEventLogger.logger().debug(f"Block not found with filters: '{event_filter_params}'. Retrying...")
+            await asyncio.sleep(0.5)
+    return logs
+
+
+class MultiContractEventLogger:
+    """
+    Fetches the logs of several events from several contracts, with a single ranged `getLogs` query per batch of
+    new blocks, instead of one query per contract, event and block as ContractEventLogger does.
+
+    Blocks are pre-filtered with their logs bloom. Logs returned by the ranged query are only accepted if they belong
+    to one of the given blocks (by hash), so logs of blocks that have been reorganized away from the given ones are
+    fetched again by block hash.
+    """
+    _mcel_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mcel_logger is None:
+            cls._mcel_logger = logging.getLogger(__name__)
+        return cls._mcel_logger
+
+    def __init__(self,
+                 w3: Web3,
+                 contract_abis: Dict[str, List[Dict[str, any]]],
+                 event_names: List[str],
+                 block_events_window_size: Optional[int] = DEFAULT_WINDOW_SIZE):
+        self._w3: Web3 = w3
+        self._block_events_window_size = block_events_window_size
+        self._abi_codec: ABICodec = ABICodec(registry)
+        self._addresses: List[str] = [to_checksum_address(address) for address in contract_abis.keys()]
+        # (contract address, event topic) -> event abi. The same event can be declared with different argument
+        # names by different contracts (e.g. WETH's Transfer), so the abi is looked up per contract.
+        self._event_abi_map: Dict[Tuple[str, HexBytes], Dict[str, any]] = {}
+        topics: Set[HexBytes] = set()
+        for address, contract_abi in contract_abis.items():
+            for event_name in event_names:
+                try:
+                    event_abi: Dict[str, any] = find_matching_event_abi(contract_abi, event_name=event_name)
+                except ValueError:
+                    continue
+                topic: HexBytes = HexBytes(event_abi_to_log_topic(event_abi))
+                self._event_abi_map[(to_checksum_address(address), topic)] = event_abi
+                topics.add(topic)
+        self._topics: List[HexBytes] = sorted(topics)
+        self._address_bloom_items: List[bytes] = [bytes.fromhex(address[2:]) for address in self._addresses]
+        self._event_cache: Set[Tuple[HexBytes, int]] = set()
+        self._block_events: OrderedDict = OrderedDict()
+
+    @property
+    def addresses(self) -> List[str]:
+        return self._addresses
+
+    def _may_contain_events(self, block: AttributeDict) -> bool:
+        block_bloom_filter = BloomFilter(int.from_bytes(block["logsBloom"], byteorder='big'))
+        return (any(topic in block_bloom_filter for topic in self._topics) and
+                any(address in block_bloom_filter for address in self._address_bloom_items))
+
+    async def get_new_entries_from_logs(self, blocks: List[AttributeDict]) -> List[AttributeDict]:
+        blocks_to_check: List[AttributeDict] = [block for block in blocks
+                                                if block is not None and self._may_contain_events(block)]
+        if len(blocks_to_check) == 0 or len(self._topics) == 0:
+            return []
+
+        filter_params: Dict[str, any] = {
+            "address": self._addresses,
+            "topics": [[topic.hex() for topic in self._topics]]
+        }
+        logs: List[any] = await get_logs(self._w3, dict(filter_params,
+                                                        fromBlock=min(block["number"] for block in blocks_to_check),
+                                                        toBlock=max(block["number"] for block in blocks_to_check)))
+        block_hashes: Set[HexBytes] = set(HexBytes(block["hash"]) for block in blocks_to_check)
+        logs = [log for log in logs if HexBytes(log["blockHash"]) in block_hashes]
+
+        # The ranged query returns the logs of the node's canonical chain. If a block passed the bloom filter but none
+        # of its logs came back, it has either been reorganized away since, or the bloom filter gave a false positive.
+        # Either way, looking it up by hash gives the logs of that exact block.
+        blocks_with_logs: Set[HexBytes] = set(HexBytes(log["blockHash"]) for log in logs)
+        blocks_without_logs: List[AttributeDict] = [block for block in blocks_to_check
+                                                    if HexBytes(block["hash"]) not in blocks_with_logs]
+        if len(blocks_without_logs) > 0:
+            raw_logs = await safe_gather(*[get_logs(self._w3, dict(filter_params, blockHash=block["hash"].hex()))
+                                           for block in blocks_without_logs])
+            logs += list(cytoolz.concat(raw_logs))
+
+        new_entries: List[AttributeDict] = []
+        for log in sorted(logs, key=lambda log: (log["blockNumber"], log["logIndex"])):
+            event_abi: Optional[Dict[str, any]] = self._event_abi_map.get(
+                (to_checksum_address(log["address"]), HexBytes(log["topics"][0]))
+            )
+            if event_abi is None:
+                continue
+            event_data: AttributeDict = get_event_data(self._abi_codec, event_abi, log)
+            event_key: Tuple[HexBytes, int] = (event_data["transactionHash"], event_data["logIndex"])
+            if event_key in self._event_cache:
+                self.logger().debug(
+                    f"Duplicate event found - '{event_data['transactionHash'].hex()}', "
+                    f"log index {event_data['logIndex']}."
+                )
+                continue
+            self._block_events.setdefault(event_data["blockNumber"], []).append(event_key)
+            self._event_cache.add(event_key)
+            new_entries.append(event_data)
+
+        while len(self._block_events) > self._block_events_window_size:
+            event_keys: List[Tuple[HexBytes, int]] = self._block_events.popitem(last=False)[1]
+            for event_key in event_keys:
+                self._event_cache.discard(event_key)
+        return new_entries
@@ -33,9 +33,14 @@ class NewBlocksWatcher(BaseWatcher):
             cls._nbw_logger = logging.getLogger(__name__)
         return cls._nbw_logger
 
-    def __init__(self, w3: Web3, block_window_size: Optional[int] = DEFAULT_BLOCK_WINDOW_SIZE):
+    def __init__(self,
+                 w3: Web3,
+                 block_window_size: Optional[int] = DEFAULT_BLOCK_WINDOW_SIZE,
+                 full_transactions: bool = False):
         super().__init__(w3)
         self._block_window_size = block_window_size
+        # Full transaction bodies are only needed by listeners that inspect the transactions themselves.
+        self._full_transactions: bool = full_transactions
         self._current_block_number: int = -1
         self._block_number_to_fetch: int = -1
         self._blocks_window: Dict = {}
@@ -111,7 +116,7 @@ class NewBlocksWatcher(BaseWatcher):
                             functools.partial(
                                 self._w3.eth.getBlock,
                                 self._block_number_to_fetch,
-                                full_transactions=True)
+                                full_transactions=self._full_transactions)
                         )
                         if incoming_block is not None:
                             current_block_hash: HexBytes = self._block_number_to_hash_map.get(
@@ -174,7 +179,7 @@ class NewBlocksWatcher(BaseWatcher):
                             functools.partial(
                                 self._w3.eth.getBlock,
                                 expected_parent_hash,
-                                full_transactions=True)
+                                full_transactions=self._full_transactions)
                         )
                         replacement_block = block
                     except BlockNotFound:
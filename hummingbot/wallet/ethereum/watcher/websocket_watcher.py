@@ -8,7 +8,8 @@ import asyncio
 
 from hexbytes import HexBytes
 from web3.datastructures import AttributeDict
-from cachetools import TTLCache
+from cachetools import LRUCache
+import functools
 
 from typing import Optional, Dict, AsyncIterable, Any
 
@@ -24,8 +25,20 @@ class WSNewBlocksWatcher(BaseWatcher):
 
     MESSAGE_TIMEOUT = 30.0
     PING_TIMEOUT = 10.0
-
-    def __init__(self, w3: Web3, websocket_url):
+    DEFAULT_BLOCK_CACHE_SIZE = 64
+
+    def __init__(self,
+                 w3: Web3,
+                 websocket_url,
+                 full_transactions: bool = False,
+                 block_cache_size: int = DEFAULT_BLOCK_CACHE_SIZE):
+        """
+        :param full_transactions: Whether new blocks are fetched with their full transaction bodies. Only needed by
+        listeners that inspect the transactions themselves (e.g. IncomingEthWatcher), log based watchers only need
+        the block headers.
+        :param block_cache_size: Number of recent blocks kept in the block cache, keyed by block hash. Since blocks
+        are keyed by hash, blocks of a reorganized fork never shadow the canonical ones.
+        """
         super().__init__(w3)
         self._network_on = False
         self._nonce: int = 0
@@ -34,7 +47,8 @@ class WSNewBlocksWatcher(BaseWatcher):
         self._node_address = None
         self._client: Optional[websockets.WebSocketClientProtocol] = None
         self._fetch_new_blocks_task: Optional[asyncio.Task] = None
-        self._block_cache = TTLCache(maxsize=10, ttl=120)
+        self._full_transactions: bool = full_transactions
+        self._block_cache: LRUCache = LRUCache(maxsize=block_cache_size)
 
     _nbw_logger: Optional[HummingbotLogger] = None
 
@@ -50,8 +64,9 @@ class WSNewBlocksWatcher(BaseWatcher):
 
     @property
     def block_cache(self) -> Dict[HexBytes, AttributeDict]:
+        # Reading from an LRU cache updates its order, so the keys are copied before iterating over them.
         cache_dict: Dict[HexBytes, AttributeDict] = dict([(key, self._block_cache[key])
-                                                          for key in self._block_cache.keys()])
+                                                          for key in list(self._block_cache.keys())])
         return cache_dict
 
     async def start_network(self):
@@ -148,7 +163,8 @@ class WSNewBlocksWatcher(BaseWatcher):
                         if incoming_block is not None:
                             with suppress(BlockNotFound):
                                 new_block: AttributeDict = await self.call_async(self._w3.eth.getBlock,
-                                                                                 incoming_block.get("hash"), True)
+                                                                                 incoming_block.get("hash"),
+                                                                                 self._full_transactions)
                                 self._current_block_number = new_block.get("number")
                                 self._block_cache[new_block.get("hash")] = new_block
                                 self.trigger_event(NewBlocksWatcherEvent.NewBlocks, [new_block])
@@ -166,14 +182,20 @@ class WSNewBlocksWatcher(BaseWatcher):
 
     async def get_timestamp_for_block(self, block_hash: HexBytes, max_tries: Optional[int] = 10) -> int:
         counter = 0
-        block: AttributeDict = None
-        if block_hash in self._block_cache.keys():
+        block: AttributeDict = self._block_cache.get(block_hash)
+        while block is None:
+            if counter == max_tries:
+                raise ValueError(f"Block hash {block_hash.hex()} does not exist.")
+            counter += 1
+            # The block is usually being fetched by the new blocks loop, give it a chance before asking the node for
+            # the block header.
+            await asyncio.sleep(0.5)
             block = self._block_cache.get(block_hash)
-        else:
-            while block is None:
-                if counter == max_tries:
-                    raise ValueError(f"Block hash {block_hash.hex()} does not exist.")
-                counter += 1
-                block = self._block_cache.get(block_hash)
-                await asyncio.sleep(0.5)
+            if block is None and counter > 1:
+                with suppress(BlockNotFound):
+                    block = await self.call_async(functools.partial(self._w3.eth.getBlock,
+                                                                    block_hash,
+                                                                    full_transactions=False))
+                    if block is not None:
+                        self._block_cache[block_hash] = block
         return block.get("timestamp")
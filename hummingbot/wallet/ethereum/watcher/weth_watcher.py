@@ -25,7 +25,7 @@ from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from .base_watcher import BaseWatcher
 from .websocket_watcher import WSNewBlocksWatcher
-from .contract_event_logs import ContractEventLogger
+from .contract_event_logs import MultiContractEventLogger
 
 DEPOSIT_EVENT_NAME = "Deposit"
 WITHDRAWAL_EVENT_NAME = "Withdrawal"
@@ -51,7 +51,9 @@ class WethWatcher(BaseWatcher):
         self._asset_decimals: Dict[str, int] = {}
         self._weth_token = weth_token
         self._weth_contract = weth_token.contract
-        self._contract_event_logger = ContractEventLogger(w3, weth_token.address, weth_token.abi)
+        self._contract_event_logger = MultiContractEventLogger(w3,
+                                                               {weth_token.address: weth_token.abi},
+                                                               [DEPOSIT_EVENT_NAME, WITHDRAWAL_EVENT_NAME])
         self._poll_weth_logs_task: asyncio.Task = None
         self._event_forwarder: EventForwarder = EventForwarder(self.did_receive_new_blocks)
         self._new_blocks_queue: asyncio.Queue = asyncio.Queue()
@@ -76,19 +78,9 @@ class WethWatcher(BaseWatcher):
             try:
                 new_blocks: List[AttributeDict] = await self._new_blocks_queue.get()
 
-                deposit_entries = await self._contract_event_logger.get_new_entries_from_logs(
-                    DEPOSIT_EVENT_NAME,
-                    new_blocks
-                )
-
-                withdrawal_entries = await self._contract_event_logger.get_new_entries_from_logs(
-                    WITHDRAWAL_EVENT_NAME,
-                    new_blocks
-                )
-                for deposit_entry in deposit_entries:
-                    await self._handle_event_data(deposit_entry)
-                for withdrawal_entry in withdrawal_entries:
-                    await self._handle_event_data(withdrawal_entry)
+                entries: List[AttributeDict] = await self._contract_event_logger.get_new_entries_from_logs(new_blocks)
+                for entry in entries:
+                    await self._handle_event_data(entry)
 
             except asyncio.CancelledError:
                 raise
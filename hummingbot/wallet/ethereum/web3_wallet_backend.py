@@ -4,7 +4,6 @@ from decimal import Decimal
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
 from eth_account.messages import defunct_hash_message
-from hexbytes import HexBytes
 import logging
 import math
 import time
@@ -23,8 +22,7 @@ from web3.contract import (
 )
 from web3.datastructures import AttributeDict
 from web3.exceptions import (
-    BlockNotFound,
-    TransactionNotFound
+    BlockNotFound
 )
 
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
@@ -58,6 +56,7 @@ from hummingbot.wallet.ethereum.watcher import (
 )
 from hummingbot.wallet.ethereum.watcher.websocket_watcher import WSNewBlocksWatcher
 from hummingbot.wallet.ethereum.erc20_token import ERC20Token
+from hummingbot.wallet.ethereum.ethereum_rpc_client import EthereumRPCClient
 from hummingbot.logger import HummingbotLogger
 from hummingbot.client.config.global_config_map import global_config_map
 
@@ -85,6 +84,8 @@ class Web3WalletBackend(PubSub):
 
         # Initialize Web3, accounts and contracts.
         self._w3: Web3 = Web3(Web3.HTTPProvider(jsonrpc_url))
+        # Polling calls (balances, nonce, gas price, receipts) go through the async client, which batches them.
+        self._rpc_client: EthereumRPCClient = EthereumRPCClient(jsonrpc_url)
         self._chain: EthereumChain = chain
         self._account: LocalAccount = Account.privateKeyToAccount(private_key)
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
@@ -208,7 +209,6 @@ class Web3WalletBackend(PubSub):
         if self._outgoing_transactions_task is not None:
             await self.stop_network()
 
-        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
         if len(self._erc20_tokens) < len(self._erc20_token_list):
             # Fetch token data.
             fetch_symbols_tasks: List[Coroutine] = [
@@ -228,19 +228,19 @@ class Web3WalletBackend(PubSub):
             self._weth_token = self._erc20_tokens.get("WETH")
 
         # Fetch blockchain data.
-        self._local_nonce = await async_scheduler.call_async(
-            lambda: self.get_remote_nonce()
-        )
+        self._local_nonce = await self._rpc_client.get_transaction_count(self.address, "pending")
 
         # Create event watchers.
         websocket_url: str = global_config_map["ethereum_rpc_ws_url"].value
-        self._new_blocks_watcher = WSNewBlocksWatcher(self._w3, websocket_url)
+        # IncomingEthWatcher needs the transactions of new blocks.
+        self._new_blocks_watcher = WSNewBlocksWatcher(self._w3, websocket_url, full_transactions=True)
         self._account_balance_watcher = AccountBalanceWatcher(
             self._w3,
             self._new_blocks_watcher,
             self._account.address,
             [erc20_token.address for erc20_token in self._erc20_tokens.values()],
-            [token.abi for token in self._erc20_tokens.values()]
+            [token.abi for token in self._erc20_tokens.values()],
+            rpc_client=self._rpc_client
         )
         self._erc20_events_watcher = ERC20EventsWatcher(
             self._w3,
@@ -335,6 +335,8 @@ class Web3WalletBackend(PubSub):
             self._check_transaction_receipts_task.cancel()
             self._check_transaction_receipts_task = None
 
+        await self._rpc_client.close()
+
     async def check_network(self) -> NetworkStatus:
         # Assume connected if received new blocks in last 2 minutes
         if time.time() - self._last_timestamp_received_blocks < 60 * 2:
@@ -383,54 +385,55 @@ class Web3WalletBackend(PubSub):
                                     "Check wallet network connection")
                 await asyncio.sleep(5.0)
 
-    async def _check_transaction_receipt(self, tx_hash: str, timestamp: int):
+    async def _check_transaction_receipt(self, tx_hash: str, timestamp: int) -> Optional[Dict[str, Any]]:
         """
-        Look for transaction receipt, only raise not found error if they are missing for longer than two minutes.
+        Look for transaction receipt, only stop tracking the transaction if it is missing for longer than two minutes.
         """
-        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
-        try:
-            return await async_scheduler.call_async(self._w3.eth.getTransactionReceipt, tx_hash)
-        except TransactionNotFound as e:
+        receipt: Optional[Dict[str, Any]] = await self._rpc_client.get_transaction_receipt(tx_hash)
+        if receipt is None:
             now: float = time.time()
             if now - timestamp > 120:
-                stop_tx_hash = e.args[0].split(" ")[3]
-                self._stop_tx_tracking(stop_tx_hash)
-                self.logger().info(f"Stopped tracking transaction with hash: {stop_tx_hash}.")
-            return None
+                self._stop_tx_tracking(tx_hash)
+                self.logger().info(f"Stopped tracking transaction with hash: {tx_hash}.")
+        return receipt
 
     async def check_transaction_receipts(self):
         """
         Look for failed transactions, and emit transaction fail event if any are found.
+
+        The receipt requests of all the pending transactions are sent in one JSON-RPC batch, and so are the requests
+        for the blocks they were mined in.
         """
-        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
         tasks = [self._check_transaction_receipt(tx_hash, self._pending_tx_dict[tx_hash]['timestamp'])
-                 for tx_hash in self._pending_tx_dict.keys()]
-        transaction_receipts: List[AttributeDict] = [tr for tr in await safe_gather(*tasks)
-                                                     if (tr is not None and tr.get("blockHash") is not None)]
-        block_hash_set: Set[HexBytes] = set(tr.blockHash for tr in transaction_receipts)
-        fetch_block_tasks = [async_scheduler.call_async(self._w3.eth.getBlock, block_hash)
+                 for tx_hash in list(self._pending_tx_dict.keys())]
+        transaction_receipts: List[Dict[str, Any]] = [tr for tr in await safe_gather(*tasks)
+                                                      if (tr is not None and tr.get("blockHash") is not None)]
+        block_hash_set: Set[str] = set(tr["blockHash"] for tr in transaction_receipts)
+        fetch_block_tasks = [self._rpc_client.get_block_by_hash(block_hash)
                              for block_hash in block_hash_set]
-        blocks: Dict[HexBytes, AttributeDict] = dict((block.hash, block)
-                                                     for block
-                                                     in await safe_gather(*fetch_block_tasks)
-                                                     if block is not None)
+        blocks: Dict[str, Dict[str, Any]] = dict((block["hash"], block)
+                                                 for block
+                                                 in await safe_gather(*fetch_block_tasks)
+                                                 if block is not None)
 
         for receipt in transaction_receipts:
             # Emit gas used event.
-            tx_hash: str = receipt.transactionHash.hex()
+            tx_hash: str = receipt["transactionHash"]
+            if tx_hash not in self._pending_tx_dict:
+                continue
             gas_price_wei: int = self._pending_tx_dict[tx_hash]['gas_price']
-            gas_used: int = receipt.gasUsed
+            gas_used: int = EthereumRPCClient.to_int(receipt["gasUsed"])
             gas_eth_amount_raw: int = gas_price_wei * gas_used
 
-            if receipt.blockHash in blocks:
-                block: AttributeDict = blocks[receipt.blockHash]
+            if receipt["blockHash"] in blocks:
+                block: Dict[str, Any] = blocks[receipt["blockHash"]]
 
-                if receipt.status == 0:
+                if EthereumRPCClient.to_int(receipt.get("status")) == 0:
                     self.logger().warning(f"The transaction {tx_hash} has failed.")
                     self.trigger_event(WalletEvent.TransactionFailure, tx_hash)
 
                 self.trigger_event(WalletEvent.GasUsed, EthereumGasUsedEvent(
-                    float(block.timestamp),
+                    float(EthereumRPCClient.to_int(block["timestamp"])),
                     tx_hash,
                     float(gas_price_wei * 1e-9),
                     gas_price_wei,
@@ -677,8 +680,7 @@ class Web3WalletBackend(PubSub):
         safe_ensure_future(self._update_gas_price())
 
     async def _update_gas_price(self):
-        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
-        new_gas_price: int = await async_scheduler.call_async(getattr, self._w3.eth, "gasPrice")
+        new_gas_price: int = await self._rpc_client.get_gas_price()
         self._gas_price = new_gas_price
 
     def get_remote_nonce(self):
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../../../")))
+import asyncio
+import unittest
+
+from hummingbot.connector.exchange.loopring.ethsnarks2.eddsa import PoseidonEdDSA
+from hummingbot.connector.exchange.loopring.ethsnarks2.field import FQ
+from hummingbot.connector.exchange.loopring.loopring_order_signer import (
+    LoopringOrderSigner,
+    generator_mult,
+    order_hash
+)
+
+PRIVATE_KEY = "1234567890123456789012345678901234567890"
+SERIALIZED_ORDER = [2, 5, 1234, 0, 2, 10 ** 18, 3 * 10 ** 17, 0, 1600000000, 1603024000, 63, 1, 20]
+
+
+class LoopringOrderSignerUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def test_generator_mult(self):
+        for scalar in [1, 2, 15, 16, 2 ** 200 + 12345, int(PRIVATE_KEY)]:
+            self.assertEqual(PoseidonEdDSA.B() * scalar, generator_mult(scalar))
+
+    def test_signature_matches_reference(self):
+        msg_hash = order_hash(SERIALIZED_ORDER)
+        reference = PoseidonEdDSA.sign(msg_hash, FQ(int(PRIVATE_KEY)))
+        signer = LoopringOrderSigner(PRIVATE_KEY, use_process_pool=False)
+        signature = signer.sign(msg_hash)
+        self.assertEqual(reference.A, signer.public_key)
+        self.assertEqual(reference.sig.R, signature.R)
+        self.assertEqual(str(reference.sig.s), str(signature.s))
+        self.assertTrue(PoseidonEdDSA.verify(signer.public_key, signature, msg_hash))
+
+    def test_sign_order_in_process_pool(self):
+        signer = LoopringOrderSigner(PRIVATE_KEY)
+        try:
+            results = self.ev_loop.run_until_complete(asyncio.gather(
+                *[signer.sign_order_async(SERIALIZED_ORDER[:1] + [i] + SERIALIZED_ORDER[2:]) for i in range(4)]
+            ))
+        finally:
+            signer.shutdown()
+        for i, (msg_hash, rx, ry, s) in enumerate(results):
+            expected_hash = order_hash(SERIALIZED_ORDER[:1] + [i] + SERIALIZED_ORDER[2:])
+            reference = PoseidonEdDSA.sign(expected_hash, FQ(int(PRIVATE_KEY)))
+            self.assertEqual(str(expected_hash), msg_hash)
+            self.assertEqual((str(reference.sig.R.x), str(reference.sig.R.y), str(reference.sig.s)), (rx, ry, s))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+import unittest
+
+from hummingbot.connector.trade_id_cursors import TradeIdCursors
+
+
+class TradeIdCursorsUnitTest(unittest.TestCase):
+
+    def test_new_trades_and_advance(self):
+        cursors = TradeIdCursors()
+        trades = [{"id": 12}, {"id": 10}, {"id": 11}]
+        self.assertIsNone(cursors.next_trade_id("LINK-ETH"))
+        self.assertEqual([10, 11, 12], [t["id"] for t in cursors.new_trades("LINK-ETH", trades)])
+
+        cursors.advance("LINK-ETH", 11)
+        self.assertEqual(12, cursors.next_trade_id("LINK-ETH"))
+        self.assertEqual([12], [t["id"] for t in cursors.new_trades("LINK-ETH", trades)])
+        # Other trading pairs are not affected.
+        self.assertEqual(3, len(cursors.new_trades("ZRX-ETH", trades)))
+
+        # Cursors never move backwards.
+        cursors.advance("LINK-ETH", 5)
+        self.assertEqual(11, cursors.get("LINK-ETH"))
+
+    def test_json_round_trip(self):
+        cursors = TradeIdCursors()
+        cursors.advance("LINK-ETH", 100)
+        cursors.advance("ZRX-ETH", "42")
+        restored = TradeIdCursors.from_json(cursors.to_json())
+        self.assertEqual(100, restored.get("LINK-ETH"))
+        self.assertEqual(42, restored.get("ZRX-ETH"))
+        self.assertEqual(0, len(TradeIdCursors.from_json(None)))
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+import time
+
+from hummingbot.connector.exchange.loopring.ethsnarks2.eddsa import PoseidonEdDSA
+from hummingbot.connector.exchange.loopring.ethsnarks2.field import FQ, SNARK_SCALAR_FIELD
+from hummingbot.connector.exchange.loopring.ethsnarks2.poseidon import poseidon, poseidon_params
+from hummingbot.connector.exchange.loopring.loopring_order_signer import LoopringOrderSigner
+
+PRIVATE_KEY = "1234567890123456789012345678901234567890"
+LADDER_SIZE = 10
+
+
+def ladder():
+    return [[2, order_id, 1234, 0, 2, 10 ** 18, 3 * 10 ** 17, 0, 1600000000, 1603024000, 63, 1, 20]
+            for order_id in range(LADDER_SIZE)]
+
+
+def sign_ladder_reference():
+    # What LoopringExchange.place_order did for every order.
+    for serialized_order in ladder():
+        params = poseidon_params(SNARK_SCALAR_FIELD, 14, 6, 53, b'poseidon', 5, security_target=128)
+        msg_hash = poseidon(serialized_order, params)
+        PoseidonEdDSA._hash_params = None
+        PoseidonEdDSA.sign(msg_hash, FQ(int(PRIVATE_KEY)))
+
+
+async def sign_ladder(signer: LoopringOrderSigner):
+    await asyncio.gather(*[signer.sign_order_async(serialized_order) for serialized_order in ladder()])
+
+
+def main():
+    ev_loop = asyncio.get_event_loop()
+    start = time.perf_counter()
+    sign_ladder_reference()
+    print(f"Reference:            {LADDER_SIZE} orders in {time.perf_counter() - start:.3f}s")
+
+    inline_signer = LoopringOrderSigner(PRIVATE_KEY, use_process_pool=False)
+    inline_signer.public_key
+    start = time.perf_counter()
+    ev_loop.run_until_complete(sign_ladder(inline_signer))
+    print(f"LoopringOrderSigner:  {LADDER_SIZE} orders in {time.perf_counter() - start:.3f}s (on the event loop)")
+
+    pool_signer = LoopringOrderSigner(PRIVATE_KEY)
+    # Warm up the workers.
+    ev_loop.run_until_complete(sign_ladder(pool_signer))
+    start = time.perf_counter()
+    ev_loop.run_until_complete(sign_ladder(pool_signer))
+    print(f"LoopringOrderSigner:  {LADDER_SIZE} orders in {time.perf_counter() - start:.3f}s (process pool)")
+    pool_signer.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import argparse
+import asyncio
+from decimal import Decimal
+import os
+import shutil
+import tempfile
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+)
+
+from hummingbot import data_path
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.trade_fill import TradeFill
+
+CONFIG_FILE_PATH = "debug_markets_recorder_benchmark.yml"
+
+
+def order_id(order_index: int) -> str:
+    # Ends with a microsecond nonce like real client order IDs, which the recorder takes the order age from.
+    return f"buy-ETH-USDT-{int(time.time() * 1e6) - 1000000 + order_index}"
+
+
+class MockMarket:
+    """
+    A market with a fixed set of in-flight orders, for the recorder to checkpoint on every fill.
+    """
+
+    def __init__(self, num_orders: int):
+        self.display_name: str = "mock_exchange"
+        self.order_ids: List[str] = [order_id(i) for i in range(num_orders)]
+        self.tracking_states: Dict[str, Any] = {
+            self.order_ids[i]: {"client_order_id": self.order_ids[i],
+                                "exchange_order_id": f"{i:032x}",
+                                "trading_pair": "ETH-USDT",
+                                "order_type": "LIMIT",
+                                "trade_type": "BUY",
+                                "price": "100",
+                                "amount": "1",
+                                "executed_amount_base": "0",
+                                "executed_amount_quote": "0",
+                                "fee_asset": "USDT",
+                                "fee_paid": "0",
+                                "last_state": "open"}
+            for i in range(num_orders)
+        }
+
+    def fill(self, order_index: int):
+        order: Dict[str, Any] = self.tracking_states[self.order_ids[order_index]]
+        order["executed_amount_base"] = str(Decimal(order["executed_amount_base"]) + Decimal("0.01"))
+
+
+def run(tuned: bool, num_fills: int, num_orders: int, read_every: int) -> Tuple[float, float]:
+    """
+    :return: (fills recorded per second, average history query time in seconds)
+    """
+    pragmas: List[Tuple[str, str]] = SQLConnectionManager.SQLITE_PRAGMAS
+    if not tuned:
+        SQLConnectionManager.SQLITE_PRAGMAS = []
+    db_dir: str = tempfile.mkdtemp()
+    db_path: str = join(db_dir, "benchmark.sqlite")
+    try:
+        sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=db_path)
+    finally:
+        SQLConnectionManager.SQLITE_PRAGMAS = pragmas
+    market: MockMarket = MockMarket(num_orders)
+    recorder: MarketsRecorder = MarketsRecorder(sql, [market], CONFIG_FILE_PATH, "benchmark")
+    read_times: List[float] = []
+
+    start: float = time.perf_counter()
+    for i in range(num_fills):
+        market.fill(i % num_orders)
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, market, OrderFilledEvent(
+            time.time(), market.order_ids[i % num_orders], "ETH-USDT", TradeType.BUY, OrderType.LIMIT,
+            Decimal("100"), Decimal("0.01"), TradeFee(Decimal("0.001")), str(i)
+        ))
+        if read_every > 0 and (i + 1) % read_every == 0:
+            read_start: float = time.perf_counter()
+            session = sql.get_reader_session() if tuned else sql.get_shared_session()
+            session.query(TradeFill).filter(TradeFill.config_file_path == CONFIG_FILE_PATH).all()
+            if tuned:
+                session.close()
+            read_times.append(time.perf_counter() - read_start)
+    elapsed: float = time.perf_counter() - start
+
+    sql.get_shared_session().close()
+    sql.engine.dispose()
+    shutil.rmtree(db_dir)
+    return num_fills / elapsed, sum(read_times) / max(len(read_times), 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measures the fills per second MarketsRecorder can record, with "
+                                                 "the default and the tuned SQLite settings.")
+    parser.add_argument("--fills", type=int, default=2000)
+    parser.add_argument("--orders", type=int, default=50, help="in-flight orders checkpointed on every fill")
+    parser.add_argument("--read-every", type=int, default=200, help="fills between history queries, 0 for none")
+    args = parser.parse_args()
+
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    try:
+        for tuned in (False, True):
+            fills_per_second, read_time = run(tuned, args.fills, args.orders, args.read_every)
+            print(f"{'tuned' if tuned else 'default'} SQLite: {fills_per_second:.1f} fills/s, "
+                  f"{read_time * 1e3:.1f} ms per history query")
+    finally:
+        csv_path: str = os.path.join(data_path(), "trades_" + CONFIG_FILE_PATH[:-4] + ".csv")
+        if os.path.exists(csv_path):
+            os.unlink(csv_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -53,6 +53,21 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 2], [3, 3, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 4, 1], [5, 5, 2], [6, 6, 3], [7, 7, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        bids, asks = order_book.depth(2)
+        self.assertEqual([[3., 3., 3.], [2., 2., 2.]], bids.tolist())
+        self.assertEqual([[4., 4., 1.], [5., 5., 2.]], asks.tolist())
+
+        bids, asks = order_book.depth(10)
+        self.assertEqual(3, len(bids))
+        self.assertEqual(4, len(asks))
+        self.assertEqual(order_book.snapshot[1].values.tolist(), order_book.get_top_levels(False).tolist())
+        self.assertEqual((0, 3), OrderBook().get_top_levels(True, 5).shape)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
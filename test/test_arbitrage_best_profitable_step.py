@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+from decimal import Decimal
+import random
+from typing import (
+    List,
+    Tuple,
+)
+import unittest
+
+from hummingbot.strategy.arbitrage.arbitrage import find_best_profitable_step
+
+s_decimal_0 = Decimal(0)
+
+
+def reference_best_profitable_amount(profitable_orders: List[Tuple[Decimal, Decimal, Decimal, Decimal, Decimal]],
+                                     min_profitability: Decimal,
+                                     buy_fee_percent: Decimal,
+                                     buy_flat_fees: Decimal,
+                                     sell_fee_percent: Decimal,
+                                     sell_flat_fees: Decimal,
+                                     buy_market_quote_balance: Decimal,
+                                     sell_market_base_balance: Decimal) -> Tuple[Decimal, Decimal, Decimal, Decimal]:
+    """
+    The step by step Decimal search ArbitrageStrategy.c_find_best_profitable_amount used to do.
+    """
+    total_bid_value_adjusted = s_decimal_0
+    total_ask_value_adjusted = s_decimal_0
+    total_previous_step_base_amount = s_decimal_0
+    best_profitable_order_amount = s_decimal_0
+    best_profitable_order_profitability = s_decimal_0
+    for bid_price_adjusted, ask_price_adjusted, bid_price, ask_price, amount in profitable_orders:
+        total_bid_value_adjusted += bid_price_adjusted * amount
+        total_ask_value_adjusted += ask_price_adjusted * amount
+        net_sell_proceeds = total_bid_value_adjusted * (1 - sell_fee_percent) - sell_flat_fees
+        net_buy_costs = total_ask_value_adjusted * (1 + buy_fee_percent) + buy_flat_fees
+        profitability = net_sell_proceeds / net_buy_costs
+        if profitability > (1 + min_profitability):
+            best_profitable_order_amount = total_previous_step_base_amount + amount
+            best_profitable_order_profitability = profitability
+        if (buy_market_quote_balance < net_buy_costs or
+                sell_market_base_balance < (total_previous_step_base_amount + amount)):
+            if profitability < (1 + min_profitability):
+                break
+            buy_market_adjusted_order_size = ((buy_market_quote_balance / ask_price - buy_flat_fees) /
+                                              (1 + buy_fee_percent))
+            best_profitable_order_amount = min(sell_market_base_balance, buy_market_adjusted_order_size)
+            best_profitable_order_profitability = profitability
+            break
+        total_previous_step_base_amount += amount
+    return best_profitable_order_amount, best_profitable_order_profitability, bid_price, ask_price
+
+
+def random_profitable_orders(num_steps: int) -> List[Tuple[Decimal, Decimal, Decimal, Decimal, Decimal]]:
+    bid_price: Decimal = Decimal("1.1")
+    ask_price: Decimal = Decimal("1.0")
+    profitable_orders = []
+    for _ in range(num_steps):
+        amount: Decimal = Decimal(random.randint(1, 500)) / Decimal(100)
+        profitable_orders.append((bid_price, ask_price, bid_price, ask_price, amount))
+        # Each step goes down the bids or up the asks.
+        if random.random() < 0.5:
+            bid_price -= Decimal(random.randint(0, 10)) / Decimal(1000)
+        else:
+            ask_price += Decimal(random.randint(0, 10)) / Decimal(1000)
+        if bid_price < ask_price:
+            break
+    return profitable_orders
+
+
+class ArbitrageBestProfitableStepUnitTest(unittest.TestCase):
+    def search(self, profitable_orders, *args) -> Tuple[Decimal, Decimal, Decimal, Decimal]:
+        """
+        The compiled search, with its result turned into an order the way c_find_best_profitable_amount does.
+        """
+        (min_profitability, buy_fee_percent, buy_flat_fees, sell_fee_percent, sell_flat_fees,
+         buy_market_quote_balance, sell_market_base_balance) = args
+        best_step, stop_step, balance_limited, profitability = find_best_profitable_step(
+            profitable_orders, *[float(arg) for arg in args]
+        )
+        _, _, bid_price, ask_price, _ = profitable_orders[stop_step]
+        if balance_limited:
+            amount = min(sell_market_base_balance,
+                         (buy_market_quote_balance / ask_price - buy_flat_fees) / (1 + buy_fee_percent))
+            return amount, Decimal(profitability), bid_price, ask_price
+        if best_step < 0:
+            return s_decimal_0, s_decimal_0, bid_price, ask_price
+        amount = sum(step[4] for step in profitable_orders[:best_step + 1])
+        return amount, Decimal(profitability), bid_price, ask_price
+
+    def assert_same_result(self, profitable_orders, *args):
+        expected = reference_best_profitable_amount(profitable_orders, *args)
+        result = self.search(profitable_orders, *args)
+        self.assertEqual(expected[0], result[0], f"{profitable_orders} {args}")
+        self.assertAlmostEqual(float(expected[1]), float(result[1]), places=9)
+        self.assertEqual(expected[2:], result[2:])
+
+    def test_against_reference(self):
+        random.seed(42)
+        for _ in range(500):
+            profitable_orders = random_profitable_orders(random.randint(1, 60))
+            min_profitability: Decimal = Decimal(random.randint(-5, 60)) / Decimal(1000)
+            buy_fee_percent: Decimal = Decimal(random.randint(0, 30)) / Decimal(10000)
+            sell_fee_percent: Decimal = Decimal(random.randint(0, 30)) / Decimal(10000)
+            buy_flat_fees: Decimal = random.choice([s_decimal_0, Decimal(random.randint(1, 100)) / Decimal(100)])
+            sell_flat_fees: Decimal = random.choice([s_decimal_0, Decimal(random.randint(1, 100)) / Decimal(100)])
+            buy_market_quote_balance: Decimal = Decimal(random.randint(0, 20000)) / Decimal(100)
+            sell_market_base_balance: Decimal = Decimal(random.randint(0, 20000)) / Decimal(100)
+            self.assert_same_result(profitable_orders, min_profitability, buy_fee_percent, buy_flat_fees,
+                                    sell_fee_percent, sell_flat_fees, buy_market_quote_balance,
+                                    sell_market_base_balance)
+
+    def test_flat_fees(self):
+        # The flat fee makes the first steps unprofitable, until the order is large enough to cover it.
+        profitable_orders = [(Decimal("1.05"), Decimal("1"), Decimal("1.05"), Decimal("1"), Decimal("1")),
+                             (Decimal("1.05"), Decimal("1"), Decimal("1.05"), Decimal("1"), Decimal("10")),
+                             (Decimal("1.005"), Decimal("1"), Decimal("1.005"), Decimal("1"), Decimal("100"))]
+        args = (Decimal("0.01"), s_decimal_0, Decimal("0.2"), s_decimal_0, s_decimal_0, Decimal("1000"),
+                Decimal("1000"))
+        amount, _, bid_price, ask_price = self.search(profitable_orders, *args)
+        self.assertEqual((Decimal("11"), Decimal("1.005"), Decimal("1")), (amount, bid_price, ask_price))
+        self.assert_same_result(profitable_orders, *args)
+
+    def test_balance_limit(self):
+        profitable_orders = [(Decimal("1.1"), Decimal("1"), Decimal("1.1"), Decimal("1"), Decimal("10")),
+                             (Decimal("1.1"), Decimal("1.01"), Decimal("1.1"), Decimal("1.01"), Decimal("20"))]
+        args = (Decimal("0.03"), s_decimal_0, s_decimal_0, s_decimal_0, s_decimal_0, Decimal("1000"), Decimal("20"))
+        self.assertEqual(Decimal("20"), self.search(profitable_orders, *args)[0])
+        self.assert_same_result(profitable_orders, *args)
+
+
+if __name__ == "__main__":
+    unittest.main()
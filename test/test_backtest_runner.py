@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+import shutil
+import tempfile
+from typing import Tuple
+import unittest
+
+from hummingbot.connector.exchange.paper_trade.backtest_runner import (
+    BacktestResult,
+    BacktestRunner,
+)
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.data_type.order_book_replay import OrderBookReplayTracker
+from hummingbot.core.data_type.order_book_synthesizer import write_synthetic_recording
+from hummingbot.core.event.events import TradeType
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+TRADING_PAIR = "ETH-USDT"
+START_TIME = 1600000000.0
+END_TIME = START_TIME + 3600.0
+
+
+class DashTradingPairExchange:
+    """
+    Trading pair conversions of an exchange using hummingbot trading pairs as is.
+    """
+    @staticmethod
+    def split_trading_pair(trading_pair: str) -> Tuple[str, str]:
+        base_asset, quote_asset = trading_pair.split("-")
+        return base_asset, quote_asset
+
+    @staticmethod
+    def convert_from_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @staticmethod
+    def convert_to_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+
+class BacktestRunnerUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.recording_dir: str = tempfile.mkdtemp()
+        write_synthetic_recording(cls.recording_dir, TRADING_PAIR, START_TIME, END_TIME, mid_price=100.0,
+                                  trade_rate=0.5, seed=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.recording_dir)
+
+    def setUp(self):
+        # The markets schedule their network checks on the event loop, which a backtest never runs.
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+
+    def tearDown(self):
+        self.ev_loop.close()
+
+    def test_synthetic_recording(self):
+        tracker: OrderBookReplayTracker = OrderBookReplayTracker(self.recording_dir, [TRADING_PAIR])
+        tracker.start()
+        order_book = tracker.order_books[TRADING_PAIR]
+        self.assertEqual(START_TIME, tracker.start_timestamp)
+        self.assertAlmostEqual(99.95, order_book.get_price(False))
+        self.assertAlmostEqual(100.05, order_book.get_price(True))
+        tracker.replay_til(START_TIME + 1800.0)
+        self.assertEqual(20, len(order_book.get_top_levels(True)))
+        self.assertEqual(20, len(order_book.get_top_levels(False)))
+        self.assertLess(order_book.get_price(False), order_book.get_price(True))
+        self.assertFalse(tracker.finished)
+        tracker.replay()
+        self.assertTrue(tracker.finished)
+
+    def test_pure_market_making(self):
+        runner: BacktestRunner = BacktestRunner(START_TIME, END_TIME)
+        market: PaperTradeExchange = runner.add_market("binance", [TRADING_PAIR], self.recording_dir,
+                                                       {"ETH": Decimal(10), "USDT": Decimal(1000)},
+                                                       target_market=DashTradingPairExchange)
+        runner.add_strategy(PureMarketMakingStrategy(MarketTradingPairTuple(market, TRADING_PAIR, "ETH", "USDT"),
+                                                     bid_spread=Decimal("0.0001"),
+                                                     ask_spread=Decimal("0.0001"),
+                                                     order_amount=Decimal("0.1"),
+                                                     order_refresh_time=10.0,
+                                                     filled_order_delay=10.0))
+        result: BacktestResult = runner.run()
+
+        self.assertGreater(result.fill_count, 10)
+        self.assertGreater(result.order_count, result.fill_count)
+        self.assertGreater(result.cancel_count, 0)
+        self.assertEqual("USDT", result.valuation_asset)
+        stats = result.fill_stats[("binance", TRADING_PAIR)]
+        self.assertEqual(result.fill_count, stats.fill_count)
+        self.assertEqual(stats.buy_count, len([fill for fill in result.fills if fill.trade_type is TradeType.BUY]))
+        # The balances move by the filled amounts, and the fees are the binance maker fees.
+        self.assertEqual(stats.buy_base_volume - stats.sell_base_volume,
+                         result.end_balances["binance"]["ETH"] - result.start_balances["binance"]["ETH"])
+        self.assertAlmostEqual(float(stats.buy_quote_volume - stats.sell_quote_volume),
+                               float(result.start_balances["binance"]["USDT"] - result.end_balances["binance"]["USDT"]))
+        self.assertAlmostEqual(float((stats.buy_quote_volume + stats.sell_quote_volume) * Decimal("0.001")),
+                               float(result.fees))
+        self.assertEqual(result.end_value - result.start_value - result.fees, result.pnl)
+        self.assertGreater(result.speed, 100)
+        self.assertIn("fills", result.report())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+import shutil
+import tempfile
+from typing import Tuple
+import unittest
+
+import pandas as pd
+
+from hummingbot.connector.exchange.paper_trade.backtest_sweep import (
+    BacktestMarketSpec,
+    BacktestSweep,
+    BacktestSweepResult,
+    parameter_grid,
+    pure_market_making_factory,
+    random_parameters,
+    results_frame,
+)
+from hummingbot.core.data_type.order_book_synthesizer import write_synthetic_recording
+
+TRADING_PAIR = "ETH-USDT"
+START_TIME = 1600000000.0
+END_TIME = START_TIME + 1800.0
+
+
+class DashTradingPairExchange:
+    @staticmethod
+    def split_trading_pair(trading_pair: str) -> Tuple[str, str]:
+        base_asset, quote_asset = trading_pair.split("-")
+        return base_asset, quote_asset
+
+    @staticmethod
+    def convert_from_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @staticmethod
+    def convert_to_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+
+class BacktestSweepUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.recording_dir: str = tempfile.mkdtemp()
+        write_synthetic_recording(cls.recording_dir, TRADING_PAIR, START_TIME, END_TIME, seed=1)
+        cls.sweep: BacktestSweep = BacktestSweep(
+            [BacktestMarketSpec("binance", [TRADING_PAIR], cls.recording_dir,
+                                {"ETH": Decimal(10), "USDT": Decimal(1000)}, DashTradingPairExchange)],
+            pure_market_making_factory, START_TIME, END_TIME)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.recording_dir)
+
+    def test_parameters(self):
+        grid = parameter_grid({"bid_spread": [Decimal("0.001"), Decimal("0.002")], "order_levels": [1, 2, 3]})
+        self.assertEqual(6, len(grid))
+        self.assertEqual({"bid_spread": Decimal("0.002"), "order_levels": 1}, grid[3])
+        samples = random_parameters({"bid_spread": (Decimal("0.001"), Decimal("0.01")),
+                                     "order_levels": (1, 3),
+                                     "price_type": ["mid_price", "last_price"]}, 20, seed=1)
+        self.assertEqual(20, len(samples))
+        self.assertEqual(samples, random_parameters({"bid_spread": (Decimal("0.001"), Decimal("0.01")),
+                                                     "order_levels": (1, 3),
+                                                     "price_type": ["mid_price", "last_price"]}, 20, seed=1))
+        for sample in samples:
+            self.assertIsInstance(sample["bid_spread"], Decimal)
+            self.assertTrue(Decimal("0.001") <= sample["bid_spread"] <= Decimal("0.01"))
+            self.assertIn(sample["order_levels"], (1, 2, 3))
+            self.assertIn(sample["price_type"], ("mid_price", "last_price"))
+
+    def test_sweep(self):
+        parameter_sets = parameter_grid({"bid_spread": [Decimal("0.0001"), Decimal("0.01")],
+                                         "ask_spread": [Decimal("0.0001")],
+                                         "order_amount": [Decimal("0.1")],
+                                         "order_refresh_time": [10.0]})
+        # A parameter PMM doesn't take fails its backtest only.
+        parameter_sets.append({"bid_spread": Decimal("0.0001"), "unknown_parameter": 1})
+        results = self.sweep.run(parameter_sets, max_workers=2)
+        self.assertEqual(3, len(results))
+        best, worst, failed = results
+        self.assertIsNotNone(failed.error)
+        self.assertIsNone(best.error)
+        self.assertGreaterEqual(best.pnl, worst.pnl)
+        # Far from the book, the bids never fill.
+        wide: BacktestSweepResult = [r for r in results if r.parameters.get("bid_spread") == Decimal("0.01")][0]
+        narrow: BacktestSweepResult = [r for r in results if r.parameters.get("bid_spread") == Decimal("0.0001") and
+                                       r.error is None][0]
+        self.assertEqual(0, wide.buy_count)
+        self.assertGreater(narrow.buy_count, 0)
+        self.assertEqual(narrow.fill_count, narrow.buy_count + narrow.sell_count)
+
+        # The same backtest in this process gives the same result.
+        inline_result = self.sweep.run([narrow.parameters], max_workers=1)[0]
+        self.assertEqual(narrow._replace(wall_time=0), inline_result._replace(wall_time=0))
+
+        frame: pd.DataFrame = results_frame(results)
+        self.assertEqual([1, 2, 3], frame["rank"].tolist())
+        self.assertEqual(float(best.pnl), frame["pnl"][0])
+        self.assertIn("bid_spread", frame.columns)
+        self.assertIn("fill_ratio", frame.columns)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+from aiohttp import web
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+
+from hummingbot.market.celo.celo_cli import (
+    CELO_BASE,
+    CELO_QUOTE,
+)
+from hummingbot.market.celo.celo_data_types import CeloExchangeRate
+from hummingbot.market.celo.celo_rate_client import (
+    CeloRateClient,
+    GET_ADDRESS_FOR_STRING,
+    GET_BUY_TOKEN_AMOUNT,
+    REGISTRY_ADDRESS,
+)
+
+EXCHANGE_ADDRESS = "0x" + "ab" * 20
+
+
+class MockCeloNode:
+    """
+    Answers the JSON-RPC calls of the rate client like a Celo node, with CGLD at 2 CUSD, and records them.
+    """
+
+    def __init__(self):
+        self.block_number: int = 100
+        self.syncing: Any = False
+        self.calls: List[Dict[str, Any]] = []
+        self.runner = None
+        self.port = None
+
+    @property
+    def url(self) -> str:
+        return f"http://localhost:{self.port}"
+
+    async def start(self):
+        app: web.Application = web.Application()
+        app.router.add_post("/", self.handler)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site: web.TCPSite = web.TCPSite(self.runner, "localhost", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    def eth_call(self, to: str, data: bytes) -> bytes:
+        if to == REGISTRY_ADDRESS:
+            assert data[:4] == GET_ADDRESS_FOR_STRING
+            return bytes(12) + bytes.fromhex(EXCHANGE_ADDRESS[2:])
+        assert to == EXCHANGE_ADDRESS and data[:4] == GET_BUY_TOKEN_AMOUNT
+        sell_amount: int = int.from_bytes(data[4:36], "big")
+        sell_gold: bool = bool(int.from_bytes(data[36:68], "big"))
+        return (sell_amount * 2 if sell_gold else sell_amount // 2).to_bytes(32, "big")
+
+    async def handler(self, request: web.Request) -> web.Response:
+        msg: Dict[str, Any] = await request.json()
+        self.calls.append(msg)
+        if msg["method"] == "eth_blockNumber":
+            result: Any = hex(self.block_number)
+        elif msg["method"] == "eth_syncing":
+            result = self.syncing
+        else:
+            call: Dict[str, str] = msg["params"][0]
+            result = "0x" + self.eth_call(call["to"], bytes.fromhex(call["data"][2:])).hex()
+        return web.json_response({"jsonrpc": "2.0", "id": msg["id"], "result": result})
+
+
+class CeloRateClientUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.node: MockCeloNode = MockCeloNode()
+        self.ev_loop.run_until_complete(self.node.start())
+        self.client: CeloRateClient = CeloRateClient(self.node.url)
+
+    def tearDown(self):
+        self.ev_loop.run_until_complete(self.client.close())
+        self.ev_loop.run_until_complete(self.node.stop())
+        self.ev_loop.close()
+
+    def eth_calls(self) -> int:
+        return len([c for c in self.node.calls if c["method"] == "eth_call"])
+
+    def test_exchange_rates(self):
+        sell_rate, buy_rate = self.ev_loop.run_until_complete(self.client.exchange_rates(Decimal("1.5"),
+                                                                                         Decimal("10")))
+        self.assertEqual(CeloExchangeRate(CELO_BASE, Decimal("1.5"), CELO_QUOTE, Decimal("3")), sell_rate)
+        self.assertEqual(CeloExchangeRate(CELO_QUOTE, Decimal("10"), CELO_BASE, Decimal("5")), buy_rate)
+        # The exchange address lookup, then the two quotes.
+        self.assertEqual(3, self.eth_calls())
+
+        rates: List[CeloExchangeRate] = self.ev_loop.run_until_complete(self.client.exchange_rate(Decimal("1.5")))
+        self.assertEqual([(CELO_BASE, CELO_QUOTE), (CELO_QUOTE, CELO_BASE)],
+                         [(r.from_token, r.to_token) for r in rates])
+        # The CGLD quote is cached for the block.
+        self.assertEqual(4, self.eth_calls())
+
+        self.node.block_number += 1
+        self.ev_loop.run_until_complete(self.client.exchange_rates(Decimal("1.5"), Decimal("10")))
+        self.assertEqual(6, self.eth_calls())
+
+    def test_validate_node_synced(self):
+        self.assertIsNone(self.ev_loop.run_until_complete(self.client.validate_node_synced()))
+        self.node.syncing = {"currentBlock": hex(10), "highestBlock": hex(20)}
+        err_msg: str = self.ev_loop.run_until_complete(self.client.validate_node_synced())
+        self.assertIn("10 of 20", err_msg)
+
+        self.ev_loop.run_until_complete(self.node.stop())
+        self.assertIsNotNone(self.ev_loop.run_until_complete(self.client.validate_node_synced()))
+        self.ev_loop.run_until_complete(self.node.start())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+import json
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+
+from eth_bloom import BloomFilter
+from eth_utils import (
+    event_abi_to_log_topic,
+    to_checksum_address,
+)
+from hexbytes import HexBytes
+from web3._utils.contracts import find_matching_event_abi
+from web3.datastructures import AttributeDict
+
+from hummingbot.wallet.ethereum.watcher.contract_event_logs import MultiContractEventLogger
+
+with open(realpath(join(__file__, "../../hummingbot/wallet/ethereum/token_abi/erc20_abi.json"))) as erc20_abi_file:
+    ERC20_ABI: List[Dict[str, Any]] = json.load(erc20_abi_file)
+TRANSFER_TOPIC: HexBytes = HexBytes(event_abi_to_log_topic(find_matching_event_abi(ERC20_ABI, event_name="Transfer")))
+TOKEN_A: str = to_checksum_address("0x" + "a1" * 20)
+TOKEN_B: str = to_checksum_address("0x" + "b2" * 20)
+OTHER_TOKEN: str = to_checksum_address("0x" + "c3" * 20)
+SENDER: str = "0x" + "11" * 20
+RECIPIENT: str = "0x" + "22" * 20
+
+
+def block_hash(number: int, fork: int = 0) -> HexBytes:
+    return HexBytes(number.to_bytes(30, "big") + fork.to_bytes(2, "big"))
+
+
+def transfer_log(address: str, block_number: int, log_index: int, fork: int = 0) -> AttributeDict:
+    return AttributeDict({
+        "address": address,
+        "topics": [TRANSFER_TOPIC,
+                   HexBytes(bytes(12) + HexBytes(SENDER)),
+                   HexBytes(bytes(12) + HexBytes(RECIPIENT))],
+        "data": "0x" + (1000 + log_index).to_bytes(32, "big").hex(),
+        "blockNumber": block_number,
+        "blockHash": block_hash(block_number, fork),
+        "transactionHash": HexBytes(block_number.to_bytes(16, "big") + fork.to_bytes(16, "big")),
+        "transactionIndex": 0,
+        "logIndex": log_index,
+        "removed": False,
+    })
+
+
+def make_block(number: int, logs: List[AttributeDict], fork: int = 0) -> AttributeDict:
+    bloom: BloomFilter = BloomFilter()
+    for log in logs:
+        bloom.add(HexBytes(log["address"]))
+        for topic in log["topics"]:
+            bloom.add(topic)
+    return AttributeDict({"number": number, "hash": block_hash(number, fork), "logsBloom": int(bloom).to_bytes(256, "big")})
+
+
+class MockEth:
+    """
+    Answers getLogs from a list of logs, ranged queries from the canonical chain and block hash queries from any fork.
+    """
+    def __init__(self):
+        self.logs: List[AttributeDict] = []
+        self.canonical_hashes: Dict[int, HexBytes] = {}
+        self.queries: List[Dict[str, Any]] = []
+
+    def add_block(self, number: int, logs: List[AttributeDict], fork: int = 0, canonical: bool = True) -> AttributeDict:
+        self.logs.extend(logs)
+        if canonical:
+            self.canonical_hashes[number] = block_hash(number, fork)
+        return make_block(number, logs, fork)
+
+    def getLogs(self, filter_params: Dict[str, Any]) -> List[AttributeDict]:
+        self.queries.append(filter_params)
+        addresses: List[str] = [to_checksum_address(address) for address in filter_params["address"]]
+        logs: List[AttributeDict] = [log for log in self.logs if to_checksum_address(log["address"]) in addresses]
+        if "blockHash" in filter_params:
+            return [log for log in logs if log["blockHash"] == HexBytes(filter_params["blockHash"])]
+        return [log for log in logs
+                if filter_params["fromBlock"] <= log["blockNumber"] <= filter_params["toBlock"] and
+                self.canonical_hashes.get(log["blockNumber"]) == log["blockHash"]]
+
+
+class MockWeb3:
+    def __init__(self):
+        self.eth: MockEth = MockEth()
+
+
+class MultiContractEventLoggerUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.w3: MockWeb3 = MockWeb3()
+        self.event_logger: MultiContractEventLogger = MultiContractEventLogger(
+            self.w3, {TOKEN_A: ERC20_ABI, TOKEN_B: ERC20_ABI}, ["Transfer", "Approval"]
+        )
+
+    def get_new_entries(self, blocks: List[AttributeDict]) -> List[AttributeDict]:
+        return self.ev_loop.run_until_complete(self.event_logger.get_new_entries_from_logs(blocks))
+
+    def test_one_query_per_block_range(self):
+        blocks: List[AttributeDict] = [
+            self.w3.eth.add_block(number, [transfer_log(TOKEN_A, number, 0), transfer_log(TOKEN_B, number, 1)])
+            for number in range(100, 103)
+        ]
+        entries: List[AttributeDict] = self.get_new_entries(blocks)
+
+        self.assertEqual(1, len(self.w3.eth.queries))
+        query: Dict[str, Any] = self.w3.eth.queries[0]
+        self.assertEqual((100, 102), (query["fromBlock"], query["toBlock"]))
+        self.assertEqual({TOKEN_A, TOKEN_B}, set(query["address"]))
+        self.assertEqual([(number, log_index) for number in range(100, 103) for log_index in (0, 1)],
+                         [(entry["blockNumber"], entry["logIndex"]) for entry in entries])
+        self.assertEqual(["Transfer"] * 6, [entry["event"] for entry in entries])
+        self.assertEqual(1000, entries[0]["args"]["value"])
+
+    def test_bloom_filter_skips_blocks(self):
+        matching_block: AttributeDict = self.w3.eth.add_block(100, [transfer_log(TOKEN_A, 100, 0)])
+        # A transfer of a token that isn't watched, and an empty block.
+        other_token_block: AttributeDict = self.w3.eth.add_block(101, [transfer_log(OTHER_TOKEN, 101, 0)])
+        empty_block: AttributeDict = self.w3.eth.add_block(102, [])
+
+        self.assertEqual([], self.get_new_entries([other_token_block, empty_block]))
+        self.assertEqual(0, len(self.w3.eth.queries))
+
+        entries: List[AttributeDict] = self.get_new_entries([matching_block, other_token_block, empty_block])
+        self.assertEqual(1, len(self.w3.eth.queries))
+        self.assertEqual((100, 100), (self.w3.eth.queries[0]["fromBlock"], self.w3.eth.queries[0]["toBlock"]))
+        self.assertEqual([100], [entry["blockNumber"] for entry in entries])
+
+    def test_reorged_block_is_queried_by_hash(self):
+        block_100: AttributeDict = self.w3.eth.add_block(100, [transfer_log(TOKEN_A, 100, 0)])
+        # The node has since switched to another fork of block 101 than the one given.
+        self.w3.eth.add_block(101, [transfer_log(TOKEN_A, 101, 0, fork=1)], fork=1)
+        stale_block_101: AttributeDict = self.w3.eth.add_block(101, [transfer_log(TOKEN_B, 101, 3)], canonical=False)
+
+        entries: List[AttributeDict] = self.get_new_entries([block_100, stale_block_101])
+        self.assertEqual(2, len(self.w3.eth.queries))
+        self.assertEqual(HexBytes(block_hash(101)), HexBytes(self.w3.eth.queries[1]["blockHash"]))
+        # Only the logs of the given blocks are returned.
+        self.assertEqual([(100, TOKEN_A), (101, TOKEN_B)],
+                         [(entry["blockNumber"], entry["address"]) for entry in entries])
+        self.assertEqual(block_hash(101), entries[1]["blockHash"])
+
+    def test_duplicate_logs_are_dropped(self):
+        log: AttributeDict = transfer_log(TOKEN_A, 100, 0)
+        block: AttributeDict = self.w3.eth.add_block(100, [log, transfer_log(TOKEN_B, 100, 1)])
+        # The node returns the same log twice.
+        self.w3.eth.logs.append(log)
+
+        entries: List[AttributeDict] = self.get_new_entries([block])
+        self.assertEqual([0, 1], [entry["logIndex"] for entry in entries])
+        # A block seen again doesn't give its events again.
+        self.assertEqual([], self.get_new_entries([block]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -487,6 +487,17 @@ class HedgedMarketMakingUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("3.0"), bid_order.quantity)
         self.assertEqual(Decimal("3.0"), ask_order.quantity)
 
+    def test_taker_vwap_cache(self):
+        buy_taker_price: Decimal = self.strategy.get_effective_hedging_price(self.market_pair, False, 3)
+        self.assertEqual(buy_taker_price, self.strategy.get_effective_hedging_price(self.market_pair, False, 3))
+
+        # The cached prices are dropped once the taker order book changes.
+        taker_order_book: OrderBook = self.taker_market.get_order_book(self.taker_trading_pairs[0])
+        self.simulate_order_book_widening(taker_order_book,
+                                          taker_order_book.get_price(False),
+                                          taker_order_book.get_price(True) + 0.0001)
+        self.assertGreater(self.strategy.get_effective_hedging_price(self.market_pair, False, 3), buy_taker_price)
+
     def test_with_adjust_orders_enabled(self):
         self.clock.remove_iterator(self.strategy)
         self.clock.remove_iterator(self.maker_market)
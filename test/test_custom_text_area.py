@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+from typing import List
+import unittest
+
+from hummingbot.client.ui.custom_widgets import CustomTextArea
+
+
+class CustomTextAreaUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+
+    def tearDown(self):
+        self.ev_loop.close()
+
+    def create_text_area(self, **kwargs) -> CustomTextArea:
+        return CustomTextArea(read_only=False, initial_text="start", **kwargs)
+
+    @staticmethod
+    def log_lines(text_area: CustomTextArea, start: int, end: int):
+        text_area.log("\n".join(f"line {i}" for i in range(start, end)))
+
+    @staticmethod
+    def rendered_lines(text_area: CustomTextArea) -> List[str]:
+        return text_area.buffer.text.split("\n")
+
+    def test_ring_buffer(self):
+        text_area: CustomTextArea = self.create_text_area(max_line_count=300)
+        self.log_lines(text_area, 0, 400)
+        self.assertEqual(300, len(text_area.log_lines))
+        self.assertEqual("line 100", text_area.log_lines[0])
+        # Only the tail is rendered, with the cursor at the end.
+        self.assertEqual([f"line {i}" for i in range(200, 400)], self.rendered_lines(text_area))
+        self.assertEqual(len(text_area.buffer.text), text_area.buffer.cursor_position)
+
+    def test_render_coalescing(self):
+        text_area: CustomTextArea = self.create_text_area(render_interval=0.05)
+
+        async def log_and_wait():
+            for i in range(50):
+                text_area.log(f"line {i}")
+            # Nothing is rendered until the render interval is over, then all the lines are at once.
+            self.assertEqual(["start"], self.rendered_lines(text_area))
+            await asyncio.sleep(0.1)
+            self.assertEqual(["start"] + [f"line {i}" for i in range(50)], self.rendered_lines(text_area))
+            self.assertIsNone(text_area._render_handle)
+
+        self.ev_loop.run_until_complete(log_and_wait())
+
+    def test_scrolling_expands_to_full_history(self):
+        text_area: CustomTextArea = self.create_text_area()
+        self.log_lines(text_area, 0, 500)
+        self.assertEqual(200, len(self.rendered_lines(text_area)))
+
+        # Moving the cursor up expands the document right away, without waiting for another log line.
+        text_area.buffer.cursor_up(10)
+        self.assertEqual(["start"] + [f"line {i}" for i in range(500)], self.rendered_lines(text_area))
+        self.assertEqual("line 489", text_area.buffer.document.current_line)
+
+        # New lines don't move the view while browsing.
+        self.log_lines(text_area, 500, 510)
+        self.assertEqual(501, len(self.rendered_lines(text_area)))
+        self.assertEqual("line 489", text_area.buffer.document.current_line)
+
+        # Back at the end, the view follows the tail again.
+        text_area.buffer.cursor_position = len(text_area.buffer.text)
+        self.assertEqual([f"line {i}" for i in range(310, 510)], self.rendered_lines(text_area))
+
+    def test_browse_timeout(self):
+        text_area: CustomTextArea = self.create_text_area(render_interval=0.01, browse_timeout=0.2)
+        self.log_lines(text_area, 0, 10)
+
+        async def browse():
+            text_area.buffer.cursor_position = 0
+            text_area.log("line 10")
+            await asyncio.sleep(0.05)
+            # Only a single render is waiting, for the end of the browse timeout.
+            self.assertEqual("start", text_area.buffer.document.current_line)
+            self.assertIsNotNone(text_area._render_handle)
+            self.assertGreater(text_area._render_handle.when() - self.ev_loop.time(), 0.1)
+            await asyncio.sleep(0.2)
+            self.assertEqual("line 10", text_area.buffer.document.current_line)
+            # Nothing is scheduled while idle.
+            self.assertIsNone(text_area._render_handle)
+
+        self.ev_loop.run_until_complete(browse())
+
+    def test_show_full_history(self):
+        text_area: CustomTextArea = self.create_text_area()
+        self.log_lines(text_area, 0, 500)
+        text_area.show_full_history()
+        self.assertEqual(501, len(self.rendered_lines(text_area)))
+        # The full history stays while searching, whatever the cursor does.
+        text_area.buffer.cursor_position = 0
+        self.log_lines(text_area, 500, 510)
+        text_area.buffer.cursor_position = len(text_area.buffer.text)
+        self.assertEqual(501, len(self.rendered_lines(text_area)))
+
+        text_area.follow()
+        self.assertEqual([f"line {i}" for i in range(310, 510)], self.rendered_lines(text_area))
+
+    def test_log_in_place(self):
+        text_area: CustomTextArea = self.create_text_area()
+        text_area.log_in_place("table 1\nrow 1", "ticker")
+        text_area.log_in_place("table 2\nrow 2\nrow 3", "ticker")
+        self.assertEqual(["start", "table 2", "row 2", "row 3"], self.rendered_lines(text_area))
+        text_area.log_in_place("table 3", "ticker")
+        self.assertEqual(["start", "table 3"], self.rendered_lines(text_area))
+
+        # Once something else is logged, the next block goes after it.
+        text_area.log("other output")
+        text_area.log_in_place("table 4", "ticker")
+        text_area.log_in_place("table 5", "ticker")
+        self.assertEqual(["start", "table 3", "other output", "table 5"], self.rendered_lines(text_area))
+        text_area.log_in_place("status", "status")
+        self.assertEqual(["start", "table 3", "other output", "table 5", "status"], self.rendered_lines(text_area))
+        self.assertEqual(5, len(text_area.log_lines))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+from aiohttp import web
+import asyncio
+from typing import (
+    Any,
+    Dict,
+    List
+)
+import unittest
+
+from hummingbot.wallet.ethereum.ethereum_rpc_client import (
+    EthereumRPCClient,
+    EthereumRPCError
+)
+
+ACCOUNT_ADDRESS = "0x5E2e2bA31aa5B4DC5E3c8f7a0F4c6bDc81d4F9e4"
+TOKEN_ADDRESSES = ["0x1111111111111111111111111111111111111111", "0x2222222222222222222222222222222222222222"]
+
+
+class StubEthereumNode:
+    """
+    Minimal JSON-RPC node answering a fixed set of methods, and recording the HTTP requests it received.
+    """
+
+    def __init__(self):
+        self.http_requests: List[Any] = []
+
+    def _result(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        method: str = request["method"]
+        params: List[Any] = request["params"]
+        if method == "eth_getBalance":
+            return {"result": hex(10 ** 18)}
+        if method == "eth_call":
+            token_index: int = TOKEN_ADDRESSES.index(params[0]["to"])
+            return {"result": "0x" + hex(1000 * (token_index + 1))[2:].rjust(64, "0")}
+        if method == "eth_gasPrice":
+            return {"result": hex(20 * 10 ** 9)}
+        if method == "eth_getTransactionCount":
+            return {"result": "0x2a"}
+        return {"error": {"code": -32601, "message": "Method not found"}}
+
+    async def handle(self, http_request: web.Request) -> web.Response:
+        payload: Any = await http_request.json()
+        self.http_requests.append(payload)
+        requests: List[Dict[str, Any]] = payload if isinstance(payload, list) else [payload]
+        responses: List[Dict[str, Any]] = [dict(self._result(request), jsonrpc="2.0", id=request["id"])
+                                           for request in reversed(requests)]
+        return web.json_response(responses if isinstance(payload, list) else responses[0])
+
+
+class EthereumRPCClientUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(cls.ev_loop)
+        cls.node: StubEthereumNode = StubEthereumNode()
+        app: web.Application = web.Application()
+        app.router.add_post("/", cls.node.handle)
+        cls.runner: web.AppRunner = web.AppRunner(app)
+        cls.ev_loop.run_until_complete(cls.runner.setup())
+        site: web.TCPSite = web.TCPSite(cls.runner, "127.0.0.1", 0)
+        cls.ev_loop.run_until_complete(site.start())
+        port: int = site._server.sockets[0].getsockname()[1]
+        cls.client: EthereumRPCClient = EthereumRPCClient(f"http://127.0.0.1:{port}/", max_batch_size=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.ev_loop.run_until_complete(cls.client.close())
+        cls.ev_loop.run_until_complete(cls.runner.cleanup())
+        cls.ev_loop.close()
+
+    def setUp(self):
+        self.node.http_requests.clear()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    def test_get_balances(self):
+        eth_balance, token_balances = self.run_async(self.client.get_balances(ACCOUNT_ADDRESS, TOKEN_ADDRESSES))
+        self.assertEqual(10 ** 18, eth_balance)
+        self.assertEqual([1000, 2000], token_balances)
+        # 3 calls with a max batch size of 2.
+        self.assertEqual([2, 1], [len(batch) for batch in self.node.http_requests])
+        self.assertEqual(ACCOUNT_ADDRESS.lower()[2:], self.node.http_requests[0][1]["params"][0]["data"][-40:])
+
+    def test_concurrent_calls_are_batched(self):
+        gas_price, nonce = self.run_async(asyncio.gather(self.client.get_gas_price(),
+                                                         self.client.get_transaction_count(ACCOUNT_ADDRESS)))
+        self.assertEqual(20 * 10 ** 9, gas_price)
+        self.assertEqual(42, nonce)
+        self.assertEqual(1, len(self.node.http_requests))
+
+    def test_errors(self):
+        results = self.run_async(self.client.batch_call([("eth_gasPrice", []), ("eth_unknown", [])]))
+        self.assertEqual(hex(20 * 10 ** 9), results[0])
+        self.assertIsInstance(results[1], EthereumRPCError)
+        self.assertEqual(-32601, results[1].code)
+        with self.assertRaises(EthereumRPCError):
+            self.run_async(self.client.call("eth_unknown"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+from decimal import Decimal
+from typing import Optional
+import unittest
+
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.connector.in_flight_order_registry import InFlightOrderRegistry
+from hummingbot.core.event.events import (
+    OrderType,
+    TradeType,
+)
+
+
+class MockInFlightOrder(InFlightOrderBase):
+    @property
+    def is_done(self) -> bool:
+        return self.last_state in {"filled", "canceled"}
+
+
+def make_order(client_order_id: str,
+               exchange_order_id: Optional[str] = None,
+               trading_pair: str = "ETH-USDT") -> MockInFlightOrder:
+    return MockInFlightOrder(client_order_id, exchange_order_id, trading_pair, OrderType.LIMIT, TradeType.BUY,
+                             Decimal("100"), Decimal("1"), "open")
+
+
+class InFlightOrderRegistryUnitTest(unittest.TestCase):
+    def test_exchange_order_id_index(self):
+        registry: InFlightOrderRegistry = InFlightOrderRegistry()
+        order: MockInFlightOrder = make_order("buy-1")
+        registry["buy-1"] = order
+        self.assertIsNone(registry.get_by_exchange_order_id("x1"))
+
+        # Setting the exchange order id on a tracked order indexes it.
+        order.update_exchange_order_id("x1")
+        self.assertIs(order, registry.get_by_exchange_order_id("x1"))
+        order.exchange_order_id = "x2"
+        self.assertIsNone(registry.get_by_exchange_order_id("x1"))
+        self.assertIs(order, registry.get_by_exchange_order_id("x2"))
+
+        registry.pop("buy-1")
+        self.assertIsNone(registry.get_by_exchange_order_id("x2"))
+        self.assertIsNone(order.registry)
+        order.exchange_order_id = "x3"
+        self.assertIsNone(registry.get_by_exchange_order_id("x3"))
+
+    def test_trading_pair_index(self):
+        registry: InFlightOrderRegistry = InFlightOrderRegistry({
+            "buy-1": make_order("buy-1", "x1"),
+            "buy-2": make_order("buy-2", "x2", "BTC-USDT"),
+        })
+        registry.update({"buy-3": make_order("buy-3", "x3")})
+        self.assertEqual(["buy-1", "buy-3"],
+                         sorted(o.client_order_id for o in registry.orders_for_trading_pair("ETH-USDT")))
+        self.assertEqual(["buy-2"], [o.client_order_id for o in registry.orders_for_trading_pair("BTC-USDT")])
+
+        del registry["buy-2"]
+        self.assertEqual([], registry.orders_for_trading_pair("BTC-USDT"))
+        self.assertIsNone(registry.get_by_exchange_order_id("x2"))
+
+        # Replacing an order under the same key drops the old one from the indexes.
+        registry["buy-1"] = make_order("buy-1", "x4", "BTC-USDT")
+        self.assertIsNone(registry.get_by_exchange_order_id("x1"))
+        self.assertEqual(["buy-3"], [o.client_order_id for o in registry.orders_for_trading_pair("ETH-USDT")])
+
+        registry.clear()
+        self.assertEqual(0, len(registry))
+        self.assertIsNone(registry.get_by_exchange_order_id("x3"))
+        self.assertEqual([], registry.orders_for_trading_pair("ETH-USDT"))
+
+    def test_dict_compatibility(self):
+        registry: InFlightOrderRegistry = InFlightOrderRegistry()
+        registry["buy-1"] = make_order("buy-1", "x1")
+        self.assertIsInstance(registry, dict)
+        self.assertEqual({"buy-1"}, set(registry.copy().keys()))
+        self.assertIsNone(registry.pop("missing", None))
+        with self.assertRaises(KeyError):
+            registry.pop("missing")
+        self.assertEqual({"buy-1": registry["buy-1"]}, {**registry})
+
+
+if __name__ == "__main__":
+    unittest.main()
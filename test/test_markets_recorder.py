@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+import shutil
+import tempfile
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+
+from hummingbot.connector.markets_recorder import (
+    MarketsRecorder,
+    join_tracking_states,
+    split_tracking_states,
+)
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_entry import MarketStateEntry
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+
+
+class MockMarket:
+    def __init__(self, display_name: str = "mock_exchange"):
+        self.display_name: str = display_name
+        self.tracking_states: Dict[str, Any] = {}
+        self.restored_states: List[Dict[str, Any]] = []
+
+    def restore_tracking_states(self, saved_states: Dict[str, Any]):
+        self.restored_states.append(saved_states)
+
+
+class SteppingMarketsRecorder(MarketsRecorder):
+    """
+    A markets recorder with a timestamp that steps on every database write, to tell which entries were written.
+    """
+    _last_timestamp: int = 0
+
+    @property
+    def db_timestamp(self) -> int:
+        SteppingMarketsRecorder._last_timestamp += 1
+        return self._last_timestamp
+
+
+def order_json(order_id: str, state: str = "open") -> Dict[str, Any]:
+    return {"client_order_id": order_id, "trading_pair": "ETH-USDT", "price": "100", "amount": "1",
+            "executed_amount_base": "0", "last_state": state}
+
+
+class MarketsRecorderUnitTest(unittest.TestCase):
+    config_path: str = "test_config.yml"
+
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.db_dir: str = tempfile.mkdtemp()
+        self.sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                                                              db_path=join(self.db_dir, "test_markets_recorder.sqlite"))
+        self.market: MockMarket = MockMarket()
+        self.recorder: MarketsRecorder = SteppingMarketsRecorder(self.sql, [self.market], self.config_path, "test_strategy")
+
+    def tearDown(self):
+        self.sql.get_shared_session().close()
+        self.sql.engine.dispose()
+        shutil.rmtree(self.db_dir)
+        self.ev_loop.close()
+
+    def entry_timestamps(self) -> Dict[str, int]:
+        return {key: timestamp for key, timestamp in
+                self.sql.get_shared_session().query(MarketStateEntry.key, MarketStateEntry.timestamp).all()}
+
+    def test_split_tracking_states(self):
+        flat_states: Dict[str, Any] = {"o1": order_json("o1"), "o2": order_json("o2")}
+        self.assertEqual(2, len(split_tracking_states(flat_states)))
+        self.assertEqual(flat_states, join_tracking_states(split_tracking_states(flat_states)))
+
+        grouped_states: Dict[str, Any] = {"market_orders": {},
+                                          "limit_orders": {"o1": order_json("o1"), "o2": order_json("o2")}}
+        self.assertEqual(3, len(split_tracking_states(grouped_states)))
+        self.assertEqual(grouped_states, join_tracking_states(split_tracking_states(grouped_states)))
+
+    def test_incremental_checkpoints(self):
+        self.market.tracking_states = {"o1": order_json("o1"), "o2": order_json("o2")}
+        self.recorder.save_market_states(self.config_path, self.market)
+        first_timestamps: Dict[str, int] = self.entry_timestamps()
+        self.assertEqual(2, len(first_timestamps))
+
+        # Only the changed order is written, and the finished one is deleted.
+        self.market.tracking_states = {"o1": order_json("o1", "filled"), "o2": order_json("o2"),
+                                       "o3": order_json("o3")}
+        self.recorder.save_market_states(self.config_path, self.market)
+        self.market.tracking_states = {"o2": order_json("o2"), "o3": order_json("o3")}
+        self.recorder.save_market_states(self.config_path, self.market)
+        timestamps: Dict[str, int] = self.entry_timestamps()
+        self.assertEqual(2, len(timestamps))
+        self.assertEqual(first_timestamps[split_key("o2")], timestamps[split_key("o2")])
+
+        saved_states: MarketState = self.recorder.get_market_states(self.config_path, self.market)
+        self.assertEqual(self.market.tracking_states, saved_states.saved_state)
+
+        # A new recorder restores the same states from the database.
+        recorder: MarketsRecorder = SteppingMarketsRecorder(self.sql, [self.market], self.config_path, "test_strategy")
+        recorder.restore_market_states(self.config_path, self.market)
+        self.assertEqual([self.market.tracking_states], self.market.restored_states)
+
+        self.market.tracking_states = {}
+        recorder.save_market_states(self.config_path, self.market)
+        self.assertEqual(0, len(self.entry_timestamps()))
+        self.assertEqual({}, recorder.get_market_states(self.config_path, self.market).saved_state)
+
+    def test_legacy_market_states(self):
+        legacy_states: Dict[str, Any] = {"o1": order_json("o1")}
+        session = self.sql.get_shared_session()
+        session.add(MarketState(config_file_path=self.config_path, market=self.market.display_name, timestamp=1,
+                                saved_state=legacy_states))
+        session.commit()
+        self.recorder.restore_market_states(self.config_path, self.market)
+        self.assertEqual([legacy_states], self.market.restored_states)
+
+        # The first checkpoint moves the tracking states into entries.
+        self.market.tracking_states = {"o1": order_json("o1"), "o2": order_json("o2")}
+        self.recorder.save_market_states(self.config_path, self.market)
+        self.assertEqual({}, session.query(MarketState).one().saved_state)
+        self.assertEqual(2, len(self.entry_timestamps()))
+        self.assertEqual(self.market.tracking_states,
+                         self.recorder.get_market_states(self.config_path, self.market).saved_state)
+
+
+def split_key(order_id: str) -> str:
+    return next(iter(split_tracking_states({order_id: order_json(order_id)}).keys()))
+
+
+if __name__ == "__main__":
+    unittest.main()
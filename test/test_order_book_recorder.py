@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_recorder import (
+    OrderBookRecorder,
+    OrderBookRecordReader,
+    OrderBookRecordType,
+    RecordingQueue,
+    recording_path,
+)
+from hummingbot.core.data_type.order_book_replay import OrderBookReplayTracker
+from hummingbot.core.event.events import TradeType
+
+TRADING_PAIR = "ETH-USDT"
+
+
+def diff_message(update_id: int, bids, asks) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.DIFF, {"trading_pair": TRADING_PAIR, "update_id": update_id,
+                                                        "bids": bids, "asks": asks}, timestamp=update_id)
+
+
+def trade_message(trade_id: int, price: float, amount: float, trade_type: TradeType) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.TRADE, {"trading_pair": TRADING_PAIR, "trade_id": trade_id,
+                                                         "trade_type": float(trade_type.value), "price": price,
+                                                         "amount": amount}, timestamp=trade_id)
+
+
+class OrderBookRecorderUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.recording_dir: str = tempfile.mkdtemp()
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+
+    def tearDown(self):
+        self.ev_loop.close()
+        shutil.rmtree(self.recording_dir)
+
+    def record(self):
+        """
+        Records an initial order book, then a diff at each second from 1001 to 1009, and a trade at 1004.
+        """
+        recorder: OrderBookRecorder = OrderBookRecorder(self.recording_dir, checkpoint_interval=3.0)
+        queue: RecordingQueue = RecordingQueue(recorder)
+        order_book: OrderBook = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[99., 1., 1.], [98., 2., 1.]]), np.array([[101., 1., 1.]]))
+        with patch("hummingbot.core.data_type.order_book_recorder.time.time") as mock_time:
+            mock_time.return_value = 1000.0
+            # Received before the initial order book, recorded after it.
+            queue.put_nowait(diff_message(2, [[99., 3.]], []))
+            recorder.record_order_book(TRADING_PAIR, order_book)
+            for update_id in range(3, 12):
+                mock_time.return_value = 998.0 + update_id
+                queue.put_nowait(diff_message(update_id, [[80. + update_id, 1.]], [[120. - update_id, 0.5]]))
+                if update_id == 6:
+                    queue.put_nowait(trade_message(77, 100.5, 0.25, TradeType.SELL))
+        recorder.close()
+        return queue
+
+    def test_record_format(self):
+        queue = self.record()
+        self.assertEqual(11, queue.qsize())
+        reader: OrderBookRecordReader = OrderBookRecordReader(recording_path(self.recording_dir, TRADING_PAIR))
+        self.assertEqual(TRADING_PAIR, reader.trading_pair)
+        records = list(reader.records())
+        self.assertEqual(OrderBookRecordType.CHECKPOINT, records[0].record_type)
+        self.assertEqual([[99., 1.], [98., 2.]], records[0].bids.tolist())
+        self.assertEqual(OrderBookRecordType.DIFF, records[1].record_type)
+        trade = [record for record in records if record.record_type is OrderBookRecordType.TRADE][0]
+        self.assertEqual(77, trade.record_id)
+        trade_message = trade.to_message(TRADING_PAIR)
+        self.assertEqual(float(TradeType.SELL.value), trade_message.content["trade_type"])
+        self.assertEqual((100.5, 0.25), (trade_message.content["price"], trade_message.content["amount"]))
+        # Checkpoints at 1000, 1003, 1006 and 1009.
+        self.assertEqual([1000., 1003., 1006., 1009.], reader.checkpoints["timestamp"].tolist())
+        self.assertEqual(OrderBookRecordType.CHECKPOINT, next(reader.records(1004.5)).record_type)
+        self.assertEqual(1003., next(reader.records(1004.5)).recv_time)
+
+    def test_replay(self):
+        self.record()
+        tracker: OrderBookReplayTracker = OrderBookReplayTracker(self.recording_dir, [TRADING_PAIR])
+        tracker.start()
+        order_book: OrderBook = tracker.order_books[TRADING_PAIR]
+        self.assertEqual(1000., tracker.start_timestamp)
+        self.assertEqual(99., order_book.get_price(False))
+
+        tracker.replay_til(1000.)
+        self.assertEqual([[99., 3.], [98., 2.]], order_book.get_top_levels(True)[:, :2].tolist())
+        self.assertTrue(np.isnan(order_book.last_trade_price))
+        tracker.replay_til(1004.)
+        self.assertEqual(1004., tracker.replay_timestamp)
+        self.assertEqual([[99., 3.], [98., 2.], [86., 1.], [85., 1.], [84., 1.], [83., 1.]],
+                         order_book.get_top_levels(True)[:, :2].tolist())
+        self.assertEqual(100.5, order_book.last_trade_price)
+        tracker.replay()
+        self.assertTrue(tracker.finished)
+        self.assertEqual(10, len(order_book.get_top_levels(False)))
+
+        # Starting from the middle gives the same order book.
+        seeked_tracker: OrderBookReplayTracker = OrderBookReplayTracker(self.recording_dir, [TRADING_PAIR],
+                                                                        start_time=1007.5)
+        seeked_tracker.start()
+        self.assertEqual(1006., seeked_tracker.start_timestamp)
+        seeked_tracker.replay()
+        self.assertEqual(order_book.get_top_levels(True).tolist(),
+                         seeked_tracker.order_books[TRADING_PAIR].get_top_levels(True).tolist())
+        self.assertEqual(order_book.get_top_levels(False).tolist(),
+                         seeked_tracker.order_books[TRADING_PAIR].get_top_levels(False).tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
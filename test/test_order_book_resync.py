@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+import logging; logging.basicConfig(level=logging.ERROR)
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+import zlib
+
+from hummingbot.connector.exchange.kraken.kraken_api_order_book_data_source import (
+    KrakenAPIOrderBookDataSource,
+    order_book_checksum,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+TRADING_PAIR = "ETH-USDT"
+
+
+def book_message(message_type: OrderBookMessageType, update_id: int, bids: List[List[float]],
+                 asks: List[List[float]], **kwargs: Any) -> OrderBookMessage:
+    return OrderBookMessage(message_type, {"trading_pair": TRADING_PAIR, "update_id": update_id, "bids": bids,
+                                           "asks": asks, **kwargs}, timestamp=float(update_id))
+
+
+class MockDataSource(OrderBookTrackerDataSource):
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs)
+        self.snapshots: List[OrderBookMessage] = [
+            book_message(OrderBookMessageType.SNAPSHOT, 10, [[99., 1.]], [[101., 1.]])
+        ]
+        self.snapshot_requests: int = 0
+        self.consistent: bool = True
+
+    @classmethod
+    async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
+        return {trading_pair: 100. for trading_pair in trading_pairs}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        snapshot: OrderBookMessage = self.snapshots.pop(0)
+        order_book: OrderBook = OrderBook()
+        order_book.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        return order_book
+
+    async def get_order_book_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        self.snapshot_requests += 1
+        return self.snapshots.pop(0)
+
+    def is_order_book_consistent(self, trading_pair: str, order_book: OrderBook, message: OrderBookMessage) -> bool:
+        return self.consistent
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class OrderBookResyncUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.data_source: MockDataSource = MockDataSource([TRADING_PAIR])
+        self.tracker: OrderBookTracker = OrderBookTracker(self.data_source, [TRADING_PAIR])
+        self.tracker.start()
+        self.ev_loop.run_until_complete(asyncio.wait_for(self.tracker._order_books_initialized.wait(), 5))
+
+    def tearDown(self):
+        self.tracker.stop()
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+        self.ev_loop.close()
+
+    def send_diff(self, first_update_id: int, update_id: int, bids: List[List[float]], asks: List[List[float]]):
+        self.tracker._order_book_diff_stream.put_nowait(
+            book_message(OrderBookMessageType.DIFF, update_id, bids, asks, first_update_id=first_update_id))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+
+    def book(self) -> List[List[List[float]]]:
+        order_book: OrderBook = self.tracker.order_books[TRADING_PAIR]
+        return [order_book.get_top_levels(True, -1)[:, :2].tolist(), order_book.get_top_levels(False, -1)[:, :2].tolist()]
+
+    def test_resync_on_gap(self):
+        self.send_diff(11, 12, [[99., 2.]], [])
+        self.assertEqual(0, self.data_source.snapshot_requests)
+        self.assertEqual([[[99., 2.]], [[101., 1.]]], self.book())
+
+        # Updates 13 and 14 never arrive.
+        self.data_source.snapshots.append(book_message(OrderBookMessageType.SNAPSHOT, 14, [[99., 5.]],
+                                                       [[101., 1.], [102., 1.]]))
+        self.send_diff(15, 16, [], [[101., 3.]])
+        self.assertEqual(1, self.data_source.snapshot_requests)
+        # The snapshot, with the diffs after it replayed.
+        self.assertEqual([[[99., 5.]], [[101., 3.], [102., 1.]]], self.book())
+        self.assertEqual({}, self.tracker._resync_requests)
+
+        self.send_diff(17, 17, [[98., 1.]], [])
+        self.assertEqual(1, self.data_source.snapshot_requests)
+
+    def test_resync_on_inconsistent_book(self):
+        self.data_source.consistent = False
+        self.data_source.snapshots.append(book_message(OrderBookMessageType.SNAPSHOT, 12, [[99., 5.]], [[101., 1.]]))
+        self.send_diff(11, 12, [[99., 2.]], [])
+        self.assertEqual(1, self.data_source.snapshot_requests)
+        self.assertEqual([[[99., 5.]], [[101., 1.]]], self.book())
+        self.assertEqual({}, self.tracker._resync_requests)
+
+    def test_resync_retries_failed_snapshot(self):
+        self.tracker.RESYNC_RETRY_DELAY = 0.3
+        # The first snapshot request fails, there is no snapshot to return.
+        self.send_diff(13, 13, [[99., 3.]], [])
+        self.assertEqual(1, self.data_source.snapshot_requests)
+        self.assertIn(TRADING_PAIR, self.tracker._resync_requests)
+
+        # The next diffs look in sync and are applied meanwhile, without requesting another resync.
+        self.send_diff(14, 14, [[99., 4.]], [])
+        self.assertEqual(1, self.data_source.snapshot_requests)
+        self.data_source.snapshots.append(book_message(OrderBookMessageType.SNAPSHOT, 14, [[99., 5.]], [[101., 1.]]))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.3))
+        self.assertEqual(2, self.data_source.snapshot_requests)
+        self.assertEqual([[[99., 5.]], [[101., 1.]]], self.book())
+        self.assertEqual({}, self.tracker._resync_requests)
+
+
+class KrakenChecksumUnitTest(unittest.TestCase):
+    def test_checksum(self):
+        order_book: OrderBook = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(0.05, 0.000005, 1), OrderBookRow(0.04995, 1.5, 1)],
+                                  [OrderBookRow(0.05005, 0.000005, 1), OrderBookRow(0.0501, 12.25, 1)], 1)
+        expected: int = zlib.crc32(b"5005500" + b"50101225000000" + b"5000500" + b"4995150000000")
+        self.assertEqual(expected, order_book_checksum(order_book, 5, 8))
+
+        data_source: KrakenAPIOrderBookDataSource = KrakenAPIOrderBookDataSource([TRADING_PAIR])
+        message: OrderBookMessage = book_message(OrderBookMessageType.DIFF, 1, [], [], checksum=expected)
+        # Not checked until the precision of the pair is known.
+        self.assertTrue(data_source.is_order_book_consistent(TRADING_PAIR, order_book, message))
+        data_source._price_decimals[TRADING_PAIR] = 5
+        data_source._volume_decimals[TRADING_PAIR] = 8
+        self.assertTrue(data_source.is_order_book_consistent(TRADING_PAIR, order_book, message))
+        order_book.apply_diffs([OrderBookRow(0.04995, 1.0, 2)], [], 2)
+        self.assertFalse(data_source.is_order_book_consistent(TRADING_PAIR, order_book, message))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+from decimal import Decimal
+import random
+import unittest
+
+from hummingbot.strategy.cross_exchange_market_making.price_sample_window import PriceSampleWindow
+
+s_decimal_nan = Decimal("nan")
+
+
+class PriceSampleWindowUnitTest(unittest.TestCase):
+    def assert_prices(self, expected_bid: Decimal, expected_ask: Decimal, prices):
+        bid, ask = prices
+        for expected, actual in ((expected_bid, bid), (expected_ask, ask)):
+            if expected.is_nan():
+                self.assertTrue(actual.is_nan())
+            else:
+                self.assertEqual(expected, actual)
+
+    def test_rolling_extrema(self):
+        window: PriceSampleWindow = PriceSampleWindow(15)
+        window.add_sample(5, Decimal("100"), Decimal("101"))
+        window.add_sample(10, Decimal("102"), Decimal("99"))
+        window.add_sample(15, Decimal("98"), Decimal("100"))
+        self.assert_prices(Decimal("102"), Decimal("99"), window.get_top_bid_ask(15, Decimal("97"), Decimal("103")))
+        # The current prices count as well.
+        self.assert_prices(Decimal("104"), Decimal("98"), window.get_top_bid_ask(15, Decimal("104"), Decimal("98")))
+
+        # The samples at 10 leave the window at 25.
+        self.assert_prices(Decimal("102"), Decimal("99"), window.get_top_bid_ask(24, Decimal("97"), Decimal("103")))
+        self.assert_prices(Decimal("98"), Decimal("100"), window.get_top_bid_ask(25, Decimal("97"), Decimal("103")))
+        self.assert_prices(Decimal("97"), Decimal("103"), window.get_top_bid_ask(30, Decimal("97"), Decimal("103")))
+
+    def test_nan_samples(self):
+        window: PriceSampleWindow = PriceSampleWindow(10)
+        window.add_sample(5, s_decimal_nan, Decimal("101"))
+        window.add_sample(10, Decimal("100"), Decimal("102"))
+        self.assert_prices(s_decimal_nan, Decimal("101"), window.get_top_bid_ask(10, Decimal("99"), Decimal("103")))
+        self.assert_prices(s_decimal_nan, s_decimal_nan, window.get_top_bid_ask(10, Decimal("99"), s_decimal_nan))
+        # Until the NaN sample leaves the window.
+        self.assert_prices(Decimal("100"), Decimal("102"), window.get_top_bid_ask(15, Decimal("99"), Decimal("103")))
+
+    def test_against_sample_list(self):
+        random.seed(47)
+        window: PriceSampleWindow = PriceSampleWindow(60)
+        samples = []
+        for timestamp in range(5, 5000, 5):
+            bid: Decimal = Decimal(random.randint(90, 110))
+            ask: Decimal = bid + Decimal(random.randint(1, 5))
+            window.add_sample(timestamp, bid, ask)
+            samples = [s for s in samples if s[0] > timestamp - 60] + [(timestamp, bid, ask)]
+            self.assertLessEqual(len(samples), 12)
+            current_bid: Decimal = Decimal(random.randint(90, 110))
+            current_ask: Decimal = current_bid + Decimal(random.randint(1, 5))
+            self.assertEqual((max([s[1] for s in samples] + [current_bid]),
+                              min([s[2] for s in samples] + [current_ask])),
+                             window.get_top_bid_ask(timestamp, current_bid, current_ask))
+
+
+if __name__ == "__main__":
+    unittest.main()
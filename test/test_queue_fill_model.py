@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+import shutil
+import tempfile
+from typing import Tuple
+import unittest
+
+import numpy as np
+
+from hummingbot.connector.exchange.paper_trade.backtest_runner import BacktestRunner
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.connector.exchange.paper_trade.queue_fill_model import QueueFillModel
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_recorder import (
+    OrderBookRecordType,
+    OrderBookRecordWriter,
+    recording_path,
+    s_empty_levels,
+)
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    BuyOrderCompletedEvent,
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    SellOrderCompletedEvent,
+)
+
+TRADING_PAIR = "ETH-USDT"
+
+
+class DashTradingPairExchange:
+    @staticmethod
+    def split_trading_pair(trading_pair: str) -> Tuple[str, str]:
+        base_asset, quote_asset = trading_pair.split("-")
+        return base_asset, quote_asset
+
+    @staticmethod
+    def convert_from_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @staticmethod
+    def convert_to_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+
+class QueueFillModelUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.order_book: OrderBook = OrderBook()
+        self.order_book.apply_numpy_snapshot(np.array([[99., 5., 1.], [98., 5., 1.]]),
+                                             np.array([[101., 5., 1.], [102., 5., 1.]]))
+        self.model: QueueFillModel = QueueFillModel(placement_latency=2.0, cancel_latency=3.0)
+
+    def test_queue_position(self):
+        self.model.add_order("buy-1", TRADING_PAIR, True, Decimal(99), Decimal(2), 1000.0)
+        self.model.update_queues(TRADING_PAIR, self.order_book, 1001.0)
+        self.assertFalse(self.model.is_active("buy-1"))
+        self.assertEqual([], self.model.match_trade(TRADING_PAIR, True, 98.0, 10.0))
+
+        self.model.update_queues(TRADING_PAIR, self.order_book, 1002.0)
+        self.assertTrue(self.model.is_active("buy-1"))
+        self.assertEqual(5.0, self.model.orders["buy-1"].queue_ahead)
+        # Trades at the price take the queue ahead first.
+        self.assertEqual([], self.model.match_trade(TRADING_PAIR, True, 99.0, 3.0))
+        self.assertEqual(2.0, self.model.orders["buy-1"].queue_ahead)
+        # The level shrinking below the queue ahead means cancels ahead.
+        self.order_book.apply_numpy_diffs(np.array([[99., 1.5, 2.]]), np.empty((0, 3)))
+        self.model.update_queues(TRADING_PAIR, self.order_book, 1003.0)
+        self.assertEqual(1.5, self.model.orders["buy-1"].queue_ahead)
+        self.assertEqual([("buy-1", Decimal("0.5"))], self.model.match_trade(TRADING_PAIR, True, 99.0, 2.0))
+        self.assertEqual(Decimal("1.5"), self.model.remaining("buy-1"))
+        # Trades on the other side or at lower prices don't fill it.
+        self.assertEqual([], self.model.match_trade(TRADING_PAIR, False, 99.0, 2.0))
+        self.assertEqual([], self.model.match_trade(TRADING_PAIR, True, 99.5, 2.0))
+        # A trade through the price fills the rest.
+        self.assertEqual([("buy-1", Decimal("1.5"))], self.model.match_trade(TRADING_PAIR, True, 98.5, 0.1))
+        self.assertEqual(Decimal(0), self.model.remaining("buy-1"))
+
+    def test_orders_share_trades(self):
+        self.model = QueueFillModel()
+        # Inside the spread, nothing ahead.
+        self.model.add_order("sell-1", TRADING_PAIR, False, Decimal(100), Decimal(1), 1000.0)
+        self.model.add_order("sell-2", TRADING_PAIR, False, Decimal(101), Decimal(1), 1000.0)
+        self.model.update_queues(TRADING_PAIR, self.order_book, 1000.0)
+        self.assertEqual(0.0, self.model.orders["sell-1"].queue_ahead)
+        fills = self.model.match_trade(TRADING_PAIR, False, 101.0, 6.0)
+        self.assertEqual([("sell-1", Decimal(1)), ("sell-2", Decimal(1))], fills)
+
+    def test_cancel_latency(self):
+        self.model.add_order("buy-1", TRADING_PAIR, True, Decimal(99), Decimal(2), 1000.0)
+        self.assertTrue(self.model.request_cancel("buy-1", 1001.0))
+        self.assertEqual([], self.model.due_cancels(1003.0))
+        self.assertEqual(["buy-1"], [order.order_id for order in self.model.due_cancels(1004.0)])
+        self.model.remove_order("buy-1")
+        self.assertEqual([], self.model.due_cancels(1004.0))
+        self.assertEqual([], self.model.trading_pairs)
+        self.assertFalse(QueueFillModel().request_cancel("buy-1", 1001.0))
+
+
+class PaperTradeQueueFillUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.recording_dir: str = tempfile.mkdtemp()
+        writer: OrderBookRecordWriter = OrderBookRecordWriter(recording_path(self.recording_dir, TRADING_PAIR),
+                                                              TRADING_PAIR)
+        writer.write(OrderBookRecordType.CHECKPOINT, 1000., 1000., 1, np.array([[99., 5.], [98., 5.]]),
+                     np.array([[101., 5.], [102., 5.]]))
+        # Sells at 99 before the buy order reaches the exchange.
+        writer.write(OrderBookRecordType.TRADE, 1001.5, 1001.5, 1, s_empty_levels, np.array([[99., 3.]]))
+        writer.write(OrderBookRecordType.DIFF, 1001.6, 1001.6, 2, np.array([[99., 2.]]), s_empty_levels)
+        writer.write(OrderBookRecordType.TRADE, 1003.5, 1003.5, 2, s_empty_levels, np.array([[99., 3.]]))
+        writer.write(OrderBookRecordType.DIFF, 1003.6, 1003.6, 3, np.array([[99., 0.]]), s_empty_levels)
+        writer.write(OrderBookRecordType.TRADE, 1004.5, 1004.5, 3, s_empty_levels, np.array([[98.5, 0.2]]))
+        # A buy through 101 while the sell order is being cancelled.
+        writer.write(OrderBookRecordType.TRADE, 1008.5, 1008.5, 4, np.array([[101.5, 1.]]), s_empty_levels)
+        writer.close()
+
+        self.runner: BacktestRunner = BacktestRunner(1000., 1020.)
+        self.market: PaperTradeExchange = self.runner.add_market(
+            "binance", [TRADING_PAIR], self.recording_dir, {"ETH": Decimal(10), "USDT": Decimal(1000)},
+            target_market=DashTradingPairExchange,
+            fill_model=QueueFillModel(placement_latency=2.0, cancel_latency=3.0))
+        self.assertTrue(self.market.ready)
+        self.event_logger: EventLogger = EventLogger()
+        for event_tag in (MarketEvent.OrderFilled, MarketEvent.BuyOrderCompleted, MarketEvent.SellOrderCompleted,
+                          MarketEvent.OrderCancelled):
+            self.market.add_listener(event_tag, self.event_logger)
+
+    def tearDown(self):
+        self.ev_loop.close()
+        shutil.rmtree(self.recording_dir)
+
+    def events(self, event_type):
+        return [event for event in self.event_logger.event_log if isinstance(event, event_type)]
+
+    def test_partial_fills(self):
+        self.runner.replay_til(1000.)
+        buy_order_id: str = self.market.buy(TRADING_PAIR, Decimal(2), OrderType.LIMIT, Decimal(99))
+        self.runner.replay_til(1003.)
+        self.assertEqual([], self.events(OrderFilledEvent))
+        self.assertEqual(2.0, self.market.fill_model.orders[buy_order_id].queue_ahead)
+        self.runner.replay_til(1004.)
+        self.assertEqual([Decimal(1)], [event.amount for event in self.events(OrderFilledEvent)])
+        self.assertEqual(Decimal(1), self.market.on_hold_balances["USDT"] / Decimal(99))
+        self.assertEqual(1, len(self.market.limit_orders))
+        self.runner.replay_til(1005.)
+        self.assertEqual([Decimal(1), Decimal(1)], [event.amount for event in self.events(OrderFilledEvent)])
+        completed = self.events(BuyOrderCompletedEvent)
+        self.assertEqual([(buy_order_id, Decimal(2))], [(event.order_id, event.base_asset_amount)
+                                                        for event in completed])
+        self.assertEqual(0, len(self.market.limit_orders))
+        self.assertEqual(Decimal(12), self.market.get_balance("ETH"))
+        self.assertEqual(Decimal(1000 - 198), self.market.get_balance("USDT"))
+
+        # The sell order fills before its cancel takes effect.
+        sell_order_id: str = self.market.sell(TRADING_PAIR, Decimal(1), OrderType.LIMIT, Decimal(101))
+        self.runner.replay_til(1008.)
+        self.market.cancel(TRADING_PAIR, sell_order_id)
+        self.runner.replay_til(1012.)
+        self.assertEqual([sell_order_id], [event.order_id for event in self.events(SellOrderCompletedEvent)])
+        self.assertEqual([], self.events(OrderCancelledEvent))
+
+        # Cancels take effect after the latency.
+        sell_order_id = self.market.sell(TRADING_PAIR, Decimal(1), OrderType.LIMIT, Decimal(110))
+        self.runner.replay_til(1013.)
+        self.market.cancel(TRADING_PAIR, sell_order_id)
+        self.runner.replay_til(1015.)
+        self.assertEqual(1, len(self.market.limit_orders))
+        self.runner.replay_til(1016.)
+        self.assertEqual([sell_order_id], [event.order_id for event in self.events(OrderCancelledEvent)])
+        self.assertEqual(0, len(self.market.limit_orders))
+        self.assertEqual({}, self.market.fill_model.orders)
+
+
+if __name__ == "__main__":
+    unittest.main()
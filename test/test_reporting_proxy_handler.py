@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import gzip
+import json
+import logging
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.logger.reporting_proxy_handler import ReportingProxyHandler
+
+
+class MockLogServerClient:
+    def __init__(self):
+        self.started: bool = True
+        self.requests: List[Dict[str, Any]] = []
+
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self.started = False
+
+    def request(self, request_obj: Dict[str, Any]):
+        self.requests.append(request_obj)
+
+
+def make_record(msg: str, exc_info=None) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.ERROR, __file__, 1, msg, None, exc_info, func="test_func")
+
+
+class ReportingProxyHandlerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.send_error_logs = global_config_map["send_error_logs"].value
+        global_config_map["send_error_logs"].value = True
+
+    def tearDown(self):
+        global_config_map["send_error_logs"].value = self.send_error_logs
+
+    @staticmethod
+    def create_handler(**kwargs) -> ReportingProxyHandler:
+        handler: ReportingProxyHandler = ReportingProxyHandler(**kwargs)
+        handler.log_server_client = MockLogServerClient()
+        return handler
+
+    @staticmethod
+    def sent_batches(handler: ReportingProxyHandler) -> List[List[Dict[str, Any]]]:
+        return [json.loads(gzip.decompress(request["request_obj"]["data"]))
+                for request in handler.log_server_client.requests]
+
+    def test_bounded_queue(self):
+        handler: ReportingProxyHandler = self.create_handler(capacity=100, max_queue_size=3)
+        for i in range(5):
+            handler.process_log(make_record(f"error {i}"))
+        self.assertEqual(3, handler.pending_log_count)
+        self.assertEqual(2, handler.dropped_log_count)
+
+        handler.flush(send_all=True)
+        batches: List[List[Dict[str, Any]]] = self.sent_batches(handler)
+        self.assertEqual(1, len(batches))
+        # The oldest messages were dropped, and that is reported with the batch.
+        self.assertEqual(["error 2", "error 3", "error 4"], [message["msg"] for message in batches[0][:3]])
+        self.assertEqual("WARNING", batches[0][3]["level"])
+        self.assertIn("2 log messages were dropped", batches[0][3]["msg"])
+        self.assertEqual(0, handler.pending_log_count)
+
+    def test_batching(self):
+        handler: ReportingProxyHandler = self.create_handler(capacity=2, max_batch_size=2, flush_interval=60)
+        for i in range(2):
+            handler.process_log(make_record(f"error {i}"))
+        handler._ship_pending_logs()
+        self.assertEqual(0, len(handler.log_server_client.requests))
+
+        # More than capacity messages are sent in batches of at most max_batch_size, the rest waits.
+        handler.process_log(make_record("error 2"))
+        handler._ship_pending_logs()
+        self.assertEqual([["error 0", "error 1"]],
+                         [[message["msg"] for message in batch] for batch in self.sent_batches(handler)])
+
+        # Fewer messages are sent once the flush interval has passed.
+        handler.process_log(make_record("error 3"))
+        handler._ship_pending_logs()
+        self.assertEqual(1, len(handler.log_server_client.requests))
+        handler._last_send_timestamp -= 60
+        handler._ship_pending_logs()
+        self.assertEqual(["error 2", "error 3"], [message["msg"] for message in self.sent_batches(handler)[1]])
+
+    def test_gzip_payload(self):
+        handler: ReportingProxyHandler = self.create_handler()
+        handler.send_logs([{"msg": "error"}])
+        request_obj: Dict[str, Any] = handler.log_server_client.requests[0]["request_obj"]
+        self.assertEqual("gzip", request_obj["headers"]["Content-Encoding"])
+        self.assertEqual([{"msg": "error"}], json.loads(gzip.decompress(request_obj["data"])))
+
+        handler = self.create_handler(compress=False)
+        handler.send_logs([{"msg": "error"}])
+        request_obj = handler.log_server_client.requests[0]["request_obj"]
+        self.assertNotIn("Content-Encoding", request_obj["headers"])
+        self.assertEqual([{"msg": "error"}], json.loads(request_obj["data"]))
+
+    def test_exceptions_formatted_when_queued(self):
+        handler: ReportingProxyHandler = self.create_handler(capacity=100)
+        try:
+            raise ValueError("bad value")
+        except ValueError:
+            handler.process_log(make_record("error", sys.exc_info()))
+        message: Dict[str, Any] = handler._log_queue[0]
+        self.assertIsInstance(message["exc_info"], str)
+        self.assertIn("ValueError: bad value", message["exc_info"])
+        self.assertEqual("bad value", message["exception_msg"])
+
+    def test_send_error_logs_off(self):
+        handler: ReportingProxyHandler = self.create_handler(capacity=100)
+        handler.process_log(make_record("error 0"))
+        global_config_map["send_error_logs"].value = False
+        handler.emit(make_record("error 1"))
+        self.assertEqual(1, handler.pending_log_count)
+
+        # The messages queued before it was turned off are dropped, not sent.
+        handler.flush(send_all=True)
+        self.assertEqual(0, handler.pending_log_count)
+        self.assertEqual(0, len(handler.log_server_client.requests))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+from decimal import Decimal
+import random
+from statistics import mean, stdev
+import unittest
+
+from hummingbot.script.script_indicators import (
+    EMA,
+    RingBuffer,
+    RollingMax,
+    RollingMin,
+    RollingStdev,
+    RollingVolatility,
+    SMA,
+    VWAP
+)
+
+
+class ScriptIndicatorsUnitTest(unittest.TestCase):
+    def setUp(self):
+        random.seed(42)
+        self.prices = [100 + random.uniform(-5, 5) for _ in range(500)]
+
+    def test_ring_buffer(self):
+        buffer = RingBuffer(3)
+        self.assertIsNone(buffer.append(1))
+        buffer.append(2)
+        buffer.append(3)
+        self.assertEqual(1, buffer.append(4))
+        self.assertEqual([2, 3, 4], buffer.values().tolist())
+
+    def test_sma_stdev_min_max(self):
+        length = 20
+        sma, std, r_min, r_max = SMA(length), RollingStdev(length), RollingMin(length), RollingMax(length)
+        for i, price in enumerate(self.prices):
+            for indicator in (sma, std, r_min, r_max):
+                indicator.update(price)
+            window = self.prices[max(0, i + 1 - length):i + 1]
+            self.assertAlmostEqual(mean(window), sma.value)
+            self.assertEqual(min(window), r_min.value)
+            self.assertEqual(max(window), r_max.value)
+            if len(window) > 1:
+                self.assertAlmostEqual(stdev(window), std.value)
+        self.assertTrue(sma.ready)
+
+    def test_ema(self):
+        ema = EMA(9)
+        ema.update(Decimal("10"))
+        self.assertEqual(10, ema.value)
+        ema.update(Decimal("20"))
+        self.assertAlmostEqual(12, ema.value)
+
+    def test_volatility(self):
+        volatility = RollingVolatility(3)
+        for price in [1, 2, 3, 4, 5]:
+            volatility.update(price)
+        self.assertAlmostEqual(stdev([(3 - 2) / 2, (4 - 3) / 3, (5 - 4) / 4]), volatility.value)
+
+    def test_vwap(self):
+        vwap = VWAP(2)
+        self.assertIsNone(vwap.value)
+        vwap.update(Decimal("100"), Decimal("1"))
+        vwap.update(Decimal("110"), Decimal("3"))
+        self.assertAlmostEqual(107.5, vwap.value)
+        vwap.update(Decimal("90"), Decimal("1"))
+        self.assertAlmostEqual((110 * 3 + 90) / 4, vwap.value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+from decimal import Decimal
+from multiprocessing import Process
+import unittest
+
+from hummingbot.script.script_base import ScriptBase
+from hummingbot.script.script_interface import OnTick
+from hummingbot.script.script_ipc import MidPriceRing, ScriptChannel
+
+
+def echo_prices(channel: ScriptChannel, reply_channel: ScriptChannel, ring: MidPriceRing):
+    channel_item = None
+    while channel_item is None:
+        channel_item = channel.get_nowait()
+    reply_channel.put(ring.latest().tolist())
+
+
+class ScriptIPCUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(cls.ev_loop)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.ev_loop.close()
+
+    def test_channel_wakes_reader(self):
+        channel = ScriptChannel()
+
+        async def put_later():
+            await asyncio.sleep(0.1)
+            channel.put("hello")
+
+        async def run():
+            asyncio.ensure_future(put_later())
+            return await asyncio.wait_for(channel.get(), timeout=1)
+
+        self.assertEqual("hello", self.ev_loop.run_until_complete(run()))
+        self.assertIsNone(channel.get_nowait())
+
+    def test_put_does_not_block_on_full_pipe(self):
+        channel = ScriptChannel()
+        item = "x" * 10000
+
+        async def put_many():
+            # Far more than the pipe buffer holds while nothing reads the channel.
+            for _ in range(200):
+                channel.put(item)
+                await asyncio.sleep(0)
+            return "done"
+
+        self.assertEqual("done", self.ev_loop.run_until_complete(asyncio.wait_for(put_many(), timeout=1)))
+        self.assertGreater(channel.pending_count, 0)
+        self.assertFalse(channel.flush(timeout=0.1))
+
+        # Once the reader drains the channel, all the messages arrive in order.
+        received = [self.ev_loop.run_until_complete(asyncio.wait_for(channel.get(), timeout=1)) for _ in range(200)]
+        self.assertEqual([item] * 200, received)
+        self.assertTrue(channel.flush(timeout=1))
+        self.assertEqual(0, channel.pending_count)
+        self.assertIsNone(channel.get_nowait())
+
+    def test_mid_price_ring(self):
+        ring = MidPriceRing(5)
+        self.assertEqual(0, len(ring))
+        self.assertIsNone(ring.samples(1, 1))
+        for price in range(1, 8):
+            ring.append(price)
+        # One slot is kept free for the writer.
+        self.assertEqual(4, len(ring))
+        self.assertEqual([4., 5., 6., 7.], ring.latest().tolist())
+        self.assertEqual([6., 7.], ring.latest(2).tolist())
+        self.assertEqual([5., 7.], ring.samples(2, 2))
+        self.assertIsNone(ring.samples(2, 3))
+
+    def test_mid_price_ring_is_shared(self):
+        ring = MidPriceRing(10)
+        channel, reply_channel = ScriptChannel(), ScriptChannel()
+        process = Process(target=echo_prices, args=(channel, reply_channel, ring))
+        process.start()
+        ring.append(1.5)
+        ring.append(2.5)
+        channel.put("read")
+        self.assertEqual([1.5, 2.5], self.ev_loop.run_until_complete(asyncio.wait_for(reply_channel.get(), 5)))
+        process.join()
+
+    def test_apply_tick_updates(self):
+        script = ScriptBase()
+        script._apply_tick_updates(OnTick(Decimal("100"),
+                                          {"buy_levels": 2, "bid_spread": Decimal("0.01")},
+                                          {"binance": {"BTC": Decimal("1"), "ETH": Decimal("10")}}))
+        script._apply_tick_updates(OnTick(Decimal("101"),
+                                          {"buy_levels": 3},
+                                          {"binance": {"ETH": None, "USDT": Decimal("5")}}))
+        self.assertEqual(3, script.pmm_parameters.buy_levels)
+        self.assertEqual(Decimal("0.01"), script.pmm_parameters.bid_spread)
+        self.assertEqual({"binance": {"BTC": Decimal("1"), "USDT": Decimal("5")}}, script.all_total_balances)
+
+
+if __name__ == "__main__":
+    unittest.main()
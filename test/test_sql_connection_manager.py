@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import shutil
+import tempfile
+import unittest
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from hummingbot.model.metadata import Metadata
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+
+
+class SQLConnectionManagerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.db_dir: str = tempfile.mkdtemp()
+        self.sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                                                              db_path=join(self.db_dir, "test.sqlite"))
+
+    def tearDown(self):
+        self.sql.get_shared_session().close()
+        self.sql.engine.dispose()
+        shutil.rmtree(self.db_dir)
+
+    def test_sqlite_pragmas(self):
+        session: Session = self.sql.get_shared_session()
+        self.assertEqual("wal", session.execute("PRAGMA journal_mode").scalar())
+        # NORMAL
+        self.assertEqual(1, session.execute("PRAGMA synchronous").scalar())
+        self.assertEqual(0, session.execute("PRAGMA query_only").scalar())
+
+    def test_reader_session(self):
+        session: Session = self.sql.get_shared_session()
+        session.add(Metadata(key="test_key", value="1"))
+        session.flush()
+
+        # The reader only sees committed writes, and doesn't block them.
+        reader: Session = self.sql.get_reader_session()
+        self.assertIsNone(reader.query(Metadata).filter(Metadata.key == "test_key").one_or_none())
+        session.commit()
+        metadata: Metadata = reader.query(Metadata).filter(Metadata.key == "test_key").one()
+        reader.close()
+        self.assertEqual("1", metadata.value)
+
+        reader = self.sql.get_reader_session()
+        reader.add(Metadata(key="reader_key", value="1"))
+        with self.assertRaises(OperationalError):
+            reader.commit()
+        reader.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
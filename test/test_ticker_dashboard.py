@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import unittest
+
+import numpy as np
+
+from hummingbot.client.ui.ticker_dashboard import TickerDashboard
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+class TickerDashboardUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.order_book: OrderBook = OrderBook()
+        self.order_book.apply_numpy_snapshot(np.array([[99., 1., 1.]]), np.array([[101., 1., 1.]]))
+        self.empty_order_book: OrderBook = OrderBook()
+        self.dashboard: TickerDashboard = TickerDashboard([("binance", "ETH-USDT", self.order_book),
+                                                           ("kucoin", "BTC-USDT", self.empty_order_book)])
+
+    def test_refresh(self):
+        lines = self.dashboard.refresh(now=1000.0).split("\n")
+        self.assertEqual(3, len(lines))
+        self.assertEqual(["Exchange", "Market", "Best", "Bid", "Best", "Ask", "Mid", "Price", "Last", "Trade",
+                          "Updates/s", "Stale", "(s)"], lines[0].split())
+        self.assertEqual(["binance", "ETH-USDT", "99", "101", "100"], lines[1].split()[:5])
+        # The empty book has no prices.
+        self.assertEqual(["kucoin", "BTC-USDT"], lines[2].split()[:2])
+        self.assertEqual(len(lines[0]), len(lines[1]))
+
+    def test_update_rate_and_staleness(self):
+        self.dashboard.refresh(now=1000.0)
+        for update_id in range(2, 12):
+            self.order_book.apply_numpy_diffs(np.array([[99.5, 1., update_id]]), np.empty((0, 3)))
+        lines = self.dashboard.refresh(now=1002.0).split("\n")
+        row, empty_row = self.dashboard.rows
+        self.assertEqual(11, row.update_count)
+        self.assertAlmostEqual(2.5, row.update_rate)
+        self.assertEqual(["99.5", "101", "100.25"], lines[1].split()[2:5])
+        self.assertEqual("0.0", lines[1].split()[-1])
+        self.assertEqual("2.0", lines[2].split()[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+from collections import defaultdict
+from decimal import Decimal
+import os
+import random
+import shutil
+import tempfile
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+
+import numpy as np
+
+from hummingbot.client.performance_analysis import (
+    add_trade_to_asset_stats,
+    calculate_asset_delta_from_columns,
+)
+from hummingbot.core.event.events import TradeFee
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_archive import (
+    concat_columns,
+    query_trade_fill_columns,
+    TradeFillArchive,
+)
+
+DAY_MS = 24 * 60 * 60 * 1000
+# 2020-10-01 00:00:00 UTC
+START_TIMESTAMP = 1601510400000
+
+
+def make_trade_fill(timestamp: int,
+                    config_file_path: str = "conf_a.yml",
+                    market: str = "binance",
+                    symbol: str = "ETH-USDT",
+                    trade_type: str = "BUY",
+                    price: float = 100.0,
+                    amount: float = 1.0,
+                    trade_fee: Dict[str, Any] = None) -> TradeFill:
+    base_asset, quote_asset = symbol.split("-")
+    return TradeFill(config_file_path=config_file_path,
+                     strategy="pure_market_making",
+                     market=market,
+                     symbol=symbol,
+                     base_asset=base_asset,
+                     quote_asset=quote_asset,
+                     timestamp=timestamp,
+                     order_id=f"{trade_type.lower()}-{symbol}-{timestamp}",
+                     trade_type=trade_type,
+                     order_type="LIMIT",
+                     price=price,
+                     amount=amount,
+                     trade_fee=trade_fee or TradeFee.to_json(TradeFee(Decimal("0.001"))),
+                     exchange_trade_id=str(timestamp))
+
+
+class TradeFillArchiveUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir: str = tempfile.mkdtemp()
+        self.sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                                                              db_path=join(self.temp_dir, "test.sqlite"))
+        self.archive: TradeFillArchive = TradeFillArchive(join(self.temp_dir, "archive"))
+
+    def tearDown(self):
+        self.sql.get_shared_session().close()
+        self.sql.engine.dispose()
+        shutil.rmtree(self.temp_dir)
+
+    def add_trade_fills(self, trade_fills: List[TradeFill]):
+        session = self.sql.get_shared_session()
+        session.add_all(trade_fills)
+        session.commit()
+
+    def test_archive_trade_fills(self):
+        # Two fills a day over 4 days for one config, and one a day for another.
+        self.add_trade_fills([make_trade_fill(START_TIMESTAMP + day * DAY_MS + hour * 3600 * 1000)
+                              for day in range(4) for hour in (1, 13)] +
+                             [make_trade_fill(START_TIMESTAMP + day * DAY_MS, config_file_path="conf_b.yml")
+                              for day in range(4)])
+        archived_count: int = self.archive.archive_trade_fills(self.sql, START_TIMESTAMP + 2 * DAY_MS)
+        self.assertEqual(6, archived_count)
+        self.assertEqual(["2020-10-01.npz", "2020-10-02.npz"],
+                         sorted(os.listdir(self.archive.config_path("conf_a.yml"))))
+        self.assertEqual(6, self.sql.get_shared_session().query(TradeFill).count())
+
+        archived: Dict[str, np.ndarray] = self.archive.load_trade_fills("conf_a.yml")
+        self.assertEqual(4, len(archived["id"]))
+        self.assertTrue(np.all(np.diff(archived["timestamp"]) > 0))
+        self.assertEqual(["BUY"] * 4, list(archived["trade_type"]))
+        self.assertAlmostEqual(0.001, archived["fee_percent"][0])
+        since_second_day_noon: Dict[str, np.ndarray] = self.archive.load_trade_fills(
+            "conf_a.yml", start_timestamp=START_TIMESTAMP + DAY_MS + 12 * 3600 * 1000
+        )
+        self.assertEqual(1, len(since_second_day_noon["id"]))
+
+        # Archived fills plus the ones still in the database are the whole history, without repeats.
+        session = self.sql.get_reader_session()
+        recent: Dict[str, np.ndarray] = query_trade_fill_columns(session, "conf_a.yml", START_TIMESTAMP)
+        session.close()
+        history: Dict[str, np.ndarray] = concat_columns(archived, recent, archived)
+        self.assertEqual(8, len(history["id"]))
+
+        # Archiving a day again adds to its file.
+        self.add_trade_fills([make_trade_fill(START_TIMESTAMP + 2 * 3600 * 1000)])
+        self.assertEqual(1, self.archive.archive_trade_fills(self.sql, START_TIMESTAMP + 2 * DAY_MS))
+        self.assertEqual(5, len(self.archive.load_trade_fills("conf_a.yml")["id"]))
+        self.assertEqual(0, len(self.archive.load_trade_fills("conf_c.yml")["id"]))
+
+    def test_asset_delta_from_columns(self):
+        random.seed(50)
+        trade_fills: List[TradeFill] = []
+        for i in range(300):
+            market, symbol = random.choice([("binance", "ETH-USDT"),
+                                            ("binance", "BTC-USDT"),
+                                            ("bamboo_relay", "ZRX-WETH")])
+            flat_fees = [("ETH", Decimal("0.001"))] if market == "bamboo_relay" else []
+            trade_fills.append(make_trade_fill(START_TIMESTAMP + i * 1000,
+                                               market=market,
+                                               symbol=symbol,
+                                               trade_type=random.choice(["BUY", "SELL"]),
+                                               price=random.randint(9000, 11000) / 100,
+                                               amount=random.randint(1, 1000) / 100,
+                                               trade_fee=TradeFee.to_json(TradeFee(Decimal("0.002"), flat_fees))))
+        self.add_trade_fills(trade_fills)
+        session = self.sql.get_reader_session()
+        stats: Dict[Any, Dict[str, Any]] = calculate_asset_delta_from_columns(query_trade_fill_columns(session))
+        session.close()
+
+        self.assertEqual(3, len(stats))
+        for (market, symbol), trading_pair_stats in stats.items():
+            trades: List[TradeFill] = [t for t in trade_fills if t.market == market and t.symbol == symbol]
+            expected_asset_stats: Dict[str, Dict[str, Decimal]] = defaultdict(
+                lambda: {"spent": Decimal(0), "acquired": Decimal(0)}
+            )
+            for trade in trades:
+                add_trade_to_asset_stats(expected_asset_stats, trade)
+            self.assertEqual(len(trades), trading_pair_stats["trade_count"])
+            self.assertEqual(trades[0].price, trading_pair_stats["starting_quote_rate"])
+            self.assertEqual(trades[-1].price, trading_pair_stats["end_quote_rate"])
+            for asset, asset_stats in trading_pair_stats["asset"].items():
+                self.assertAlmostEqual(float(expected_asset_stats[asset]["spent"]), asset_stats["spent"], places=6)
+                self.assertAlmostEqual(float(expected_asset_stats[asset]["acquired"]), asset_stats["acquired"],
+                                       places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,11 @@ import time
 from decimal import Decimal
 from typing import List, Dict
 import unittest
-from hummingbot.client.performance_analysis import calculate_asset_delta_from_trades, calculate_trade_performance
+from hummingbot.client.performance_analysis import (
+    calculate_asset_delta_from_trades,
+    calculate_trade_performance,
+    RunningTradePerformance
+)
 from hummingbot.core.event.events import TradeFee, OrderType
 from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
@@ -315,3 +319,60 @@ class TestTradePerformanceAnalysis(unittest.TestCase):
         self.assertDictEqual(expected_trade_performance_stats, trade_performance_stats)
         self.assertDictEqual(expected_markettrading_pair_stats_1, market_trading_pair_stats[self.trading_pair_tuple_1])
         self.assertDictEqual(expected_markettrading_pair_stats_2, market_trading_pair_stats[self.trading_pair_tuple_2])
+
+    def test_running_trade_performance(self):
+        test_trades_1 = [
+            ("BUY", 100, 1),
+            ("SELL", 100, 0.9),
+            ("BUY", 110, 1),
+            ("SELL", 115, 1)
+        ]
+        start_time = int(time.time() * 1e3) - 100000
+        self.save_trade_fill_records(test_trades_1,
+                                     self.trading_pair_tuple_1,
+                                     OrderType.MARKET.name,
+                                     start_time,
+                                     self.strategy_1
+                                     )
+        test_trades_2 = [
+            ("BUY", 100, 2),
+            ("SELL", 110, 0.9),
+            ("BUY", 105, 0.5),
+            ("SELL", 120, 1)
+        ]
+        self.save_trade_fill_records(test_trades_2,
+                                     self.trading_pair_tuple_2,
+                                     OrderType.MARKET.name,
+                                     start_time,
+                                     self.strategy_1
+                                     )
+        raw_queried_trades = self.get_trades_from_session(start_time)
+        m_name_1 = self.trading_pair_tuple_1.market.name
+        m_name_2 = self.trading_pair_tuple_2.market.name
+        starting_balances = {"DAI": {m_name_1: Decimal("1000"), m_name_2: Decimal("500")},
+                             "WETH": {m_name_1: Decimal("5"), m_name_2: Decimal("1")}}
+        market_trading_pair_tuples = [self.trading_pair_tuple_1, self.trading_pair_tuple_2]
+
+        expected_trade_performance_stats, expected_market_trading_pair_stats = calculate_trade_performance(
+            self.strategy_1, market_trading_pair_tuples, raw_queried_trades, starting_balances
+        )
+
+        running_performance = RunningTradePerformance(self.strategy_1, market_trading_pair_tuples)
+        for trade in raw_queried_trades:
+            self.assertTrue(running_performance.add_trade(trade))
+        self.assertEqual(8, running_performance.trade_count)
+        trade_performance_stats, market_trading_pair_stats = \
+            running_performance.calculate_trade_performance(starting_balances)
+        self.assertDictEqual(expected_trade_performance_stats, trade_performance_stats)
+        self.assertDictEqual(expected_market_trading_pair_stats, market_trading_pair_stats)
+
+        # Evaluating the performance does not change the running asset deltas.
+        trade_performance_stats, _ = running_performance.calculate_trade_performance(starting_balances)
+        self.assertDictEqual(expected_trade_performance_stats, trade_performance_stats)
+
+        # Trades from other strategies are ignored, and reset rebuilds the deltas from scratch.
+        other_strategy_trade = TradeFill(**next(self.create_trade_fill_records(
+            [("BUY", 100, 1)], self.trading_pair_tuple_1, OrderType.MARKET.name, start_time, "strategy_2")))
+        self.assertFalse(running_performance.add_trade(other_strategy_trade))
+        running_performance.reset(raw_queried_trades[:4])
+        self.assertEqual(4, running_performance.trade_count)
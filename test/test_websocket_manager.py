@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+import logging; logging.basicConfig(level=logging.ERROR)
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import ujson
+import unittest
+
+import websockets
+
+from hummingbot.connector.exchange.binance.binance_websocket_manager import BinanceWebSocketManager
+
+
+class MockBinanceStreamServer:
+    """
+    Answers subscription requests like Binance's combined streams endpoint, and records them.
+    """
+
+    def __init__(self):
+        self.requests: List[Dict[str, Any]] = []
+        self.request_times: List[float] = []
+        self.connections: List[Any] = []
+        self.server = None
+
+    @property
+    def url(self) -> str:
+        return f"ws://localhost:{self.server.sockets[0].getsockname()[1]}"
+
+    async def start(self):
+        self.server = await websockets.serve(self.handler, "localhost", 0)
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handler(self, ws, *args):
+        self.connections.append(ws)
+        try:
+            async for raw_msg in ws:
+                request: Dict[str, Any] = ujson.loads(raw_msg)
+                self.requests.append(request)
+                self.request_times.append(time.time())
+                await ws.send(ujson.dumps({"result": None, "id": request["id"]}))
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            self.connections.remove(ws)
+
+    async def publish(self, stream: str, data: Dict[str, Any]):
+        for ws in self.connections:
+            await ws.send(ujson.dumps({"stream": stream, "data": data}))
+
+
+class WebSocketManagerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.server: MockBinanceStreamServer = MockBinanceStreamServer()
+        self.ev_loop.run_until_complete(self.server.start())
+        self.ws_manager: BinanceWebSocketManager = BinanceWebSocketManager(self.server.url)
+        self.ws_manager.RECONNECT_MIN_DELAY = 0.01
+
+    def tearDown(self):
+        self.ws_manager.stop()
+        self.ev_loop.run_until_complete(self.server.stop())
+        self.ev_loop.close()
+
+    def run_for(self, seconds: float = 0.2):
+        self.ev_loop.run_until_complete(asyncio.sleep(seconds))
+
+    def test_multiplexing(self):
+        diffs: asyncio.Queue = asyncio.Queue()
+        trades: asyncio.Queue = asyncio.Queue()
+        self.ws_manager.subscribe(["ethusdt@depth", "btcusdt@depth"], diffs)
+        self.ws_manager.subscribe(["ethusdt@trade"], trades)
+        self.run_for()
+        self.assertEqual(1, self.ws_manager.connection_count)
+        self.assertEqual(1, len(self.server.connections))
+        self.assertEqual([["btcusdt@depth", "ethusdt@depth", "ethusdt@trade"]],
+                         [request["params"] for request in self.server.requests])
+
+        self.ev_loop.run_until_complete(self.server.publish("ethusdt@depth", {"u": 1}))
+        self.ev_loop.run_until_complete(self.server.publish("ethusdt@trade", {"t": 2}))
+        self.ev_loop.run_until_complete(self.server.publish("ltcusdt@trade", {"t": 3}))
+        self.run_for()
+        self.assertEqual([{"u": 1}], [diffs.get_nowait() for _ in range(diffs.qsize())])
+        self.assertEqual([{"t": 2}], [trades.get_nowait() for _ in range(trades.qsize())])
+        self.assertEqual(1, self.ws_manager.channel_stats["ethusdt@depth"].message_count)
+        self.assertEqual(0, self.ws_manager.channel_stats["btcusdt@depth"].message_count)
+        self.assertGreater(self.ws_manager.last_recv_time("btcusdt@depth"), 0)
+
+        # Reconnects and subscribes again after the exchange drops the connection.
+        self.ev_loop.run_until_complete(self.server.connections[0].close())
+        self.run_for(0.5)
+        self.assertEqual(1, len(self.server.connections))
+        self.assertEqual(["btcusdt@depth", "ethusdt@depth", "ethusdt@trade"], self.server.requests[-1]["params"])
+
+        self.ws_manager.unsubscribe(["ethusdt@trade"])
+        self.run_for()
+        self.assertEqual({"method": "UNSUBSCRIBE", "params": ["ethusdt@trade"]},
+                         {k: v for k, v in self.server.requests[-1].items() if k != "id"})
+        self.ws_manager.unsubscribe(["ethusdt@depth", "btcusdt@depth"])
+        self.run_for()
+        self.assertEqual(0, self.ws_manager.connection_count)
+        self.assertEqual(0, len(self.server.connections))
+
+    def test_connection_limit(self):
+        self.ws_manager.MAX_CHANNELS_PER_CONNECTION = 2
+        queue: asyncio.Queue = asyncio.Queue()
+        self.ws_manager.subscribe(["a@depth", "b@depth", "c@depth"], queue)
+        self.run_for()
+        self.assertEqual(2, self.ws_manager.connection_count)
+        self.assertEqual(2, len(self.server.connections))
+        self.assertEqual([["a@depth", "b@depth"], ["c@depth"]],
+                         sorted(request["params"] for request in self.server.requests))
+
+    def test_send_rate(self):
+        self.ws_manager.MAX_CHANNELS_PER_MESSAGE = 2
+        self.ws_manager.MAX_MESSAGES_PER_SECOND = 10
+        queue: asyncio.Queue = asyncio.Queue()
+        self.ws_manager.subscribe([f"pair{i}@depth" for i in range(6)], queue)
+        self.run_for(0.1)
+        # Subscriptions sent while the first ones are being sent wait for them.
+        self.ws_manager.subscribe(["pair6@depth"], queue)
+        self.ws_manager.unsubscribe(["pair0@depth"])
+        self.run_for(0.6)
+        self.assertEqual(1, self.ws_manager.connection_count)
+        self.assertEqual(["SUBSCRIBE"] * 4 + ["UNSUBSCRIBE"], [request["method"] for request in self.server.requests])
+        intervals: List[float] = [t1 - t0 for t0, t1 in zip(self.server.request_times, self.server.request_times[1:])]
+        self.assertGreaterEqual(min(intervals), 0.09)
+
+    def test_reconnect_delay(self):
+        ws_manager: BinanceWebSocketManager = BinanceWebSocketManager()
+        for failures in range(1, 20):
+            delay: float = ws_manager.reconnect_delay(failures)
+            self.assertLessEqual(delay, min(ws_manager.RECONNECT_MAX_DELAY, 2 ** failures))
+            self.assertGreaterEqual(delay, 0)
+
+    def test_subscription_batches(self):
+        ws_manager: BinanceWebSocketManager = BinanceWebSocketManager()
+        channels: List[str] = [f"pair{i}@depth" for i in range(450)]
+        messages: List[Dict[str, Any]] = [ujson.loads(m) for m in ws_manager.subscription_messages(channels, True)]
+        self.assertEqual([200, 200, 50], [len(m["params"]) for m in messages])
+        self.assertEqual(3, len(set(m["id"] for m in messages)))
+
+
+if __name__ == "__main__":
+    unittest.main()